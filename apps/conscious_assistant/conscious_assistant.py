@@ -15,12 +15,23 @@
 # END COPYRIGHT
 
 import os
+import re
+from datetime import datetime
 
 from neuro_san.client.agent_session_factory import AgentSessionFactory
 from neuro_san.client.streaming_input_processor import StreamingInputProcessor
 
 AGENT_NETWORK_NAME = "conscious_agent"
 
+# The first thought of a new session, before the user has said anything
+FIRST_THOUGHT = "thought: hmm, let's see now..."
+
+# Splits a response into blocks that begin with "thought:" or "say:" and run to the next block or the end
+BLOCK_PATTERN = re.compile(
+    r"(?m)^(thought|say):[ \t]*(.*?)(?=^\s*(?:thought|say):|\Z)",
+    re.S,  # look-ahead  # dot = newline
+)
+
 
 def set_up_conscious_assistant():
     """Configure these as needed."""
@@ -82,6 +93,74 @@ def conscious_thinker(conscious_session, conscious_thread, thoughts):
     return last_chat_response, conscious_thread
 
 
+def start_conscious_session(_data=None):
+    """
+    Sets up the conscious session of one client.
+
+    :param _data: Unused; there is only one conscious agent.
+    :return: A tuple of (conscious_session, conscious_thread).
+    """
+    return set_up_conscious_assistant()
+
+
+def run_conscious_turn(state, events, emit):
+    """
+    Runs one thinking turn for one client and emits its thoughts and speech to that client.
+
+    The agent thinks about what the user said since the last turn, about its first thought
+    in a new session, or about the silence when the user said nothing.
+
+    Parameters:
+        state (tuple): The client's (conscious_session, conscious_thread).
+        events (list): The "user_input" ClientEvents since the last turn; empty on a quiet tick.
+        emit (callable): Sends (event name, payload) to the client.
+
+    Returns:
+        tuple: The updated (conscious_session, conscious_thread).
+    """
+    conscious_session, conscious_thread = state
+    timestamp = datetime.now().strftime("[%I:%M:%S%p]").lower()
+    user_input = "\n".join(event.data for event in events if event.data)
+    if user_input:
+        thoughts = f"\n{timestamp} user: " + user_input
+    elif conscious_thread.get("last_chat_response") is None:
+        thoughts = FIRST_THOUGHT
+    else:
+        thoughts = f"\n{timestamp} user: " + "[Silence]"
+
+    thoughts, conscious_thread = conscious_thinker(conscious_session, conscious_thread, thoughts)
+    print(thoughts)
+
+    thoughts_to_emit = []
+    speeches_to_emit = []
+    for kind, raw in BLOCK_PATTERN.findall(thoughts or ""):
+        content = raw.lstrip()  # drop the leading spaces/newline after the prefix
+        if not content:
+            continue
+
+        if kind == "thought":
+            timestamp = datetime.now().strftime("[%I:%M:%S%p]").lower()
+            thoughts_to_emit.append(f"{timestamp} thought: {content}")
+        else:  # kind == "say"
+            speeches_to_emit.append(content)
+
+    if thoughts_to_emit:
+        emit("update_thoughts", {"data": "\n".join(thoughts_to_emit)})
+    if speeches_to_emit:
+        emit("update_speech", {"data": "\n".join(speeches_to_emit)})
+
+    return conscious_session, conscious_thread
+
+
+def end_conscious_session(state):
+    """
+    Tears down the conscious session of one client.
+
+    :param state: The client's (conscious_session, conscious_thread).
+    """
+    tear_down_conscious_assistant(state[0])
+
+
 def tear_down_conscious_assistant(conscious_session):
     """Tear down the assistant.
 
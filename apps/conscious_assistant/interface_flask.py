@@ -16,105 +16,54 @@
 
 import atexit
 import os
-import queue
-import re
 import time
-from datetime import datetime
 
 # pylint: disable=import-error
 import schedule
 from flask import Flask
 from flask import render_template
+from flask import request
 from flask_socketio import SocketIO
 
-from apps.conscious_assistant.conscious_assistant import conscious_thinker
-from apps.conscious_assistant.conscious_assistant import set_up_conscious_assistant
-from apps.conscious_assistant.conscious_assistant import tear_down_conscious_assistant
+from apps.conscious_assistant.conscious_assistant import end_conscious_session
+from apps.conscious_assistant.conscious_assistant import run_conscious_turn
+from apps.conscious_assistant.conscious_assistant import start_conscious_session
+from apps.socket_session_loops import SocketSessionLoops
 
 os.environ["AGENT_MANIFEST_FILE"] = "registries/manifest.hocon"
 os.environ["AGENT_TOOL_PATH"] = "coded_tools"
 app = Flask(__name__)
 app.config["SECRET_KEY"] = "secret!"
-socketio = SocketIO(app)
-thread_started = False  # pylint: disable=invalid-name
-
-user_input_queue = queue.Queue()
-
-conscious_session, conscious_thread = set_up_conscious_assistant()
-
-
-def conscious_thinking_process():
-    """Main permanent agent-calling loop."""
-    with app.app_context():  # Manually push the application context
-        global conscious_thread  # pylint: disable=global-statement
-        thoughts = "thought: hmm, let's see now..."
-        while True:
-            socketio.sleep(1)
-
-            thoughts, conscious_thread = conscious_thinker(conscious_session, conscious_thread, thoughts)
-            print(thoughts)
-
-            # Separating thoughts and speeches
-            # Assume 'thoughts' is the string returned by conscious_thinker
-
-            thoughts_to_emit = []
-            speeches_to_emit = []
-
-            # --- 1.  Slice the input into blocks ----------------------------------------
-            #     Each block begins with  "thought:"  or  "say:"  and continues until
-            #     the next block or the end of the string.
-            pattern = re.compile(
-                r"(?m)^(thought|say):[ \t]*(.*?)(?=^\s*(?:thought|say):|\Z)",
-                re.S,  # look-ahead  # dot = newline
-            )
-
-            for kind, raw in pattern.findall(thoughts):
-                content = raw.lstrip()  # drop the leading spaces/newline after the prefix
-                if not content:
-                    continue
-
-                if kind == "thought":
-                    timestamp = datetime.now().strftime("[%I:%M:%S%p]").lower()
-                    thoughts_to_emit.append(f"{timestamp} thought: {content}")
-                else:  # kind == "say"
-                    speeches_to_emit.append(content)
-
-            # --- 2.  Emit the blocks -----------------------------------------------------
-            if thoughts_to_emit:
-                socketio.emit(
-                    "update_thoughts",
-                    {"data": "\n".join(thoughts_to_emit)},
-                    namespace="/chat",
-                )
-
-            if speeches_to_emit:
-                socketio.emit(
-                    "update_speech",
-                    {"data": "\n".join(speeches_to_emit)},
-                    namespace="/chat",
-                )
-
-            timestamp = datetime.now().strftime("[%I:%M:%S%p]").lower()
-            thoughts = f"\n{timestamp} user: " + "[Silence]"
-            try:
-                user_input = user_input_queue.get(timeout=0.1)
-                if user_input:
-                    thoughts = f"\n{timestamp} user: " + user_input
-                if user_input == "exit":
-                    break
-            except queue.Empty:
-                time.sleep(0.1)
-                continue
+# Threading mode: each client's agent loop is a thread that blocks on its own inbox
+socketio = SocketIO(app, async_mode="threading")
+
+# Seconds the agent thinks on its own before it hears "[Silence]" from a quiet user
+THINK_INTERVAL_SECONDS = 1.0
+
+# Seconds a browser tab may stay silent before its conscious session is torn down
+IDLE_TIMEOUT_SECONDS = 30 * 60
+
+# One conscious session and thinking loop per connected client; user input wakes it at once
+session_loops = SocketSessionLoops(
+    start_session=start_conscious_session,
+    run_turn=run_conscious_turn,
+    end_session=end_conscious_session,
+    emit=lambda event, data, sid: socketio.emit(event, data, to=sid, namespace="/chat"),
+    idle_timeout=IDLE_TIMEOUT_SECONDS,
+    tick_interval=THINK_INTERVAL_SECONDS,
+)
 
 
 @socketio.on("connect", namespace="/chat")
-def on_connect():
-    """Start background task on connect."""
-    global thread_started  # pylint: disable=global-statement
-    if not thread_started:
-        thread_started = True
-        # let socketio manage the green-thread
-        socketio.start_background_task(conscious_thinking_process)
+def on_connect(*_):
+    """Start the client's thinking loop on connect."""
+    session_loops.open(request.sid)
+
+
+@socketio.on("disconnect", namespace="/chat")
+def on_disconnect(*_):
+    """Tear down the client's session when its socket goes away."""
+    session_loops.close(request.sid)
 
 
 @app.route("/")
@@ -131,14 +80,17 @@ def handle_user_input(json, *_):
     :param json: A json object
     """
     user_input = json["data"]
-    user_input_queue.put(user_input)
-    socketio.emit("update_user_input", {"data": user_input}, namespace="/chat")
+    socketio.emit("update_user_input", {"data": user_input}, to=request.sid, namespace="/chat")
+    if user_input == "exit":
+        session_loops.close(request.sid)
+        return
+    session_loops.submit(request.sid, "user_input", user_input)
 
 
 def cleanup():
     """Tear things down on exit."""
     print("Bye!")
-    tear_down_conscious_assistant(conscious_session)
+    session_loops.close_all()
     socketio.stop()
 
 
@@ -87,6 +87,95 @@ def cruse(cruse_session, cruse_state_info, user_input):
     return last_chat_response, cruse_state_info
 
 
+def start_cruse_session(data=None):
+    """
+    Sets up the cruse session of one client, for the system named in a new_chat payload.
+
+    Parameters:
+        data (dict or str or None): A dictionary with a "system" key, the system name itself,
+            or None. Without a system name the first available system is used.
+
+    Returns:
+        tuple: (cruse_session, cruse_agent_state) for the client.
+
+    Raises:
+        ValueError: If no system was named and none is available.
+    """
+    if isinstance(data, dict):
+        selected_agent = data.get("system")
+    elif isinstance(data, str):
+        selected_agent = data
+    else:
+        selected_agent = None
+
+    # Fallback to default system if none was provided
+    if not selected_agent:
+        available_systems = get_available_systems()
+        selected_agent = available_systems[0] if available_systems else None
+
+    if not selected_agent:
+        raise ValueError("No available systems to initialize!")
+
+    print(f"Starting session... Selected agent is: {selected_agent}")
+    return set_up_cruse_assistant(selected_agent)
+
+
+def run_cruse_turn(state, events, emit):
+    """
+    Runs one cruse turn for one client and emits the response blocks to that client.
+
+    User input and GUI context that arrived together are sent to the agent as one turn,
+    the user input first.
+
+    Parameters:
+        state (tuple): The client's (cruse_session, cruse_agent_state).
+        events (list): The ClientEvents ("user_input" or "gui_context") since the last turn.
+        emit (callable): Sends (event name, payload) to the client.
+
+    Returns:
+        tuple: The updated (cruse_session, cruse_agent_state).
+    """
+    cruse_session, cruse_agent_state = state
+    user_input = "".join(event.data for event in events if event.kind == "user_input")
+    gui_context = "".join(str(event.data) for event in events if event.kind == "gui_context")
+
+    print(f"USER INPUT:{user_input}\n\nGUI CONTEXT:{gui_context}\n")
+    response, cruse_agent_state = cruse(cruse_session, cruse_agent_state, user_input + gui_context)
+    print(response)
+    response = response or ""
+
+    gui_to_emit = []
+    speeches_to_emit = []
+    blocks = parse_response_blocks(response)
+    for kind, content in blocks:
+        if not content:
+            continue
+        if kind == "gui":
+            gui_to_emit.append(content)
+        elif kind == "say":
+            speeches_to_emit.append(content)
+
+    # fallback if nothing was matched
+    if not blocks and response.strip():
+        speeches_to_emit.append(response.strip())
+
+    if gui_to_emit:
+        emit("update_gui", {"data": "\n".join(gui_to_emit)})
+    if speeches_to_emit:
+        emit("update_speech", {"data": "\n".join(speeches_to_emit)})
+
+    return cruse_session, cruse_agent_state
+
+
+def end_cruse_session(state):
+    """
+    Tears down the cruse session of one client.
+
+    :param state: The client's (cruse_session, cruse_agent_state).
+    """
+    tear_down_cruse_assistant(state[0])
+
+
 def tear_down_cruse_assistant(cruse_session):
     """Tear down the assistant.
 
@@ -0,0 +1,515 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Streaming, concurrent analysis of agent thinking logs.
+
+Log files (plain, rotated ``.1``/``.2`` and gzipped) are read incrementally, conversation
+entries are parsed in a process pool, and a bounded number of analysis requests are kept in
+flight at once. Every analyzed entry is recorded in a JSON-lines checkpoint keyed by a hash
+of its text, so a rerun only sends entries it has not analyzed yet. In follow mode the
+directory keeps being tailed for new lines and new (or rotated) files.
+
+    python -m apps.log_analyzer.streaming_log_analyzer --directory /tmp/agent_thinking --follow
+"""
+
+import copy
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from argparse import ArgumentParser
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from apps.log_analyzer.log_analyzer import AGENT_THINKING_LOGS_DIRECTORY
+from apps.log_analyzer.log_analyzer import extract_conversation_entries
+from apps.log_analyzer.log_analyzer import extract_system_prompt
+from apps.log_analyzer.log_analyzer import log_analyzer_agent
+from apps.log_analyzer.log_analyzer import set_up_log_analyzer
+from apps.log_analyzer.log_analyzer import tear_down_analysis_assistant
+
+logger = logging.getLogger(__name__)
+
+# "agent.log.3" / "agent.log.3.gz": larger rotation numbers are older files.
+ROTATION_SUFFIX_RE = re.compile(r"\.(\d+)(?:\.gz)?$")
+
+HUMAN_LABEL = "[HUMAN]"
+
+READ_BLOCK_BYTES = 1 << 16
+
+# (source file, system prompt, text of one or more conversation entries starting at [HUMAN])
+Chunk = Tuple[str, str, str]
+# (entry id, source file, text sent to the analyzer)
+Entry = Tuple[str, str, str]
+
+
+def entry_id(text: str) -> str:
+    """
+    Stable identity of one analysis input. Content-based rather than (file, offset)-based,
+    so the same entry read again from a rotated or gzipped copy is recognized.
+
+    :param text: The system prompt plus conversation entry sent to the analyzer
+    :return: Hex SHA-256 of the text
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def parse_chunks(chunks: List[Chunk]) -> List[Entry]:
+    """
+    Turn raw chunks into analysis inputs. Module-level so process-pool workers can run it.
+
+    :param chunks: Chunks as produced by LogFileTailer
+    :return: One (entry id, source, text) per non-empty conversation entry, in order
+    """
+    entries: List[Entry] = []
+    for source, system_prompt, chunk in chunks:
+        for log_entry in extract_conversation_entries(chunk):
+            if log_entry.strip():
+                text = system_prompt + " " + log_entry
+                entries.append((entry_id(text), source, text))
+    return entries
+
+
+class LogFileTailer:  # pylint: disable=too-many-instance-attributes,too-few-public-methods
+    """
+    Reads one log file incrementally and cuts it into chunks at each [HUMAN] label.
+
+    Everything before the first [HUMAN] is the file's preamble, from which the [SYSTEM]
+    prompt is extracted once. A chunk is released as soon as the next [HUMAN] starts (the
+    previous entry can no longer grow), or on flush at end of input. Plain files remember
+    their byte offset, so later polls only read appended data; a file that shrinks was
+    truncated in place and is read again from the start. Gzipped files are complete by
+    the time they exist and are streamed once.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Path of the log file
+        """
+        self.path: str = path
+        self.compressed: bool = path.endswith(".gz")
+        self.offset: int = 0
+        self.last_growth: float = time.monotonic()
+        self._exhausted: bool = False
+        self._partial: bytes = b""
+        self._preamble: List[str] = []
+        self._entry: List[str] = []
+        self._system_prompt: Optional[str] = None
+
+    def poll(self, flush: bool) -> Iterator[Chunk]:
+        """
+        Read whatever is new and yield the chunks it completes.
+
+        :param flush: Also release the trailing, possibly unfinished, chunk
+        :return: An iterator of (source, system prompt, chunk text)
+        """
+        for line in self._new_lines():
+            yield from self._feed(line)
+        if flush:
+            if self._partial:
+                yield from self._feed(self._partial.decode("utf-8", errors="replace"))
+                self._partial = b""
+            if self._entry:
+                yield (self.path, self._prompt(), "".join(self._entry))
+                self._entry = []
+
+    def _new_lines(self) -> Iterator[str]:
+        """Lines appended since the last poll; for gzip files, the whole stream exactly once."""
+        if self.compressed:
+            if self._exhausted:
+                return
+            self._exhausted = True
+            with gzip.open(self.path, "rt", encoding="utf-8", errors="replace") as log_file:
+                yield from log_file
+            return
+
+        try:
+            size = os.stat(self.path).st_size
+        except OSError:
+            return
+        if size < self.offset:
+            logger.info("%s shrank; reading it again from the start", self.path)
+            self.offset = 0
+            self._partial = b""
+            self._preamble, self._entry, self._system_prompt = [], [], None
+
+        with open(self.path, "rb") as log_file:
+            log_file.seek(self.offset)
+            while True:
+                block = log_file.read(READ_BLOCK_BYTES)
+                if not block:
+                    break
+                self.offset += len(block)
+                self.last_growth = time.monotonic()
+                lines = (self._partial + block).split(b"\n")
+                # The last piece has no newline yet; it may still be growing.
+                self._partial = lines.pop()
+                for raw_line in lines:
+                    yield raw_line.decode("utf-8", errors="replace") + "\n"
+
+    def _feed(self, line: str) -> Iterator[Chunk]:
+        """Route one line to the preamble or the current entry, releasing entries at each [HUMAN]."""
+        pieces = line.split(HUMAN_LABEL)
+        self._append(pieces[0])
+        for piece in pieces[1:]:
+            # A [HUMAN] label starts a new entry, so the previous one can no longer grow.
+            if self._system_prompt is None:
+                self._system_prompt = self._prompt()
+            elif self._entry:
+                yield (self.path, self._system_prompt, "".join(self._entry))
+            self._entry = [HUMAN_LABEL + piece]
+
+    def _append(self, text: str) -> None:
+        if text:
+            (self._preamble if self._system_prompt is None else self._entry).append(text)
+
+    def _prompt(self) -> str:
+        """The [SYSTEM] prompt of this file, extracted once from its preamble."""
+        if self._system_prompt is None:
+            return extract_system_prompt("".join(self._preamble))
+        return self._system_prompt
+
+
+class AnalysisCheckpoint:
+    """
+    Append-only JSON-lines record of analyzed entries: one ``{"id", "source", "analysis"}``
+    object per line, flushed as each analysis completes so an interrupted run loses nothing
+    it already paid for. A torn final line (from a crash mid-write) is ignored on load.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Path of the checkpoint file; created on first write
+        """
+        self.path: str = path
+        self._lock = threading.Lock()
+        self._done: Set[str] = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as checkpoint_file:
+                for line in checkpoint_file:
+                    try:
+                        self._done.add(json.loads(line)["id"])
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        continue
+
+    def __contains__(self, an_entry_id: str) -> bool:
+        return an_entry_id in self._done
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def record(self, an_entry_id: str, source: str, analysis: Any) -> None:
+        """
+        Mark one entry analyzed.
+
+        :param an_entry_id: The entry's id
+        :param source: The file the entry was read from
+        :param analysis: The analyzer's response
+        """
+        line = json.dumps({"id": an_entry_id, "source": source, "analysis": analysis}, default=str)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as checkpoint_file:
+                checkpoint_file.write(line + "\n")
+            self._done.add(an_entry_id)
+
+
+@dataclass
+class AnalysisStats:
+    """Counters for one run of the streaming analyzer."""
+
+    files: int = 0
+    entries: int = 0
+    skipped: int = 0
+    analyzed: int = 0
+    failed: int = 0
+
+
+class AgentAnalysisSessions:
+    """
+    Analyzer callable backed by the log analysis agent network, safe to call from many threads.
+
+    Each worker thread lazily gets its own agent session. Each entry is analyzed in a fresh
+    conversation, so concurrent analyses never share (or race on) conversation state.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: List[Any] = []
+
+    def __call__(self, text: str) -> Any:
+        """
+        :param text: One analysis input
+        :return: The agent's response
+        """
+        if not hasattr(self._local, "session"):
+            self._local.session, self._local.thread_template = set_up_log_analyzer()
+            with self._lock:
+                self._sessions.append(self._local.session)
+        analysis, _ = log_analyzer_agent(self._local.session, copy.deepcopy(self._local.thread_template), text)
+        return analysis
+
+    def close(self) -> None:
+        """Tear down every session that was opened."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            tear_down_analysis_assistant(session)
+
+
+class StreamingLogAnalyzer:  # pylint: disable=too-many-instance-attributes,too-few-public-methods
+    """
+    Pipeline: tail files -> parse chunks in a process pool -> analyze with bounded concurrency.
+
+    Parsing is windowed (at most two batches per parse worker outstanding) and analysis
+    submission blocks once ``max_in_flight`` requests are running, so memory stays flat no
+    matter how large the logs are.
+    """
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        directory: str,
+        analyze: Callable[[str], Any],
+        checkpoint_path: str,
+        *,
+        max_in_flight: int = 4,
+        parse_workers: Optional[int] = None,
+        batch_size: int = 64,
+        follow: bool = False,
+        poll_interval: float = 2.0,
+        settle_seconds: Optional[float] = None,
+        on_result: Optional[Callable[[str, Any], None]] = None,
+    ):
+        """
+        :param directory: Directory holding the log files
+        :param analyze: Called with one analysis input, from up to ``max_in_flight`` threads at once
+        :param checkpoint_path: JSON-lines checkpoint file (see AnalysisCheckpoint)
+        :param max_in_flight: Maximum concurrent analysis requests
+        :param parse_workers: Parser processes; 0 parses in this process. Defaults to the CPU count.
+        :param batch_size: Chunks handed to a parser process at once
+        :param follow: Keep tailing the directory until stopped
+        :param poll_interval: Seconds between directory polls in follow mode
+        :param settle_seconds: In follow mode, how long a file must be idle before its trailing
+                entry is treated as complete. Defaults to twice the poll interval.
+        :param on_result: Called with (source, analysis) for each completed analysis. Defaults to print.
+        """
+        self.directory = directory
+        self.analyze = analyze
+        self.checkpoint = AnalysisCheckpoint(checkpoint_path)
+        self.max_in_flight = max(1, max_in_flight)
+        self.parse_workers = (os.cpu_count() or 1) if parse_workers is None else max(0, parse_workers)
+        self.batch_size = max(1, batch_size)
+        self.follow = follow
+        self.poll_interval = poll_interval
+        self.settle_seconds = settle_seconds if settle_seconds is not None else 2 * poll_interval
+        self.on_result = on_result or (lambda _source, analysis: print(analysis))
+        self.stats = AnalysisStats()
+        self._tailers: Dict[Tuple[int, int], LogFileTailer] = {}
+        self._in_flight: Dict[Future, Entry] = {}
+        self._pending_ids: Set[str] = set()
+
+    def run(self, stop: Optional[threading.Event] = None) -> AnalysisStats:
+        """
+        Analyze everything currently in the directory (and, in follow mode, everything that
+        arrives until ``stop`` is set).
+
+        :param stop: Event that ends follow mode; ignored otherwise
+        :return: Counters for this run
+        """
+        stop = stop or threading.Event()
+        parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers) if self.parse_workers else None
+        with ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="log-analysis") as call_pool:
+            try:
+                while True:
+                    final = not self.follow or stop.is_set()
+                    self._parse_and_dispatch(self._read_batches(final), parse_pool, call_pool)
+                    if final:
+                        break
+                    stop.wait(self.poll_interval)
+            finally:
+                self._drain(len(self._in_flight))
+                if parse_pool is not None:
+                    parse_pool.shutdown(cancel_futures=True)
+        return self.stats
+
+    def _parse_and_dispatch(
+        self,
+        batches: Iterator[List[Chunk]],
+        parse_pool: Optional[ProcessPoolExecutor],
+        call_pool: ThreadPoolExecutor,
+    ) -> None:
+        """Parse batches (in the pool when there is one) and dispatch their entries in order."""
+        if parse_pool is None:
+            for batch in batches:
+                self._dispatch(parse_chunks(batch), call_pool)
+            return
+        window: Deque[Future] = deque()
+        for batch in batches:
+            window.append(parse_pool.submit(parse_chunks, batch))
+            while len(window) >= 2 * self.parse_workers:
+                self._dispatch(window.popleft().result(), call_pool)
+        while window:
+            self._dispatch(window.popleft().result(), call_pool)
+
+    def _read_batches(self, final: bool) -> Iterator[List[Chunk]]:
+        """Poll every log file, oldest first, and group the chunks they release into batches."""
+        batch: List[Chunk] = []
+        now = time.monotonic()
+        for tailer in self._discover():
+            flush = final or now - tailer.last_growth >= self.settle_seconds
+            for chunk in tailer.poll(flush):
+                batch.append(chunk)
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    def _discover(self) -> List[LogFileTailer]:
+        """
+        Tailers for every log file now in the directory, oldest first.
+
+        Tailers are keyed by (device, inode), not by name, so a file renamed by rotation
+        keeps its read offset instead of being read again from the top.
+        """
+        found: List[Tuple[Tuple[int, float], LogFileTailer]] = []
+        seen: Set[Tuple[int, int]] = set()
+        checkpoint_path = os.path.abspath(self.checkpoint.path)
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith(".") or os.path.abspath(path) == checkpoint_path:
+                continue
+            try:
+                stat_result = os.stat(path)
+            except OSError:
+                continue
+            if not os.path.isfile(path):
+                continue
+            key = (stat_result.st_dev, stat_result.st_ino)
+            seen.add(key)
+            tailer = self._tailers.get(key)
+            if tailer is None:
+                tailer = self._tailers[key] = LogFileTailer(path)
+                self.stats.files += 1
+            tailer.path = path
+            rotation = ROTATION_SUFFIX_RE.search(name)
+            found.append(((-int(rotation.group(1)) if rotation else 0, stat_result.st_mtime), tailer))
+        # Forget deleted files, so a recycled inode is not mistaken for one already read.
+        for key in set(self._tailers) - seen:
+            del self._tailers[key]
+        return [tailer for _key, tailer in sorted(found, key=lambda item: item[0])]
+
+    def _dispatch(self, entries: List[Entry], call_pool: ThreadPoolExecutor) -> None:
+        """Submit entries not yet analyzed, blocking while ``max_in_flight`` requests are running."""
+        for entry in entries:
+            an_entry_id = entry[0]
+            self.stats.entries += 1
+            if an_entry_id in self.checkpoint or an_entry_id in self._pending_ids:
+                self.stats.skipped += 1
+                continue
+            if len(self._in_flight) >= self.max_in_flight:
+                self._drain(1)
+            self._pending_ids.add(an_entry_id)
+            self._in_flight[call_pool.submit(self.analyze, entry[2])] = entry
+
+    def _drain(self, count: int) -> None:
+        """Wait until at least ``count`` in-flight analyses finish, and record them."""
+        completed = 0
+        while self._in_flight and completed < count:
+            done, _ = wait(self._in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                an_entry_id, source, _text = self._in_flight.pop(future)
+                self._pending_ids.discard(an_entry_id)
+                completed += 1
+                try:
+                    analysis = future.result()
+                except Exception as exception:  # pylint: disable=broad-exception-caught
+                    # Not checkpointed, so the next run retries it.
+                    self.stats.failed += 1
+                    logger.warning("Analysis of an entry from %s failed: %s", source, exception)
+                    continue
+                self.checkpoint.record(an_entry_id, source, analysis)
+                self.stats.analyzed += 1
+                self.on_result(source, analysis)
+
+
+def main():
+    """
+    Analyze a directory of agent thinking logs with the streaming pipeline.
+
+    Entries already recorded in the checkpoint are skipped, so rerunning after an
+    interruption (or on a directory that has since grown) only analyzes new entries.
+    """
+    parser = ArgumentParser(description="Analyze agent thinking logs with the log analysis agent network.")
+    parser.add_argument("--directory", default=AGENT_THINKING_LOGS_DIRECTORY, help="Directory holding the logs.")
+    parser.add_argument(
+        "--checkpoint",
+        default="log_analyzer_checkpoint.jsonl",
+        help="JSON-lines file recording analyzed entries and their analyses.",
+    )
+    parser.add_argument("--max-in-flight", type=int, default=4, help="Maximum concurrent analysis requests.")
+    parser.add_argument(
+        "--parse-workers", type=int, default=None, help="Parser processes (0 parses in-process). Default: CPU count."
+    )
+    parser.add_argument("--follow", action="store_true", help="Keep tailing the directory for new log lines.")
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="Seconds between polls with --follow.")
+    args = parser.parse_args()
+
+    sessions = AgentAnalysisSessions()
+    analyzer = StreamingLogAnalyzer(
+        args.directory,
+        sessions,
+        args.checkpoint,
+        max_in_flight=args.max_in_flight,
+        parse_workers=args.parse_workers,
+        follow=args.follow,
+        poll_interval=args.poll_interval,
+    )
+    try:
+        stats = analyzer.run()
+    except KeyboardInterrupt:
+        # run() has already waited for (and checkpointed) the requests that were in flight.
+        stats = analyzer.stats
+    finally:
+        sessions.close()
+    print(
+        f"{stats.files} file(s), {stats.entries} entries: {stats.analyzed} analyzed, "
+        f"{stats.skipped} already done, {stats.failed} failed."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""One agent loop per connected Socket.IO client, woken by that client's events rather than a polling timer.
+
+Each client (Socket.IO session id) gets a worker thread that blocks on its own inbox. Socket handlers
+put the client's events there; the worker drains whatever has arrived, runs one agent turn on it and
+emits the response to that client only. Each worker owns its agent session, so browser tabs do not
+share conversation state, and a worker that hears nothing for idle_timeout seconds tears its session
+down and exits; the client's next event starts a fresh one.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+# Event kind that replaces the client's agent session; its data is passed to start_session.
+NEW_CHAT = "new_chat"
+
+# Sends one Socket.IO event to one client: (event name, payload, session id).
+Emit = Callable[[str, dict, str], None]
+
+# Starts an agent session from the NEW_CHAT data (None for the default) and returns its state.
+StartSession = Callable[[Any], Any]
+
+# Runs one agent turn: (session state, events since the last turn, emit to this client) -> new state.
+RunTurn = Callable[[Any, List["ClientEvent"], Callable[[str, dict], None]], Any]
+
+_STOP = object()
+
+
+@dataclass
+class ClientEvent:
+    """One event from a client, e.g. ("user_input", "hello") or ("gui_context", {...})."""
+
+    kind: str
+    data: Any
+
+
+@dataclass
+class ClientLoop:
+    """The worker serving one client."""
+
+    sid: str
+    inbox: "queue.Queue[Any]" = field(default_factory=queue.Queue)
+    finished: threading.Event = field(default_factory=threading.Event)
+    thread: Optional[threading.Thread] = None
+    state: Any = None
+    started: bool = False
+
+
+class SocketSessionLoops:  # pylint: disable=too-many-instance-attributes
+    """Starts, feeds and retires the per-client agent loops of a Socket.IO app."""
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        start_session: StartSession,
+        run_turn: RunTurn,
+        end_session: Callable[[Any], None],
+        emit: Emit,
+        *,
+        idle_timeout: float = 1800.0,
+        tick_interval: Optional[float] = None,
+        coalesce_seconds: float = 0.05,
+    ):
+        """Initialize the loops.
+
+        Args:
+            start_session: Creates a client's agent session; called on the worker thread before its first
+                turn, and again for each NEW_CHAT.
+            run_turn: Runs one agent turn and emits its output; called on the worker thread.
+            end_session: Tears a session down when its client leaves, idles out or starts a new chat.
+            emit: Sends an event to one client.
+            idle_timeout: Seconds without client events after which a worker ends its session.
+            tick_interval: If set, run_turn is also called with no events whenever the client has been
+                quiet this long, for agents that keep thinking between user turns.
+            coalesce_seconds: How long a woken worker waits for further events before running its turn,
+                so events a client sends back to back (user input, then GUI context) make one turn.
+        """
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self.start_session = start_session
+        self.run_turn = run_turn
+        self.end_session = end_session
+        self.emit = emit
+        self.idle_timeout = idle_timeout
+        self.tick_interval = tick_interval
+        self.coalesce_seconds = coalesce_seconds
+        self._loops: Dict[str, ClientLoop] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def active_sids(self) -> List[str]:
+        """Session ids of the clients that currently have a worker."""
+        with self._lock:
+            return list(self._loops)
+
+    def open(self, sid: str) -> None:
+        """Start the worker for *sid* if it has none, e.g. when the client connects."""
+        with self._lock:
+            self._get_or_start(sid)
+
+    def submit(self, sid: str, kind: str, data: Any) -> None:
+        """Hand one event from client *sid* to its worker, starting the worker if needed."""
+        with self._lock:
+            self._get_or_start(sid).inbox.put(ClientEvent(kind, data))
+
+    def close(self, sid: str) -> None:
+        """Stop the worker for *sid*, e.g. when the client disconnects. Its session is torn down."""
+        with self._lock:
+            loop = self._loops.pop(sid, None)
+        if loop is not None:
+            loop.inbox.put(_STOP)
+
+    def close_all(self, timeout: float = 10.0) -> None:
+        """Stop every worker and wait up to *timeout* seconds in total for their sessions to be torn down."""
+        with self._lock:
+            loops = list(self._loops.values())
+            self._loops.clear()
+        for loop in loops:
+            loop.inbox.put(_STOP)
+        deadline = time.monotonic() + timeout
+        for loop in loops:
+            loop.finished.wait(max(0.0, deadline - time.monotonic()))
+
+    def _get_or_start(self, sid: str) -> ClientLoop:
+        """The worker for *sid*, started if missing. Call with the lock held."""
+        loop = self._loops.get(sid)
+        if loop is None:
+            loop = ClientLoop(sid)
+            loop.thread = threading.Thread(target=self._serve, args=(loop,), name=f"session-loop-{sid}", daemon=True)
+            self._loops[sid] = loop
+            loop.thread.start()
+        return loop
+
+    def _serve(self, loop: ClientLoop) -> None:
+        """The worker: wait for events and run a turn per batch, until stopped or idle."""
+        try:
+            if self.tick_interval is not None:
+                self._turn(loop, [])
+            idle_deadline = time.monotonic() + self.idle_timeout
+            while True:
+                wait = idle_deadline - time.monotonic()
+                if self.tick_interval is not None:
+                    wait = min(wait, self.tick_interval)
+                try:
+                    item = loop.inbox.get(timeout=max(0.0, wait))
+                except queue.Empty:
+                    if time.monotonic() >= idle_deadline and self._retire_if_idle(loop):
+                        self._logger.info("Ending idle session for client %s", loop.sid)
+                        return
+                    if self.tick_interval is not None:
+                        self._turn(loop, [])
+                    continue
+
+                items = [item] + self._collect(loop.inbox, self.coalesce_seconds)
+                if any(entry is _STOP for entry in items):
+                    return
+                self._handle(loop, items)
+                idle_deadline = time.monotonic() + self.idle_timeout
+        except Exception:  # pylint: disable=broad-exception-caught
+            self._logger.exception("Session loop for client %s failed", loop.sid)
+        finally:
+            with self._lock:
+                if self._loops.get(loop.sid) is loop:
+                    del self._loops[loop.sid]
+            self._end(loop)
+            loop.finished.set()
+
+    def _handle(self, loop: ClientLoop, events: List[ClientEvent]) -> None:
+        """Run one turn on the events that arrived together; a NEW_CHAT starts a fresh session midway."""
+        pending: List[ClientEvent] = []
+        for event in events:
+            if event.kind != NEW_CHAT:
+                pending.append(event)
+                continue
+            if pending:
+                self._turn(loop, pending)
+                pending = []
+            self._end(loop)
+            loop.state = self.start_session(event.data)
+            loop.started = True
+        if pending:
+            self._turn(loop, pending)
+
+    def _turn(self, loop: ClientLoop, events: List[ClientEvent]) -> None:
+        """Run one agent turn, starting the default session first if there is none yet.
+
+        A failed turn is logged and leaves the session as it was.
+        """
+        if not loop.started:
+            loop.state = self.start_session(None)
+            loop.started = True
+        try:
+            loop.state = self.run_turn(loop.state, events, lambda name, payload: self.emit(name, payload, loop.sid))
+        except Exception:  # pylint: disable=broad-exception-caught
+            self._logger.exception("Agent turn for client %s failed", loop.sid)
+
+    def _end(self, loop: ClientLoop) -> None:
+        """Tear down the client's session, if it has one."""
+        if not loop.started:
+            return
+        loop.started = False
+        try:
+            self.end_session(loop.state)
+        except Exception:  # pylint: disable=broad-exception-caught
+            self._logger.exception("Tearing down the session of client %s failed", loop.sid)
+
+    def _retire_if_idle(self, loop: ClientLoop) -> bool:
+        """Unregister *loop* unless an event arrived meanwhile; submit() then starts a new worker."""
+        with self._lock:
+            if not loop.inbox.empty():
+                return False
+            if self._loops.get(loop.sid) is loop:
+                del self._loops[loop.sid]
+            return True
+
+    @staticmethod
+    def _collect(inbox: "queue.Queue[Any]", seconds: float) -> List[Any]:
+        """Everything that reaches *inbox* within the next *seconds*."""
+        items = []
+        deadline = time.monotonic() + seconds
+        while True:
+            try:
+                items.append(inbox.get(timeout=max(0.0, deadline - time.monotonic())))
+            except queue.Empty:
+                return items
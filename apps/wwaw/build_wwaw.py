@@ -15,14 +15,18 @@
 # END COPYRIGHT
 
 from argparse import ArgumentParser
+from argparse import Namespace
 from hashlib import md5
 from os import makedirs
+from pathlib import Path
 from random import choices
 from random import uniform
 from re import sub
 from string import ascii_lowercase
 from string import digits
 from time import sleep
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -30,6 +34,9 @@ from urllib.parse import urljoin
 from urllib.parse import urlparse
 
 from bs4 import BeautifulSoup
+from crawl_engine import AsyncCrawlEngine
+from crawl_engine import CrawledPage
+from crawl_engine import normalize_url
 from hocon_constants import HOCON_HEADER_REMAINDER
 from hocon_constants import HOCON_HEADER_START
 from hocon_constants import LEAF_NODE_AGENT_TEMPLATE
@@ -228,9 +235,14 @@ class WebAgentNetworkBuilder:
         Returns:
             str: A clean, unique agent name suitable for use as an identifier.
         """
+        return self._agent_name_from_title(url, _extract_title_from_html(html), existing_names)
+
+    def _agent_name_from_title(self, url: str, title: str, existing_names: Optional[set] = None) -> str:
+        """
+        The body of get_clean_agent_name, for callers that have already extracted the page title.
+        """
         if existing_names is None:
             existing_names = set()
-        title = _extract_title_from_html(html)
 
         # If no title is found, fall back to using the URL path or netloc for the agent name
         if not title:
@@ -281,38 +293,58 @@ class WebAgentNetworkBuilder:
 
         return base
 
-    def _process_page(
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def _add_page_agent(
         self,
         url: str,
         parent_name: Optional[str],
-        resp,
-        visited: set,
+        is_top: bool,
+        text: str,
+        title: str,
         existing_names: set,
         agents: dict,
-        count: int,
-        to_visit: List[Tuple[str, Optional[str]]],
-        base_domain: str,
-    ) -> int:
-        text = clean_and_extract_text(resp.text)
+    ) -> Optional[str]:
+        """
+        Turns the cleaned text of one page into an agent and links it under its parent.
+
+        Returns:
+            Optional[str]: The new agent's name, or None if the page is too light to become an agent.
+        """
         if len(text) < self.MIN_PAGE_LEN:
-            return count  # Skip light pages
+            return None
 
-        name = self.get_clean_agent_name(url, resp.text, existing_names)
+        name = self._agent_name_from_title(url, title, existing_names)
         existing_names.add(name)
         clean_text = (
             text[: self.PAGE_LEN_MAX].replace('"', "").replace("'", "").encode("ascii", errors="ignore").decode()
         )
         instructions = f"{self.AGENT_INSTRUCTION_PREFACE}\n\n{clean_text}".replace('"""', "").replace('"', "")
 
-        if parent_name is None:
-            is_top = "true"
+        if is_top:
             self.top_agent_name = name
-        else:
-            is_top = "false"
-        self.add_agent(agents, name, instructions, [], is_top)
+        self.add_agent(agents, name, instructions, [], "true" if is_top else "false")
 
         if parent_name and parent_name in agents and name != parent_name:
             agents[parent_name].get("down_chains", []).append(name)
+        return name
+
+    def _process_page(
+        self,
+        url: str,
+        parent_name: Optional[str],
+        resp,
+        visited: set,
+        existing_names: set,
+        agents: dict,
+        count: int,
+        to_visit: List[Tuple[str, Optional[str]]],
+        base_domain: str,
+    ) -> int:
+        text = clean_and_extract_text(resp.text)
+        title = _extract_title_from_html(resp.text)
+        name = self._add_page_agent(url, parent_name, parent_name is None, text, title, existing_names, agents)
+        if name is None:
+            return count  # Skip light pages
 
         visited.add(url)
 
@@ -348,10 +380,7 @@ class WebAgentNetworkBuilder:
         visited = set()
         to_visit: List[Tuple[str, Optional[str]]] = [(start_url, None)]
         count = 0
-        # Use tldextract to isolate the registered domain and suffix (e.g., 'example.com') from the URL.
-        # This helps in determining whether a link is internal to the site, which is important for focused crawling.
-        domain_info = extract(start_url)
-        base_domain = f"{domain_info.domain}.{domain_info.suffix}"
+        base_domain = get_base_domain(start_url)
         existing_names = set()
 
         while to_visit and count < max_agents:
@@ -380,8 +409,59 @@ class WebAgentNetworkBuilder:
         print(f"Generated {count} agents with real content.")
         return agents
 
+    def crawl_concurrent(self, start_url: str, max_agents: int, engine: AsyncCrawlEngine, resume: bool = False):
+        """
+        Builds the same agent hierarchy as `crawl`, but fetches pages concurrently through `engine`.
+
+        The engine takes care of the frontier, per-host rate limits, robots.txt, sitemaps, conditional
+        re-fetches and checkpoints, and parses pages in its worker pool with `extract_page`. Pages are
+        turned into agents here, in the order they complete.
+
+        Args:
+            start_url (str): The root URL to begin crawling from.
+            max_agents (int): Maximum number of agents (pages) to generate.
+            engine (AsyncCrawlEngine): The configured crawl engine.
+            resume (bool): Continue an interrupted crawl from the engine's checkpoint.
+
+        Returns:
+            dict: The agent hierarchy, in the same shape `crawl` returns.
+        """
+        agents = {}
+        existing_names = set()
+        names_by_url = {}
+        base_domain = get_base_domain(start_url)
+
+        def on_page(page: CrawledPage) -> bool:
+            try:
+                name = self._add_page_agent(
+                    page.url,
+                    names_by_url.get(page.parent_url),
+                    page.parent_url is None,
+                    page.text,
+                    page.title,
+                    existing_names,
+                    agents,
+                )
+            except ValueError as e:
+                print(f"Skipping {page.url} due to error: {str(e)}")
+                return False
+            if name is None:
+                return False  # Skip light pages
+            names_by_url[page.url] = name
+            return True
+
+        stats = engine.crawl(start_url, max_agents, on_page, lambda link: is_valid_url(link, base_domain), resume)
+
+        print(
+            f"Generated {stats.accepted} agents with real content "
+            f"({stats.fetched} fetched, {stats.not_modified} not modified, {stats.resumed} resumed, "
+            f"{stats.robots_blocked} blocked by robots.txt, {stats.errors} errors)."
+        )
+        return agents
+
     @classmethod
-    def main(cls):
+    def argument_parser(cls) -> ArgumentParser:
+        """The command line options, with the class attributes as defaults."""
         parser = ArgumentParser(description="Generate a hierarchy of web agents.")
         parser.add_argument(
             "--total_agents",
@@ -428,23 +508,55 @@ class WebAgentNetworkBuilder:
             default=0.0,
             help="Average delay (in seconds) between page requests to be polite to servers (default: 0.0)",
         )
+        parser.add_argument(
+            "--sequential",
+            action="store_true",
+            help="Use the original one-page-at-a-time crawl instead of the concurrent crawl engine",
+        )
+        parser.add_argument(
+            "--concurrency", type=int, default=8, help="Maximum number of requests in flight (default: 8)"
+        )
+        parser.add_argument(
+            "--max_per_host", type=int, default=4, help="Maximum number of requests in flight per host (default: 4)"
+        )
+        parser.add_argument(
+            "--parse_workers",
+            type=int,
+            default=None,
+            help="Worker processes for HTML text extraction (default: CPU count, 0 parses in a thread)",
+        )
+        parser.add_argument("--ignore_robots", action="store_true", help="Do not honour robots.txt")
+        parser.add_argument("--sitemap", action="store_true", help="Seed the crawl from the site's sitemaps")
+        parser.add_argument(
+            "--checkpoint",
+            type=str,
+            default=None,
+            help="JSON checkpoint file; pages in it are re-fetched conditionally using their stored ETags",
+        )
+        parser.add_argument(
+            "--resume", action="store_true", help="Resume an interrupted crawl from the --checkpoint file"
+        )
+        return parser
+
+    def crawl_from_args(self, args: Namespace):
+        """Crawl with the sequential crawler or the concurrent engine, as the command line asks."""
+        self.politeness_delay = args.politeness_delay
+        if args.sequential:
+            return self.crawl(args.start_url, args.total_agents)
+        engine = AsyncCrawlEngine(
+            extract_page,
+            concurrency=args.concurrency,
+            max_per_host=args.max_per_host,
+            politeness_delay=args.politeness_delay,
+            respect_robots=not args.ignore_robots,
+            use_sitemaps=args.sitemap,
+            checkpoint_path=args.checkpoint,
+            parse_workers=args.parse_workers,
+        )
+        return self.crawl_concurrent(args.start_url, args.total_agents, engine, resume=args.resume)
 
-        args = parser.parse_args()
-
-        # Dynamically set class attributes based on command-line arguments
-        cls.MAX_CHILDREN = args.max_children
-        cls.MAX_NAME_LEN = args.max_name_len
-        cls.PAGE_LEN_MAX = args.page_len_max
-        cls.MIN_PAGE_LEN = args.min_page_len
-
-        the_start_url = args.start_url
-        the_total_agents = args.total_agents
-        the_agent_network_name = args.agent_network_name
-
-        builder = cls()
-        builder.politeness_delay = args.politeness_delay
-        the_agents = builder.crawl(the_start_url, the_total_agents)
-        the_agents = builder.enforce_fanout_recursive(the_agents, max_children=cls.MAX_CHILDREN)
+    def link_unlinked_agents(self, the_agents: Dict[str, Any]):
+        """Hangs agents nothing points to under one hub below the top agent, and strips self-references."""
         the_linked = set()
         for an_agnt in the_agents.values():
             the_linked.update(an_agnt.get("down_chains", []))
@@ -458,7 +570,7 @@ class WebAgentNetworkBuilder:
             the_hub_name = "unlinked_hub"
             # only create once
             if the_hub_name not in the_agents:
-                builder.add_agent(
+                self.add_agent(
                     the_agents, the_hub_name, "You connect otherwise unlinked agents.", the_unlinked, "false"
                 )
 
@@ -476,12 +588,28 @@ class WebAgentNetworkBuilder:
         for name, data in the_agents.items():
             data["down_chains"] = [child for child in data.get("down_chains", []) if child != name]
 
+    @classmethod
+    def main(cls):
+        """Crawl the site given on the command line and write its agent network HOCON."""
+        args = cls.argument_parser().parse_args()
+
+        # Dynamically set class attributes based on command-line arguments
+        cls.MAX_CHILDREN = args.max_children
+        cls.MAX_NAME_LEN = args.max_name_len
+        cls.PAGE_LEN_MAX = args.page_len_max
+        cls.MIN_PAGE_LEN = args.min_page_len
+
+        the_agent_network_name = args.agent_network_name
+
+        builder = cls()
+        the_agents = builder.crawl_from_args(args)
+        the_agents = builder.enforce_fanout_recursive(the_agents, max_children=cls.MAX_CHILDREN)
+        builder.link_unlinked_agents(the_agents)
+
         # now generate HOCON
         hocon = get_agent_network_hocon(the_agents, the_agent_network_name)
 
         # Write the agent network file
-        from pathlib import Path
-
         file_path = Path(cls.OUTPUT_PATH) / f"{the_agent_network_name}.hocon"
         # Ensure the directory exists
         makedirs(file_path.parent, exist_ok=True)
@@ -491,6 +619,25 @@ class WebAgentNetworkBuilder:
         print("\nDone!\n")
 
 
+def get_base_domain(url: str) -> str:
+    """
+    Isolates the registered domain and suffix (e.g., 'example.com') of a URL with tldextract.
+
+    This helps in determining whether a link is internal to the site, which is important for focused crawling.
+    Hosts without a public suffix (e.g. 'localhost' or an IP address) are used as they are.
+
+    Args:
+        url (str): The URL whose domain to isolate.
+
+    Returns:
+        str: The base domain that internal links must contain.
+    """
+    domain_info = extract(url)
+    if not domain_info.suffix:
+        return domain_info.domain
+    return f"{domain_info.domain}.{domain_info.suffix}"
+
+
 def is_valid_url(link, base_domain):
     """
     Determines whether a given link is a valid internal HTTP/HTTPS URL within the specified base domain.
@@ -549,6 +696,28 @@ def clean_and_extract_text(html):
     return clean_text.strip()
 
 
+def extract_page(html: str, url: str) -> Tuple[str, str, List[str]]:
+    """
+    Parses one page for the concurrent crawl: its title, its cleaned text and the absolute URLs it links to.
+
+    Runs in the crawl engine's worker processes, so it must stay a picklable top-level function.
+
+    Args:
+        html (str): Raw HTML content of a web page.
+        url (str): The page URL, used to resolve relative links.
+
+    Returns:
+        Tuple[str, str, List[str]]: The title, the cleaned text and the page's links, without fragments.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    links = []
+    for a in soup.find_all("a", href=True):
+        link = normalize_url(urljoin(url, a["href"]))
+        if link not in links:
+            links.append(link)
+    return _extract_title_from_html(html), clean_and_extract_text(html), links
+
+
 def _extract_title_from_html(html: str) -> str:
     """
     Extracts the title from the given HTML content using BeautifulSoup.
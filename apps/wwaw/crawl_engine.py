@@ -0,0 +1,559 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Concurrent, polite crawl engine for the WWAW builder.
+
+The engine only fetches and schedules. Pages come off a frontier ordered by link depth, requests run
+with bounded concurrency and a per-host rate limit, robots.txt is honoured, and sitemaps can seed the
+frontier. Pages seen by an earlier crawl are re-fetched conditionally using their stored ETag and
+Last-Modified validators. A JSON checkpoint lets an interrupted crawl resume where it stopped.
+
+HTML parsing is CPU bound and runs in a process pool through a caller-supplied `extract` function.
+Deciding what a page becomes (an agent, or nothing) stays with the caller through `on_page`.
+"""
+
+import asyncio
+import gzip
+import json
+from collections import deque
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import replace
+from heapq import heappop
+from heapq import heappush
+from itertools import count
+from multiprocessing import get_context
+from os import cpu_count
+from os import replace as replace_file
+from random import uniform
+from typing import AsyncIterator
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from urllib.parse import urldefrag
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import ParseError
+from xml.etree.ElementTree import fromstring
+
+from aiohttp import ClientError
+from aiohttp import ClientSession
+from aiohttp import ClientTimeout
+from aiohttp import TCPConnector
+
+USER_AGENT = "neuro-san-wwaw"
+
+# Upper bound on sitemap documents (including nested sitemap indexes) read to seed one crawl
+MAX_SITEMAP_FILES = 50
+
+# Signature of the page parser run in the worker pool: (html, url) -> (title, text, absolute links)
+Extractor = Callable[[str, str], Tuple[str, str, List[str]]]
+
+
+def normalize_url(url: str) -> str:
+    """
+    Drops the #fragment from a URL, so in-page anchors do not count as separate pages.
+
+    Args:
+        url (str): An absolute URL.
+
+    Returns:
+        str: The URL without its fragment.
+    """
+    return urldefrag(url)[0]
+
+
+@dataclass
+class CrawledPage:  # pylint: disable=too-many-instance-attributes
+    """One fetched page, with the validators needed to re-fetch it conditionally."""
+
+    url: str
+    parent_url: Optional[str]
+    depth: int
+    title: str = ""
+    text: str = ""
+    links: List[str] = field(default_factory=list)
+    etag: str = ""
+    last_modified: str = ""
+    accepted: bool = False
+
+
+@dataclass
+class CrawlStats:
+    """Counters reported at the end of a crawl."""
+
+    accepted: int = 0
+    fetched: int = 0
+    not_modified: int = 0
+    resumed: int = 0
+    robots_blocked: int = 0
+    errors: int = 0
+
+
+class CrawlFrontier:
+    """
+    Priority frontier: shallower pages first, then discovery order. Each URL is queued at most once,
+    which replaces the O(n) `list.pop(0)` and queued-URL scan of the sequential crawl.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[int, int, str, Optional[str]]] = []
+        self._seen: Set[str] = set()
+        self._order = count()
+
+    def push(self, url: str, parent_url: Optional[str], depth: int) -> bool:
+        """
+        Queues a URL unless it has been queued or seen before.
+
+        Returns:
+            bool: True if the URL was queued.
+        """
+        url = normalize_url(url)
+        if url in self._seen:
+            return False
+        self._seen.add(url)
+        heappush(self._heap, (depth, next(self._order), url, parent_url))
+        return True
+
+    def pop(self) -> Tuple[str, Optional[str], int]:
+        """
+        Returns:
+            Tuple[str, Optional[str], int]: The next (url, parent_url, depth) to fetch.
+        """
+        depth, _, url, parent_url = heappop(self._heap)
+        return url, parent_url, depth
+
+    def mark_seen(self, url: str) -> None:
+        """Records a URL as already handled so it is never queued."""
+        self._seen.add(normalize_url(url))
+
+    def pending(self) -> List[Tuple[str, Optional[str], int]]:
+        """
+        Returns:
+            List[Tuple[str, Optional[str], int]]: The queued (url, parent_url, depth) entries in pop order.
+        """
+        return [(url, parent_url, depth) for depth, _, url, parent_url in sorted(self._heap)]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class HostRateLimiter:  # pylint: disable=too-few-public-methods
+    """Caps concurrent requests per host and spaces the start of requests to one host by a jittered delay."""
+
+    def __init__(self, max_per_host: int, delay: float):
+        self.max_per_host = max_per_host
+        self.delay = delay
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._next_start: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str, min_delay: float = 0.0) -> AsyncIterator[None]:
+        """
+        Holds one of the host's request slots for the duration of the block.
+
+        Args:
+            host (str): The host (netloc) being requested.
+            min_delay (float): A floor for the delay, e.g. the host's robots.txt Crawl-delay.
+        """
+        semaphore = self._slots.setdefault(host, asyncio.Semaphore(self.max_per_host))
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        delay = max(self.delay, min_delay)
+        async with semaphore:
+            if delay > 0:
+                async with lock:
+                    loop = asyncio.get_running_loop()
+                    wait = self._next_start.get(host, 0.0) - loop.time()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    self._next_start[host] = loop.time() + uniform(delay * 0.75, delay * 1.25)
+            yield
+
+
+class RobotsPolicy:
+    """robots.txt rules, fetched once per origin on first use."""
+
+    def __init__(self, session: ClientSession, user_agent: str, enabled: bool = True):
+        self.session = session
+        self.user_agent = user_agent
+        self.enabled = enabled
+        self._parsers: Dict[str, RobotFileParser] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def parser_for(self, url: str) -> RobotFileParser:
+        """
+        Returns:
+            RobotFileParser: The parsed robots.txt for the URL's origin.
+        """
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        if origin not in self._parsers:
+            async with self._locks.setdefault(origin, asyncio.Lock()):
+                if origin not in self._parsers:
+                    self._parsers[origin] = await self._fetch(origin)
+        return self._parsers[origin]
+
+    async def _fetch(self, origin: str) -> RobotFileParser:
+        parser = RobotFileParser(f"{origin}/robots.txt")
+        if not self.enabled:
+            parser.allow_all = True
+            return parser
+        try:
+            async with self.session.get(parser.url) as resp:
+                if resp.status >= 500:
+                    # RFC 9309: an unreachable robots.txt means the whole site is off limits for now
+                    parser.disallow_all = True
+                elif resp.status >= 400:
+                    parser.allow_all = True
+                else:
+                    parser.parse((await resp.text(errors="replace")).splitlines())
+        except (ClientError, asyncio.TimeoutError):
+            parser.allow_all = True
+        return parser
+
+    async def allowed(self, url: str) -> bool:
+        """Whether robots.txt lets this crawler fetch the URL."""
+        return (await self.parser_for(url)).can_fetch(self.user_agent, url)
+
+    async def crawl_delay(self, url: str) -> float:
+        """The Crawl-delay requested for this crawler on the URL's origin, or 0."""
+        delay = (await self.parser_for(url)).crawl_delay(self.user_agent)
+        return float(delay) if delay else 0.0
+
+    async def sitemaps(self, url: str) -> List[str]:
+        """The Sitemap URLs listed in the origin's robots.txt."""
+        return list((await self.parser_for(url)).site_maps() or [])
+
+
+class CrawlCheckpoint:
+    """JSON snapshot of a crawl: the pages fetched so far, with their validators and content, and the frontier."""
+
+    VERSION = 1
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self, start_url: str) -> Tuple[List[CrawledPage], List[Tuple[str, Optional[str], int]], bool]:
+        """
+        Reads the checkpoint written for the same start URL.
+
+        Returns:
+            Tuple: (pages, frontier, complete). An absent, foreign or unreadable checkpoint
+            reads as a completed crawl with no pages.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if data.get("version") != self.VERSION or data.get("start_url") != start_url:
+                return [], [], True
+            pages = [CrawledPage(**page) for page in data["pages"]]
+            frontier = [tuple(entry) for entry in data["frontier"]]
+            return pages, frontier, bool(data["complete"])
+        except FileNotFoundError:
+            return [], [], True
+        except (OSError, ValueError, TypeError, KeyError) as exc:
+            print(f"Ignoring unreadable crawl checkpoint {self.path}: {exc}")
+            return [], [], True
+
+    def save(
+        self,
+        start_url: str,
+        pages: List[CrawledPage],
+        frontier: List[Tuple[str, Optional[str], int]],
+        complete: bool,
+    ) -> None:
+        """Atomically replaces the checkpoint file."""
+        data = {
+            "version": self.VERSION,
+            "start_url": start_url,
+            "complete": complete,
+            "pages": [asdict(page) for page in pages],
+            "frontier": [list(entry) for entry in frontier],
+        }
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        replace_file(temp_path, self.path)
+
+
+@dataclass
+class _FetchContext:
+    """What every page fetch of one crawl shares."""
+
+    session: ClientSession
+    robots: RobotsPolicy
+    limiter: HostRateLimiter
+    pool: Optional[Executor]
+    stats: CrawlStats
+
+
+# pylint: disable-next=too-many-instance-attributes
+class AsyncCrawlEngine:
+    """
+    Fetches pages with asyncio and aiohttp and hands each one to `on_page` in completion order.
+
+    A page's links are only followed when `on_page` accepts it, and a child is only discovered after
+    its parent has been handed over, so parents are always processed before their children.
+    """
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        extract: Extractor,
+        *,
+        concurrency: int = 8,
+        max_per_host: int = 4,
+        politeness_delay: float = 0.0,
+        respect_robots: bool = True,
+        use_sitemaps: bool = False,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every: int = 25,
+        parse_workers: Optional[int] = None,
+        timeout: float = 10.0,
+        user_agent: str = USER_AGENT,
+    ):
+        """
+        Args:
+            extract (Extractor): Picklable top-level function that parses a page in the worker pool.
+            concurrency (int): Maximum number of requests in flight.
+            max_per_host (int): Maximum number of requests in flight to any one host.
+            politeness_delay (float): Average delay between request starts on one host.
+            respect_robots (bool): Whether to honour robots.txt rules and Crawl-delay.
+            use_sitemaps (bool): Whether to seed the frontier from the site's sitemaps.
+            checkpoint_path (Optional[str]): JSON file for resume and conditional re-crawl, if any.
+            checkpoint_every (int): Number of fetched pages between checkpoint writes.
+            parse_workers (Optional[int]): Worker processes for `extract`; None for the CPU count,
+                0 to parse in a thread instead.
+            timeout (float): Total timeout for one request, in seconds.
+            user_agent (str): User-Agent header and robots.txt identity.
+        """
+        self.extract = extract
+        self.concurrency = max(1, concurrency)
+        self.max_per_host = max(1, max_per_host)
+        self.politeness_delay = politeness_delay
+        self.respect_robots = respect_robots
+        self.use_sitemaps = use_sitemaps
+        self.checkpoint = CrawlCheckpoint(checkpoint_path) if checkpoint_path else None
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.parse_workers = (cpu_count() or 1) if parse_workers is None else parse_workers
+        self.timeout = timeout
+        self.user_agent = user_agent
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def crawl(
+        self,
+        start_url: str,
+        max_pages: int,
+        on_page: Callable[[CrawledPage], bool],
+        follow: Callable[[str], bool],
+        resume: bool = False,
+    ) -> CrawlStats:
+        """
+        Runs a crawl to completion.
+
+        Args:
+            start_url (str): The root URL to begin crawling from.
+            max_pages (int): Stop once this many pages have been accepted by `on_page`.
+            on_page (Callable): Called with each fetched page; returns True to accept it and follow its links.
+            follow (Callable): Whether a discovered link should be queued.
+            resume (bool): Continue an interrupted crawl from the checkpoint instead of starting over.
+
+        Returns:
+            CrawlStats: Counters for the crawl.
+        """
+        # Worker processes are spawned rather than forked: aiohttp's resolver threads are already running.
+        pool: Optional[Executor] = None
+        if self.parse_workers > 0:
+            pool = ProcessPoolExecutor(max_workers=self.parse_workers, mp_context=get_context("spawn"))
+        try:
+            return asyncio.run(self.crawl_async(start_url, max_pages, on_page, follow, resume, pool))
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments,too-many-locals,too-many-branches
+    async def crawl_async(
+        self,
+        start_url: str,
+        max_pages: int,
+        on_page: Callable[[CrawledPage], bool],
+        follow: Callable[[str], bool],
+        resume: bool = False,
+        pool: Optional[Executor] = None,
+    ) -> CrawlStats:
+        """The coroutine behind `crawl`, for callers that already run an event loop."""
+        start_url = normalize_url(start_url)
+        stats = CrawlStats()
+        frontier = CrawlFrontier()
+        pages: Dict[str, CrawledPage] = {}
+        stored, stored_frontier, complete = self.checkpoint.load(start_url) if self.checkpoint else ([], [], True)
+        previous = {page.url: page for page in stored}
+
+        resuming = resume and not complete
+        if resuming:
+            # Replay accepted pages in their original order so the caller rebuilds the same state
+            for page in stored:
+                pages[page.url] = page
+                frontier.mark_seen(page.url)
+                if page.accepted and stats.accepted < max_pages and on_page(page):
+                    stats.accepted += 1
+            stats.resumed = len(stored)
+            for url, parent_url, depth in stored_frontier:
+                frontier.push(url, parent_url, depth)
+        else:
+            frontier.push(start_url, None, 0)
+
+        connector = TCPConnector(limit=self.concurrency, limit_per_host=self.max_per_host)
+        headers = {"User-Agent": self.user_agent}
+        async with ClientSession(
+            connector=connector, timeout=ClientTimeout(total=self.timeout), headers=headers
+        ) as session:
+            robots = RobotsPolicy(session, self.user_agent, self.respect_robots)
+            limiter = HostRateLimiter(self.max_per_host, self.politeness_delay)
+            context = _FetchContext(session, robots, limiter, pool, stats)
+            if self.use_sitemaps and not resuming:
+                for url in await self._sitemap_urls(session, robots, start_url, max_pages * 4):
+                    if follow(url):
+                        frontier.push(url, start_url, 1)
+
+            in_flight: Dict[asyncio.Task, Tuple[str, Optional[str], int]] = {}
+            try:
+                while frontier or in_flight:
+                    while (
+                        frontier and len(in_flight) < self.concurrency and stats.accepted + len(in_flight) < max_pages
+                    ):
+                        url, parent_url, depth = frontier.pop()
+                        fetch = self._fetch_page(context, url, parent_url, depth, previous.get(url))
+                        in_flight[asyncio.create_task(fetch)] = (url, parent_url, depth)
+                    if not in_flight:
+                        break
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        del in_flight[task]
+                        page = task.result()
+                        if page is None:
+                            continue
+                        pages[page.url] = page
+                        if stats.accepted < max_pages and on_page(page):
+                            page.accepted = True
+                            stats.accepted += 1
+                            for link in filter(follow, page.links):
+                                frontier.push(link, page.url, page.depth + 1)
+                        if self.checkpoint and len(pages) % self.checkpoint_every == 0:
+                            # Requests still in flight are fetched again by a resumed crawl
+                            resumable = list(in_flight.values()) + frontier.pending()
+                            self.checkpoint.save(start_url, list(pages.values()), resumable, False)
+            finally:
+                for task in in_flight:
+                    task.cancel()
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+        if self.checkpoint:
+            self.checkpoint.save(start_url, list(pages.values()), frontier.pending(), True)
+        return stats
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    async def _fetch_page(
+        self,
+        context: _FetchContext,
+        url: str,
+        parent_url: Optional[str],
+        depth: int,
+        previous: Optional[CrawledPage],
+    ) -> Optional[CrawledPage]:
+        """Fetches and parses one page; returns None for pages that are skipped."""
+        try:
+            if not await context.robots.allowed(url):
+                context.stats.robots_blocked += 1
+                return None
+            request_headers = {}
+            if previous is not None and previous.etag:
+                request_headers["If-None-Match"] = previous.etag
+            if previous is not None and previous.last_modified:
+                request_headers["If-Modified-Since"] = previous.last_modified
+
+            async with context.limiter.slot(urlparse(url).netloc, await context.robots.crawl_delay(url)):
+                async with context.session.get(url, headers=request_headers) as resp:
+                    if resp.status == 304 and previous is not None:
+                        context.stats.not_modified += 1
+                        return replace(previous, parent_url=parent_url, depth=depth, accepted=False)
+                    # Skip error pages and non-HTML content types
+                    if resp.status >= 400 or "text/html" not in resp.headers.get("Content-Type", ""):
+                        return None
+                    html = await resp.text(errors="replace")
+                    etag = resp.headers.get("ETag", "")
+                    last_modified = resp.headers.get("Last-Modified", "")
+            context.stats.fetched += 1
+
+            title, text, links = await asyncio.get_running_loop().run_in_executor(
+                context.pool, self.extract, html, url
+            )
+        except (ClientError, asyncio.TimeoutError, UnicodeDecodeError, ValueError) as exc:
+            context.stats.errors += 1
+            print(f"Skipping {url} due to error: {str(exc)}")
+            return None
+        return CrawledPage(url, parent_url, depth, title, text, links, etag, last_modified)
+
+    async def _sitemap_urls(
+        self, session: ClientSession, robots: RobotsPolicy, start_url: str, limit: int
+    ) -> List[str]:
+        """Page URLs from the sitemaps in robots.txt (or /sitemap.xml), following sitemap indexes."""
+        parsed = urlparse(start_url)
+        pending = deque(await robots.sitemaps(start_url) or [f"{parsed.scheme}://{parsed.netloc}/sitemap.xml"])
+        read: Set[str] = set()
+        found: List[str] = []
+        while pending and len(found) < limit and len(read) < MAX_SITEMAP_FILES:
+            sitemap_url = pending.popleft()
+            if sitemap_url in read:
+                continue
+            read.add(sitemap_url)
+            root = await self._read_sitemap(session, sitemap_url)
+            if root is None:
+                continue
+            is_index = root.tag.endswith("sitemapindex")
+            for element in root.iter():
+                if element.tag.endswith("loc") and element.text:
+                    location = element.text.strip()
+                    if is_index:
+                        pending.append(location)
+                    elif len(found) < limit:
+                        found.append(location)
+        return found
+
+    @staticmethod
+    async def _read_sitemap(session: ClientSession, sitemap_url: str) -> Optional[Element]:
+        """The parsed sitemap (gzipped or not), or None if it cannot be fetched or parsed."""
+        try:
+            async with session.get(sitemap_url) as resp:
+                if resp.status >= 400:
+                    return None
+                body = await resp.read()
+            if body[:2] == b"\x1f\x8b":
+                body = gzip.decompress(body)
+            return fromstring(body)
+        except (ClientError, asyncio.TimeoutError, OSError, ParseError) as exc:
+            print(f"Skipping sitemap {sitemap_url} due to error: {str(exc)}")
+            return None
@@ -0,0 +1,212 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import threading
+
+import pytest
+from aiohttp import web
+from build_wwaw import WebAgentNetworkBuilder
+from build_wwaw import extract_page
+from crawl_engine import AsyncCrawlEngine
+from crawl_engine import CrawlFrontier
+
+LINKS = {
+    "/": ["/a", "/b", "/private/x", "/a#section", "#top"],
+    "/a": ["/c"],
+    "/b": ["/a"],
+    "/c": [],
+    "/private/x": [],
+    "/orphan": [],
+}
+
+
+class LocalSite:
+    """A small site served from a background thread, with robots.txt, a sitemap and ETags."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.hits = []
+        self.active = 0
+        self.peak = 0
+        self.base = ""
+        self._loop = asyncio.new_event_loop()
+        self._runner = None
+
+    async def page(self, request):
+        """A page linking to its LINKS, with an ETag; 304 when the client already has it."""
+        path = request.path
+        if path not in LINKS:
+            return web.Response(status=404)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        etag = f'"{path}-v1"'
+        if request.headers.get("If-None-Match") == etag:
+            self.hits.append((path, 304))
+            return web.Response(status=304, headers={"ETag": etag})
+        self.hits.append((path, 200))
+        anchors = "".join(f'<a href="{link}">{link}</a>' for link in LINKS[path])
+        body = f"<html><head><title>Page {path}</title></head><body><p>Content of {path}. </p>{anchors}</body></html>"
+        return web.Response(text=body, content_type="text/html", headers={"ETag": etag})
+
+    async def robots(self, _request):
+        """robots.txt disallowing /private and pointing at the sitemap."""
+        return web.Response(text=f"User-agent: *\nDisallow: /private\nSitemap: {self.base}/sitemap.xml\n")
+
+    async def sitemap(self, _request):
+        """A sitemap listing the page no other page links to."""
+        body = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            f"<url><loc>{self.base}/orphan</loc></url></urlset>"
+        )
+        return web.Response(text=body, content_type="application/xml")
+
+    def __enter__(self):
+        app = web.Application()
+        app.router.add_get("/robots.txt", self.robots)
+        app.router.add_get("/sitemap.xml", self.sitemap)
+        app.router.add_get("/{tail:.*}", self.page)
+        self._runner = web.AppRunner(app)
+        self._loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        self._loop.run_until_complete(site.start())
+        port = self._runner.addresses[0][1]
+        self.base = f"http://127.0.0.1:{port}"
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *_exc):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def fetched(self, status=200):
+        """Paths served with `status`, sorted."""
+        return sorted(path for path, code in self.hits if code == status)
+
+
+def crawl(site, engine, max_pages=100, resume=False, on_page=None):
+    """Crawl `site` with `engine`, accepting every page; returns the stats and the pages in order."""
+    pages = []
+
+    def accept(page):
+        if on_page is not None:
+            on_page(page)
+        pages.append(page)
+        return True
+
+    stats = engine.crawl(site.base + "/", max_pages, accept, lambda link: link.startswith(site.base), resume)
+    return stats, pages
+
+
+def test_frontier_orders_by_depth_and_queues_each_url_once():
+    """Shallower pages come first, and a URL differing only by fragment is not queued again."""
+    frontier = CrawlFrontier()
+    assert frontier.push("http://x.com/deep", "http://x.com/", 2)
+    assert frontier.push("http://x.com/a", "http://x.com/", 1)
+    assert not frontier.push("http://x.com/a#part", "http://x.com/b", 1)
+    assert frontier.push("http://x.com/b", "http://x.com/", 1)
+
+    assert [frontier.pop()[0] for _ in range(len(frontier))] == [
+        "http://x.com/a",
+        "http://x.com/b",
+        "http://x.com/deep",
+    ]
+
+
+def test_crawl_honours_robots_and_fragments():
+    """Disallowed paths are skipped and fragment links are fetched once."""
+    with LocalSite() as site:
+        stats, pages = crawl(site, AsyncCrawlEngine(extract_page, parse_workers=0))
+
+    # /private is disallowed by robots.txt, and /a#section is the same page as /a
+    assert site.fetched() == ["/", "/a", "/b", "/c"]
+    assert stats.robots_blocked == 1
+    assert pages[0].url == site.base + "/"
+    assert {page.url: page.depth for page in pages}[site.base + "/c"] == 2
+
+
+def test_sitemap_seeds_unlinked_pages():
+    """A page only the sitemap lists is crawled too."""
+    with LocalSite() as site:
+        crawl(site, AsyncCrawlEngine(extract_page, parse_workers=0, use_sitemaps=True))
+
+    assert "/orphan" in site.fetched()
+
+
+def test_requests_per_host_are_bounded():
+    """No more than max_per_host requests reach one host at a time."""
+    with LocalSite(delay=0.1) as site:
+        crawl(site, AsyncCrawlEngine(extract_page, parse_workers=0, concurrency=8, max_per_host=2, use_sitemaps=True))
+
+    assert site.peak == 2
+
+
+def test_recrawl_uses_stored_etags(tmp_path):
+    """A second crawl revalidates pages with their stored ETags and reuses unchanged content."""
+    checkpoint = str(tmp_path / "crawl.json")
+    with LocalSite() as site:
+        crawl(site, AsyncCrawlEngine(extract_page, parse_workers=0, checkpoint_path=checkpoint))
+        site.hits.clear()
+        stats, pages = crawl(site, AsyncCrawlEngine(extract_page, parse_workers=0, checkpoint_path=checkpoint))
+
+    assert site.fetched(304) == ["/", "/a", "/b", "/c"]
+    assert stats.not_modified == 4 and stats.fetched == 0
+    # Content comes back from the checkpoint for unchanged pages
+    assert all("Content of" in page.text for page in pages)
+
+
+def test_interrupted_crawl_resumes_from_checkpoint(tmp_path):
+    """A resumed crawl skips the pages already done and fetches the rest."""
+    checkpoint = str(tmp_path / "crawl.json")
+    with LocalSite() as site:
+
+        def interrupt(page):
+            if page.url.endswith("/a"):
+                raise KeyboardInterrupt
+
+        engine = AsyncCrawlEngine(
+            extract_page, parse_workers=0, concurrency=1, checkpoint_path=checkpoint, checkpoint_every=1
+        )
+        with pytest.raises(KeyboardInterrupt):
+            crawl(site, engine, on_page=interrupt)
+        before = site.fetched()
+        site.hits.clear()
+        stats, pages = crawl(site, engine, resume=True)
+
+    assert before == ["/", "/a"]
+    # Only the root was checkpointed as done; the crawl stopped while handing over /a
+    assert stats.resumed == 1
+    assert site.fetched() == ["/a", "/b", "/c"]
+    assert [page.url.removeprefix(site.base) for page in pages] == ["/", "/a", "/b", "/c"]
+
+
+def test_builder_crawl_concurrent_links_agents_under_their_parents(monkeypatch):
+    """Each accepted page becomes an agent under the page that linked to it."""
+    monkeypatch.setattr(WebAgentNetworkBuilder, "MIN_PAGE_LEN", 10)
+    builder = WebAgentNetworkBuilder()
+    with LocalSite() as site:
+        # A worker pool, to check extract_page round-trips through the spawned processes
+        agents = builder.crawl_concurrent(site.base + "/", 10, AsyncCrawlEngine(extract_page, parse_workers=2))
+
+    assert [name for name, data in agents.items() if data["top_agent"] == "true"] == ["page"]
+    assert sorted(agents["page"]["down_chains"]) == ["page-a", "page-b"]
+    assert agents["page-a"]["down_chains"] == ["page-c"]
+    assert "Content of /c" in agents["page-c"]["instructions"]
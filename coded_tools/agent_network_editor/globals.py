@@ -138,6 +138,26 @@ class ProcessGlobals:  # pylint: disable=too-few-public-methods
     #             publishing, so recovery stays possible.
     #    Used by: GetMcpTool.async_invoke() (the coded tool the editor LLM
     #             calls).
+    #
+    # 7. Shared S3 clients
+    #    Holds:   one boto3 client per service name (today only "s3").
+    #    Lives:   s3_client_pool.S3ClientPool (get_client)
+    #    Expiry:  none — built once; botocore refreshes temporary credentials
+    #             inside the client, so it never needs rebuilding.
+    #    Used by: reservation_config_cache.ReservationConfigCache.get().
+    #
+    # 8. Shared reservation configs
+    #    Holds:   up to AGENT_RESERVATIONS_S3_CACHE_MAX_ENTRIES (default 128)
+    #             parsed reservations/<id>.json objects, keyed by (bucket,
+    #             reservation id), each with its S3 ETag.
+    #    Lives:   reservation_config_cache.ReservationConfigCache (get_shared)
+    #    Expiry:  revalidated on every read with a conditional GET on the
+    #             ETag; least recently used entries are evicted past the size
+    #             bound; dropped on NoSuchKey and after a redeploy.
+    #    Used by: agent_network_definition_middleware.AgentNetworkDefinitionMiddleware
+    #             .fetch_reservation_from_s3();
+    #             reservations_agent_network_persistor.ReservationsAgentNetworkPersistor
+    #             .async_persist() (invalidation after a deploy).
     # -----------------------------------------------------------------------
 
     # Machine-readable registry of the entries above, as
@@ -174,6 +194,16 @@ class ProcessGlobals:  # pylint: disable=too-few-public-methods
             "GetMcpTool",
             "clear_shared_mcp_tool_descriptions_for_testing",
         ),
+        (
+            "coded_tools.agent_network_editor.s3_client_pool",
+            "S3ClientPool",
+            "clear_shared_clients_for_testing",
+        ),
+        (
+            "coded_tools.agent_network_editor.reservation_config_cache",
+            "ReservationConfigCache",
+            "clear_shared_reservation_configs_for_testing",
+        ),
     ]
 
     @staticmethod
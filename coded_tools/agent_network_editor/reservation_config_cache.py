@@ -0,0 +1,212 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Process-wide cache of parsed reservation configs read from S3.
+
+The neuro-san server stores every temporary agent network it deploys as
+``reservations/<reservation_id>.json`` in AGENT_RESERVATIONS_S3_BUCKET, and the
+designer re-reads the latest one on every turn. This cache keeps the parsed
+JSON per (bucket, reservation id) together with the object's ETag, and
+revalidates with a conditional GET (If-None-Match) so an unchanged object
+costs one round trip with no body, no download and no JSON parse.
+"""
+
+import json
+from collections import OrderedDict
+from os import environ
+from threading import Lock
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+from coded_tools.agent_network_editor.s3_client_pool import S3ClientPool
+
+# S3 error codes reported for a conditional GET whose ETag still matches.
+NOT_MODIFIED_CODES: tuple[str, ...] = ("304", "NotModified")
+# S3 error codes reported when the reservation object does not exist.
+NOT_FOUND_CODES: tuple[str, ...] = ("NoSuchKey", "404")
+
+
+class ReservationConfigCache:
+    """
+    Bounded, thread-safe LRU cache of reservation configs with ETag revalidation.
+
+    * Entries are (etag, parsed config) pairs stored under (bucket, reservation
+      id). A hit still issues a conditional GET, so a reservation rewritten
+      in place by the server is picked up on the next read rather than after
+      some TTL; only the body transfer and the parse are saved.
+    * The lock guards the OrderedDict only; S3 I/O always runs outside it, so
+      a slow read never stalls readers of other reservations. Two threads
+      missing on the same key at once may both fetch — the later publish
+      simply wins, and both values are equally current.
+    * Returned configs are the live shared values, not copies. Callers must
+      treat them as read-only (AgentNetworkDefinitionMiddleware only reads
+      them to build its definition).
+    * A max_entries <= 0 disables retention: every read is a plain GET, but
+      the pooled S3 client is still reused.
+    """
+
+    DEFAULT_MAX_ENTRIES: int = 128
+
+    # The one process-wide instance, built lazily by get_shared().
+    _shared: "ReservationConfigCache | None" = None
+    _shared_lock: Lock = Lock()
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, prefix: str = "reservations/"):
+        """
+        Constructor
+
+        :param max_entries: Maximum number of reservation configs retained
+                before the least recently used one is evicted
+        :param prefix: S3 key prefix under which the server stores reservations
+        """
+        self.max_entries: int = max_entries
+        self.prefix: str = prefix
+        self._entries: OrderedDict[tuple[str, str], tuple[str, dict[str, Any]]] = OrderedDict()
+        self._lock: Lock = Lock()
+
+    @staticmethod
+    def get_shared() -> "ReservationConfigCache":
+        """
+        :return: The process-wide cache, built on first use with its size
+                taken from AGENT_RESERVATIONS_S3_CACHE_MAX_ENTRIES (defaults to
+                DEFAULT_MAX_ENTRIES when unset).
+        """
+        cache: ReservationConfigCache | None = ReservationConfigCache._shared
+        if cache is not None:
+            return cache
+
+        with ReservationConfigCache._shared_lock:
+            if ReservationConfigCache._shared is None:
+                max_entries_str: str = environ.get("AGENT_RESERVATIONS_S3_CACHE_MAX_ENTRIES", "").strip()
+                max_entries: int = ReservationConfigCache.DEFAULT_MAX_ENTRIES
+                if max_entries_str:
+                    try:
+                        max_entries = int(max_entries_str)
+                    except ValueError as exception:
+                        raise ValueError(
+                            "Value for AGENT_RESERVATIONS_S3_CACHE_MAX_ENTRIES needs to be an integer"
+                        ) from exception
+                ReservationConfigCache._shared = ReservationConfigCache(max_entries=max_entries)
+            return ReservationConfigCache._shared
+
+    @staticmethod
+    def clear_shared_reservation_configs_for_testing():
+        """
+        Forget the process-wide instance. For test isolation only (tests/conftest.py
+        runs this via ProcessGlobals around every test), so an entry fetched
+        against one test's mock bucket cannot be served to the next test.
+        """
+        with ReservationConfigCache._shared_lock:
+            ReservationConfigCache._shared = None
+
+    def get_object_key(self, reservation_id: str) -> str:
+        """
+        :param reservation_id: The reservation id
+        :return: The S3 key the server stores that reservation under
+        """
+        return f"{self.prefix}{reservation_id}.json"
+
+    def get(self, bucket: str, reservation_id: str) -> dict[str, Any]:
+        """
+        Read a reservation config, revalidating any cached copy against S3.
+
+        Blocking; call via asyncio.to_thread() from async code.
+
+        :param bucket: Target S3 bucket name
+        :param reservation_id: Reservation id whose JSON object should be fetched
+        :return: The parsed config dict. Shared with the cache: read-only.
+                botocore ClientError / NoCredentialsError propagate as they
+                would from a plain get_object(); a body that is not JSON
+                raises JSONDecodeError, and one that is not a JSON object
+                raises ValueError. Nothing is cached on any failure.
+        """
+        cache_key: tuple[str, str] = (bucket, reservation_id)
+        cached: tuple[str, dict[str, Any]] | None = self._lookup(cache_key)
+
+        request: dict[str, Any] = {"Bucket": bucket, "Key": self.get_object_key(reservation_id)}
+        if cached is not None:
+            request["IfNoneMatch"] = cached[0]
+
+        s3: Any = S3ClientPool.get_client("s3")
+        try:
+            response: dict[str, Any] = s3.get_object(**request)
+        except ClientError as client_error:
+            error_code: str = client_error.response.get("Error", {}).get("Code", "")
+            if cached is not None and error_code in NOT_MODIFIED_CODES:
+                return cached[1]
+            if error_code in NOT_FOUND_CODES:
+                # Deleted (e.g. expired) upstream: do not keep serving it.
+                self.invalidate(bucket, reservation_id)
+            raise
+
+        stream = response["Body"]
+        try:
+            body: bytes = stream.read()
+        finally:
+            stream.close()
+        parsed: Any = json.loads(body)
+        if not isinstance(parsed, dict):
+            raise ValueError(f"Reservation JSON must decode to an object, got {type(parsed).__name__}")
+
+        etag: str | None = response.get("ETag")
+        if etag:
+            self._publish(cache_key, (etag, parsed))
+        return parsed
+
+    def invalidate(self, bucket: str, reservation_id: str):
+        """
+        Drop any cached config for a reservation, so the next get() does an
+        unconditional read.
+
+        :param bucket: S3 bucket name
+        :param reservation_id: Reservation id
+        """
+        with self._lock:
+            self._entries.pop((bucket, reservation_id), None)
+
+    def __len__(self) -> int:
+        """
+        :return: The number of reservation configs currently retained
+        """
+        return len(self._entries)
+
+    def _lookup(self, cache_key: tuple[str, str]) -> tuple[str, dict[str, Any]] | None:
+        """
+        :param cache_key: The (bucket, reservation id) key
+        :return: The cached (etag, config) pair, marked most recently used,
+                or None on a miss
+        """
+        with self._lock:
+            cached: tuple[str, dict[str, Any]] | None = self._entries.get(cache_key)
+            if cached is not None:
+                self._entries.move_to_end(cache_key)
+            return cached
+
+    def _publish(self, cache_key: tuple[str, str], entry: tuple[str, dict[str, Any]]):
+        """
+        Store an entry as most recently used and evict down to max_entries.
+
+        :param cache_key: The (bucket, reservation id) key
+        :param entry: The (etag, config) pair to store
+        """
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[cache_key] = entry
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
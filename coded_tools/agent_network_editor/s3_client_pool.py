@@ -0,0 +1,92 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Process-wide pool of boto3 service clients for the Agent Network Designer family.
+
+Building a boto3 client resolves credentials, discovers the endpoint and
+creates a fresh urllib3 connection pool, which is most of the cost of a small
+S3 read. boto3 clients are thread-safe once built, so one client per service
+can be shared by every designer turn in the process instead of being rebuilt
+on each reservation lookup.
+"""
+
+from threading import Lock
+from typing import Any
+
+from leaf_common.resolution.resolver_util import ResolverUtil
+
+
+class S3ClientPool:
+    """
+    Process-wide, thread-safe cache of boto3 clients keyed by service name.
+
+    * The warm path takes no lock: a published client is a single dict value
+      written once, and CPython reference reads are atomic under the GIL.
+    * The cold path builds the client under a threading.Lock, because the
+      default boto3 session that boto3.client() goes through is NOT safe to
+      use concurrently — two threads building the first client at the same
+      time could otherwise race inside the session.
+    * Clients are never expired. A client that picked up temporary
+      credentials refreshes them itself through botocore's credential
+      provider chain, so a long-lived client stays usable.
+    """
+
+    # Access goes through the class by name (not cls) so a hypothetical
+    # subclass shares the one pool instead of splitting it.
+    _clients: dict[str, Any] = {}
+    _lock: Lock = Lock()
+
+    @staticmethod
+    def get_client(service_name: str = "s3") -> Any:
+        """
+        Get the shared boto3 client for a service, building it on the first
+        call in the process.
+
+        Blocking on a miss (client construction may touch the network to
+        resolve credentials), so async callers should reach this through
+        asyncio.to_thread(), as the S3 readers in this family already do.
+
+        :param service_name: The boto3 service name. Defaults to "s3".
+        :return: The shared boto3 client for that service
+        """
+        client: Any = S3ClientPool._clients.get(service_name)
+        if client is not None:
+            return client
+
+        with S3ClientPool._lock:
+            # Double-check under the lock against a build that finished
+            # while this thread waited.
+            client = S3ClientPool._clients.get(service_name)
+            if client is None:
+                boto3_client = ResolverUtil.create_type("boto3.client", install_if_missing="boto3")
+                client = boto3_client(service_name)
+                # Publish only after the client was fully built.
+                S3ClientPool._clients[service_name] = client
+        return client
+
+    @staticmethod
+    def clear_shared_clients_for_testing():
+        """
+        Drop every pooled client. For test isolation only (tests/conftest.py
+        runs this via ProcessGlobals around every test).
+
+        Production code must never call this: clients are deliberately built
+        once per process. Tests need it because a client built under one
+        test's AWS env vars (or outside a moto mock) would otherwise be
+        served to every later test.
+        """
+        with S3ClientPool._lock:
+            S3ClientPool._clients.clear()
@@ -75,10 +75,14 @@ class SharedProcessCache(Generic[CachedValue]):
       callers may run on different event loops in different threads, and an
       asyncio.Lock cannot be shared across event loops.
     * The warm path takes no lock: the entry is a single attribute written
-      exactly once per load, only after the loader fully succeeded, and
-      CPython reference reads are atomic under the GIL — so a non-None read
-      always yields a complete (value, fingerprint) pair. Do not reorder the
-      publish in get().
+      exactly once per load, only after the loader fully succeeded, and a
+      CPython attribute store or load of an object reference is atomic —
+      under the GIL, and on free-threaded builds too, where the store
+      publishes the fully built tuple and a reader that sees it also sees
+      its contents. So a non-None read always yields a complete (value,
+      fingerprint) pair. Do not reorder the publish in get(), and do not
+      replace the tuple with two attributes: that pair would tear without
+      the GIL.
     * aget() keeps the cold load off the event loop via asyncio.to_thread()
       and funnels concurrent cold callers on the same loop into ONE load: the
       first caller creates the load task and the rest await it, so a cold
@@ -97,6 +101,11 @@ class SharedProcessCache(Generic[CachedValue]):
       fills have no cross-loop serialization.) A publish-time fingerprint
       re-probe in _fill_and_publish keeps a slower fill whose capture went
       stale from clobbering a fresher racer's entry.
+    * The once-gate's WeakKeyDictionary is plain Python bookkeeping that is
+      not safe for concurrent mutation without the GIL (its weakref removal
+      callbacks and clear() race with lookups), so every access goes through
+      _in_flight_lock. That lock is held only around dictionary operations,
+      never across a load, so it cannot stall an event loop.
     * A cache is either loader-backed (get()/aget()) or call-site-filled
       (aget_or_fill()), never both; the wrong entry point raises RuntimeError
       on a miss. Beyond keeping each instance's read surface predictable,
@@ -126,10 +135,12 @@ class SharedProcessCache(Generic[CachedValue]):
         # one loop share a single to_thread() dispatch. Entries are removed
         # by each task's done callback (_forget_in_flight_load) — the weak
         # keying alone cannot reclaim them, because a Task strongly
-        # references the loop it runs on, i.e. its own key. Access races
-        # between loops are benign: at worst two loops each run a load, and
-        # the lock in get() still serializes the actual work.
+        # references the loop it runs on, i.e. its own key. Guarded by its
+        # own short-held lock (see the class docstring); races between loops
+        # beyond that are benign: at worst two loops each run a load, and the
+        # lock in get() still serializes the actual work.
         self._loads_in_flight: WeakKeyDictionary = WeakKeyDictionary()
+        self._in_flight_lock = Lock()
 
     @staticmethod
     def stat_modification_time_ns(path: str) -> int | None:
@@ -328,13 +339,16 @@ class SharedProcessCache(Generic[CachedValue]):
         :return: The loaded value, once the shared task completes.
         """
         loop = get_running_loop()
-        task: Task | None = self._loads_in_flight.get(loop)
-        if task is None or task.done():
-            # A done task is a finished earlier attempt (possibly failed or
-            # stale); start a new one. Awaiters of the old task are unaffected.
-            task = loop.create_task(start_load())
-            self._loads_in_flight[loop] = task
-            task.add_done_callback(self._forget_in_flight_load)
+        with self._in_flight_lock:
+            task: Task | None = self._loads_in_flight.get(loop)
+            if task is None or task.done():
+                # A done task is a finished earlier attempt (possibly failed or
+                # stale); start a new one. Awaiters of the old task are unaffected.
+                # create_task() only schedules the load, so holding the lock here
+                # is brief.
+                task = loop.create_task(start_load())
+                self._loads_in_flight[loop] = task
+                task.add_done_callback(self._forget_in_flight_load)
         # shield() detaches awaiter cancellation from the shared task: a
         # cancelled awaiter still gets its CancelledError, but the load keeps
         # running and completes for the other awaiters. An unshielded await
@@ -392,8 +406,9 @@ class SharedProcessCache(Generic[CachedValue]):
         # clear between the check and the removal stays a no-op; a *newer*
         # task cannot sneak into the slot in that window, because only this
         # loop's thread installs tasks for this key.
-        if self._loads_in_flight.get(loop) is task:
-            self._loads_in_flight.pop(loop, None)
+        with self._in_flight_lock:
+            if self._loads_in_flight.get(loop) is task:
+                self._loads_in_flight.pop(loop, None)
         if not task.cancelled():
             # Mark a failed load's exception as retrieved (returns None on
             # success). Awaiters that were still around received it via the
@@ -417,4 +432,5 @@ class SharedProcessCache(Generic[CachedValue]):
         # this can never unpublish an entry mid-initialization.
         with self._lock:
             self._entry = None
-            self._loads_in_flight.clear()
+            with self._in_flight_lock:
+                self._loads_in_flight.clear()
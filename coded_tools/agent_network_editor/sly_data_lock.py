@@ -34,10 +34,11 @@ class SlyDataLock:
         :return: A common lock for modifying the sly_data.
         """
 
-        # Under normal circumstances we might be tempted to hold a synchronous lock
-        # while looking for the existing async lock, but we know that async methods
-        # should all be running in their own thread, so that's not necessary.
         lock: Lock = sly_data.get(lock_name)
         if lock is None:
-            lock = sly_data[lock_name] = Lock()
+            # setdefault() is one atomic dict operation, with or without the GIL, so
+            # two callers racing on a miss (e.g. tools of one session dispatched to
+            # different threads on a free-threaded build) always end up sharing the
+            # same lock. A get-then-set here could hand each of them its own.
+            lock = sly_data.setdefault(lock_name, Lock())
         return lock
@@ -15,12 +15,13 @@
 # END COPYRIGHT
 
 import logging
-from asyncio import Future
-from asyncio import gather
+from contextlib import aclosing
 from typing import Any
 
 from coded_tools.experimental.mdap_decomposer.voter import Voter
 from neuro_san_studio.coded_tools.agent_caller import AgentCaller
+from neuro_san_studio.coded_tools.agent_fan_out import AgentCall
+from neuro_san_studio.coded_tools.agent_fan_out import AgentFanOut
 
 
 # pylint: disable=too-few-public-methods
@@ -28,6 +29,9 @@ class FirstToKVoter(Voter):
     """
     Generic Voter implementation that returns the first solution that receives
     a certain number of votes (K).
+
+    Votes are tallied as they arrive; once a solution has K votes the votes still
+    being cast are cancelled.
     """
 
     # pylint: disable=too-many-arguments, too-many-positional-arguments
@@ -66,34 +70,34 @@ class FirstToKVoter(Voter):
 
         tool_args: dict[str, Any] = {"problem": problem, self.candidates_key: candidates}
 
-        # Prepare a list of coroutines to parallelize
-        coroutines: list[Future] = []
-        for _ in range(self.number_of_votes):
-            # All entries for parallelization do the same thing.
-            # Note: Perhaps not the most token/cost efficient, but definitely good for time.
-            coroutines.append(self.discriminator_caller.call_agent(tool_args))
-
-        # Call the agents in parallel
-        results: list[str] = await gather(*coroutines)
+        # All calls do the same thing.
+        # Note: Perhaps not the most token/cost efficient, but definitely good for time.
+        calls: list[AgentCall] = [AgentCall(self.discriminator_caller, tool_args)] * self.number_of_votes
+        fan_out = AgentFanOut(max_concurrency=self.number_of_votes)
 
-        # Process the votes
+        # Call the agents in parallel and process the votes as they come in
         votes: list[int] = [0] * len(candidates)
         winner_idx: int = None
-        for vote_txt in results:
-            logging.info("%s raw vote: %s", self.source, vote_txt)
-            try:
-                idx: int = int(vote_txt) - 1
-                if idx >= len(candidates):
-                    logging.error("Invalid vote index: %d", idx)
-                if 0 <= idx < len(candidates):
-                    votes[idx] += 1
-                    logging.info("%s tally: %s", self.source, str(votes))
-                    if votes[idx] >= self.winning_vote_count:
-                        winner_idx = idx
-                        logging.info("%s early winner: %d", self.source, winner_idx + 1)
-                        break
-            except ValueError:
-                logging.error("%s malformed vote ignored: %s", self.source, vote_txt)
+        async with aclosing(fan_out.as_completed(calls)) as results:
+            async for result in results:
+                if not result.ok:
+                    raise result.error
+                vote_txt: str = result.response
+                logging.info("%s raw vote: %s", self.source, vote_txt)
+                try:
+                    idx: int = int(vote_txt) - 1
+                    if idx >= len(candidates):
+                        logging.error("Invalid vote index: %d", idx)
+                    if 0 <= idx < len(candidates):
+                        votes[idx] += 1
+                        logging.info("%s tally: %s", self.source, str(votes))
+                        if votes[idx] >= self.winning_vote_count:
+                            winner_idx = idx
+                            logging.info("%s early winner: %d", self.source, winner_idx + 1)
+                            # Leaving the loop cancels the votes still outstanding
+                            break
+                except ValueError:
+                    logging.error("%s malformed vote ignored: %s", self.source, vote_txt)
 
         if winner_idx is None:
             winner_idx = max(range(len(votes)), key=lambda v: votes[v])
@@ -29,6 +29,8 @@ from neuro_san.interfaces.coded_tool import CodedTool
 from nupunkt import sent_tokenize
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+from neuro_san_studio.utils.cpu_pool import CpuPool
+
 # pylint: enable=import-error
 
 # Setup logger
@@ -241,6 +243,7 @@ class SentimentAnalysis(CodedTool):
 
     async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Delegates to the synchronous invoke method.
+        Runs the synchronous invoke method on the shared CPU pool: tokenizing and
+        scoring every article is CPU-bound and would otherwise stall the event loop.
         """
-        return self.invoke(args, sly_data)
+        return await CpuPool.run(self.invoke, args, sly_data)
@@ -23,32 +23,123 @@ Before running this coded tool
 - `python server.py`
 """
 
+import asyncio
 import logging
+import threading
+import time
 from typing import Any
 from typing import Dict
+from typing import Optional
+from typing import Tuple
 from uuid import uuid4
+from weakref import WeakKeyDictionary
 
 import httpx
 
 # pylint: disable=import-error
 from a2a.client import A2ACardResolver
+from a2a.client import A2AClientHTTPError
+from a2a.client import A2AClientJSONError
 from a2a.client import Client
 from a2a.client import ClientConfig
 from a2a.client import ClientFactory
 from a2a.types import AgentCard
 from a2a.types import Message
+from a2a.types import Task
+from a2a.types import TaskArtifactUpdateEvent
+from a2a.types import TaskState
+from a2a.types import TaskStatusUpdateEvent
+from a2a.utils import get_artifact_text
+from a2a.utils import get_message_text
 from a2a.utils.constants import AGENT_CARD_WELL_KNOWN_PATH
+from neuro_san.interfaces.agent_progress_reporter import AgentProgressReporter
 from neuro_san.interfaces.coded_tool import CodedTool
 
 # Make sure that the port here matches the one in the server.
 BASE_URL = "http://localhost:9999"
 
+# How long a fetched agent card, and the client built from it, is reused before it is fetched again.
+AGENT_CARD_TTL_SECONDS = 300.0
+
+# Errors that mean the server is gone or has changed; the cached card and client for it are dropped.
+_CONNECTION_ERRORS = (A2AClientHTTPError, A2AClientJSONError, httpx.HTTPError)
+
+# One event loop's httpx client, and the Client built on it for each base URL with the card it was built from.
+_LoopClients = Tuple[httpx.AsyncClient, Dict[str, Tuple[AgentCard, Client]]]
+
+
+class _A2aConnections:
+    """A2A connections shared by every invocation in this process.
+
+    httpx connections belong to the event loop that opened them, so each event loop gets one
+    keep-alive httpx client, and a Client per base URL built on it. Agent cards are plain data and
+    are shared across loops. Both are reused for AGENT_CARD_TTL_SECONDS, or until invalidate().
+    """
+
+    _cards: Dict[str, Tuple[AgentCard, float]] = {}
+    _loops: "WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients]" = WeakKeyDictionary()
+    _lock = threading.Lock()
+
+    @classmethod
+    async def client(cls, base_url: str, logger: logging.Logger) -> Client:
+        """The Client for *base_url* on the running event loop, fetching the agent card if it is stale."""
+        httpx_client, clients = cls._for_loop()
+        card: Optional[AgentCard] = cls._fresh_card(base_url)
+        if card is None:
+            logger.info("Attempting to fetch public agent card from: %s%s", base_url, AGENT_CARD_WELL_KNOWN_PATH)
+            resolver = A2ACardResolver(httpx_client=httpx_client, base_url=base_url)
+            card = await resolver.get_agent_card()
+            logger.info("Successfully fetched agent card:")
+            logger.info(card.model_dump_json(indent=2, exclude_none=True))
+            with cls._lock:
+                cls._cards[base_url] = (card, time.monotonic() + AGENT_CARD_TTL_SECONDS)
+
+        cached: Optional[Tuple[AgentCard, Client]] = clients.get(base_url)
+        if cached is not None and cached[0] is card:
+            return cached[1]
+        factory = ClientFactory(config=ClientConfig(httpx_client=httpx_client))
+        client: Client = factory.create(card)
+        clients[base_url] = (card, client)
+        logger.info("A2A Client initialized.")
+        return client
+
+    @classmethod
+    def invalidate(cls, base_url: str) -> None:
+        """Forget the agent card and the clients for *base_url*, so the next call resolves them again."""
+        with cls._lock:
+            cls._cards.pop(base_url, None)
+            for _, clients in cls._loops.values():
+                clients.pop(base_url, None)
+
+    @classmethod
+    def _fresh_card(cls, base_url: str) -> Optional[AgentCard]:
+        with cls._lock:
+            cached: Optional[Tuple[AgentCard, float]] = cls._cards.get(base_url)
+        if cached is None or time.monotonic() >= cached[1]:
+            return None
+        return cached[0]
+
+    @classmethod
+    def _for_loop(cls) -> _LoopClients:
+        loop = asyncio.get_running_loop()
+        with cls._lock:
+            state = cls._loops.get(loop)
+            if state is None or state[0].is_closed:
+                # It could take a long time before remote agents response.
+                # Adjust the timeout accordingly.
+                httpx_client = httpx.AsyncClient(timeout=600.0, limits=httpx.Limits(keepalive_expiry=30.0))
+                state = cls._loops[loop] = (httpx_client, {})
+            return state
+
 
 class A2aResearchReport(CodedTool):
     """
     CodedTool as an A2A client that connects to a crewAI agents that write
     a report on a given topic in A2A server.
 
+    Connections are pooled: invocations on the same event loop share one keep-alive httpx client,
+    and the agent card is fetched once per AGENT_CARD_TTL_SECONDS rather than on every call.
+
     Adapted from https://github.com/a2aproject/a2a-samples/blob/main/samples/python/agents/helloworld/test_client.py
     """
 
@@ -82,41 +173,76 @@ class A2aResearchReport(CodedTool):
 
         logger.info("Writing report on %s", topic)
 
-        # It could take a long time before remote agents response.
-        # Adjust the timeout accordingly.
-        async with httpx.AsyncClient(timeout=600.0) as httpx_client:
-            # Initialize A2ACardResolver
-            resolver = A2ACardResolver(httpx_client=httpx_client, base_url=BASE_URL)
-
-            try:
-                logger.info("Attempting to fetch public agent card from: %s%s", BASE_URL, AGENT_CARD_WELL_KNOWN_PATH)
-                agent_card: AgentCard = await resolver.get_agent_card()
-                logger.info("Successfully fetched agent card:")
-                logger.info(agent_card.model_dump_json(indent=2, exclude_none=True))
-            except RuntimeError as runtime_error:
-                logger.error("Critical error fetching public agent card: %s", str(runtime_error))
-                return "Failed to the agent card. Cannot continue."
-
-            # Create client
-            factory = ClientFactory(config=ClientConfig(httpx_client=httpx_client))
-            client: Client = factory.create(agent_card)
-            logger.info("A2A Client initialized.")
-
-            # Send message and process responses
-            message: Message = {
-                "role": "user",
-                "parts": [{"kind": "text", "text": topic}],
-                "messageId": uuid4().hex,
-            }
-
-            responses: list[Message] = []
-            async for response in client.send_message(message):
-                responses.append(response)
-
-            # Last response is typically the final message
-            # Convert to a dictionary
-            result: dict[str, Any] = responses[-1].model_dump(mode="json", exclude_none=True)
-            logger.info("Got the following response: %s", str(result))
-
-            # Extract text from the response
-            return result["parts"][-1]["text"]
+        try:
+            client: Client = await _A2aConnections.client(BASE_URL, logger)
+        except (RuntimeError, *_CONNECTION_ERRORS) as error:
+            logger.error("Critical error fetching public agent card: %s", str(error))
+            _A2aConnections.invalidate(BASE_URL)
+            return "Failed to the agent card. Cannot continue."
+
+        # Send message and process responses
+        message: Message = {
+            "role": "user",
+            "parts": [{"kind": "text", "text": topic}],
+            "messageId": uuid4().hex,
+        }
+
+        try:
+            return await self._receive_report(client, message, args.get("progress_reporter"), logger)
+        except _CONNECTION_ERRORS:
+            # The server may have restarted or moved; resolve it afresh on the next call
+            _A2aConnections.invalidate(BASE_URL)
+            raise
+
+    @staticmethod
+    async def _receive_report(
+        client: Client,
+        message: Message,
+        progress_reporter: Optional[AgentProgressReporter],
+        logger: logging.Logger,
+    ) -> str:
+        """
+        Send the request and follow the research task the server streams back: status updates,
+        then one artifact per finished crew task, the last of which is the report.
+        Only the latest state of the task is kept; the updates on the way are relayed as progress.
+        """
+        task: Task = None
+        async for response in client.send_message(message):
+            if isinstance(response, Message):
+                # A server that answers directly, without a task
+                return get_message_text(response)
+            task, update = response
+            if isinstance(update, TaskArtifactUpdateEvent):
+                logger.info("Received %s", update.artifact.name)
+                await A2aResearchReport._relay(
+                    progress_reporter,
+                    {"a2a_task_state": task.status.state.value, "artifact": update.artifact.name},
+                    f"Received {update.artifact.name}",
+                    logger,
+                )
+            elif isinstance(update, TaskStatusUpdateEvent) and update.status.message:
+                text: str = get_message_text(update.status.message)
+                logger.info("%s: %s", update.status.state.value, text)
+                await A2aResearchReport._relay(
+                    progress_reporter, {"a2a_task_state": update.status.state.value}, text, logger
+                )
+
+        if task is None or task.status.state != TaskState.completed or not task.artifacts:
+            state: str = task.status.state.value if task is not None else "no response"
+            return f"Error: The research report did not complete ({state})."
+        return get_artifact_text(task.artifacts[-1])
+
+    @staticmethod
+    async def _relay(
+        progress_reporter: Optional[AgentProgressReporter],
+        structure: Dict[str, Any],
+        content: str,
+        logger: logging.Logger,
+    ):
+        """Best-effort progress report; a failed report never fails the research."""
+        if progress_reporter is None:
+            return
+        try:
+            await progress_reporter.async_report_progress(structure, content)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.warning("Could not report A2A progress", exc_info=True)
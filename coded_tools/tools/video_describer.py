@@ -14,17 +14,21 @@
 #
 # END COPYRIGHT
 
-import base64
+import asyncio
 import logging
 from typing import Any
 
-# pylint: disable=import-error
-import cv2
 from langchain_core.messages import HumanMessage
 from langchain_openai import ChatOpenAI
 from neuro_san.interfaces.coded_tool import CodedTool
 
-INSTRUCTIONS = "Describe the content of the video in detail."
+from coded_tools.tools.video_frame_sampler import FrameSamplingSettings
+from coded_tools.tools.video_frame_sampler import sample_frames
+
+INSTRUCTIONS = (
+    "Describe the content of the video in detail. The images are frames sampled from the video, in order, "
+    "each preceded by its timestamp; refer to those timestamps when describing when things happen."
+)
 
 
 class VideoDescriber(CodedTool):
@@ -35,7 +39,7 @@ class VideoDescriber(CodedTool):
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
-    async def async_invoke(self, args: dict[str, Any], sly_data: dict[str, Any]) -> str:
+    async def async_invoke(self, args: dict[str, Any], sly_data: dict[str, Any]) -> dict[str, Any]:
         """
         :param args: An argument dictionary whose keys are the parameters
                 to the coded tool and whose values are the values passed for them
@@ -46,11 +50,17 @@ class VideoDescriber(CodedTool):
                     - "file_path" (str): Path to the video file to be described.
                 - from user
                     - "openai_model" (str): OpenAI model to call the tool. Default to gpt-4o.
+                    - "sampling" (str): "interval" (fixed rate, default) or "scene" (scene changes).
+                    - "frame_interval_seconds" (float): Seconds between frames in interval mode. Default 1.
+                    - "max_frames" (int): Most frames sent to the model. Default 32.
+                    - "max_dimension" (int): Frames are downscaled so their longer side is at most this. Default 768.
+                    - "scene_threshold" (float): Difference (0-1) between frames that counts as a scene change.
 
         :param sly_data: A dictionary whose keys are defined by the agent hierarchy,
                 but whose values are meant to be kept out of the chat stream.
 
-        :return: Text string describing the video.
+        :return: A dictionary with the "description" of the video and the "frame_timestamps" (seconds)
+                of the frames it is based on.
         """
 
         # Get file_path from args
@@ -60,36 +70,31 @@ class VideoDescriber(CodedTool):
 
         # User-defined arguments
         openai_model: str = args.get("openai_model", "gpt-4o")
-
-        # Read video and extract frames
-        video = cv2.VideoCapture(file_path)
-        base64_frames: list[str] = []
-        while video.isOpened():
-            success, frame = video.read()
-            if not success:
-                break
-            _, buffer = cv2.imencode(".jpg", frame)
-            base64_frames.append(base64.b64encode(buffer).decode("utf-8"))
-
-        video.release()
-        self.logger.info("%d frames read from %s.", len(base64_frames), file_path)
+        defaults = FrameSamplingSettings()
+        settings = FrameSamplingSettings(
+            mode=args.get("sampling", defaults.mode),
+            interval_seconds=float(args.get("frame_interval_seconds", defaults.interval_seconds)),
+            max_frames=int(args.get("max_frames", defaults.max_frames)),
+            max_dimension=int(args.get("max_dimension", defaults.max_dimension)),
+            scene_threshold=float(args.get("scene_threshold", defaults.scene_threshold)),
+        )
+
+        # Decode and encode in a worker thread, keeping only the sampled frames, so the event loop stays free
+        frames = await asyncio.to_thread(sample_frames, file_path, settings)
+        if not frames:
+            raise ValueError(f"No frames could be read from {file_path}")
+        self.logger.info("%d frames sampled (%s) from %s.", len(frames), settings.mode, file_path)
 
         llm = ChatOpenAI(model=openai_model)
-        content = [
-            {
-                "type": "text",
-                "text": f"{INSTRUCTIONS}",
-            },
-            *[
-                {
-                    "type": "image",
-                    "base64": f"{frame}",
-                    "mime_type": "image/jpeg",
-                }
-                for frame in base64_frames
-            ],
-        ]
+        content: list[dict[str, Any]] = [{"type": "text", "text": INSTRUCTIONS}]
+        for frame in frames:
+            content.append({"type": "text", "text": f"Frame at {frame.timestamp:.1f}s"})
+            content.append({"type": "image", "base64": frame.jpeg_base64, "mime_type": "image/jpeg"})
 
         message = HumanMessage(content=content)
         response = await llm.ainvoke([message])
-        return response.text
+        return {
+            "description": response.text,
+            "frame_timestamps": [frame.timestamp for frame in frames],
+            "sampling": settings.mode,
+        }
@@ -0,0 +1,169 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Keyframe selection for VideoDescriber: decodes a video as a stream and keeps at most a budget of
+downscaled, JPEG-encoded frames, so a long clip never turns into thousands of images in memory or in
+one model request.
+
+Two sampling modes:
+- "interval": one frame every `interval_seconds`, widened when needed so the whole clip fits the budget.
+- "scene": the first frame, every frame that differs enough from the last kept one (a cut), and one
+  frame after `max_gap_seconds` without a cut. Over budget, the weakest cuts are dropped.
+
+sample_frames() blocks while it decodes; call it from a worker thread (asyncio.to_thread).
+"""
+
+import base64
+import heapq
+import itertools
+from dataclasses import dataclass
+from typing import Callable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# pylint: disable=import-error
+import cv2
+import numpy
+
+SAMPLING_MODES = ("interval", "scene")
+
+# Frames are compared for scene changes on a small grayscale thumbnail of this size.
+_THUMBNAIL_SIZE = (64, 36)
+
+
+@dataclass
+class SampledFrame:
+    """One selected frame."""
+
+    timestamp: float
+    index: int
+    jpeg_base64: str
+
+
+@dataclass
+class FrameSamplingSettings:  # pylint: disable=too-many-instance-attributes
+    """How frames are chosen and encoded."""
+
+    mode: str = "interval"
+    interval_seconds: float = 1.0
+    max_frames: int = 32
+    max_dimension: int = 768
+    jpeg_quality: int = 80
+    # Scene mode: mean absolute thumbnail difference (0..1) that counts as a cut.
+    scene_threshold: float = 0.12
+    max_gap_seconds: float = 10.0
+    # Scene mode: frames compared per second of video; the others are skipped without being converted.
+    analysis_fps: float = 4.0
+
+    def __post_init__(self):
+        if self.mode not in SAMPLING_MODES:
+            raise ValueError(f"Unknown sampling mode {self.mode!r}; expected one of {SAMPLING_MODES}")
+        if self.max_frames < 1 or self.interval_seconds <= 0 or self.analysis_fps <= 0:
+            raise ValueError("max_frames, interval_seconds and analysis_fps must be positive")
+
+
+def sample_frames(file_path: str, settings: Optional[FrameSamplingSettings] = None) -> List[SampledFrame]:
+    """
+    Select, downscale and encode the frames of a video, in time order.
+    :param file_path: The video file.
+    :param settings: Sampling settings; defaults apply when omitted.
+    :return: At most settings.max_frames frames.
+    :raises ValueError: If the file cannot be opened as a video.
+    """
+    settings = settings or FrameSamplingSettings()
+    video = cv2.VideoCapture(file_path)
+    try:
+        if not video.isOpened():
+            raise ValueError(f"Cannot open video file {file_path}")
+        fps = video.get(cv2.CAP_PROP_FPS) or 0.0
+        fps = fps if fps > 0 else 25.0
+        frame_count = int(video.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+        if settings.mode == "scene":
+            return _sample_scenes(video, fps, settings)
+        return _sample_interval(video, fps, frame_count, settings)
+    finally:
+        video.release()
+
+
+def _frames(video, wanted: Callable[[int], bool]) -> Iterator[Tuple[int, numpy.ndarray]]:
+    """The wanted frames with their indexes, one at a time; the others are grabbed but never converted."""
+    for index in itertools.count():
+        if not video.grab():
+            return
+        if wanted(index):
+            success, frame = video.retrieve()
+            if success:
+                yield index, frame
+
+
+def _sample_interval(video, fps: float, frame_count: int, settings: FrameSamplingSettings) -> List[SampledFrame]:
+    interval = settings.interval_seconds
+    if frame_count > 0:
+        # Known length: spread the budget over the whole clip.
+        interval = max(interval, frame_count / fps / settings.max_frames)
+    step = max(1, round(interval * fps))
+    kept: List[SampledFrame] = []
+    for index, frame in _frames(video, lambda index: index % step == 0):
+        kept.append(_encode(frame, index, fps, settings))
+        if len(kept) > settings.max_frames:
+            # Unknown or understated length: halve the rate, dropping every other frame kept so far.
+            step *= 2
+            kept = [frame for frame in kept if frame.index % step == 0]
+    return kept
+
+
+def _sample_scenes(video, fps: float, settings: FrameSamplingSettings) -> List[SampledFrame]:
+    step = max(1, round(fps / settings.analysis_fps))
+    # Min-heap on score keeps the strongest max_frames candidates: (score, index, frame).
+    heap: List[Tuple[float, int, SampledFrame]] = []
+    previous: Optional[numpy.ndarray] = None
+    last_kept_time = 0.0
+    for index, frame in _frames(video, lambda index: index % step == 0):
+        thumbnail = cv2.cvtColor(cv2.resize(frame, _THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+        timestamp = index / fps
+        if previous is None:
+            score = float("inf")
+        else:
+            difference = float(numpy.mean(cv2.absdiff(thumbnail, previous))) / 255.0
+            if difference >= settings.scene_threshold:
+                score = difference
+            elif timestamp - last_kept_time >= settings.max_gap_seconds:
+                score = 0.0
+            else:
+                continue
+        previous = thumbnail
+        last_kept_time = timestamp
+        candidate = (score, index, _encode(frame, index, fps, settings))
+        if len(heap) < settings.max_frames:
+            heapq.heappush(heap, candidate)
+        else:
+            heapq.heappushpop(heap, candidate)
+    return sorted((entry[2] for entry in heap), key=lambda frame: frame.index)
+
+
+def _encode(frame: numpy.ndarray, index: int, fps: float, settings: FrameSamplingSettings) -> SampledFrame:
+    """Downscale so the longer side is at most max_dimension, then JPEG- and base64-encode."""
+    height, width = frame.shape[:2]
+    scale = settings.max_dimension / max(height, width)
+    if scale < 1.0:
+        frame = cv2.resize(
+            frame, (max(1, round(width * scale)), max(1, round(height * scale))), interpolation=cv2.INTER_AREA
+        )
+    _, buffer = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, settings.jpeg_quality])
+    return SampledFrame(round(index / fps, 3), index, base64.b64encode(buffer).decode("utf-8"))
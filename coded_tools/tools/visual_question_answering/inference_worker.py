@@ -0,0 +1,297 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Client for a long-lived ml-fastvlm inference worker (vqa_worker.py).
+
+An InferenceWorker starts the worker process on the first question, keeps it, and with it the loaded
+model, for the following ones, and restarts it after it crashes or times out. Questions wait in a
+bounded queue for one of `max_concurrency` slots. A worker left idle for `idle_timeout` seconds is
+stopped to free the model's memory.
+
+All process I/O happens on one background event loop owned by this module, because the server runs
+each session on its own event loop and an asyncio subprocess is bound to the loop that created it.
+ask() can be awaited from any event loop; ask_sync() blocks the calling thread.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import threading
+from asyncio.subprocess import Process
+from collections import deque
+from concurrent.futures import Future
+from time import monotonic
+from typing import Any
+from typing import Awaitable
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vqa_worker.py")
+
+# Longest response line the worker may send; answers are a few hundred bytes.
+_LINE_LIMIT = 16 * 1024 * 1024
+
+
+class InferenceWorkerError(Exception):
+    """The worker could not answer: it is busy, failed to start, or exited mid-question."""
+
+
+class _BackgroundLoop:  # pylint: disable=too-few-public-methods
+    """One event loop on a daemon thread, shared by every InferenceWorker in the process."""
+
+    _lock = threading.Lock()
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def submit(cls, coroutine: Awaitable[Any]) -> Future:
+        """Schedule `coroutine` on the background loop, starting the loop on first use."""
+        with cls._lock:
+            if cls._loop is None:
+                cls._loop = asyncio.new_event_loop()
+                threading.Thread(target=cls._loop.run_forever, name="vqa-inference-worker", daemon=True).start()
+            loop = cls._loop
+        return asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+
+# pylint: disable=too-many-instance-attributes
+class InferenceWorker:
+    """
+    One warm ml-fastvlm process answering questions for one model.
+    """
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        python_cmd: str,
+        *,
+        repo_dir: Optional[str] = None,
+        max_concurrency: int = 1,
+        max_queue: int = 8,
+        idle_timeout: float = 600.0,
+        start_timeout: float = 60.0,
+        worker_script: str = WORKER_SCRIPT,
+    ):
+        """
+        Constructor
+
+        :param python_cmd: The Python interpreter of the ml-fastvlm virtual environment.
+        :param repo_dir: The ml-fastvlm checkout, put on the worker's import path.
+        :param max_concurrency: Questions sent to the worker at once. The worker answers them in
+                order, so more than 1 only pipelines them.
+        :param max_queue: Questions that may wait for a slot; more are rejected as busy.
+        :param idle_timeout: Seconds without questions before the worker is stopped; 0 keeps it.
+        :param start_timeout: Seconds the worker has to start up.
+        :param worker_script: The worker program.
+        """
+        self.python_cmd = python_cmd
+        self.repo_dir = repo_dir
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.idle_timeout = idle_timeout
+        self.start_timeout = start_timeout
+        self.worker_script = worker_script
+        self.starts = 0
+        self._process: Optional[Process] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._sent: Dict[int, Process] = {}
+        self._ids = itertools.count(1)
+        self._waiting = 0
+        self._last_used = monotonic()
+        self._idle_handle: Optional[asyncio.TimerHandle] = None
+        self._stderr_tail: Deque[str] = deque(maxlen=40)
+
+    @property
+    def pid(self) -> Optional[int]:
+        """The worker's process id while it is running."""
+        process = self._process
+        return process.pid if process is not None and process.returncode is None else None
+
+    async def ask(self, script: str, argv: List[str], timeout: float) -> Dict[str, Any]:
+        """
+        Run one ml-fastvlm script in the worker, from any event loop.
+
+        :param script: The script to run, e.g. predict.py.
+        :param argv: Its command line arguments.
+        :param timeout: Seconds to wait for the answer, queueing included.
+        :return: A dictionary with "exit_code", "stdout" and "stderr", as from running the script.
+        :raises TimeoutError: If no answer came in time; the worker is restarted for the next question.
+        :raises InferenceWorkerError: If the worker is busy or could not answer.
+        """
+        return await asyncio.wrap_future(_BackgroundLoop.submit(self._ask(script, argv, timeout)))
+
+    def ask_sync(self, script: str, argv: List[str], timeout: float) -> Dict[str, Any]:
+        """Blocking variant of ask() for synchronous callers."""
+        return _BackgroundLoop.submit(self._ask(script, argv, timeout)).result()
+
+    def close(self) -> None:
+        """Stop the worker process, if it is running."""
+        _BackgroundLoop.submit(self._stop("closed")).result()
+
+    async def _ask(self, script: str, argv: List[str], timeout: float) -> Dict[str, Any]:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._start_lock = asyncio.Lock()
+        if self._waiting >= self.max_concurrency + self.max_queue:
+            raise InferenceWorkerError(f"busy: {self._waiting} questions are already queued")
+        self._waiting += 1
+        request_id = next(self._ids)
+        try:
+            return await asyncio.wait_for(self._ask_in_slot(request_id, script, argv), timeout)
+        except asyncio.TimeoutError as exc:
+            raise TimeoutError(f"no answer within {timeout} seconds") from exc
+        finally:
+            self._sent.pop(request_id, None)
+            self._waiting -= 1
+            self._last_used = monotonic()
+            self._schedule_idle_stop()
+
+    async def _ask_in_slot(self, request_id: int, script: str, argv: List[str]) -> Dict[str, Any]:
+        async with self._slots:
+            process = await self._ensure_started()
+            answer = asyncio.get_running_loop().create_future()
+            line = json.dumps({"id": request_id, "script": script, "argv": argv}) + "\n"
+            self._pending[request_id] = answer
+            self._sent[request_id] = process
+            try:
+                process.stdin.write(line.encode("utf-8"))
+                await process.stdin.drain()
+                return await answer
+            except (BrokenPipeError, ConnectionResetError) as exc:
+                raise InferenceWorkerError(f"worker exited: {self._stderr_summary()}") from exc
+            except asyncio.CancelledError:
+                # Timed out or abandoned: the worker is still busy with this question. Kill it while the
+                # slot is held, so the question waiting for the slot starts a fresh worker instead.
+                self._kill(process, f"question {request_id} was abandoned")
+                raise
+            finally:
+                self._pending.pop(request_id, None)
+
+    async def _ensure_started(self) -> Process:
+        async with self._start_lock:
+            if self._process is not None and self._process.returncode is None:
+                return self._process
+            if self.starts:
+                logger.warning("Restarting the VQA inference worker (start %d)", self.starts + 1)
+            self.starts += 1
+            env = dict(os.environ, PYTHONUNBUFFERED="1")
+            if self.repo_dir:
+                env["VQA_REPO_DIR"] = self.repo_dir
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    self.python_cmd,
+                    self.worker_script,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=env,
+                    limit=_LINE_LIMIT,
+                )
+            except OSError as exc:
+                raise InferenceWorkerError(f"cannot start {self.python_cmd}: {exc}") from exc
+            self._stderr_tail.clear()
+            asyncio.ensure_future(self._drain_stderr(process))
+            try:
+                ready = await asyncio.wait_for(process.stdout.readline(), self.start_timeout)
+            except asyncio.TimeoutError:
+                ready = b""
+            if not ready.strip().startswith(b'{"ready"'):
+                await self._terminate(process)
+                raise InferenceWorkerError(f"worker did not start: {self._stderr_summary()}")
+            self._process = process
+            asyncio.ensure_future(self._read_answers(process))
+            logger.info("VQA inference worker started (pid %d)", process.pid)
+            return process
+
+    async def _read_answers(self, process: Process) -> None:
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                break
+            try:
+                response = json.loads(line)
+            except ValueError:
+                continue
+            answer = self._pending.get(response.pop("id", None))
+            if answer is not None and not answer.done():
+                answer.set_result(response)
+        returncode = await process.wait()
+        if self._process is process:
+            self._process = None
+            logger.warning("VQA inference worker exited with code %s", returncode)
+        for request_id, answer in self._pending.items():
+            # Questions already sent to a newer worker are not affected
+            if self._sent.get(request_id) is process and not answer.done():
+                answer.set_exception(
+                    InferenceWorkerError(f"worker exited with code {returncode}: {self._stderr_summary()}")
+                )
+
+    async def _drain_stderr(self, process: Process) -> None:
+        async for line in process.stderr:
+            text = line.decode("utf-8", "replace").rstrip()
+            self._stderr_tail.append(text)
+            logger.debug("vqa_worker: %s", text)
+
+    def _stderr_summary(self) -> str:
+        return " | ".join(list(self._stderr_tail)[-5:]) or "no output"
+
+    def _schedule_idle_stop(self) -> None:
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+        if self.idle_timeout > 0 and self._process is not None:
+            loop = asyncio.get_running_loop()
+            self._idle_handle = loop.call_later(self.idle_timeout, lambda: asyncio.ensure_future(self._stop_if_idle()))
+
+    async def _stop_if_idle(self) -> None:
+        if self._waiting == 0 and monotonic() - self._last_used >= self.idle_timeout:
+            await self._stop(f"idle for {self.idle_timeout:.0f} seconds")
+
+    def _kill(self, process: Process, reason: str) -> None:
+        """Kill a worker at once and forget it; _read_answers reaps it."""
+        if self._process is process:
+            self._process = None
+        if process.returncode is None:
+            logger.info("Killing the VQA inference worker (pid %d): %s", process.pid, reason)
+            process.kill()
+
+    async def _stop(self, reason: str) -> None:
+        process = self._process
+        self._process = None
+        if process is not None and process.returncode is None:
+            logger.info("Stopping the VQA inference worker (pid %d): %s", process.pid, reason)
+            await self._terminate(process)
+
+    @staticmethod
+    async def _terminate(process: Process) -> None:
+        """Close the worker's stdin so it exits; kill it if it does not within a few seconds."""
+        if process.returncode is not None:
+            await process.wait()
+            return
+        try:
+            process.stdin.close()
+            await asyncio.wait_for(process.wait(), 5.0)
+        except (asyncio.TimeoutError, OSError):
+            process.kill()
+            await process.wait()
@@ -16,14 +16,19 @@
 
 import logging
 import os
-import subprocess
+import threading
 from pathlib import Path
 from typing import Any
 from typing import Dict
+from typing import List
+from typing import Tuple
 from typing import Union
 
 from neuro_san.interfaces.coded_tool import CodedTool
 
+from coded_tools.tools.visual_question_answering.inference_worker import InferenceWorker
+from coded_tools.tools.visual_question_answering.inference_worker import InferenceWorkerError
+
 logger = logging.getLogger(__name__)
 
 # Adjust these to your repo/paths
@@ -57,14 +62,56 @@ DEFAULT_MAX_NUM_OF_TOKENS = 128
 DEFAULT_TEMPERATURE = 0.2
 DEFAULT_TIMEOUT = 120
 
+# Each model is served by one long-lived worker process that keeps it loaded (see inference_worker.py).
+# Questions beyond the concurrency limit wait in a queue of WORKER_MAX_QUEUE; a worker idle for
+# WORKER_IDLE_TIMEOUT seconds is stopped to free the model's memory.
+WORKER_MAX_CONCURRENCY = int(os.environ.get("VQA_WORKER_MAX_CONCURRENCY", "1"))
+WORKER_MAX_QUEUE = int(os.environ.get("VQA_WORKER_MAX_QUEUE", "8"))
+WORKER_IDLE_TIMEOUT = float(os.environ.get("VQA_WORKER_IDLE_TIMEOUT", "600"))
+
+_workers: Dict[str, InferenceWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def _worker_for(model: str) -> InferenceWorker:
+    """The warm worker serving `model`, created on first use."""
+    with _workers_lock:
+        worker = _workers.get(model)
+        if worker is None:
+            worker = InferenceWorker(
+                PYTHON_CMD,
+                repo_dir=REPO_DIR,
+                max_concurrency=WORKER_MAX_CONCURRENCY,
+                max_queue=WORKER_MAX_QUEUE,
+                idle_timeout=WORKER_IDLE_TIMEOUT,
+            )
+            _workers[model] = worker
+        return worker
+
 
 class VisualQuestionAnswering(CodedTool):
     """
     A tool that allows you to query an image or a video.
     """
 
-    # pylint: disable=too-many-locals,too-many-return-statements
     def invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Union[Dict[str, Any], str]:
+        """
+        Provide an answer for a query on an image/video, blocking until the model answers.
+        See async_invoke() for the arguments.
+        """
+        request = self._build_request(args, sly_data)
+        if isinstance(request, str):
+            return request
+        model, script, argv, timeout_sec = request
+        try:
+            payload = _worker_for(model).ask_sync(script, argv, timeout_sec)
+        except TimeoutError:
+            return "Query timed out after " + str(timeout_sec) + " seconds"
+        except InferenceWorkerError as exc:
+            return "Error: " + str(exc)
+        return self._format_answer(payload)
+
+    async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Union[Dict[str, Any], str]:
         """
         Provide an answer for a query on an image/video
         :param args: An dictionary with the following fields
@@ -88,6 +135,25 @@ class VisualQuestionAnswering(CodedTool):
                 a text string an error message in the format:
                 "Error: <error message>"
         """
+        request = self._build_request(args, sly_data)
+        if isinstance(request, str):
+            return request
+        model, script, argv, timeout_sec = request
+        try:
+            payload = await _worker_for(model).ask(script, argv, timeout_sec)
+        except TimeoutError:
+            return "Query timed out after " + str(timeout_sec) + " seconds"
+        except InferenceWorkerError as exc:
+            return "Error: " + str(exc)
+        return self._format_answer(payload)
+
+    def _build_request(
+        self, args: Dict[str, Any], sly_data: Dict[str, Any]
+    ) -> Union[str, Tuple[str, str, List[str], int]]:
+        """
+        Validate the arguments and build the ml-fastvlm script invocation.
+        :return: (model path, script, script arguments, timeout) or an "Error: ..." string.
+        """
         tool_name = self.__class__.__name__
         logger.debug("========== Calling %s ==========", tool_name)
 
@@ -128,9 +194,8 @@ class VisualQuestionAnswering(CodedTool):
             logger.debug("It's an image!")
 
             # Call predict.py
-            cmd = [
-                PYTHON_CMD,
-                PREDICT,
+            script = PREDICT
+            argv = [
                 "--model-path",
                 model,
                 "--image-file",
@@ -144,10 +209,9 @@ class VisualQuestionAnswering(CodedTool):
         elif extension in VIDEO_EXTENSIONS:
             logger.debug("It's a video!")
 
-            # Call predict.py
-            cmd = [
-                PYTHON_CMD,
-                PREDICT_VIDEO,
+            # Call predict_video.py
+            script = PREDICT_VIDEO
+            argv = [
                 "--model-path",
                 model,
                 "--video-path",
@@ -176,24 +240,20 @@ class VisualQuestionAnswering(CodedTool):
                 + " are allowed."
             )
 
-        try:
-            proc = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout_sec,
-                check=False,  # don’t raise automatically; we’ll return stderr if needed
-            )
-        except subprocess.TimeoutExpired:
-            return "Query timed out after " + timeout_sec + " seconds"
+        return model, script, argv, timeout_sec
 
-        # Parse/return
+    def _format_answer(self, result: Dict[str, Any]) -> str:
+        """
+        :param result: The script's "exit_code", "stdout" and "stderr" from the worker.
+        :return: The script's output, or an "Error: ..." string if it failed.
+        """
+        tool_name = self.__class__.__name__
         payload = {
-            "exit_code": proc.returncode,
-            "stdout": proc.stdout.strip(),
-            "stderr": proc.stderr.strip(),
+            "exit_code": result.get("exit_code"),
+            "stdout": str(result.get("stdout") or "").strip(),
+            "stderr": str(result.get("stderr") or "").strip(),
         }
-        if proc.returncode != 0:
+        if payload["exit_code"] != 0:
             return (
                 "Error: exit_code: "
                 + str(payload["exit_code"])
@@ -207,9 +267,3 @@ class VisualQuestionAnswering(CodedTool):
         logger.debug("%s response: %s", tool_name, payload["stdout"])
         logger.debug("========== Done with %s ==========", tool_name)
         return payload["stdout"]
-
-    async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Union[Dict[str, Any], str]:
-        """
-        Delegates to the synchronous invoke method because it's quick, non-blocking.
-        """
-        return self.invoke(args, sly_data)
@@ -0,0 +1,123 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Long-lived ml-fastvlm inference worker, run with the ml-fastvlm virtual environment's Python.
+
+The worker answers requests from InferenceWorker over its stdin/stdout, one JSON object per line:
+
+    request:  {"id": 1, "script": "/path/to/predict.py", "argv": ["--model-path", "...", ...]}
+    response: {"id": 1, "exit_code": 0, "stdout": "...", "stderr": "..."}
+
+Each request runs the unchanged ml-fastvlm script in this process, as `python script argv...` would, with
+its output captured. llava's load_pretrained_model is wrapped so the model is loaded by the first request
+only and kept in memory for the following ones. The worker exits when its stdin is closed.
+
+This file must only use the standard library: it runs outside the neuro-san environment.
+"""
+
+import contextlib
+import functools
+import io
+import json
+import os
+import runpy
+import sys
+import traceback
+
+# Models kept loaded at once; a request for another model unloads the previous one.
+MAX_LOADED_MODELS = 1
+
+
+def keep_models_loaded(repo_dir):
+    """Make llava load each model once per process. Returns False if llava is not importable."""
+    if repo_dir and repo_dir not in sys.path:
+        sys.path.insert(0, repo_dir)
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        from llava.model import builder
+    except ImportError as exc:
+        print(f"vqa_worker: llava is not importable ({exc}); models are loaded per request", file=sys.stderr)
+        return False
+
+    load = builder.load_pretrained_model
+    loaded = {}
+
+    @functools.wraps(load)
+    def load_once(*args, **kwargs):
+        key = repr((args, sorted(kwargs.items())))
+        if key not in loaded:
+            while len(loaded) >= MAX_LOADED_MODELS:
+                loaded.pop(next(iter(loaded)))
+            loaded[key] = load(*args, **kwargs)
+        return loaded[key]
+
+    # The scripts do `from llava.model.builder import load_pretrained_model` each time they run,
+    # which now picks up the wrapper.
+    builder.load_pretrained_model = load_once
+    return True
+
+
+def run_script(script, argv):
+    """Run one script as __main__ with `argv`, returning its exit code and captured output."""
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    exit_code = 0
+    saved_argv = sys.argv
+    sys.argv = [script, *argv]
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            runpy.run_path(script, run_name="__main__")
+    except SystemExit as exc:
+        if isinstance(exc.code, int):
+            exit_code = exc.code
+        elif exc.code is not None:
+            stderr.write(f"{exc.code}\n")
+            exit_code = 1
+    except Exception:  # pylint: disable=broad-exception-caught
+        stderr.write(traceback.format_exc())
+        exit_code = 1
+    finally:
+        sys.argv = saved_argv
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+def main():
+    """Serve requests from stdin until it is closed."""
+    # Answer on a private copy of stdout, and send anything else written to fd 1 (native libraries,
+    # stray prints) to stderr so it cannot corrupt the protocol.
+    protocol = os.fdopen(os.dup(1), "w", encoding="utf-8", buffering=1)
+    os.dup2(2, 1)
+    keep_models_loaded(os.environ.get("VQA_REPO_DIR"))
+    protocol.write(json.dumps({"ready": True, "pid": os.getpid()}) + "\n")
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            exit_code, stdout, stderr = run_script(request["script"], [str(arg) for arg in request["argv"]])
+        except (ValueError, KeyError, TypeError, AttributeError) as exc:
+            exit_code, stdout, stderr = 2, "", f"vqa_worker: malformed request: {exc}"
+        response = {"id": request_id, "exit_code": exit_code, "stdout": stdout, "stderr": stderr}
+        protocol.write(json.dumps(response) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
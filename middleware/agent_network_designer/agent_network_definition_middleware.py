@@ -39,9 +39,7 @@ from langchain.agents.middleware.types import hook_config
 from langchain_core.messages import AIMessage
 from langchain_core.messages import BaseMessage
 from langchain_core.messages import SystemMessage
-from leaf_common.resolution.resolver_util import ResolverUtil
 from neuro_san.interfaces.agent_progress_reporter import AgentProgressReporter
-from neuro_san.internals.persistence.abstract_async_config_restorer import AbstractAsyncConfigRestorer
 from pyparsing.exceptions import ParseException
 
 from coded_tools.agent_network_editor.and_logger import AndLogger
@@ -49,8 +47,10 @@ from coded_tools.agent_network_editor.connectivity_dictionary_converter import C
 from coded_tools.agent_network_editor.constants import AGENT_NETWORK_DEFINITION
 from coded_tools.agent_network_editor.constants import AGENT_NETWORK_NAME
 from coded_tools.agent_network_editor.progress_handler import ProgressHandler
+from coded_tools.agent_network_editor.reservation_config_cache import ReservationConfigCache
 from coded_tools.agent_network_editor.sly_data_lock import SlyDataLock
 from middleware.agent_network_designer.persistence.file_system_agent_network_persistor import DEFAULT_REGISTRIES_DIR
+from neuro_san_studio.utils.hocon_config_cache import HoconConfigCache
 
 AGENT_NETWORK_HOCON_FILE: str = "agent_network_hocon_file"
 AGENT_RESERVATIONS: str = "agent_reservations"
@@ -374,24 +374,18 @@ class AgentNetworkDefinitionMiddleware(AgentMiddleware):
         can read what the server writes without depending on the server's internal
         storage classes.
 
+        Reads go through the process-wide ReservationConfigCache: the S3 client is
+        pooled rather than rebuilt per lookup, and a reservation already read once is
+        revalidated with a conditional GET on its ETag instead of being downloaded and
+        parsed again.
+
         :param bucket: Target S3 bucket name
         :param reservation_id: Reservation ID whose JSON object should be fetched
         :return: Parsed JSON content as a dict (matches what ``AgentNetwork.get_config()``
-                would return for the same reservation)
+                would return for the same reservation). The dict is shared with the
+                cache, so treat it as read-only.
         """
-        boto3_client = ResolverUtil.create_type("boto3.client", install_if_missing="boto3")
-        s3 = boto3_client("s3")
-        key: str = f"reservations/{reservation_id}.json"
-        response: dict[str, Any] = s3.get_object(Bucket=bucket, Key=key)
-        stream = response["Body"]
-        try:
-            body: bytes = stream.read()
-        finally:
-            stream.close()
-        parsed: Any = json.loads(body)
-        if not isinstance(parsed, dict):
-            raise ValueError(f"Reservation JSON must decode to an object, got {type(parsed).__name__}")
-        return parsed
+        return ReservationConfigCache.get_shared().get(bucket, reservation_id)
 
     def _normalize_network_def(self, network_def: dict[str, Any] | list[dict[str, Any]]) -> dict[str, Any]:
         """
@@ -550,7 +544,7 @@ class AgentNetworkDefinitionMiddleware(AgentMiddleware):
         """
         Read and parse an agent network config file into a raw config dictionary.
 
-        ``AbstractAsyncConfigRestorer`` accepts both ``.hocon`` and ``.json`` files, so JSON
+        ``HoconConfigCache`` accepts both ``.hocon`` and ``.json`` files, so JSON
         inputs work as well even though the surrounding API is named for HOCON.
 
         :param network_hocon_file: Agent network config file path (absolute or relative);
@@ -562,10 +556,13 @@ class AgentNetworkDefinitionMiddleware(AgentMiddleware):
         if file_reference is None:
             return None
 
-        # Note we don't need to cache this because we only expect to read the file once.
+        # Parse through the process-wide HoconConfigCache, off the event loop: the same
+        # registry files are read by discovery, export and validation too, and a pyhocon
+        # parse is slow enough to stall every other conversation on this loop.
         try:
-            hocon = AbstractAsyncConfigRestorer(file_purpose="get_agent_network_definition", must_exist=True)
-            return await hocon.async_restore(file_reference=file_reference)
+            return await asyncio.to_thread(
+                HoconConfigCache.restore, file_reference, file_purpose="get_agent_network_definition"
+            )
         except FileNotFoundError:
             error_message: str = f"Error: Agent network config file not found: {file_reference}"
             self.logger.error(error_message)
@@ -579,14 +576,15 @@ class AgentNetworkDefinitionMiddleware(AgentMiddleware):
             self.error_message = error_message
             return None
         except ValueError as value_error:
-            # Raised by AbstractAsyncConfigRestorer when the file extension is not .hocon or .json.
+            # Raised by HoconConfigCache when the file extension is not .hocon or .json,
+            # and for HOCON/JSON parse failures.
             error_message = f"Error: Unsupported agent network config file '{file_reference}'. {value_error}"
             self.logger.error(error_message)
             self.error_message = error_message
             return None
         except ParseException as parse_error:
-            # AbstractAsyncConfigRestorer wraps HOCON/JSON parse failures (ParseException,
-            # ParseSyntaxException, JSONDecodeError, ConfigException) into ParseException.
+            # HoconConfigCache wraps HOCON/JSON parse failures into ValueError (above); a bare
+            # pyparsing ParseException escaping unwrapped is still reported as a parse failure.
             error_message = f"Error: Failed to parse agent network config file '{file_reference}'. {parse_error}"
             self.logger.error(error_message)
             self.error_message = error_message
@@ -732,10 +730,11 @@ class AgentNetworkDefinitionMiddleware(AgentMiddleware):
             # Get from file
             try:
                 use_file = "registries/aaosa.hocon"
-                hocon = AbstractAsyncConfigRestorer(
-                    file_purpose="get_agent_network_definition - custom instructions", must_exist=True
+                config: dict[str, Any] = await asyncio.to_thread(
+                    HoconConfigCache.restore,
+                    use_file,
+                    file_purpose="get_agent_network_definition - custom instructions",
                 )
-                config: dict[str, Any] = await hocon.async_restore(file_reference=use_file)
                 aaosa_instructions = config.get("aaosa_instructions", "")
             except FileNotFoundError:
                 aaosa_instructions = ""
@@ -20,6 +20,7 @@ from typing import Any
 from neuro_san.interfaces.reservation import Reservation
 from neuro_san.internals.reservations.reservation_util import ReservationUtil
 
+from coded_tools.agent_network_editor.reservation_config_cache import ReservationConfigCache
 from middleware.agent_network_designer.persistence.agent_network_assembler import AgentNetworkAssembler
 from middleware.agent_network_designer.persistence.agent_network_persistor import AgentNetworkPersistor
 from middleware.agent_network_designer.persistence.deployable_agent_network_assembler import (
@@ -99,6 +100,15 @@ class ReservationsAgentNetworkPersistor(AgentNetworkPersistor):
         if error is not None:
             return error
 
+        # The server has just (re)written reservations/<id>.json in the bucket
+        # AgentNetworkDefinitionMiddleware reads from. Writes go through the
+        # Reservationist rather than S3 directly, so keep the shared reservation
+        # cache coherent with them here: the next designer turn then does a plain
+        # read of the deployed spec instead of a conditional GET certain to miss.
+        bucket: str = environ.get("AGENT_RESERVATIONS_S3_BUCKET", "")
+        if bucket:
+            ReservationConfigCache.get_shared().invalidate(bucket, reservation.get_reservation_id())
+
         agent_reservations: list[dict[str, Any]] = [
             {
                 "reservation_id": reservation.get_reservation_id(),
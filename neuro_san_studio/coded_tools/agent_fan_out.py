@@ -0,0 +1,255 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import logging
+import statistics
+import time
+from collections import deque
+from contextlib import aclosing
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Optional
+from typing import Sequence
+from weakref import WeakKeyDictionary
+
+from neuro_san_studio.coded_tools.agent_caller import AgentCaller
+
+# Latencies kept per agent name for latency_summary(); older ones are dropped first.
+MAX_LATENCY_SAMPLES: int = 1000
+
+
+@dataclass
+class AgentCall:
+    """
+    One call in a fan-out: which agent to call and with what
+    """
+
+    caller: AgentCaller
+    tool_args: dict[str, Any]
+    sly_data: Optional[dict[str, Any]] = None
+
+
+@dataclass
+class AgentCallResult:
+    """
+    The outcome of one AgentCall
+    """
+
+    # Position of the call in the list given to the fan-out, since results arrive in completion order
+    index: int
+    name: str
+    response: Optional[str] = None
+    # The exception the call raised, or a TimeoutError when it ran past a deadline
+    error: Optional[BaseException] = None
+    # Seconds from getting a concurrency slot to finishing; 0.0 if the call never started
+    latency_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """
+        :return: True if the call returned a response
+        """
+        return self.error is None
+
+
+@dataclass
+class _FanOutState:
+    """
+    Bookkeeping of one as_completed() run
+    """
+
+    tasks: dict[asyncio.Task, int] = field(default_factory=dict)
+    started_at: dict[int, float] = field(default_factory=dict)
+
+
+class AgentFanOut:
+    """
+    Calls many agents concurrently and hands back their results as they complete.
+
+    All calls made through one AgentFanOut share its concurrency limit, so a single
+    instance can cap the agent calls of several fan-outs (or several coded tools).
+    The limit is kept per event loop, since each server session runs its own loop.
+
+    Two deadlines apply: call_timeout bounds each call once it has a concurrency slot,
+    and timeout bounds a whole as_completed()/gather() run. A call that runs past
+    either one is cancelled and reported with a TimeoutError rather than raised,
+    so callers always get a result per call they did not stop waiting for.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        call_timeout: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Constructor
+
+        :param max_concurrency: Most agent calls in flight at once
+        :param call_timeout: Seconds each call may run, or None for no limit
+        :param timeout: Seconds a whole fan-out may run, or None for no limit
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        self.max_concurrency: int = max_concurrency
+        self.call_timeout: Optional[float] = call_timeout
+        self.timeout: Optional[float] = timeout
+        self._semaphores: WeakKeyDictionary = WeakKeyDictionary()
+        self._latencies: dict[str, deque] = {}
+
+    async def as_completed(self, calls: Sequence[AgentCall]) -> AsyncIterator[AgentCallResult]:
+        """
+        Start every call and yield each result as soon as it is available.
+
+        Stopping early cancels the calls still running (the stragglers). Use
+        contextlib.aclosing() around the iteration when breaking out of it, so the
+        cancellation happens right away instead of whenever the generator is collected.
+
+        :param calls: The calls to make
+        :return: An async iterator of one AgentCallResult per call, in completion order
+        """
+        loop = asyncio.get_running_loop()
+        deadline: Optional[float] = None if self.timeout is None else loop.time() + self.timeout
+        state = _FanOutState()
+        for index, call in enumerate(calls):
+            task = asyncio.ensure_future(self._run(index, call, state))
+            state.tasks[task] = index
+
+        try:
+            pending = set(state.tasks)
+            while pending:
+                remaining: Optional[float] = None if deadline is None else max(0.0, deadline - loop.time())
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    # Overall deadline: report what did not finish, then cancel it below
+                    for task in sorted(pending, key=state.tasks.get):
+                        index: int = state.tasks[task]
+                        result = self._timed_out(index, calls[index], state, "the fan-out deadline")
+                        if index in state.started_at:
+                            self._record(result)
+                        yield result
+                    return
+                for task in sorted(done, key=state.tasks.get):
+                    yield task.result()
+        finally:
+            stragglers = [task for task in state.tasks if not task.done()]
+            for task in stragglers:
+                task.cancel()
+            if stragglers:
+                await asyncio.gather(*stragglers, return_exceptions=True)
+
+    async def gather(
+        self,
+        calls: Sequence[AgentCall],
+        quorum: Optional[int] = None,
+        accept: Optional[Callable[[AgentCallResult], bool]] = None,
+    ) -> list[AgentCallResult]:
+        """
+        Make every call and collect the results, optionally stopping at a quorum.
+
+        :param calls: The calls to make
+        :param quorum: Stop once this many results are accepted and cancel the rest
+                       (first-k completion), or None to wait for every call
+        :param accept: Decides which results count towards the quorum; defaults to
+                       every successful result
+        :return: The results received, in completion order. Sort by index to restore call order.
+        """
+        accept = accept or (lambda result: result.ok)
+        results: list[AgentCallResult] = []
+        accepted: int = 0
+        async with aclosing(self.as_completed(calls)) as completed:
+            async for result in completed:
+                results.append(result)
+                if accept(result):
+                    accepted += 1
+                    if quorum is not None and accepted >= quorum:
+                        break
+        return results
+
+    def latency_summary(self) -> dict[str, dict[str, float]]:
+        """
+        :return: Per agent name, the count, mean, p50, p95 and max of the latest call latencies in seconds
+        """
+        summary: dict[str, dict[str, float]] = {}
+        for name, samples in self._latencies.items():
+            ordered = sorted(samples)
+            summary[name] = {
+                "count": len(ordered),
+                "mean": statistics.fmean(ordered),
+                "p50": ordered[int(0.50 * (len(ordered) - 1))],
+                "p95": ordered[int(0.95 * (len(ordered) - 1))],
+                "max": ordered[-1],
+            }
+        return summary
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """
+        :return: The concurrency limit of the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        semaphore: Optional[asyncio.Semaphore] = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def _run(self, index: int, call: AgentCall, state: _FanOutState) -> AgentCallResult:
+        """
+        Make one call under the concurrency limit and the per-call deadline
+        """
+        name: str = call.caller.get_name()
+        async with self._semaphore():
+            started: float = time.monotonic()
+            state.started_at[index] = started
+            try:
+                response: str = await asyncio.wait_for(
+                    call.caller.call_agent(call.tool_args, sly_data=call.sly_data), self.call_timeout
+                )
+                result = AgentCallResult(index, name, response=response)
+            except asyncio.TimeoutError:
+                result = self._timed_out(index, call, state, "its call_timeout")
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                result = AgentCallResult(index, name, error=exception)
+            result.latency_seconds = time.monotonic() - started
+        self._record(result)
+        return result
+
+    def _timed_out(self, index: int, call: AgentCall, state: _FanOutState, deadline: str) -> AgentCallResult:
+        """
+        :return: The result of a call cancelled at a deadline
+        """
+        started: Optional[float] = state.started_at.get(index)
+        latency: float = 0.0 if started is None else time.monotonic() - started
+        name: str = call.caller.get_name()
+        logging.warning("Agent call %d to %s ran past %s after %.1fs", index, name, deadline, latency)
+        return AgentCallResult(index, name, error=TimeoutError(f"{name} ran past {deadline}"), latency_seconds=latency)
+
+    def _record(self, result: AgentCallResult) -> None:
+        """
+        Keep the latency of a finished call for latency_summary()
+        """
+        logging.debug(
+            "Agent call %d to %s took %.3fs (ok=%s)", result.index, result.name, result.latency_seconds, result.ok
+        )
+        samples: Optional[deque] = self._latencies.get(result.name)
+        if samples is None:
+            samples = deque(maxlen=MAX_LATENCY_SAMPLES)
+            self._latencies[result.name] = samples
+        samples.append(result.latency_seconds)
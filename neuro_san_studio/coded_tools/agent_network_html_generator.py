@@ -14,7 +14,6 @@
 #
 # END COPYRIGHT
 
-import asyncio
 import json
 import logging
 import os
@@ -26,6 +25,8 @@ from neuro_san.interfaces.coded_tool import CodedTool
 from neuro_san.internals.graph.persistence.agent_network_restorer import AgentNetworkRestorer
 from pyvis.network import Network
 
+from neuro_san_studio.utils.cpu_pool import CpuPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -93,8 +94,8 @@ class AgentNetworkHtmlGenerator(CodedTool):
         return f"{agent_name}.html was successfully generated."
 
     async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> str:
-        """Run invoke asynchronously."""
-        return await asyncio.to_thread(self.invoke, args, sly_data)
+        """Run invoke on the shared CPU pool; parsing the network and laying out the graph are CPU-bound."""
+        return await CpuPool.run(self.invoke, args, sly_data)
 
 
 def generate_html(agent_name: str, network_dict: Dict[str, Any]):
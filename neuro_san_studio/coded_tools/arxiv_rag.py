@@ -21,6 +21,8 @@ from typing import Dict
 from neuro_san.interfaces.coded_tool import CodedTool
 
 from neuro_san_studio.coded_tools.base_rag import BaseRag
+from neuro_san_studio.coded_tools.modified_arxiv_retriever import DEFAULT_ARXIV_CACHE_DIR
+from neuro_san_studio.coded_tools.modified_arxiv_retriever import DEFAULT_ARXIV_CACHE_MAX_BYTES
 from neuro_san_studio.coded_tools.modified_arxiv_retriever import ModifiedArxivRetriever
 
 logging.basicConfig(level=logging.INFO)
@@ -47,6 +49,9 @@ class ArxivRag(CodedTool):
             "sort_order": options are `ascending` and `descending`. Default to `descending`.
             "max_concurrent_downloads": maximum number of PDFs downloaded in parallel
                 when `get_full_documents` is True (default is 5)
+            "cache_dir": directory of the cache of extracted paper text, shared across sessions
+                (default is ~/.cache/neuro-san-studio/arxiv; an empty string disables the cache)
+            "cache_max_mb": most megabytes of compressed text kept in the cache (default is 512)
 
         :param sly_data: A dictionary whose keys are defined by the agent
             hierarchy, but whose values are meant to be kept out of the
@@ -88,6 +93,8 @@ class ArxivRag(CodedTool):
             sort_by=args.get("sort_by") or "relevance",
             sort_order=args.get("sort_order") or "descending",
             max_concurrent_downloads=args.get("max_concurrent_downloads") or 5,
+            cache_dir=args.get("cache_dir", DEFAULT_ARXIV_CACHE_DIR) or None,
+            cache_max_bytes=int(float(args.get("cache_max_mb") or DEFAULT_ARXIV_CACHE_MAX_BYTES / 2**20) * 2**20),
         )
 
         # Query the retriever
@@ -182,8 +182,11 @@ class BaseRag(ABC):
         """Load and split documents"""
         # Load documents and build the vector store
         docs: list[Document] = await self.load_documents(loader_args)
+        return self.split_documents(docs)
 
-        # Split documents into smaller chunks for better embedding and retrieval
+    @staticmethod
+    def split_documents(docs: list[Document]) -> list[Document]:
+        """Split documents into smaller chunks for better embedding and retrieval."""
         text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(chunk_size=100, chunk_overlap=50)
 
         doc_chunks: list[Document] = text_splitter.split_documents(docs)
@@ -274,19 +277,23 @@ class BaseRag(ABC):
             logger.error("Fail to create vector store due to invalid DB name. %s\n", invalid_catalog_error)
             return None
 
-    async def _save_vector_store(self, vectorstore: VectorStore, vector_store_type: Literal["in_memory", "postgres"]):
-        """Save vector store to file if configured."""
+    async def _save_vector_store(
+        self, vectorstore: VectorStore, vector_store_type: Literal["in_memory", "postgres"]
+    ) -> bool:
+        """Save vector store to file if configured. Returns True if the file was written."""
         should_save: bool = self.save_vector_store and self.abs_vector_store_path and vector_store_type == "in_memory"
 
         if not should_save:
-            return None
+            return False
 
         try:
             os.makedirs(os.path.dirname(self.abs_vector_store_path), exist_ok=True)
             vectorstore.dump(path=self.abs_vector_store_path)
             logger.info("Vector store saved to: %s\n", self.abs_vector_store_path)
+            return True
         except OSError as os_error:
             logger.error("Failed to save vector store to %s: %s\n", self.abs_vector_store_path, os_error)
+            return False
 
     async def query_vectorstore(self, vectorstore: VectorStore, query: str) -> str:
         """
@@ -17,16 +17,32 @@
 """Tool module for doing RAG from Confluence pages."""
 
 import asyncio
+import json
 import logging
+import multiprocessing
 import os
+import threading
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from datetime import timezone
 from io import BytesIO
 from pathlib import Path
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
 
 from bs4 import BeautifulSoup
 from langchain_core.documents import Document
+from langchain_core.vectorstores import InMemoryVectorStore
+from langchain_core.vectorstores import VectorStore
 from leaf_common.resolution.resolver_util import ResolverUtil
 from neuro_san.interfaces.coded_tool import CodedTool
 from requests.exceptions import HTTPError
@@ -40,12 +56,24 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 PAGE_EXPANSIONS = "body.storage,version"
+VERSION_EXPANSIONS = "version"
 DEFAULT_PAGE_LIMIT = 50
 DEFAULT_MAX_PAGES = 1000
+DEFAULT_PAGE_CONCURRENCY = 8
+DEFAULT_EXTRACTION_WORKERS = min(4, os.cpu_count() or 1)
+# OCR is the heaviest extraction in memory and CPU, so fewer run at once than the other kinds.
+DEFAULT_EXTRACTION_LIMITS = {"image": 2, "svg": 2}
+ATTACHMENT_KINDS = ("pdf", "image", "svg", "docx", "excel")
+
+
+class _NoApiPermissionError(Exception):
+    """Stands in for atlassian's ApiPermissionError when atlassian is not installed; never raised."""
+
 
 CONFLUENCE_TYPE = ResolverUtil.create_type("atlassian.Confluence", raise_if_not_found=False)
 API_PERMISSION_ERROR_TYPE = ResolverUtil.create_type("atlassian.errors.ApiPermissionError", raise_if_not_found=False)
-API_PERMISSION_ERRORS = (API_PERMISSION_ERROR_TYPE,) if API_PERMISSION_ERROR_TYPE is not None else ()
+# Always real exception classes, so `except API_PERMISSION_ERRORS` is valid with or without atlassian
+API_PERMISSION_ERRORS = (API_PERMISSION_ERROR_TYPE or _NoApiPermissionError,)
 IMAGE_OPEN = ResolverUtil.create_type("PIL.Image.open", raise_if_not_found=False)
 IMAGE_TO_STRING = ResolverUtil.create_type("pytesseract.image_to_string", raise_if_not_found=False)
 SVG_TO_DRAWING = ResolverUtil.create_type("svglib.svglib.svg2rlg", raise_if_not_found=False)
@@ -54,6 +82,131 @@ DOCX_PROCESS = ResolverUtil.create_type("docx2txt.process", raise_if_not_found=F
 READ_EXCEL = ResolverUtil.create_type("pandas.read_excel", raise_if_not_found=False)
 
 
+@dataclass
+class ConfluenceSyncState:
+    """What the last incremental sync indexed, persisted as one JSON file next to the vector store.
+
+    ``pages`` maps each indexed page id to its Confluence version number. ``attachments`` caches
+    extracted attachment text by attachment key (id, version and OCR languages), each entry recording
+    the page it belongs to. An unreadable or missing file reads as an empty state.
+    """
+
+    path: str
+    pages: Dict[str, int] = field(default_factory=dict)
+    attachments: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    synced_at: Optional[str] = None
+
+    @classmethod
+    def load(cls, path: str) -> "ConfluenceSyncState":
+        """Read the state at *path*, or an empty state if there is none."""
+        try:
+            with open(path, "r", encoding="utf-8") as state_file:
+                data = json.load(state_file)
+            return cls(
+                path=path,
+                pages={str(page_id): int(version) for page_id, version in data.get("pages", {}).items()},
+                attachments=dict(data.get("attachments", {})),
+                synced_at=data.get("synced_at"),
+            )
+        except (OSError, ValueError, TypeError, AttributeError):
+            return cls(path=path)
+
+    def save(self) -> None:
+        """Write the state atomically; a failed write is logged and leaves the previous file in place."""
+        self.synced_at = datetime.now(timezone.utc).isoformat()
+        data = {"synced_at": self.synced_at, "pages": self.pages, "attachments": self.attachments}
+        temp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as state_file:
+                json.dump(data, state_file)
+            os.replace(temp_path, self.path)
+        except OSError as os_error:
+            logger.error("Failed to save Confluence sync state to %s: %s", self.path, os_error)
+
+
+class AttachmentExtractor:
+    """Extracts attachment text in worker processes, with a concurrency limit per attachment kind.
+
+    With ``workers`` set to 0 the text is extracted in the calling thread. Extracted text is cached
+    by attachment key, so an attachment whose version has not changed is neither downloaded nor
+    extracted again. Safe to call from several threads.
+    """
+
+    def __init__(
+        self,
+        extract: Callable[[bytes, str, str, Optional[str]], str],
+        workers: int = 0,
+        limits: Optional[Dict[str, int]] = None,
+        cache: Optional[Dict[str, Dict[str, str]]] = None,
+    ):
+        """Initialize the extractor.
+
+        :param extract: Picklable function (content, title, media type, OCR languages) -> text.
+        :param workers: Number of worker processes; 0 extracts in the calling thread.
+        :param limits: Most extractions of one kind ("pdf", "image", "svg", "docx", "excel") running at
+            once. Kinds not listed may use every worker.
+        :param cache: Attachment key -> {"page": page id, "text": extracted text}, updated in place.
+        """
+        self.extract_function = extract
+        self.cache: Dict[str, Dict[str, str]] = cache if cache is not None else {}
+        self.used_keys: Set[str] = set()
+        limits = limits or {}
+        self._limits = {
+            kind: threading.BoundedSemaphore(max(1, int(limits.get(kind, max(1, workers)))))
+            for kind in ATTACHMENT_KINDS
+        }
+        # Spawned rather than forked: the server process runs many threads, which fork does not copy safely.
+        self._pool: Optional[Executor] = (
+            ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            if workers > 0
+            else None
+        )
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "AttachmentExtractor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def cached_text(self, key: Optional[str]) -> Optional[str]:
+        """The text cached for *key*, marking it as still in use, or None."""
+        if key is None:
+            return None
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                return None
+            self.used_keys.add(key)
+            return entry.get("text", "")
+
+    def remember(self, key: Optional[str], page_id: str, text: str) -> None:
+        """Cache the text extracted for *key*."""
+        if key is None:
+            return
+        with self._lock:
+            self.cache[key] = {"page": page_id, "text": text}
+            self.used_keys.add(key)
+
+    def extract(self, content: bytes, title: str, media_type: str, ocr_languages: Optional[str]) -> str:
+        """Extract the text of one attachment, waiting for a slot of its kind."""
+        kind = ConfluenceRag.attachment_kind(title, media_type)
+        if kind is None:
+            # Unsupported kinds are only logged; no need to hand them to a worker
+            return self.extract_function(content, title, media_type, ocr_languages)
+        with self._limits[kind]:
+            if self._pool is None:
+                return self.extract_function(content, title, media_type, ocr_languages)
+            return self._pool.submit(self.extract_function, content, title, media_type, ocr_languages).result()
+
+
 class ConfluenceRag(CodedTool, BaseRag):
     """
     CodedTool implementation which provides a way to do RAG on confluence pages
@@ -98,6 +251,9 @@ class ConfluenceRag(CodedTool, BaseRag):
                 "limit",
                 "max_pages",
                 "ocr_languages",
+                "page_concurrency",
+                "extraction_workers",
+                "extraction_limits",
             )
             if name in args
         }
@@ -131,7 +287,13 @@ class ConfluenceRag(CodedTool, BaseRag):
         self.configure_vector_store_path(args.get("vector_store_path"))
 
         # Prepare the vector store
-        vectorstore = await self.generate_vector_store(loader_args=loader_args)
+        if args.get("incremental_sync", False):
+            if not self.abs_vector_store_path:
+                logger.error("'incremental_sync' requires 'vector_store_path'")
+                return "❌ 'incremental_sync' requires 'vector_store_path' to keep the synced vector store in."
+            vectorstore = await self.sync_vector_store(loader_args)
+        else:
+            vectorstore = await self.generate_vector_store(loader_args=loader_args)
 
         # Run the query against the vector store
         return await self.query_vectorstore(vectorstore, query)
@@ -157,27 +319,180 @@ class ConfluenceRag(CodedTool, BaseRag):
 
         return docs
 
+    async def sync_vector_store(self, loader_args: Dict[str, Any]) -> Optional[VectorStore]:
+        """
+        Bring the saved in-memory vector store up to date with Confluence and save it.
+
+        Only pages whose version differs from the last sync are fetched and embedded again; the chunks
+        of changed and deleted pages are replaced in the existing store. The sync state is kept next
+        to the vector store file, and without a saved store every page is loaded.
+
+        :param loader_args: Dictionary containing 'url', 'space_key', and/or 'page_ids' of the Confluence pages to load
+        :return: The updated vector store
+        """
+        state_path = self.abs_vector_store_path.removesuffix(".json") + ".sync.json"
+        state = ConfluenceSyncState.load(state_path)
+        vectorstore = await self._load_existing_vector_store()
+        if vectorstore is None:
+            # Nothing to update in place; every page has to be indexed
+            state.pages = {}
+
+        url = loader_args.get("url")
+        try:
+            docs, stale_page_ids = await asyncio.to_thread(self._sync_documents_sync, loader_args, state)
+        except HTTPError as http_error:
+            logger.error("HTTP error while syncing from %s: %s", url, http_error)
+            return vectorstore
+        except API_PERMISSION_ERRORS as api_error:
+            logger.error("API Permission error while syncing from %s: %s", url, api_error)
+            return vectorstore
+        logger.info(
+            "Synced Confluence pages from %s: %d changed or new, %d stale", url, len(docs), len(stale_page_ids)
+        )
+
+        doc_chunks = self.split_documents(docs)
+        if vectorstore is None:
+            vectorstore = await InMemoryVectorStore.afrom_documents(documents=doc_chunks, embedding=self.embeddings)
+        else:
+            stale_ids = [
+                chunk_id
+                for chunk_id, record in vectorstore.store.items()
+                if record.get("metadata", {}).get("id") in stale_page_ids
+            ]
+            if stale_ids:
+                vectorstore.delete(stale_ids)
+            if doc_chunks:
+                await vectorstore.aadd_documents(doc_chunks)
+
+        self.save_vector_store = True
+        # The state must not claim pages the saved store does not contain
+        if await self._save_vector_store(vectorstore, "in_memory"):
+            state.save()
+        return vectorstore
+
     def _load_documents_sync(self, loader_args: Dict[str, Any]) -> List[Document]:
         """Load and convert Confluence pages using the synchronous Atlassian client."""
-        if CONFLUENCE_TYPE is None:
-            logger.error("Confluence support requires the 'atlassian-python-api' package")
+        confluence = self._create_client(loader_args)
+        if confluence is None:
             return []
 
-        url = loader_args["url"]
-        confluence = CONFLUENCE_TYPE(
-            url=url,
+        pages = self._get_pages(confluence, loader_args)
+        with self._create_extractor(loader_args) as extractor:
+            return self._convert_pages(
+                lambda page: self._page_to_document(
+                    confluence,
+                    loader_args["url"],
+                    page,
+                    loader_args.get("include_attachments", False),
+                    loader_args.get("ocr_languages"),
+                    extractor,
+                ),
+                pages,
+                loader_args,
+            )
+
+    def _sync_documents_sync(
+        self, loader_args: Dict[str, Any], state: ConfluenceSyncState
+    ) -> Tuple[List[Document], Set[str]]:
+        """
+        Load the pages that changed since the sync recorded in *state*, and update *state* in place.
+
+        Pages are listed with their version only; the bodies and attachments of pages whose version
+        differs from *state* are then fetched.
+
+        :return: Documents of the changed pages, and the ids of the pages whose indexed chunks are stale
+            (changed or no longer listed)
+        """
+        confluence = self._create_client(loader_args)
+        if confluence is None:
+            return [], set()
+
+        listed = {
+            str(page["id"]): self._page_version(page)
+            for page in self._get_pages(confluence, loader_args, expand=VERSION_EXPANSIONS)
+        }
+        changed = [
+            page_id for page_id, version in listed.items() if version is None or state.pages.get(page_id) != version
+        ]
+        stale_page_ids = set(changed) | (set(state.pages) - set(listed))
+
+        with self._create_extractor(loader_args, state.attachments) as extractor:
+
+            def fetch_and_convert(page_id: str) -> Optional[Document]:
+                page = confluence.get_page_by_id(page_id=page_id, expand=PAGE_EXPANSIONS)
+                if not page or not page.get("id"):
+                    return None
+                listed[page_id] = self._page_version(page)
+                return self._page_to_document(
+                    confluence,
+                    loader_args["url"],
+                    page,
+                    loader_args.get("include_attachments", False),
+                    loader_args.get("ocr_languages"),
+                    extractor,
+                )
+
+            docs = self._convert_pages(fetch_and_convert, changed, loader_args)
+            used_keys = extractor.used_keys
+
+        converted = {doc.metadata["id"] for doc in docs if doc is not None}
+        state.pages = {
+            page_id: version
+            for page_id, version in listed.items()
+            if version is not None and (page_id in converted or page_id not in stale_page_ids)
+        }
+        # Keep cached text of unchanged pages, and of the changed pages' attachments that are still attached
+        state.attachments = {
+            key: entry
+            for key, entry in state.attachments.items()
+            if entry.get("page") in state.pages and (entry.get("page") not in stale_page_ids or key in used_keys)
+        }
+        return [doc for doc in docs if doc is not None], stale_page_ids
+
+    @staticmethod
+    def _create_client(loader_args: Dict[str, Any]) -> Any:
+        """The Atlassian Confluence client, or None if the package is not installed."""
+        if CONFLUENCE_TYPE is None:
+            logger.error("Confluence support requires the 'atlassian-python-api' package")
+            return None
+        return CONFLUENCE_TYPE(
+            url=loader_args["url"],
             username=loader_args.get("username"),
             password=loader_args.get("api_key"),
             cloud=loader_args.get("cloud", True),
         )
-        pages = self._get_pages(confluence, loader_args)
-        include_attachments = loader_args.get("include_attachments", False)
-        ocr_languages = loader_args.get("ocr_languages")
 
-        return [self._page_to_document(confluence, url, page, include_attachments, ocr_languages) for page in pages]
+    def _create_extractor(
+        self, loader_args: Dict[str, Any], cache: Optional[Dict[str, Dict[str, str]]] = None
+    ) -> AttachmentExtractor:
+        """The attachment extractor for one load; worker processes are only started when attachments are enabled."""
+        workers = loader_args.get("extraction_workers", DEFAULT_EXTRACTION_WORKERS)
+        return AttachmentExtractor(
+            self._extract_attachment_text,
+            workers=workers if loader_args.get("include_attachments", False) else 0,
+            limits={**DEFAULT_EXTRACTION_LIMITS, **(loader_args.get("extraction_limits") or {})},
+            cache=cache,
+        )
+
+    @staticmethod
+    def _convert_pages(convert: Callable[[Any], Any], pages: List[Any], loader_args: Dict[str, Any]) -> List[Any]:
+        """Apply *convert* to every page on a pool of threads, keeping the order of *pages*."""
+        concurrency = max(1, int(loader_args.get("page_concurrency", DEFAULT_PAGE_CONCURRENCY)))
+        if concurrency == 1 or len(pages) < 2:
+            return [convert(page) for page in pages]
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="confluence-page") as executor:
+            return list(executor.map(convert, pages))
+
+    @staticmethod
+    def _page_version(page: Dict[str, Any]) -> Optional[int]:
+        """The version number of a Confluence API page, or None if the response has none."""
+        number = page.get("version", {}).get("number")
+        return int(number) if number is not None else None
 
     @staticmethod
-    def _get_pages(confluence: Any, loader_args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _get_pages(
+        confluence: Any, loader_args: Dict[str, Any], expand: str = PAGE_EXPANSIONS
+    ) -> List[Dict[str, Any]]:
         """Fetch configured pages, preserving order and removing duplicates."""
         pages: List[Dict[str, Any]] = []
         seen_page_ids = set()
@@ -193,7 +508,7 @@ class ConfluenceRag(CodedTool, BaseRag):
                     start=start,
                     limit=min(limit, max_pages - len(pages)),
                     status="current",
-                    expand=PAGE_EXPANSIONS,
+                    expand=expand,
                 )
                 if not batch:
                     break
@@ -213,7 +528,7 @@ class ConfluenceRag(CodedTool, BaseRag):
             page_id = str(page_id)
             if page_id in seen_page_ids:
                 continue
-            page = confluence.get_page_by_id(page_id=page_id, expand=PAGE_EXPANSIONS)
+            page = confluence.get_page_by_id(page_id=page_id, expand=expand)
             response_page_id = str(page.get("id", "")) if page else ""
             if response_page_id:
                 seen_page_ids.add(response_page_id)
@@ -231,13 +546,14 @@ class ConfluenceRag(CodedTool, BaseRag):
         page: Dict[str, Any],
         include_attachments: bool,
         ocr_languages: str | None,
+        extractor: AttachmentExtractor | None = None,
     ) -> Document:
         """Convert one Confluence API page into a LangChain document."""
         page_id = str(page.get("id", ""))
         html = page.get("body", {}).get("storage", {}).get("value", "")
         text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
         if include_attachments and page_id:
-            text += "".join(self._load_attachment_texts(confluence, base_url, page_id, ocr_languages))
+            text += "".join(self._load_attachment_texts(confluence, base_url, page_id, ocr_languages, extractor))
 
         metadata = {
             "title": page.get("title", "Untitled"),
@@ -249,10 +565,17 @@ class ConfluenceRag(CodedTool, BaseRag):
             metadata["when"] = updated_at
         return Document(page_content=text, metadata=metadata)
 
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments,too-many-locals
     def _load_attachment_texts(
-        self, confluence: Any, base_url: str, page_id: str, ocr_languages: str | None
+        self,
+        confluence: Any,
+        base_url: str,
+        page_id: str,
+        ocr_languages: str | None,
+        extractor: AttachmentExtractor | None = None,
     ) -> List[str]:
-        """Download and extract text from supported page attachments."""
+        """Download and extract text from supported page attachments, reusing cached text of unchanged ones."""
+        extractor = extractor or AttachmentExtractor(self._extract_attachment_text)
         attachments = confluence.get_attachments_from_content(page_id).get("results", [])
         texts = []
         for attachment in attachments:
@@ -261,20 +584,33 @@ class ConfluenceRag(CodedTool, BaseRag):
             download_path = attachment.get("_links", {}).get("download")
             if not download_path:
                 continue
-            download_url = base_url.rstrip("/") + download_path
-            content = self._download_attachment(confluence, download_url)
-            if content is None:
-                continue
-
-            try:
-                extracted_text = self._extract_attachment_text(content, title, media_type, ocr_languages)
-            except Exception as error:  # pylint: disable=broad-exception-caught
-                logger.warning("Failed to extract text from attachment %s: %s", title, error)
-                continue
+            key = self._attachment_key(attachment, ocr_languages)
+            extracted_text = extractor.cached_text(key)
+            if extracted_text is None:
+                download_url = base_url.rstrip("/") + download_path
+                content = self._download_attachment(confluence, download_url)
+                if content is None:
+                    continue
+
+                try:
+                    extracted_text = extractor.extract(content, title, media_type, ocr_languages)
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    logger.warning("Failed to extract text from attachment %s: %s", title, error)
+                    continue
+                extractor.remember(key, page_id, extracted_text)
             if extracted_text:
                 texts.append(f"\n{title}\n{extracted_text}")
         return texts
 
+    @staticmethod
+    def _attachment_key(attachment: Dict[str, Any], ocr_languages: str | None) -> str | None:
+        """Cache key of an attachment's extracted text, or None if the response lacks its id or version."""
+        attachment_id = attachment.get("id")
+        version = attachment.get("version", {}).get("number")
+        if not attachment_id or version is None:
+            return None
+        return f"{attachment_id}:{version}:{ocr_languages or ''}"
+
     @staticmethod
     def _download_attachment(confluence: Any, download_url: str) -> bytes | None:
         """Download one attachment, returning None when that attachment is unavailable."""
@@ -289,18 +625,34 @@ class ConfluenceRag(CodedTool, BaseRag):
         return None
 
     @staticmethod
-    def _extract_attachment_text(content: bytes, title: str, media_type: str, ocr_languages: str | None) -> str:
-        """Extract text from an attachment according to its media type."""
+    def attachment_kind(title: str, media_type: str) -> str | None:
+        """The extractor for an attachment: one of ATTACHMENT_KINDS, or None if the type is unsupported."""
         suffix = Path(title).suffix.lower()
         if media_type == "application/pdf" or suffix == ".pdf":
-            return PdfUtils.parse_pdf_bytes(content)
+            return "pdf"
         if media_type in {"image/png", "image/jpeg", "image/jpg"} or suffix in {".png", ".jpg", ".jpeg"}:
-            return ConfluenceRag._extract_image_text(content, ocr_languages)
+            return "image"
         if media_type == "image/svg+xml" or suffix == ".svg":
-            return ConfluenceRag._extract_svg_text(content, ocr_languages)
+            return "svg"
         if suffix == ".docx":
-            return ConfluenceRag._extract_docx_text(content)
+            return "docx"
         if suffix in {".xls", ".xlsx"}:
+            return "excel"
+        return None
+
+    @staticmethod
+    def _extract_attachment_text(content: bytes, title: str, media_type: str, ocr_languages: str | None) -> str:
+        """Extract text from an attachment according to its media type."""
+        kind = ConfluenceRag.attachment_kind(title, media_type)
+        if kind == "pdf":
+            return PdfUtils.parse_pdf_bytes(content)
+        if kind == "image":
+            return ConfluenceRag._extract_image_text(content, ocr_languages)
+        if kind == "svg":
+            return ConfluenceRag._extract_svg_text(content, ocr_languages)
+        if kind == "docx":
+            return ConfluenceRag._extract_docx_text(content)
+        if kind == "excel":
             return ConfluenceRag._extract_excel_text(content)
 
         logger.info("Skipping unsupported Confluence attachment type %s (%s)", media_type, title)
@@ -0,0 +1,153 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""A sparse line-offset index over a text file, so a range of lines can be read without reading the file."""
+
+import codecs
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+from typing import ClassVar
+
+from leaf_common.serialization.util.bytes_decoder import BytesDecoder
+
+# Bytes per index block. The index stores one count per block, and finding a line start scans at most one block.
+BLOCK_BYTES: int = 64 * 1024
+
+# Bytes read per step while building an index.
+_READ_BYTES: int = 1024 * 1024
+
+# Most indexes kept in memory by LineIndex.for_file(); the least recently used are dropped first.
+MAX_CACHED_INDEXES: int = 64
+
+
+@dataclass(frozen=True)
+class LineIndex:
+    """Newline counts per fixed-size block of one version of a file.
+
+    Lines end at "\\n" (so "\\r\\n" endings stay part of their line), as in editors and ``grep -n``.
+    ``newlines_before[i]`` is the number of newlines in the bytes before block ``i``; locating the
+    start of any line is a binary search over it plus a scan of one block, and the index takes
+    8 bytes per 64 KiB of file however many lines it has.
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+    newline_count: int
+    ends_with_newline: bool
+    newlines_before: array
+
+    _cache: ClassVar["OrderedDict[str, LineIndex]"] = OrderedDict()
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @property
+    def total_lines(self) -> int:
+        """Number of lines; a last line without a trailing newline counts."""
+        if self.size == 0:
+            return 0
+        return self.newline_count + (0 if self.ends_with_newline else 1)
+
+    @classmethod
+    def build(cls, path: str) -> "LineIndex":
+        """Index *path* in one streaming pass. Raises OSError if it cannot be read."""
+        with open(path, "rb") as file:
+            stat = os.fstat(file.fileno())
+            newlines_before = array("q", [0])
+            count = 0
+            last_byte = b""
+            block_fill = 0
+            while chunk := file.read(_READ_BYTES):
+                offset = 0
+                while offset < len(chunk):
+                    take = min(BLOCK_BYTES - block_fill, len(chunk) - offset)
+                    count += chunk.count(b"\n", offset, offset + take)
+                    offset += take
+                    block_fill += take
+                    if block_fill == BLOCK_BYTES:
+                        newlines_before.append(count)
+                        block_fill = 0
+                last_byte = chunk[-1:]
+            size = file.tell()
+        return cls(
+            path=path,
+            size=size,
+            mtime_ns=stat.st_mtime_ns,
+            newline_count=count,
+            ends_with_newline=last_byte == b"\n",
+            newlines_before=newlines_before,
+        )
+
+    @classmethod
+    def for_file(cls, path: Path) -> "LineIndex":
+        """The index of *path*, reused while the file's size and modification time are unchanged."""
+        key = str(path)
+        stat = path.stat()
+        with cls._lock:
+            index = cls._cache.get(key)
+            if index is not None and (index.size, index.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+                cls._cache.move_to_end(key)
+                return index
+        index = cls.build(key)
+        with cls._lock:
+            cls._cache[key] = index
+            cls._cache.move_to_end(key)
+            while len(cls._cache) > MAX_CACHED_INDEXES:
+                cls._cache.popitem(last=False)
+        return index
+
+    def line_start(self, file: BinaryIO, line: int) -> int:
+        """Byte offset where 1-based *line* starts; ``size`` for the line after the last one."""
+        newlines = line - 1
+        if newlines <= 0:
+            return 0
+        if newlines > self.newline_count:
+            return self.size
+        # The newlines-th newline is in the last block that starts with fewer newlines before it
+        block = bisect_left(self.newlines_before, newlines) - 1
+        remaining = newlines - self.newlines_before[block]
+        file.seek(block * BLOCK_BYTES)
+        data = file.read(BLOCK_BYTES)
+        position = -1
+        for _ in range(remaining):
+            position = data.find(b"\n", position + 1)
+        return block * BLOCK_BYTES + position + 1
+
+    def read_lines(self, file: BinaryIO, start_line: int, end_line: int, max_chars: int) -> str:
+        """Text of lines *start_line* to *end_line* (1-based, inclusive), cut to *max_chars* characters.
+
+        At most 4 bytes per character are read, enough for *max_chars* characters of UTF-8.
+        """
+        start = self.line_start(file, start_line)
+        end = self.line_start(file, end_line + 1)
+        budget = min(end - start, max_chars * 4)
+        file.seek(start)
+        data = file.read(budget)
+        return _decode(data, truncated=len(data) < end - start)[:max_chars]
+
+
+def _decode(data: bytes, truncated: bool) -> str:
+    """Decode like TextFileReader, tolerating a UTF-8 sequence cut off by a read budget."""
+    try:
+        return codecs.getincrementaldecoder("utf-8")().decode(data, final=not truncated)
+    except UnicodeDecodeError:
+        text, _ = BytesDecoder.decode_bytes(data)
+        return text
@@ -22,13 +22,13 @@ from logging import getLogger
 from pathlib import Path
 from typing import Any
 
-from leaf_common.serialization.util.text_file_reader import TextFileReader
 from neuro_san.interfaces.coded_tool import CodedTool
 
 from coded_tools.agent_network_editor.sly_data_lock import SlyDataLock
+from neuro_san_studio.coded_tools.file_management.line_index import LineIndex
 
 MAX_CHARS: int = 20_000
-MAX_FILE_BYTES: int = 10 * 1024 * 1024  # 10 MB hard cap on files read into memory
+MAX_FILE_BYTES: int = 1024 * 1024 * 1024  # 1 GB cap; only the requested lines are read into memory
 READ_FILE_HISTORY_KEY: str = "read_file_history"  # sly_data key for the list of read file paths
 
 
@@ -36,6 +36,9 @@ class ReadFile(CodedTool):
     """
     CodedTool implementation that reads a local file and returns its contents.
 
+    Lines are located through a LineIndex cached per file (size, mtime), so a line range
+    is read with one seek and a read bounded by max_content_chars, however large the file.
+
     By default the tool cannot read any file. Access must be explicitly granted
     via allow-lists in the tool arguments:
         - allowed_paths   : specific file paths or directories that may be read
@@ -51,7 +54,7 @@ class ReadFile(CodedTool):
                            or its extension is not in allowed_file_extensions.
         path_not_found   – the file does not exist.
         is_a_directory   – the path points to a directory, not a file.
-        file_too_large   – the file exceeds MAX_FILE_BYTES (10 MB).
+        file_too_large   – the file exceeds MAX_FILE_BYTES (1 GB).
         read_error       – the file could not be read (permission error, I/O failure, etc.).
     """
 
@@ -139,7 +142,7 @@ class ReadFile(CodedTool):
     async def _async_read_file(
         self, file_path: Path, start_line: int, end_line: int | None, max_chars: int
     ) -> tuple[str, int, int, int]:
-        """Read the file's contents and slice to the requested line range / char cap.
+        """Read the requested line range / char cap of the file in a worker thread.
 
         Returns (content, actual_start, actual_end, total_lines). Raises read_error
         on permission / I/O failures.
@@ -147,13 +150,14 @@ class ReadFile(CodedTool):
         logger: Logger = getLogger(self.__class__.__name__)
         logger.info("ReadFile: reading %s", file_path)
         try:
-            raw_text: str = await TextFileReader.async_read_text_file(str(file_path))
+            content, actual_start, actual_end, total_lines = await asyncio.to_thread(
+                self._read_line_range, file_path, start_line, end_line, max_chars
+            )
         except PermissionError as exc:
             raise ValueError(f"read_error: Permission denied reading '{file_path}'.") from exc
         except OSError as exc:
             raise ValueError(f"read_error: Could not read '{file_path}': {exc}") from exc
 
-        content, actual_start, actual_end, total_lines = self._slice_text(raw_text, start_line, end_line, max_chars)
         logger.info(
             "ReadFile: returned %d characters from %s (lines %d-%d of %d)",
             len(content),
@@ -171,7 +175,7 @@ class ReadFile(CodedTool):
         intentionally NOT cached:
           - Staleness risk: the same file could be edited (now or once a write_file tool
             exists) between reads, so a content cache could silently return outdated bytes.
-          - Memory: with MAX_FILE_BYTES = 10 MB, caching contents would let a single
+          - Memory: with MAX_FILE_BYTES = 1 GB, caching contents would let a single
             conversation accumulate hundreds of megabytes in sly_data.
           - Cache-key complexity: each call can specify different start_line / end_line /
             max_content_chars, so the cache key would need to encode all of those — or
@@ -242,7 +246,7 @@ class ReadFile(CodedTool):
             raise ValueError(f"is_a_directory: '{file_path}' is a directory, not a file.")
 
     def _check_file_size(self, file_path: Path) -> None:
-        """Reject files larger than MAX_FILE_BYTES before they are read into memory."""
+        """Reject files larger than MAX_FILE_BYTES before they are indexed."""
         try:
             size: int = file_path.stat().st_size
         except OSError as exc:
@@ -326,17 +330,19 @@ class ReadFile(CodedTool):
             raise ValueError(f"invalid_input: 'max_content_chars' must be a positive integer, got {value!r}.")
         return value
 
-    def _slice_text(
-        self, raw_text: str, start_line: int, end_line: int | None, max_chars: int
+    def _read_line_range(
+        self, file_path: Path, start_line: int, end_line: int | None, max_chars: int
     ) -> tuple[str, int, int, int]:
-        """Slice raw_text to the requested line range and char cap.
+        """Read the requested line range and char cap of file_path through its LineIndex.
 
         Returns (content, actual_start, actual_end, total_lines). When start_line is past
         EOF (or the file is empty), returns empty content with actual_start > actual_end so
         the reported range stays internally consistent. end_line=None reads to EOF.
+        Lines end at "\\n"; "\\r\\n" endings are kept in the returned content.
+        Raises OSError when the file cannot be read.
         """
-        lines: list[str] = raw_text.splitlines(keepends=True)
-        total_lines: int = len(lines)
+        index: LineIndex = LineIndex.for_file(file_path)
+        total_lines: int = index.total_lines
         if start_line > total_lines:
             # Requested range is past EOF — return empty content with consistent bounds.
             actual_start: int = total_lines + 1 if total_lines else 1
@@ -344,7 +350,10 @@ class ReadFile(CodedTool):
         else:
             actual_start = max(1, start_line)
             actual_end = min(total_lines, end_line if end_line is not None else total_lines)
-        content: str = "".join(lines[actual_start - 1 : actual_end])[:max_chars]
+        if actual_start > actual_end:
+            return "", actual_start, actual_end, total_lines
+        with open(file_path, "rb") as file:
+            content: str = index.read_lines(file, actual_start, actual_end, max_chars)
         return content, actual_start, actual_end, total_lines
 
     # ------------------------------------------------------------------
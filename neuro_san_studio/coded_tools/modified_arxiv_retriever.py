@@ -14,15 +14,22 @@
 #
 # END COPYRIGHT
 
+import os
 import re
+import threading
+from asyncio import CancelledError
 from asyncio import Semaphore
 from asyncio import TimeoutError as AsyncTimeoutError
 from asyncio import gather
 from asyncio import run as asyncio_run
+from asyncio import shield
 from asyncio import to_thread
+from asyncio import wrap_future
+from concurrent.futures import Future
 from logging import getLogger
 from typing import Any
 from typing import ClassVar
+from typing import Dict
 from typing import List
 from typing import Optional
 
@@ -43,12 +50,63 @@ from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
 from pypdf.errors import PyPdfError
 
+from neuro_san_studio.coded_tools.utils.compressed_text_cache import CompressedTextCache
 from neuro_san_studio.coded_tools.utils.pdf_utils import PdfUtils
+from neuro_san_studio.utils.cpu_pool import CpuPool
+from neuro_san_studio.utils.last_known_good_cache import DEFAULT_CACHE_DIR
 
 logger = getLogger(__name__)
 
 DOWNLOAD_TIMEOUT_SECONDS: int = 60
 
+# Where ArxivRag keeps extracted paper text unless it is given another directory.
+DEFAULT_ARXIV_CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, "arxiv")
+DEFAULT_ARXIV_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# The versioned identifier at the end of an entry id, e.g. 2301.01234v2 or hep-th/9901001v1.
+_VERSIONED_ID = re.compile(r"/abs/(.+v\d+)$")
+
+
+class _DownloadAbandoned(Exception):
+    """The request downloading a paper was cancelled; requests waiting for that download fetch it themselves."""
+
+
+class _SingleFlight:
+    """PDF downloads in progress in this process, by versioned arXiv id.
+
+    Concurrent requests for the same paper, from any session's event loop, wait for the first one's
+    download and parse instead of starting their own.
+    """
+
+    _in_flight: Dict[str, Future] = {}
+    _caches: Dict[str, CompressedTextCache] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def join(cls, key: str) -> tuple[Future, bool]:
+        """The shared result for *key*, and whether the caller is the one that must produce it."""
+        with cls._lock:
+            shared = cls._in_flight.get(key)
+            if shared is not None:
+                return shared, False
+            shared = cls._in_flight[key] = Future()
+            return shared, True
+
+    @classmethod
+    def leave(cls, key: str) -> None:
+        """Forget the download for *key* once its result is set."""
+        with cls._lock:
+            cls._in_flight.pop(key, None)
+
+    @classmethod
+    def cache(cls, directory: str, max_bytes: int) -> CompressedTextCache:
+        """The process-wide text cache for *directory*, so its size is tracked once per process."""
+        with cls._lock:
+            cache = cls._caches.get(directory)
+            if cache is None or cache.max_bytes != max_bytes:
+                cache = cls._caches[directory] = CompressedTextCache(directory, max_bytes)
+            return cache
+
 
 class ModifiedArxivRetriever(BaseRetriever):
     """
@@ -70,6 +128,9 @@ class ModifiedArxivRetriever(BaseRetriever):
     - Downloads full-document PDFs concurrently with aiohttp, bounded by
       `max_concurrent_downloads`; the async path (`ainvoke`) is canonical and
       the sync path delegates to it.
+    - Concurrent requests for the same paper version share one download, and
+      with `cache_dir` set the extracted text is kept in a CompressedTextCache
+      keyed by the versioned arXiv id, so repeat queries skip the download and parse.
 
     Adapted from
     https://github.com/langchain-ai/langchain-community/blob/main/libs/community/langchain_community/utilities/arxiv.py
@@ -85,6 +146,8 @@ class ModifiedArxivRetriever(BaseRetriever):
     max_concurrent_downloads: int = 5
     sort_by: str = "relevance"
     sort_order: str = "descending"
+    cache_dir: Optional[str] = None
+    cache_max_bytes: int = DEFAULT_ARXIV_CACHE_MAX_BYTES
 
     ARXIV_MAX_QUERY_LENGTH: ClassVar[int] = 300
 
@@ -185,15 +248,7 @@ class ModifiedArxivRetriever(BaseRetriever):
             if not result.pdf_url:
                 logger.debug("No PDF link for %s", result.entry_id)
                 return None
-            # Hold the semaphore through download AND parsing so the raw bytes of
-            # at most max_concurrent_downloads PDFs are alive at any moment.
-            async with semaphore:
-                async with session.get(result.pdf_url) as response:
-                    response.raise_for_status()
-                    data: bytes = await response.read()
-                # Text extraction is CPU-bound; run it in a worker thread so a large
-                # or complex PDF does not stall the event loop.
-                text: str = await to_thread(PdfUtils.parse_pdf_bytes, data)
+            text: str = await self._pdf_text(result, session, semaphore)
         except (ClientError, AsyncTimeoutError, PyPdfError) as f_ex:
             logger.debug(f_ex)
             return None
@@ -207,6 +262,70 @@ class ModifiedArxivRetriever(BaseRetriever):
 
         return Document(page_content=text[: self.doc_content_chars_max], metadata=self._build_metadata(result))
 
+    async def _pdf_text(self, result: Result, session: ClientSession, semaphore: Semaphore) -> str:
+        """
+        The full text of one result's PDF: from the cache, from a download of the same
+        paper already in progress, or downloaded and parsed here.
+
+        Only versioned entry ids are cached and shared, since the PDF of a version never changes.
+
+        :param result: arXiv search result with a PDF link
+        :param session: shared aiohttp session for the whole batch
+        :param semaphore: bounds the number of concurrent downloads
+        :return: the extracted text, untruncated
+        """
+        match = _VERSIONED_ID.search(result.entry_id or "")
+        if match is None:
+            return await self._download_text(result.pdf_url, session, semaphore)
+        key = match.group(1)
+        cache = _SingleFlight.cache(self.cache_dir, self.cache_max_bytes) if self.cache_dir else None
+
+        while True:
+            if cache is not None:
+                text: Optional[str] = await CpuPool.run(cache.get, key)
+                if text is not None:
+                    return text
+
+            shared, leader = _SingleFlight.join(key)
+            if not leader:
+                try:
+                    # shield: cancelling this request must not cancel the download it waits for
+                    return await shield(wrap_future(shared))
+                except _DownloadAbandoned:
+                    continue
+
+            try:
+                text = await self._download_text(result.pdf_url, session, semaphore)
+                shared.set_result(text)
+            except BaseException as exception:
+                shared.set_exception(_DownloadAbandoned() if isinstance(exception, CancelledError) else exception)
+                raise
+            finally:
+                _SingleFlight.leave(key)
+            if cache is not None:
+                await CpuPool.run(cache.put, key, text)
+            return text
+
+    @staticmethod
+    async def _download_text(pdf_url: str, session: ClientSession, semaphore: Semaphore) -> str:
+        """
+        Download one PDF and extract its text.
+
+        :param pdf_url: link to the PDF
+        :param session: shared aiohttp session for the whole batch
+        :param semaphore: bounds the number of concurrent downloads
+        :return: the extracted text
+        """
+        # Hold the semaphore through download AND parsing so the raw bytes of
+        # at most max_concurrent_downloads PDFs are alive at any moment.
+        async with semaphore:
+            async with session.get(pdf_url) as response:
+                response.raise_for_status()
+                data: bytes = await response.read()
+            # Text extraction is CPU-bound; run it on the shared CPU pool so a
+            # large or complex PDF does not stall the event loop.
+            return await CpuPool.run(PdfUtils.parse_pdf_bytes, data)
+
     def _build_metadata(self, result: Result) -> dict[str, Any]:
         """
         Build Document metadata; include all available arXiv fields when configured.
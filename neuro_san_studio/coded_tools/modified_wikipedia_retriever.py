@@ -14,23 +14,94 @@
 #
 # END COPYRIGHT
 
+import hashlib
+import json
+import os
+import time
 from asyncio import to_thread
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from typing import Dict
+from typing import Optional
 
 from langchain_core.callbacks import AsyncCallbackManagerForRetrieverRun
 from langchain_core.callbacks import CallbackManagerForRetrieverRun
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
 
+from neuro_san_studio.utils.last_known_good_cache import DEFAULT_CACHE_DIR
+
 WIKIPEDIA_MAX_QUERY_LENGTH = 300
 
+# Where WikipediaRag keeps fetched pages unless it is given another directory.
+DEFAULT_WIKIPEDIA_CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, "wikipedia")
+DEFAULT_WIKIPEDIA_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+class WikipediaPageCache:
+    """Fetched Wikipedia pages on disk, one JSON file per (language, title), validated by revision id.
+
+    An entry checked within ``ttl_seconds`` is used as is. An older entry is revalidated: if the page's
+    current revision id is the cached one, its content is reused and only the check time is renewed.
+    Files are replaced atomically, so processes and threads can share a directory. An unreadable entry
+    reads as absent; a failed write is ignored.
+    """
+
+    def __init__(self, directory: str, ttl_seconds: float):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding the entries. Created on the first write.
+            ttl_seconds: How long an entry is used without asking Wikipedia for the page's revision.
+        """
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, lang: str, title: str) -> Optional[Dict[str, Any]]:
+        """The entry for a page: title, revision_id, content, summary, url and checked_at; or None."""
+        try:
+            with open(self._path(lang, title), "r", encoding="utf-8") as entry_file:
+                entry = json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) and "content" in entry else None
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Whether *entry* was checked within the TTL."""
+        return time.time() - float(entry.get("checked_at", 0.0)) < self.ttl_seconds
+
+    def put(self, lang: str, title: str, entry: Dict[str, Any]) -> None:
+        """Store *entry* for a page, stamped with the current time as its check time."""
+        entry = {**entry, "checked_at": time.time()}
+        path = self._path(lang, title)
+        temp_path = f"{path}.{os.getpid()}.{id(entry)}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as entry_file:
+                json.dump(entry, entry_file)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+
+    def _path(self, lang: str, title: str) -> str:
+        digest = hashlib.sha256(f"{lang}\0{title}".encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
 
 class ModifiedWikipediaRetriever(BaseRetriever):
-    """Wikipedia retriever that depends directly on the ``wikipedia`` package."""
+    """Wikipedia retriever that depends directly on the ``wikipedia`` package.
+
+    The matching pages are fetched concurrently, at most ``max_concurrency`` at a time. With
+    ``cache_dir`` set, fetched pages are kept in a WikipediaPageCache shared by every retriever using
+    that directory.
+    """
 
     top_k_results: int = 3
     lang: str = "en"
     doc_content_chars_max: int = 4000
+    max_concurrency: int = 4
+    cache_dir: Optional[str] = None
+    cache_ttl_seconds: float = DEFAULT_WIKIPEDIA_CACHE_TTL_SECONDS
 
     def _get_relevant_documents(self, query: str, *, run_manager: CallbackManagerForRetrieverRun) -> list[Document]:
         """Retrieve Wikipedia documents synchronously."""
@@ -50,26 +121,65 @@ class ModifiedWikipediaRetriever(BaseRetriever):
             query[:WIKIPEDIA_MAX_QUERY_LENGTH],
             results=self.top_k_results,
         )
+        page_titles = page_titles[: self.top_k_results]
+        cache = WikipediaPageCache(self.cache_dir, self.cache_ttl_seconds) if self.cache_dir else None
 
-        documents: list[Document] = []
-        for page_title in page_titles[: self.top_k_results]:
+        def fetch(page_title: str) -> Optional[Document]:
             try:
-                page = wikipedia.page(title=page_title, auto_suggest=False)
+                page = self._fetch_page(wikipedia, page_title, cache)
             except (wikipedia.exceptions.PageError, wikipedia.exceptions.DisambiguationError):
-                continue
-
-            documents.append(
-                Document(
-                    page_content=page.content[: self.doc_content_chars_max],
-                    metadata={
-                        "title": page_title,
-                        "summary": page.summary,
-                        "source": page.url,
-                    },
-                )
+                return None
+            return Document(
+                page_content=page["content"][: self.doc_content_chars_max],
+                metadata={
+                    "title": page_title,
+                    "summary": page["summary"],
+                    "source": page["url"],
+                },
             )
 
-        return documents
+        workers = max(1, min(self.max_concurrency, len(page_titles)))
+        if workers == 1:
+            fetched = [fetch(page_title) for page_title in page_titles]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wikipedia-page") as executor:
+                fetched = list(executor.map(fetch, page_titles))
+
+        return [document for document in fetched if document is not None]
+
+    def _fetch_page(self, wikipedia: Any, page_title: str, cache: Optional[WikipediaPageCache]) -> Dict[str, Any]:
+        """The content, summary and url of one page, from the cache while its revision is current."""
+        entry = cache.get(self.lang, page_title) if cache is not None else None
+        if entry is not None and cache.is_fresh(entry):
+            return entry
+
+        page = wikipedia.page(title=page_title, auto_suggest=False)
+        if entry is not None and entry.get("revision_id") is not None:
+            # Revalidate with a revision id query, which is small; the content and summary are not
+            if self._current_revision_id(wikipedia, page) == entry["revision_id"]:
+                cache.put(self.lang, page_title, entry)
+                return entry
+
+        fetched = {"content": page.content, "summary": page.summary, "url": page.url}
+        if cache is not None:
+            # Read after the content, which loads the revision id along with it
+            fetched["revision_id"] = getattr(page, "revision_id", None)
+            cache.put(self.lang, page_title, fetched)
+        return fetched
+
+    @staticmethod
+    def _current_revision_id(wikipedia: Any, page: Any) -> Optional[int]:
+        """The latest revision id of a page, from a ``prop=revisions&rvprop=ids`` query.
+
+        ``WikipediaPage.revision_id`` is no use for this: in wikipedia 1.4.0 it loads the whole article
+        (``prop=extracts|revisions``) first. The query goes through the library's own request helper, so it
+        uses the language, user agent and rate limit set on the library.
+        """
+        # pylint: disable-next=protected-access
+        response = wikipedia.wikipedia._wiki_request({"prop": "revisions", "rvprop": "ids", "pageids": page.pageid})
+        pages = response.get("query", {}).get("pages", {})
+        revisions = pages.get(str(page.pageid), {}).get("revisions") or []
+        return revisions[0].get("revid") if revisions else None
 
     @staticmethod
     def _get_wikipedia_client() -> Any:
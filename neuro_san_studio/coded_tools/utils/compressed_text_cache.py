@@ -0,0 +1,111 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""A size-bounded, gzip-compressed text cache on disk with least-recently-used eviction."""
+
+import gzip
+import hashlib
+import os
+import threading
+import uuid
+from typing import Optional
+
+
+class CompressedTextCache:
+    """Key -> text, one gzip file per key, bounded to ``max_bytes`` of compressed data.
+
+    Meant for values that never change for a key, e.g. the text of one version of a paper. A read
+    renews the entry's modification time, and eviction removes the entries read or written longest
+    ago. Files are replaced atomically, so several threads and processes can share a directory;
+    the size bound is then kept approximately. An unreadable entry reads as absent and a failed write
+    is ignored.
+    """
+
+    SUFFIX = ".txt.gz"
+
+    def __init__(self, directory: str, max_bytes: int, compresslevel: int = 6):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding the entries. Created on the first write.
+            max_bytes: Most compressed bytes kept; older entries are evicted beyond it. 0 disables the cache.
+            compresslevel: gzip level, 1 (fastest) to 9 (smallest).
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.compresslevel = compresslevel
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """The text stored for *key*, or None."""
+        if self.max_bytes <= 0:
+            return None
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as entry_file:
+                text = entry_file.read()
+            os.utime(path)
+        except (OSError, EOFError, UnicodeDecodeError):
+            return None
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Store *text* for *key*, then evict the least recently used entries beyond the size bound."""
+        data = gzip.compress(text.encode("utf-8"), compresslevel=self.compresslevel)
+        if self.max_bytes <= 0 or len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            replaced = os.path.getsize(path) if os.path.exists(path) else 0
+            with open(temp_path, "wb") as entry_file:
+                entry_file.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size += len(data) - replaced
+            if self._size is None or self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete the oldest entries until the cache fits; recounts the directory, which other processes may share."""
+        entries = []
+        try:
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    if entry.name.endswith(self.SUFFIX):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                size -= entry_size
+            except OSError:
+                pass
+        self._size = size
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}{self.SUFFIX}")
@@ -15,7 +15,6 @@
 # END COPYRIGHT
 
 from asyncio import TimeoutError as AsyncTimeoutError
-from asyncio import to_thread
 from datetime import datetime
 from datetime import timezone
 from http import HTTPStatus
@@ -38,6 +37,7 @@ from neuro_san.interfaces.coded_tool import CodedTool
 
 from neuro_san_studio.coded_tools.global_only_resolver import GlobalOnlyResolver
 from neuro_san_studio.coded_tools.utils.pdf_utils import PdfUtils
+from neuro_san_studio.utils.cpu_pool import CpuPool
 
 MAX_CHARS: int = 20_000
 MAX_URL_LENGTH: int = 250
@@ -348,9 +348,9 @@ class WebFetch(CodedTool):
         data: bytes = await self._download_pdf_bytes(url, session)
 
         try:
-            # Text extraction is CPU-bound; run it in a worker thread so a large
-            # or complex PDF does not stall the event loop.
-            return await to_thread(PdfUtils.parse_pdf_bytes, data)
+            # Text extraction is CPU-bound; run it on the shared CPU pool so a
+            # large or complex PDF does not stall the event loop.
+            return await CpuPool.run(PdfUtils.parse_pdf_bytes, data)
         except Exception as exc:
             raise ClientError(f"url_not_accessible: Failed to parse PDF '{url}': {exc}") from exc
 
@@ -21,6 +21,8 @@ from typing import Dict
 from neuro_san.interfaces.coded_tool import CodedTool
 
 from neuro_san_studio.coded_tools.base_rag import BaseRag
+from neuro_san_studio.coded_tools.modified_wikipedia_retriever import DEFAULT_WIKIPEDIA_CACHE_DIR
+from neuro_san_studio.coded_tools.modified_wikipedia_retriever import DEFAULT_WIKIPEDIA_CACHE_TTL_SECONDS
 from neuro_san_studio.coded_tools.modified_wikipedia_retriever import ModifiedWikipediaRetriever
 
 logging.basicConfig(level=logging.DEBUG)
@@ -41,6 +43,11 @@ class WikipediaRag(CodedTool):
             "lang": language code for Wikipedia articles (default is "en")
             "top_k_results": number of top results to return (default is 3)
             "doc_content_chars_max": maximum number of characters to keep in each document (default is 4000)
+            "max_concurrency": number of pages fetched at the same time (default is 4)
+            "cache_dir": directory of the page cache shared across sessions
+                (default is ~/.cache/neuro-san-studio/wikipedia; an empty string disables the cache)
+            "cache_ttl_seconds": seconds a cached page is used before its revision is checked again
+                (default is one day)
 
         :param sly_data: A dictionary whose keys are defined by the agent
             hierarchy, but whose values are meant to be kept out of the
@@ -71,6 +78,9 @@ class WikipediaRag(CodedTool):
             lang=str(args.get("lang", "en")),
             top_k_results=int(args.get("top_k_results", 3)),
             doc_content_chars_max=int(args.get("doc_content_chars_max", 4000)),
+            max_concurrency=int(args.get("max_concurrency", 4)),
+            cache_dir=args.get("cache_dir", DEFAULT_WIKIPEDIA_CACHE_DIR) or None,
+            cache_ttl_seconds=float(args.get("cache_ttl_seconds", DEFAULT_WIKIPEDIA_CACHE_TTL_SECONDS)),
         )
 
         return await BaseRag.query_retriever(retriever, query)
@@ -41,11 +41,18 @@ Supports two HOCON formats:
 """
 
 import asyncio
+import json
 import logging
 import os
 import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from dataclasses import field
 from typing import Any
+from typing import AsyncIterator
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -60,12 +67,15 @@ from leaf_common.config.dictionary_overlay import DictionaryOverlay
 from neuro_san.internals.graph.persistence.agent_network_restorer import AgentNetworkRestorer
 from neuro_san.internals.graph.registry.agent_network import AgentNetwork
 from neuro_san.internals.interfaces.context_type_llm_factory import ContextTypeLlmFactory
-from neuro_san.internals.persistence.abstract_async_config_restorer import AbstractAsyncConfigRestorer
 from neuro_san.internals.run_context.factory.master_llm_factory import MasterLlmFactory
 from neuro_san.internals.run_context.langchain.llms.langchain_llm_resources import LangChainLlmResources
 
-# parse_hocon_file chdir's into a HOCON file's own directory so file-relative
-# includes resolve. For agent-network files (repo-root-relative includes) that
+from neuro_san_studio.utils.hocon_config_cache import HoconConfigCache
+from neuro_san_studio.utils.last_known_good_cache import DEFAULT_CACHE_DIR
+from neuro_san_studio.utils.last_known_good_cache import LastKnownGoodCache
+
+# parse_hocon_file resolves includes against a HOCON file's own directory so
+# file-relative includes work. For agent-network files (repo-root-relative includes) that
 # scoped parse will fail to resolve their `include "config/..."` directives and
 # pyhocon logs a "Cannot include file ..." warning. That parse is only used to
 # detect the file format (inline "tools" key), so demote the noise. Mirrors
@@ -74,6 +84,15 @@ logging.getLogger("pyhocon.config_parser").setLevel(logging.ERROR)
 
 DEFAULT_HOCON_PATH = os.path.join("config", "llm_config.hocon")
 
+DEFAULT_MANIFEST_PATH = os.path.join("registries", "manifest.hocon")
+
+DEFAULT_CACHE_FILE = os.path.join(DEFAULT_CACHE_DIR, "check_config.json")
+
+MANIFEST_FILE_NAME = "manifest.hocon"
+
+# Config keys that decide how MasterLlmFactory resolves an llm_config (see DefaultLlmFactory.__init__)
+_FACTORY_CONFIG_KEYS = ("context_type", "llm_info_file")
+
 TEST_PROMPT = "Reply with exactly one word: hello"
 
 # Word-level tokens that mark a key as sensitive.  Matching is done against
@@ -125,25 +144,37 @@ def redact_llm_config(config: Dict[str, Any]) -> Dict[str, Any]:
     return redacted
 
 
+def _registries_dir_of(manifest_path: str) -> str:
+    """The registries/ directory a manifest's keys are relative to: its nearest ancestor named registries."""
+    directory = os.path.dirname(manifest_path)
+    candidate = directory
+    while os.path.basename(candidate) != "registries":
+        parent = os.path.dirname(candidate)
+        if parent == candidate:
+            return directory
+        candidate = parent
+    return candidate
+
+
 def parse_hocon_file(network_hocon_file: str) -> Dict[str, Any]:
-    """Parse a raw HOCON file into a Python dict via AbstractAsyncConfigRestorer.
+    """Parse a raw HOCON file into a Python dict via the shared HoconConfigCache.
 
-    Temporarily chdir into the file's directory so file-relative `include`
+    Includes resolve against the file's own directory so file-relative `include`
     directives (e.g. config/llm_config.hocon's `include "developer_llm_config.hocon"`)
-    resolve -- pyhocon resolves relative includes against the current working
-    directory, not the file's location. CWD is restored in `finally`. os.chdir is
-    process-global (not thread-safe); this matches existing precedent in
-    agent_network_registry.py.
+    work from any working directory. Files under a registries/ directory resolve
+    against the project directory instead, as their `include "registries/..."` and
+    `include "config/..."` directives expect. The directory is handed to pyhocon as its
+    include basedir rather than chdir-ed into, so process CWD is never touched and
+    the parse is shared with every other caller of the cache.
     """
     abs_path: str = os.path.abspath(network_hocon_file)
-    hocon = AbstractAsyncConfigRestorer(file_purpose="get_agent_network_definition_for_validation", must_exist=True)
-    prev_cwd: str = os.getcwd()
-    try:
-        os.chdir(os.path.dirname(abs_path))
-        hocon_file = hocon.restore(file_reference=os.path.basename(abs_path))
-    finally:
-        os.chdir(prev_cwd)
-    return hocon_file
+    registries_dir: str = _registries_dir_of(abs_path)
+    in_registries: bool = os.path.basename(registries_dir) == "registries"
+    return HoconConfigCache.restore(
+        abs_path,
+        basedir=os.path.dirname(registries_dir) if in_registries else os.path.dirname(abs_path),
+        file_purpose="get_agent_network_definition_for_validation",
+    )
 
 
 def is_agent_network_hocon(config: Dict[str, Any]) -> bool:
@@ -280,66 +311,167 @@ async def invoke_llm(llm: BaseLanguageModel) -> str:
     return str(response)
 
 
-async def test_llm_configs(
-    llm_factory: ContextTypeLlmFactory,
-    llm_configs: List[Tuple[str, Dict[str, Any]]],
-) -> Tuple[List[Tuple[List[str], Dict[str, Any]]], List[Tuple[List[str], Dict[str, Any], str]]]:
-    """
-    Test each unique llm_config by creating an LLM instance and invoking it.
-    Returns (successes, failures) where each entry groups labels sharing the same config.
-    """
-    # pylint: disable=too-many-locals
-    failures: List[Tuple[List[str], Dict[str, Any], str]] = []
-    successes: List[Tuple[List[str], Dict[str, Any]]] = []
+@dataclass
+class ProbeLimits:
+    """Bounds on the live LLM probes of one check-config run."""
 
-    # Deduplicate configs to avoid redundant API calls while tracking all labels
-    # Key: string repr of sorted llm_config items -> (labels, llm_config)
-    unique_configs: Dict[str, Tuple[List[str], Dict[str, Any]]] = {}
-    for label, llm_cfg in llm_configs:
-        config_key: str = str(sorted(llm_cfg.items()))
-        if config_key not in unique_configs:
-            unique_configs[config_key] = ([], llm_cfg)
-        unique_configs[config_key][0].append(label)
+    # Probes in flight at once, across all providers
+    concurrency: int = 8
+    # Probes in flight at once against any one provider (llm_config "class")
+    per_provider: int = 4
+    # Seconds allowed for one invocation before it counts as a failure
+    timeout: float = 60.0
+
+
+@dataclass
+class UniqueLlmConfig:
+    """One distinct llm_config to probe, with every label that uses it."""
+
+    labels: List[str]
+    llm_config: Dict[str, Any]
+    llm_factory: ContextTypeLlmFactory
+    # Identifies the factory settings, since the same llm_config can resolve differently under another llm_info_file
+    factory_key: str = ""
 
-    total_count: int = len(llm_configs)
-    unique_count: int = len(unique_configs)
-    print(f"  Found {total_count} llm_config(s) with {unique_count} unique configuration(s).")
-    if unique_count < total_count:
-        print(f"  Skipping {total_count - unique_count} duplicate config(s).\n")
-    else:
-        print()
 
-    for config_key, (labels, llm_cfg) in unique_configs.items():
-        labels_str: str = ", ".join(labels)
-        model_name: str = llm_cfg.get("model_name", "<not specified>")
-        print(f"  Testing model '{model_name}' (used by: {labels_str})")
+class _ProbeThrottle:  # pylint: disable=too-few-public-methods
+    """A global probe limit plus one limit per provider. Must be created inside the running event loop."""
 
+    def __init__(self, limits: ProbeLimits):
+        self.limits = limits
+        self._all = asyncio.Semaphore(max(1, limits.concurrency))
+        self._providers: Dict[str, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def slot(self, provider: str) -> AsyncIterator[None]:
+        """Hold a provider slot, then a global slot, for the duration of one probe."""
+        provider_slot = self._providers.setdefault(provider, asyncio.Semaphore(max(1, self.limits.per_provider)))
+        async with provider_slot, self._all:
+            yield
+
+
+def dedupe_llm_configs(
+    entries: Iterable[Tuple[str, Dict[str, Any], ContextTypeLlmFactory, str]],
+) -> List[UniqueLlmConfig]:
+    """Group (label, llm_config, llm_factory, factory_key) entries so each distinct config is probed once."""
+    unique_configs: Dict[Tuple[str, str], UniqueLlmConfig] = {}
+    for label, llm_cfg, llm_factory, factory_key in entries:
+        config_key = (factory_key, json.dumps(llm_cfg, sort_keys=True, default=str))
+        if config_key not in unique_configs:
+            unique_configs[config_key] = UniqueLlmConfig([], llm_cfg, llm_factory, factory_key)
+        unique_configs[config_key].labels.append(label)
+    return list(unique_configs.values())
+
+
+def provider_of(llm_factory: ContextTypeLlmFactory, llm_config: Dict[str, Any]) -> str:
+    """The provider an llm_config resolves to: its own "class", else the class llm_info gives its model."""
+    provider = llm_config.get("class")
+    if not provider:
+        llm_infos = getattr(llm_factory, "llm_infos", None) or {}
+        model_info = llm_infos.get(llm_config.get("model_name"), {})
+        provider = model_info.get("class") if isinstance(model_info, dict) else None
+    return str(provider or "unknown")
+
+
+async def _probe_llm_config(
+    unique: UniqueLlmConfig,
+    throttle: _ProbeThrottle,
+    cache: Optional[LastKnownGoodCache],
+) -> Optional[str]:
+    """Create and invoke one llm_config. Returns None on success or the error message on failure."""
+    labels_str: str = ", ".join(unique.labels)
+    model_name: str = unique.llm_config.get("model_name", "<not specified>")
+    header: str = f"  Testing model '{model_name}' (used by: {labels_str})"
+    cache_key: str = LastKnownGoodCache.fingerprint(
+        {"factory": unique.factory_key, "llm_config": redact_llm_config(unique.llm_config)}
+    )
+    if cache is not None and cache.is_fresh(cache_key):
+        print(f"{header}\n    OK (cached, checked {cache.age_seconds(cache_key):.0f}s ago)\n")
+        return None
+
+    async with throttle.slot(provider_of(unique.llm_factory, unique.llm_config)):
         # Create the LLM instance
         try:
-            llm: BaseLanguageModel = create_llm_instance(llm_factory, llm_cfg)
-            print(f"    LLM instance created: {type(llm).__name__}")
+            llm: BaseLanguageModel = create_llm_instance(unique.llm_factory, unique.llm_config)
         except Exception as exc:  # pylint: disable=broad-except
             error_msg: str = f"Failed to create LLM: {exc}"
-            print(f"    FAIL (creation): {error_msg}")
-            failures.append((labels, llm_cfg, error_msg))
-            continue
+            print(f"{header}\n    FAIL (creation): {error_msg}\n")
+            return error_msg
 
         # Invoke the LLM
+        timeout: float = throttle.limits.timeout
         try:
-            response_text: str = await invoke_llm(llm)
-            print(f"    Response: {response_text[:100]!r}")
-            successes.append((labels, llm_cfg))
+            response_text: str = await asyncio.wait_for(invoke_llm(llm), timeout=timeout)
+        except asyncio.TimeoutError:
+            error_msg = f"Failed to invoke LLM: no response within {timeout:g}s"
+            print(f"{header}\n    LLM instance created: {type(llm).__name__}\n    FAIL (timeout): {error_msg}\n")
+            return error_msg
         except Exception as exc:  # pylint: disable=broad-except
             error_msg = f"Failed to invoke LLM: {exc}"
-            print(f"    FAIL (invocation): {error_msg}")
+            print(f"{header}\n    LLM instance created: {type(llm).__name__}\n    FAIL (invocation): {error_msg}")
             traceback.print_exc()
-            failures.append((labels, llm_cfg, error_msg))
+            print()
+            return error_msg
 
-        print()
+    print(f"{header}\n    LLM instance created: {type(llm).__name__}\n    Response: {response_text[:100]!r}\n")
+    if cache is not None:
+        cache.record(cache_key)
+    return None
 
+
+async def probe_unique_configs(
+    unique_configs: List[UniqueLlmConfig],
+    limits: Optional[ProbeLimits] = None,
+    cache: Optional[LastKnownGoodCache] = None,
+) -> Tuple[List[Tuple[List[str], Dict[str, Any]]], List[Tuple[List[str], Dict[str, Any], str]]]:
+    """
+    Probe every unique llm_config concurrently within `limits`, skipping those the cache saw pass
+    within its TTL. Returns (successes, failures) in the order of `unique_configs`.
+    """
+    throttle = _ProbeThrottle(limits or ProbeLimits())
+    errors: List[Optional[str]] = await asyncio.gather(
+        *(_probe_llm_config(unique, throttle, cache) for unique in unique_configs)
+    )
+    if cache is not None:
+        cache.save()
+
+    successes: List[Tuple[List[str], Dict[str, Any]]] = []
+    failures: List[Tuple[List[str], Dict[str, Any], str]] = []
+    for unique, error_msg in zip(unique_configs, errors):
+        if error_msg is None:
+            successes.append((unique.labels, unique.llm_config))
+        else:
+            failures.append((unique.labels, unique.llm_config, error_msg))
     return successes, failures
 
 
+def _print_dedup_counts(total_count: int, unique_count: int) -> None:
+    print(f"  Found {total_count} llm_config(s) with {unique_count} unique configuration(s).")
+    if unique_count < total_count:
+        print(f"  Skipping {total_count - unique_count} duplicate config(s).\n")
+    else:
+        print()
+
+
+async def test_llm_configs(
+    llm_factory: ContextTypeLlmFactory,
+    llm_configs: List[Tuple[str, Dict[str, Any]]],
+    limits: Optional[ProbeLimits] = None,
+    cache: Optional[LastKnownGoodCache] = None,
+) -> Tuple[List[Tuple[List[str], Dict[str, Any]]], List[Tuple[List[str], Dict[str, Any], str]]]:
+    """
+    Test each unique llm_config by creating an LLM instance and invoking it.
+    Probes run concurrently within `limits`; `cache` lets configs that passed recently be skipped.
+    Returns (successes, failures) where each entry groups labels sharing the same config.
+    """
+    # Deduplicate configs to avoid redundant API calls while tracking all labels
+    unique_configs: List[UniqueLlmConfig] = dedupe_llm_configs(
+        (label, llm_cfg, llm_factory, "") for label, llm_cfg in llm_configs
+    )
+    _print_dedup_counts(len(llm_configs), len(unique_configs))
+    return await probe_unique_configs(unique_configs, limits, cache)
+
+
 def print_results(
     successes: List[Tuple[List[str], Dict[str, Any]]],
     failures: List[Tuple[List[str], Dict[str, Any], str]],
@@ -367,7 +499,11 @@ def print_results(
     print()
 
 
-async def run_checks(hocon_path: str) -> bool:
+async def run_checks(
+    hocon_path: str,
+    limits: Optional[ProbeLimits] = None,
+    cache: Optional[LastKnownGoodCache] = None,
+) -> bool:
     """
     Run all LLM config validation steps for the given HOCON file.
 
@@ -425,7 +561,7 @@ async def run_checks(hocon_path: str) -> bool:
 
     # --- Step 4: Test each unique LLM configuration ---
     print("[4] Testing LLM configuration(s)...\n")
-    successes, failures = await test_llm_configs(llm_factory, llm_configs)
+    successes, failures = await test_llm_configs(llm_factory, llm_configs, limits, cache)
 
     # --- Step 5: Report results ---
     print_results(successes, failures)
@@ -433,25 +569,195 @@ async def run_checks(hocon_path: str) -> bool:
     return not failures
 
 
+@dataclass
+class LoadedLlmConfigs:
+    """The llm_configs of one HOCON file, as plain data that can cross a process boundary."""
+
+    hocon_path: str
+    factory_config: Dict[str, Any] = field(default_factory=dict)
+    llm_configs: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+    error: str = ""
+
+
+def manifest_network_paths(manifest_path: str) -> List[str]:
+    """Paths of the networks a manifest serves (value true, or a dict without "serve": false)."""
+    abs_path: str = os.path.abspath(manifest_path)
+    registries_dir: str = _registries_dir_of(abs_path)
+    # The root manifest's `include "registries/<group>/manifest.hocon"` paths are relative to the project dir
+    raw: Dict[str, Any] = HoconConfigCache.restore(
+        abs_path, basedir=os.path.dirname(registries_dir), file_purpose="agent network manifest"
+    )
+    paths: List[str] = []
+    for key, value in raw.items():
+        clean: str = key.strip('"')
+        if not clean.endswith(".hocon"):
+            continue
+        serve: bool = bool(value.get("serve", True)) if isinstance(value, dict) else bool(value)
+        if serve:
+            paths.append(os.path.join(registries_dir, clean))
+    return sorted(paths)
+
+
+def collect_hocon_paths(path: str) -> List[str]:
+    """
+    Expand a check-config target into the HOCON files to check:
+      - a directory: every *.hocon beneath it, except manifests
+      - a manifest.hocon: every network it serves
+      - any other path: itself
+    """
+    if os.path.isdir(path):
+        found: List[str] = []
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            found.extend(
+                os.path.join(dirpath, name)
+                for name in sorted(filenames)
+                if name.endswith(".hocon") and name != MANIFEST_FILE_NAME
+            )
+        return found
+    if os.path.basename(path) == MANIFEST_FILE_NAME and os.path.isfile(path):
+        return manifest_network_paths(path)
+    return [path]
+
+
+def load_llm_configs(hocon_path: str) -> LoadedLlmConfigs:
+    """
+    Parse one HOCON file and extract its llm_configs. Runs in a worker process during batch checks,
+    so errors are returned rather than raised. Agent labels are prefixed with the file path, since
+    configs from many files are reported together.
+    """
+    try:
+        raw_config: Dict[str, Any] = parse_hocon_file(hocon_path)
+        if is_agent_network_hocon(raw_config):
+            agent_network: AgentNetwork = load_agent_network(hocon_path)
+            config: Dict[str, Any] = agent_network.get_config()
+            llm_configs = [
+                (f"{hocon_path}: {label}", llm_cfg)
+                for label, llm_cfg in extract_llm_configs_from_agent_network(agent_network)
+            ]
+        else:
+            config = raw_config
+            llm_configs = extract_llm_configs_from_studio_config(raw_config, hocon_path)
+        factory_config: Dict[str, Any] = {key: config[key] for key in _FACTORY_CONFIG_KEYS if config.get(key)}
+        # Round-trip through JSON so pyhocon ConfigTrees become plain, picklable dicts
+        plain = json.loads(json.dumps({"factory": factory_config, "llm_configs": llm_configs}, default=str))
+    except Exception as exc:  # pylint: disable=broad-except
+        return LoadedLlmConfigs(hocon_path, error=f"Failed to load HOCON file: {exc}")
+    return LoadedLlmConfigs(hocon_path, plain["factory"], [tuple(entry) for entry in plain["llm_configs"]])
+
+
+def load_all_llm_configs(hocon_paths: List[str], workers: Optional[int] = None) -> List[LoadedLlmConfigs]:
+    """Load every file, in a process pool of `workers` (default: the CPU count) when there are several."""
+    workers = min(workers or os.cpu_count() or 1, len(hocon_paths))
+    if workers <= 1:
+        return [load_llm_configs(hocon_path) for hocon_path in hocon_paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(load_llm_configs, hocon_paths))
+
+
+async def run_batch_checks(
+    hocon_paths: List[str],
+    limits: Optional[ProbeLimits] = None,
+    cache: Optional[LastKnownGoodCache] = None,
+    workers: Optional[int] = None,
+) -> bool:
+    """
+    Validate the llm_configs of many HOCON files at once. Files are parsed in parallel, configs are
+    deduplicated across all of them, and each distinct config is probed once.
+
+    Returns True if every file loaded and every configuration passed.
+    """
+    # pylint: disable=too-many-locals
+    print(f"[1] Parsing {len(hocon_paths)} HOCON file(s)...")
+    loaded: List[LoadedLlmConfigs] = load_all_llm_configs(hocon_paths, workers)
+    load_failures: List[Tuple[List[str], Dict[str, Any], str]] = [
+        ([item.hocon_path], {}, item.error) for item in loaded if item.error
+    ]
+    for labels, _, error_msg in load_failures:
+        print(f"    FAIL: {labels[0]}: {error_msg}")
+
+    print("[2] Extracting llm_configs...")
+    with_configs: List[LoadedLlmConfigs] = [item for item in loaded if item.llm_configs]
+    print(f"    {sum(len(item.llm_configs) for item in with_configs)} llm_config(s) in {len(with_configs)} file(s)")
+
+    print("[3] Creating LLM factories (loading default_llm_info.hocon)...")
+    factories: Dict[str, Optional[ContextTypeLlmFactory]] = {}
+    entries: List[Tuple[str, Dict[str, Any], ContextTypeLlmFactory, str]] = []
+    for item in with_configs:
+        factory_key: str = json.dumps(item.factory_config, sort_keys=True)
+        if factory_key not in factories:
+            try:
+                factories[factory_key] = create_and_load_llm_factory(item.factory_config)
+            except Exception as exc:  # pylint: disable=broad-except
+                factories[factory_key] = None
+                print(f"    FATAL: Failed to create/load LLM factory for {item.factory_config}: {exc}")
+        llm_factory: Optional[ContextTypeLlmFactory] = factories[factory_key]
+        if llm_factory is None:
+            load_failures.append(([item.hocon_path], item.factory_config, "Failed to create/load LLM factory"))
+            continue
+        entries.extend((label, llm_cfg, llm_factory, factory_key) for label, llm_cfg in item.llm_configs)
+
+    print("[4] Testing LLM configuration(s)...\n")
+    unique_configs: List[UniqueLlmConfig] = dedupe_llm_configs(entries)
+    _print_dedup_counts(len(entries), len(unique_configs))
+    successes, failures = await probe_unique_configs(unique_configs, limits, cache)
+
+    # --- Report results ---
+    print_results(successes, failures + load_failures)
+
+    return not failures and not load_failures
+
+
 class CheckConfigCommand:  # pylint: disable=too-few-public-methods
-    """Validate LLM configurations in a HOCON file.
+    """Validate LLM configurations in a HOCON file, a directory of them, or a manifest.
 
     Accepts both agent network files (with a 'tools' list) and standalone
     studio llm_config files. Returns a non-zero exit code if any
     configuration fails.
     """
 
-    def __init__(self, hocon_path: Optional[str] = None):
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        hocon_path: Optional[str] = None,
+        *,
+        manifest: bool = False,
+        limits: Optional[ProbeLimits] = None,
+        cache_ttl: float = 0.0,
+        cache_file: Optional[str] = None,
+        workers: Optional[int] = None,
+    ):
         """Initialize the command.
 
         Args:
-            hocon_path: Path to the HOCON file to validate. Defaults to
-                config/llm_config.hocon when not provided.
+            hocon_path: Path to the HOCON file, directory or manifest.hocon to validate. Defaults to
+                config/llm_config.hocon, or registries/manifest.hocon with `manifest`.
+            manifest: Check every network the project's manifest serves.
+            limits: Probe concurrency, per-provider concurrency and timeout.
+            cache_ttl: Seconds a passing config is trusted without a new probe; 0 always probes.
+            cache_file: The last-known-good cache file. Defaults to one under ~/.cache/neuro-san-studio.
+            workers: Worker processes for parsing several files. Defaults to the CPU count.
         """
-        self.hocon_path = hocon_path or DEFAULT_HOCON_PATH
+        self.hocon_path = hocon_path or (DEFAULT_MANIFEST_PATH if manifest else DEFAULT_HOCON_PATH)
+        self.limits = limits or ProbeLimits()
+        self.cache_ttl = cache_ttl
+        self.cache_file = cache_file or DEFAULT_CACHE_FILE
+        self.workers = workers
 
     def run(self) -> int:
         """Run validation and return an exit code (0 on success, 1 on failure)."""
-        print(f"Checking LLM configs in: {self.hocon_path}")
-        success: bool = asyncio.run(run_checks(self.hocon_path))
+        cache: Optional[LastKnownGoodCache] = None
+        if self.cache_ttl > 0:
+            cache = LastKnownGoodCache(self.cache_file, self.cache_ttl)
+
+        hocon_paths: List[str] = collect_hocon_paths(self.hocon_path)
+        if hocon_paths == [self.hocon_path]:
+            print(f"Checking LLM configs in: {self.hocon_path}")
+            success: bool = asyncio.run(run_checks(self.hocon_path, self.limits, cache))
+        elif not hocon_paths:
+            print(f"No HOCON files found in: {self.hocon_path}")
+            success = False
+        else:
+            print(f"Checking LLM configs in {len(hocon_paths)} file(s) from: {self.hocon_path}")
+            success = asyncio.run(run_batch_checks(hocon_paths, self.limits, cache, self.workers))
         return 0 if success else 1
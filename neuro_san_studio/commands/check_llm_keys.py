@@ -22,17 +22,27 @@ Three-tier validation for LLM API keys and other critical environment variables:
 - Tier 1: Placeholder detection (always runs)
 - Tier 2: Format validation (always runs)
 - Tier 3: Live validation via API calls (optional)
+
+Tier 3 checks run concurrently, over one pooled HTTP connection pool, each with its own timeout.
+Keys that passed recently can be skipped through a last-known-good cache keyed by a hash of the key.
 """
 
+import asyncio
+import hashlib
 import os
 from dataclasses import dataclass
 from enum import Enum
 from typing import Callable
 from typing import Optional
 
+import httpx
+
+from neuro_san_studio.utils.last_known_good_cache import DEFAULT_CACHE_DIR
+from neuro_san_studio.utils.last_known_good_cache import LastKnownGoodCache
+
 # Optional dependencies for live validation (Tier 3)
 try:
-    from anthropic import Anthropic
+    from anthropic import AsyncAnthropic
     from anthropic import AuthenticationError as AnthropicAuthError
     from anthropic import BadRequestError as AnthropicBadRequestError
     from anthropic import RateLimitError as AnthropicRateLimitError
@@ -43,20 +53,26 @@ except ImportError:
 
 try:
     from google import genai
+    from google.genai import types as genai_types
 
     HAS_GOOGLE = True
 except ImportError:
     HAS_GOOGLE = False
 
 try:
+    from openai import AsyncOpenAI
     from openai import AuthenticationError as OpenAIAuthError
-    from openai import OpenAI
     from openai import RateLimitError as OpenAIRateLimitError
 
     HAS_OPENAI = True
 except ImportError:
     HAS_OPENAI = False
 
+# Seconds each tier 3 check may take before the key is reported as unreachable.
+DEFAULT_LIVE_CHECK_TIMEOUT = 10.0
+
+DEFAULT_CACHE_FILE = os.path.join(DEFAULT_CACHE_DIR, "check_llm_keys.json")
+
 
 class ValidationStatus(Enum):
     """Status of environment variable validation."""
@@ -142,9 +158,23 @@ class EnvValidator:
         "AZURE_OPENAI_ENDPOINT",
     ]
 
-    def __init__(self):
-        """Initialize the environment validator."""
+    # Tier 3 checks that run concurrently in validate_all, by variable name
+    ASYNC_LIVE_VALIDATORS = {
+        "OPENAI_API_KEY": "validate_tier3_openai_async",
+        "ANTHROPIC_API_KEY": "validate_tier3_anthropic_async",
+        "GOOGLE_API_KEY": "validate_tier3_google_async",
+    }
+
+    def __init__(self, timeout: float = DEFAULT_LIVE_CHECK_TIMEOUT, cache: Optional[LastKnownGoodCache] = None):
+        """Initialize the environment validator.
+
+        Args:
+            timeout: Seconds each tier 3 live check may take.
+            cache: Keys that passed a live check within the cache's TTL are not checked again.
+        """
         self.results: list[ValidationResult] = []
+        self.timeout = timeout
+        self.cache = cache
 
     @staticmethod
     def mask_value(value: str) -> str:
@@ -214,72 +244,30 @@ class EnvValidator:
             masked_value=self.mask_value(value),
         )
 
-    def validate_tier3_openai(self, var_name: str) -> ValidationResult:
-        """Validate OpenAI API key with a live API call."""
-        tier2_result = self.validate_tier2(var_name)
-        if tier2_result.status != ValidationStatus.VALID:
-            return tier2_result
-
+    async def validate_tier3_openai_async(self, var_name: str, http_client: httpx.AsyncClient) -> ValidationResult:
+        """Validate a format-checked OpenAI API key with a live API call on the shared HTTP client."""
         value = os.getenv(var_name, "")
-
         if not HAS_OPENAI:
-            return ValidationResult(
-                var_name=var_name,
-                status=ValidationStatus.UNKNOWN_ERROR,
-                message="openai package not installed - skipping live validation",
-                masked_value=self.mask_value(value),
-            )
+            return self._live_result(var_name, ValidationStatus.UNKNOWN_ERROR, "openai package not installed")
 
         try:
-            client = OpenAI(api_key=value)
-            client.models.list()
-            return ValidationResult(
-                var_name=var_name,
-                status=ValidationStatus.VALID,
-                message="API key verified",
-                masked_value=self.mask_value(value),
-            )
+            client = AsyncOpenAI(api_key=value, http_client=http_client, max_retries=0)
+            await client.models.list()
         except OpenAIAuthError:
-            return ValidationResult(
-                var_name=var_name,
-                status=ValidationStatus.INVALID_KEY,
-                message="Authentication failed - invalid API key",
-                masked_value=self.mask_value(value),
-            )
+            return self._live_result(var_name, ValidationStatus.INVALID_KEY)
         except OpenAIRateLimitError:
-            return ValidationResult(
-                var_name=var_name,
-                status=ValidationStatus.RATE_LIMITED,
-                message="Rate limited - key may be valid but quota exceeded",
-                masked_value=self.mask_value(value),
-            )
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            return ValidationResult(
-                var_name=var_name,
-                status=ValidationStatus.NETWORK_ERROR,
-                message=f"Connection error: {type(e).__name__}",
-                masked_value=self.mask_value(value),
-            )
-
-    def validate_tier3_anthropic(self, var_name: str) -> ValidationResult:
-        """Validate Anthropic API key with a live API call."""
-        tier2_result = self.validate_tier2(var_name)
-        if tier2_result.status != ValidationStatus.VALID:
-            return tier2_result
+            return self._live_result(var_name, ValidationStatus.RATE_LIMITED)
+        return self._live_result(var_name, ValidationStatus.VALID)
 
+    async def validate_tier3_anthropic_async(self, var_name: str, http_client: httpx.AsyncClient) -> ValidationResult:
+        """Validate a format-checked Anthropic API key with a live API call on the shared HTTP client."""
         value = os.getenv(var_name, "")
-
         if not HAS_ANTHROPIC:
-            return ValidationResult(
-                var_name=var_name,
-                status=ValidationStatus.UNKNOWN_ERROR,
-                message="anthropic package not installed - skipping live validation",
-                masked_value=self.mask_value(value),
-            )
+            return self._live_result(var_name, ValidationStatus.UNKNOWN_ERROR, "anthropic package not installed")
 
         try:
-            client = Anthropic(api_key=value)
-            client.messages.count_tokens(
+            client = AsyncAnthropic(api_key=value, http_client=http_client, max_retries=0)
+            await client.messages.count_tokens(
                 model="claude-sonnet-4-6",
                 messages=[{"role": "user", "content": "test"}],
             )
@@ -287,93 +275,95 @@ class EnvValidator:
             # 400 means the key authenticated but the request was malformed — key is valid.
             pass
         except AnthropicAuthError:
-            return ValidationResult(
-                var_name=var_name,
-                status=ValidationStatus.INVALID_KEY,
-                message="Authentication failed - invalid API key",
-                masked_value=self.mask_value(value),
-            )
+            return self._live_result(var_name, ValidationStatus.INVALID_KEY)
         except AnthropicRateLimitError:
-            return ValidationResult(
-                var_name=var_name,
-                status=ValidationStatus.RATE_LIMITED,
-                message="Rate limited - key may be valid but quota exceeded",
-                masked_value=self.mask_value(value),
-            )
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            return ValidationResult(
-                var_name=var_name,
-                status=ValidationStatus.NETWORK_ERROR,
-                message=f"Connection error: {type(e).__name__}",
-                masked_value=self.mask_value(value),
-            )
+            return self._live_result(var_name, ValidationStatus.RATE_LIMITED)
+        return self._live_result(var_name, ValidationStatus.VALID)
 
+    async def validate_tier3_google_async(self, var_name: str, http_client: httpx.AsyncClient) -> ValidationResult:
+        """Validate a format-checked Google API key with a live API call on the shared HTTP client."""
+        value = os.getenv(var_name, "")
+        if not HAS_GOOGLE:
+            return self._live_result(var_name, ValidationStatus.UNKNOWN_ERROR, "google-genai package not installed")
+
+        try:
+            client = genai.Client(api_key=value, http_options=genai_types.HttpOptions(httpx_async_client=http_client))
+            await client.aio.models.list()
+        except Exception as e:
+            error_msg = str(e).lower()
+            if "api key" in error_msg or "invalid" in error_msg or "401" in error_msg:
+                return self._live_result(var_name, ValidationStatus.INVALID_KEY)
+            raise
+        return self._live_result(var_name, ValidationStatus.VALID)
+
+    def _live_result(self, var_name: str, status: ValidationStatus, detail: str = "") -> ValidationResult:
+        """Build a tier 3 result with the message for its status."""
+        messages = {
+            ValidationStatus.VALID: "API key verified",
+            ValidationStatus.INVALID_KEY: "Authentication failed - invalid API key",
+            ValidationStatus.RATE_LIMITED: "Rate limited - key may be valid but quota exceeded",
+            ValidationStatus.UNKNOWN_ERROR: f"{detail} - skipping live validation",
+        }
         return ValidationResult(
             var_name=var_name,
-            status=ValidationStatus.VALID,
-            message="API key verified",
-            masked_value=self.mask_value(value),
+            status=status,
+            message=messages.get(status, detail),
+            masked_value=self.mask_value(os.getenv(var_name, "")),
+        )
+
+    @staticmethod
+    def key_fingerprint(var_name: str, value: str) -> str:
+        """Cache key for a live check: derived from a hash of the value, so the key itself is never stored."""
+        return LastKnownGoodCache.fingerprint(
+            {"var_name": var_name, "sha256": hashlib.sha256(value.encode("utf-8")).hexdigest()}
         )
 
-    def validate_tier3_google(self, var_name: str) -> ValidationResult:
-        """Validate Google API key with a live API call."""
+    async def _validate_live(self, var_name: str, http_client: httpx.AsyncClient) -> ValidationResult:
+        """Tier 3 for one variable: format checks first, then the cache, then a live call within the timeout."""
         tier2_result = self.validate_tier2(var_name)
-        if tier2_result.status != ValidationStatus.VALID:
+        method_name = self.ASYNC_LIVE_VALIDATORS.get(var_name)
+        if tier2_result.status != ValidationStatus.VALID or method_name is None:
             return tier2_result
 
-        value = os.getenv(var_name, "")
-
-        if not HAS_GOOGLE:
-            return ValidationResult(
-                var_name=var_name,
-                status=ValidationStatus.UNKNOWN_ERROR,
-                message="google-genai package not installed - skipping live validation",
-                masked_value=self.mask_value(value),
-            )
+        cache_key = self.key_fingerprint(var_name, os.getenv(var_name, ""))
+        if self.cache is not None and self.cache.is_fresh(cache_key):
+            result = self._live_result(var_name, ValidationStatus.VALID)
+            result.message += f" (cached, checked {self.cache.age_seconds(cache_key):.0f}s ago)"
+            return result
 
         try:
-            client = genai.Client(api_key=value)
-            list(client.models.list())
-            return ValidationResult(
-                var_name=var_name,
-                status=ValidationStatus.VALID,
-                message="API key verified",
-                masked_value=self.mask_value(value),
+            result = await asyncio.wait_for(getattr(self, method_name)(var_name, http_client), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            result = self._live_result(
+                var_name, ValidationStatus.NETWORK_ERROR, f"No response within {self.timeout:g}s"
             )
         except Exception as e:  # pylint: disable=broad-exception-caught
-            error_msg = str(e).lower()
-            if "api key" in error_msg or "invalid" in error_msg or "401" in error_msg:
-                return ValidationResult(
-                    var_name=var_name,
-                    status=ValidationStatus.INVALID_KEY,
-                    message="Authentication failed - invalid API key",
-                    masked_value=self.mask_value(value),
-                )
-            return ValidationResult(
-                var_name=var_name,
-                status=ValidationStatus.NETWORK_ERROR,
-                message=f"Connection error: {type(e).__name__}",
-                masked_value=self.mask_value(value),
+            result = self._live_result(
+                var_name, ValidationStatus.NETWORK_ERROR, f"Connection error: {type(e).__name__}"
             )
 
-    def validate_tier3(self, var_name: str) -> ValidationResult:
-        """Tier 3: Validate with a live API call."""
-        if var_name == "OPENAI_API_KEY":
-            return self.validate_tier3_openai(var_name)
-        if var_name == "ANTHROPIC_API_KEY":
-            return self.validate_tier3_anthropic(var_name)
-        if var_name == "GOOGLE_API_KEY":
-            return self.validate_tier3_google(var_name)
-        return self.validate_tier2(var_name)
+        if self.cache is not None and result.status == ValidationStatus.VALID:
+            self.cache.record(cache_key)
+        return result
+
+    async def validate_tier3_all_async(self, var_names: list[str]) -> list[ValidationResult]:
+        """Tier 3 for every variable at once, over one pooled HTTP client. Results keep the order of var_names."""
+        async with httpx.AsyncClient(timeout=self.timeout) as http_client:
+            results = await asyncio.gather(*(self._validate_live(var_name, http_client) for var_name in var_names))
+        if self.cache is not None:
+            self.cache.save()
+        return list(results)
 
     def validate_all(self, tier: int = 2) -> list[ValidationResult]:
-        """Validate all known LLM API keys."""
+        """Validate all known LLM API keys. Tier 3 runs the live checks concurrently."""
         self.results = []
 
+        if tier >= 3:
+            self.results = asyncio.run(self.validate_tier3_all_async(self.LLM_API_KEYS))
+            return self.results
+
         for var_name in self.LLM_API_KEYS:
-            if tier >= 3:
-                result = self.validate_tier3(var_name)
-            elif tier >= 2:
+            if tier >= 2:
                 result = self.validate_tier2(var_name)
             else:
                 result = self.validate_tier1(var_name)
@@ -457,17 +447,30 @@ class EnvValidator:
 class CheckLlmKeysCommand:  # pylint: disable=too-few-public-methods
     """Run LLM API key validation and exit with 0 (warnings only) or 1 (real errors)."""
 
-    def __init__(self, tier: int = 3):
+    def __init__(
+        self,
+        tier: int = 3,
+        timeout: float = DEFAULT_LIVE_CHECK_TIMEOUT,
+        cache_ttl: float = 0.0,
+        cache_file: Optional[str] = None,
+    ):
         """Initialize the command.
 
         Args:
             tier: Validation tier level (1=placeholder, 2=format, 3=live API calls). Defaults to 3.
+            timeout: Seconds each live API call may take.
+            cache_ttl: Seconds a key that passed a live check is trusted without a new call; 0 always calls.
+            cache_file: The last-known-good cache file. Defaults to one under ~/.cache/neuro-san-studio.
         """
         self.tier = tier
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache_file = cache_file or DEFAULT_CACHE_FILE
 
     def run(self) -> int:
         """Run validation and return the appropriate exit code."""
-        validator = EnvValidator()
+        cache = LastKnownGoodCache(self.cache_file, self.cache_ttl) if self.cache_ttl > 0 else None
+        validator = EnvValidator(timeout=self.timeout, cache=cache)
         results = validator.validate_all(tier=self.tier)
         validator.print_results(results)
         return 1 if validator.has_errors(results) else 0
@@ -14,7 +14,12 @@
 #
 # END COPYRIGHT
 
-"""Typer CLI dispatcher for the neuro-san-studio package."""
+"""Typer CLI dispatcher for the neuro-san-studio package.
+
+Every subcommand imports its implementation inside its handler, so `--version`, `--help` and the
+lighter commands never pay for the server, plugin and LLM stacks that only `run` and `chat` need.
+`tests/neuro_san_studio/commands/test_cli_startup.py` guards the `--version` import budget.
+"""
 
 import os
 import sys
@@ -23,9 +28,6 @@ from typing import Optional
 
 import typer
 
-from neuro_san_studio.commands.project_environment import ProjectEnvironment
-from neuro_san_studio.commands.run import NeuroSanRunner
-
 
 class NeuroSanStudioCli:  # pylint: disable=too-few-public-methods
     """Typer CLI dispatcher: routes `neuro-san-studio <subcommand>` invocations."""
@@ -69,6 +71,9 @@ class NeuroSanStudioCli:  # pylint: disable=too-few-public-methods
         # sys.argv is the only source of those args: Click empties ctx.args before this runs.
         if any(arg in ctx.help_option_names for arg in sys.argv[1:]):
             return
+        # pylint: disable-next=import-outside-toplevel
+        from neuro_san_studio.commands.project_environment import ProjectEnvironment
+
         ProjectEnvironment(os.getcwd()).load_env_file()
 
     @staticmethod
@@ -88,6 +93,8 @@ class NeuroSanStudioCli:  # pylint: disable=too-few-public-methods
             )
         if server_only and "nsflow_port" in overrides:
             raise typer.BadParameter("You cannot specify --nsflow-port when using --server-only mode.")
+        if client_only and "server_workers" in overrides:
+            raise typer.BadParameter("You cannot specify --workers when using --client-only mode.")
 
     @staticmethod
     @app.command(
@@ -118,6 +125,17 @@ class NeuroSanStudioCli:  # pylint: disable=too-few-public-methods
         server_only: bool = typer.Option(
             False, "--server-only", help="Run only the NeuroSan server without the default nsflow client."
         ),
+        workers: Optional[int] = typer.Option(
+            None,
+            "--workers",
+            min=1,
+            help="Number of Neuro SAN server processes, load-balanced behind the server port.",
+        ),
+        check_llm_keys: bool = typer.Option(
+            False,
+            "--check-llm-keys",
+            help="Validate LLM API keys live in the background while the servers start.",
+        ),
     ) -> None:
         """Pass Typer-parsed run flags straight to NeuroSanRunner (single CLI framework: Typer).
 
@@ -136,10 +154,14 @@ class NeuroSanStudioCli:  # pylint: disable=too-few-public-methods
             "thinking_file": thinking_file,
             "client_only": client_only,
             "server_only": server_only,
+            "server_workers": workers,
+            "check_llm_keys": check_llm_keys,
         }
         overrides = {key: value for key, value in run_flags.items() if value not in (None, False)}
 
         NeuroSanStudioCli._validate_run_flags(overrides)
+        from neuro_san_studio.commands.run import NeuroSanRunner  # pylint: disable=import-outside-toplevel
+
         NeuroSanRunner(cli_overrides=overrides, extra_args=list(ctx.args)).run()
 
     @staticmethod
@@ -180,24 +202,42 @@ class NeuroSanStudioCli:  # pylint: disable=too-few-public-methods
         ImportCommand(networks_arg=networks, force=force).run()
 
     @staticmethod
-    @app.command("export", help="Export an agent network from the current project into a shareable file.")
+    @app.command("export", help="Export agent networks from the current project into shareable files.")
     def _export_command(
-        network: Optional[str] = typer.Argument(
+        networks: Optional[List[str]] = typer.Argument(
             None,
-            help="Network name (e.g. 'music_nerd') or path under registries/ (e.g. 'basic/music_nerd').",
+            help=(
+                "Network name (e.g. 'music_nerd') or path under registries/ (e.g. 'basic/music_nerd'). "
+                "Several names, group names, or 'all' export in bulk. Omit for interactive mode."
+            ),
         ),
         output: Optional[str] = typer.Option(
             None,
             "--output",
             "-o",
-            help="Output file path. Defaults to '<network>.hocon' (no deps) or '<network>.zip' (deps).",
+            help=(
+                "Output file path. Defaults to '<network>.hocon' (no deps) or '<network>.zip' (deps). "
+                "In bulk mode: the output directory, or the archive path with --combined."
+            ),
+        ),
+        combined: bool = typer.Option(
+            False,
+            "--combined",
+            help="Bulk mode: write one archive (with an export_manifest.json) instead of one per network.",
+        ),
+        workers: Optional[int] = typer.Option(
+            None,
+            "--workers",
+            "-j",
+            min=1,
+            help="Bulk mode: worker processes used to compress files. Defaults to the CPU count.",
         ),
     ) -> None:
-        """Bundle a network from the current project for sharing with another project."""
+        """Bundle networks from the current project for sharing with another project."""
         # pylint: disable-next=import-outside-toplevel
         from neuro_san_studio.commands.export_networks import ExportCommand
 
-        ExportCommand(network=network, output=output).run()
+        ExportCommand(networks=networks, output=output, combined=combined, workers=workers).run()
 
     @staticmethod
     @app.command("check-llm-keys", help="Validate LLM API keys and other critical environment variables.")
@@ -209,27 +249,75 @@ class NeuroSanStudioCli:  # pylint: disable=too-few-public-methods
             max=3,
             help="Validation tier: 1=placeholder check, 2=format check, 3=live API call.",
         ),
+        timeout: float = typer.Option(10.0, "--timeout", min=1.0, help="Seconds each live API call may take."),
+        cache_ttl: float = typer.Option(
+            0.0,
+            "--cache-ttl",
+            min=0.0,
+            help="Skip live calls for keys that passed within this many seconds (0 always calls).",
+        ),
+        cache_file: Optional[str] = typer.Option(
+            None, "--cache-file", help="Last-known-good cache file. Defaults to ~/.cache/neuro-san-studio."
+        ),
     ) -> None:
         """Run the LLM-key validation command and propagate its exit code."""
         # pylint: disable-next=import-outside-toplevel
         from neuro_san_studio.commands.check_llm_keys import CheckLlmKeysCommand
 
-        raise typer.Exit(code=CheckLlmKeysCommand(tier=tier).run())
+        command = CheckLlmKeysCommand(tier=tier, timeout=timeout, cache_ttl=cache_ttl, cache_file=cache_file)
+        raise typer.Exit(code=command.run())
 
     @staticmethod
-    @app.command("check-config", help="Validate LLM configurations in a HOCON file.")
-    def _check_config_command(
+    @app.command("check-config", help="Validate LLM configurations in a HOCON file, directory or manifest.")
+    def _check_config_command(  # pylint: disable=too-many-arguments
+        *,
         hocon_path: Optional[str] = typer.Option(
             None,
             "--hocon-path",
-            help="Path to the HOCON file to validate. Defaults to config/llm_config.hocon.",
+            help=(
+                "HOCON file, directory of HOCON files, or manifest.hocon to validate. "
+                "Defaults to config/llm_config.hocon."
+            ),
+        ),
+        manifest: bool = typer.Option(
+            False,
+            "--manifest",
+            help="Validate every network served by registries/manifest.hocon.",
+        ),
+        concurrency: int = typer.Option(8, "--concurrency", min=1, help="Maximum probes in flight."),
+        per_provider: int = typer.Option(
+            4, "--per-provider", min=1, help="Maximum probes in flight against any one provider."
+        ),
+        timeout: float = typer.Option(60.0, "--timeout", min=1.0, help="Seconds before a probe counts as failed."),
+        cache_ttl: float = typer.Option(
+            0.0,
+            "--cache-ttl",
+            min=0.0,
+            help="Skip configs that passed within this many seconds (0 always probes).",
+        ),
+        cache_file: Optional[str] = typer.Option(
+            None, "--cache-file", help="Last-known-good cache file. Defaults to ~/.cache/neuro-san-studio."
+        ),
+        workers: Optional[int] = typer.Option(
+            None, "--workers", "-j", min=1, help="Processes for parsing many files. Defaults to the CPU count."
         ),
     ) -> None:
         """Run the HOCON LLM-config validation and propagate its exit code."""
         # pylint: disable-next=import-outside-toplevel
         from neuro_san_studio.commands.check_config import CheckConfigCommand
 
-        raise typer.Exit(code=CheckConfigCommand(hocon_path=hocon_path).run())
+        # pylint: disable-next=import-outside-toplevel
+        from neuro_san_studio.commands.check_config import ProbeLimits
+
+        command = CheckConfigCommand(
+            hocon_path=hocon_path,
+            manifest=manifest,
+            limits=ProbeLimits(concurrency=concurrency, per_provider=per_provider, timeout=timeout),
+            cache_ttl=cache_ttl,
+            cache_file=cache_file,
+            workers=workers,
+        )
+        raise typer.Exit(code=command.run())
 
     @staticmethod
     @app.command(
@@ -14,7 +14,7 @@
 #
 # END COPYRIGHT
 
-"""Export an agent network from the current project into a self-contained file."""
+"""Export agent networks from the current project into self-contained files."""
 
 import os
 import sys
@@ -26,16 +26,32 @@ import questionary
 
 from neuro_san_studio.discovery.agent_network_registry import AgentNetworkRegistry
 from neuro_san_studio.exporter.agent_network_exporter import AgentNetworkExporter
+from neuro_san_studio.exporter.bulk_exporter import BulkAgentNetworkExporter
 from neuro_san_studio.utils.cli_prompt import CliPrompt
 from neuro_san_studio.utils.cli_status import CliStatus
 
 
 class ExportCommand:  # pylint: disable=too-few-public-methods
-    """Run the `ns export` flow: resolve the network, walk deps, write the bundle."""
-
-    def __init__(self, network: Optional[str] = None, output: Optional[str] = None):
+    """Run the `ns export` flow: resolve the network, walk deps, write the bundle.
+
+    One network name exports exactly as before. Several names, a group name, ``all`` or
+    ``--combined`` switch to the bulk exporter, which walks the union dependency graph once.
+    """
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        network: Optional[str] = None,
+        output: Optional[str] = None,
+        networks: Optional[List[str]] = None,
+        combined: bool = False,
+        workers: Optional[int] = None,
+    ):
         self.network = network
         self.output = output
+        self.networks = [token for token in (networks or []) if token.strip()]
+        self.combined = combined
+        self.workers = workers
         self.project_dir = os.getcwd()
 
     def run(self) -> None:
@@ -46,6 +62,14 @@ class ExportCommand:  # pylint: disable=too-few-public-methods
             print()
             sys.exit(1)
 
+        if self.networks:
+            bulk_selection = self._bulk_selection()
+            if bulk_selection is None:
+                self.network = self.networks[0]
+            else:
+                self._run_bulk(bulk_selection)
+                return
+
         if not self.network:
             picked = self._prompt_for_network()
             if not picked:
@@ -79,6 +103,71 @@ class ExportCommand:  # pylint: disable=too-few-public-methods
                 print(f"        - {w}")
         print()
 
+    def _bulk_selection(self) -> Optional[List[str]]:
+        """Expand the positional tokens for a bulk export, or return None for a plain single export.
+
+        ``all`` and group names expand through the project manifest, like `ns import`; any
+        other token is passed through for the exporter to resolve as a network name or path.
+        """
+        try:
+            networks_by_group = AgentNetworkRegistry(source_dir=self.project_dir).discover()
+        except (FileNotFoundError, ValueError):
+            networks_by_group = {}
+
+        expands = any(token == "all" or token in networks_by_group for token in self.networks)
+        if len(self.networks) == 1 and not expands and not self.combined:
+            return None
+
+        selected: List[str] = []
+        for token in self.networks:
+            if token == "all":
+                selected.extend(path for paths in networks_by_group.values() for path in paths)
+            elif token in networks_by_group:
+                selected.extend(networks_by_group[token])
+            else:
+                selected.append(token)
+        return list(dict.fromkeys(selected))
+
+    def _run_bulk(self, networks: List[str]) -> None:
+        """Export many networks at once and print per-network outcomes plus per-phase timing."""
+        if not networks:
+            print()
+            CliStatus.err("No networks matched. Pass network names, group names, or 'all'.")
+            print()
+            sys.exit(1)
+
+        exporter = BulkAgentNetworkExporter(project_dir=self.project_dir, workers=self.workers)
+        try:
+            bulk = exporter.export_many(networks, output=self.output, combined=self.combined)
+        except (FileNotFoundError, ValueError) as exc:
+            print()
+            CliStatus.err(str(exc))
+            print()
+            sys.exit(1)
+
+        print()
+        if bulk.combined:
+            CliStatus.ok(f"Exported {len(bulk.networks)} network(s) -> {bulk.output_paths[0]}")
+            for result in bulk.networks:
+                print(f"        - {result.network_name}")
+        else:
+            CliStatus.ok(f"Exported {len(bulk.networks)} network(s):")
+            for result in bulk.networks:
+                print(f"        - {result.network_name} -> {result.output_path}")
+        print()
+        CliStatus.info(
+            f"{bulk.members_compressed} archive member(s) compressed "
+            f"({bulk.bytes_in} -> {bulk.bytes_out} bytes) into {len(bulk.output_paths)} file(s)."
+        )
+        timing = ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in bulk.phase_seconds.items())
+        CliStatus.info(f"Timing: {timing}")
+        if bulk.warnings:
+            print()
+            CliStatus.warn(f"Warnings ({len(bulk.warnings)}):")
+            for w in bulk.warnings:
+                print(f"        - {w}")
+        print()
+
     @staticmethod
     def _print_dep_summary(result) -> None:
         """List what's in the bundle so the user can verify nothing is missing."""
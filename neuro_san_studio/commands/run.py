@@ -20,6 +20,7 @@ import signal
 import socket
 import subprocess
 import sys
+import threading
 import time
 from importlib.util import find_spec
 from pathlib import Path
@@ -40,6 +41,9 @@ from neuro_san_studio.runner.simple_process_logger import SimpleProcessLogger
 # detached terminal can't hang the process forever.
 INPUT_TIMEOUT_SECONDS = 300
 
+# How long `--check-llm-keys` trusts a key that passed a live check; CHECK_LLM_KEYS_CACHE_TTL overrides it.
+DEFAULT_LLM_KEYS_CACHE_TTL_SECONDS = 3600.0
+
 
 class NeuroSanRunner:
     """Command-line tool to run the Neuro SAN server and web client."""
@@ -86,6 +90,8 @@ class NeuroSanRunner:
         self.args: Dict[str, Any] = {
             "server_host": os.getenv("NEURO_SAN_SERVER_HOST", "localhost"),
             "server_http_port": int(os.getenv("NEURO_SAN_SERVER_HTTP_PORT", "8080")),
+            # More than 1 starts that many server processes behind a local proxy on server_http_port
+            "server_workers": int(os.getenv("NEURO_SAN_SERVER_WORKERS", "1")),
             "server_connection": str(os.getenv("NEURO_SAN_SERVER_CONNECTION", "http")),
             "manifest_update_period_seconds": int(os.getenv("AGENT_MANIFEST_UPDATE_PERIOD_SECONDS", "5")),
             # "spawn" is not the fastest, but the safest and most available on all OSes.
@@ -110,6 +116,8 @@ class NeuroSanRunner:
             # so the runner can read them unconditionally regardless of what was passed.
             "client_only": False,
             "server_only": False,
+            # Live LLM key validation in a background thread; see start_llm_key_check()
+            "check_llm_keys": os.getenv("CHECK_LLM_KEYS", "false").lower() in ("true", "1", "yes"),
         }
 
         # Ensure logs directory exists
@@ -134,6 +142,9 @@ class NeuroSanRunner:
         # Process references
         self.server_process = None
         self.nsflow_process = None
+        self.server_pool = None
+        self.server_proxy = None
+        self.llm_key_check_thread: Optional[threading.Thread] = None
 
     def _apply_toolbox_env(self) -> None:
         """Export AGENT_TOOLBOX_INFO_FILE only if a user-provided toolbox path is configured.
@@ -237,20 +248,62 @@ class NeuroSanRunner:
 
         return process
 
-    def start_neuro_san(self):
-        """Start the Neuro SAN server."""
-        print("Starting Neuro SAN server...")
-        command = [
+    @staticmethod
+    def server_command(http_port: int) -> List[str]:
+        """The command line of one Neuro SAN server process listening on `http_port`."""
+        return [
             sys.executable,
             "-u",
             "-m",
             "neuro_san_studio.runner.neuro_san_server_wrapper",
             "--http_port",
-            str(self.args["server_http_port"]),
+            str(http_port),
         ]
+
+    def start_neuro_san(self):
+        """Start the Neuro SAN server, or a pool of them with --workers."""
+        if self.args["server_workers"] > 1:
+            self.start_neuro_san_workers()
+            return
+        print("Starting Neuro SAN server...")
+        command = self.server_command(self.args["server_http_port"])
         self.server_process = self.start_process(command, "NeuroSan", "logs/server.log")
         print("NeuroSan server http started on port: ", self.args["server_http_port"])
 
+    def start_neuro_san_workers(self):
+        """Start server_workers server processes on internal ports, behind a session-affine proxy.
+
+        The pool restarts workers that exit or stop answering /healthz; every (re)started worker goes
+        through start_process, so plugins see each one and its logs are bridged separately.
+        """
+        # Imported here so single-process runs never load the proxy's dependencies
+        # pylint: disable-next=import-outside-toplevel
+        from neuro_san_studio.runner.affinity_proxy import AffinityProxy
+
+        # pylint: disable-next=import-outside-toplevel
+        from neuro_san_studio.runner.server_worker_pool import ServerWorkerPool
+
+        workers = self.args["server_workers"]
+        print(f"Starting {workers} Neuro SAN server workers...")
+        self.server_pool = ServerWorkerPool(workers, self._start_server_worker)
+        self.server_pool.start()
+        self.server_proxy = AffinityProxy(self.server_pool, self.args["server_host"], self.args["server_http_port"])
+        self.server_proxy.start()
+        print(
+            f"NeuroSan server http started on port: {self.args['server_http_port']} "
+            f"(workers on ports {', '.join(str(port) for port in self.server_pool.ports)})"
+        )
+
+    def _start_server_worker(self, index: int, port: int) -> subprocess.Popen:
+        """Start one pool worker. Also called from the pool's monitor thread to restart a worker."""
+        process_name = f"NeuroSan-{index}"
+        process = self.start_process(self.server_command(port), process_name, f"logs/server-{index}.log")
+        if not any(isinstance(plugin, ProcessLoggerInterface) for plugin in self.plugins):
+            # Workers restart after run() attached its fallback loggers, so attach here instead
+            log_file = str(self.logs_dir / f"{process_name.lower()}.log")
+            SimpleProcessLogger().attach_process_logger(process, process_name, log_file)
+        return process
+
     def start_nsflow(self):
         """Start nsflow client."""
         print("Starting nsflow client...")
@@ -284,6 +337,12 @@ class NeuroSanRunner:
             # Wait for the server to finish cleanup (e.g. flushing observability traces)
             self.server_process.wait(timeout=10)
 
+        if self.server_pool:
+            print("\nStopping SERVER workers...")
+            if self.server_proxy:
+                self.server_proxy.stop()
+            self.server_pool.stop(timeout=10)
+
         if self.nsflow_process:
             print(f"Stopping NSFLOW (PID {self.nsflow_process.pid})...")
             if self.is_windows:
@@ -391,6 +450,41 @@ class NeuroSanRunner:
         print("Too many invalid responses. Considering the answer is 'no'.")
         return False
 
+    def _llm_keys_cache_ttl(self) -> float:
+        """CHECK_LLM_KEYS_CACHE_TTL in seconds; read only once the key check is enabled."""
+        raw = os.getenv("CHECK_LLM_KEYS_CACHE_TTL")
+        if raw is None:
+            return DEFAULT_LLM_KEYS_CACHE_TTL_SECONDS
+        try:
+            return float(raw)
+        except ValueError:
+            self._logger.warning(
+                "Ignoring CHECK_LLM_KEYS_CACHE_TTL=%r: not a number; using %s seconds.",
+                raw,
+                DEFAULT_LLM_KEYS_CACHE_TTL_SECONDS,
+            )
+            return DEFAULT_LLM_KEYS_CACHE_TTL_SECONDS
+
+    def _check_llm_keys(self) -> None:
+        """Run `check-llm-keys` and report the outcome. Runs in the background key-check thread."""
+        # Imported here so the provider SDKs load off the start-up path
+        # pylint: disable-next=import-outside-toplevel
+        from neuro_san_studio.commands.check_llm_keys import CheckLlmKeysCommand
+
+        try:
+            exit_code = CheckLlmKeysCommand(cache_ttl=self._llm_keys_cache_ttl()).run()
+        except Exception:  # pylint: disable=broad-exception-caught
+            self._logger.exception("Background LLM key check failed")
+            return
+        if exit_code:
+            self._logger.warning("LLM key check found invalid keys; see the results above.")
+
+    def start_llm_key_check(self) -> threading.Thread:
+        """Validate LLM API keys live in a daemon thread, so server start-up does not wait on provider calls."""
+        self.llm_key_check_thread = threading.Thread(target=self._check_llm_keys, name="check-llm-keys", daemon=True)
+        self.llm_key_check_thread.start()
+        return self.llm_key_check_thread
+
     def conditional_start_servers(self):
         """
         Start neuro-san server and nsflow client based on --client-only and --server-only flags.
@@ -452,6 +546,9 @@ class NeuroSanRunner:
         else:
             signal.signal(signal.SIGTERM, self.signal_handler)  # Handle kill command (not available on Windows)
 
+        if self.args["check_llm_keys"]:
+            self.start_llm_key_check()
+
         # Start all relevant processes
         self.conditional_start_servers()
 
@@ -478,3 +575,5 @@ class NeuroSanRunner:
             self.nsflow_process.wait()
         if self.server_process:
             self.server_process.wait()
+        if self.server_pool:
+            self.server_pool.wait()
@@ -22,12 +22,11 @@ from typing import Dict
 from typing import List
 from typing import Optional
 
-from neuro_san.internals.graph.persistence.raw_manifest_restorer import RawManifestRestorer
-
+from neuro_san_studio.utils.hocon_config_cache import HoconConfigCache
 from neuro_san_studio.utils.package_paths import PackagePaths
 
-# pyhocon resolves `include "..."` directives relative to CWD; we chdir to the
-# source dir while reading so they resolve. Demote any residual log noise.
+# The manifest's `include "registries/..."` directives resolve against the source dir
+# (passed to pyhocon as its include basedir). Demote any residual log noise.
 logging.getLogger("pyhocon.config_parser").setLevel(logging.ERROR)
 
 
@@ -49,15 +48,10 @@ class AgentNetworkRegistry:  # pylint: disable=too-few-public-methods
         if not os.path.exists(manifest_path):
             return {}
 
-        # pyhocon's `include` directives are resolved relative to CWD, not the
-        # manifest. chdir ensures `include "registries/<group>/manifest.hocon"`
-        # paths in the root manifest resolve correctly.
-        prev_cwd = os.getcwd()
-        try:
-            os.chdir(self.source_dir)
-            raw = RawManifestRestorer().restore(file_reference=manifest_path)
-        finally:
-            os.chdir(prev_cwd)
+        # `include "registries/<group>/manifest.hocon"` paths in the root manifest are
+        # relative to the source dir, so that is the include basedir. The parse is shared
+        # through HoconConfigCache, so repeated listings do not re-parse the registry.
+        raw = HoconConfigCache.restore(manifest_path, basedir=self.source_dir, file_purpose="agent network manifest")
 
         result: Dict[str, List[str]] = {}
         for key in raw:
@@ -26,10 +26,11 @@ from typing import List
 from typing import Optional
 from typing import Set
 
-from neuro_san.internals.persistence.abstract_async_config_restorer import AbstractAsyncConfigRestorer
 from neuro_san.internals.utils.external_agent_parsing import ExternalAgentParsing
 from pyparsing.exceptions import ParseException
 
+from neuro_san_studio.utils.hocon_config_cache import HoconConfigCache
+
 LLM_CLASSES = {"openai", "anthropic", "google", "bedrock", "azure"}
 
 
@@ -56,8 +57,11 @@ class DependencyAnalyzer:
         """Parse one HOCON file and extract its references (one level, no recursion)."""
         deps = AgentNetworkDependencies()
         try:
-            restorer = AbstractAsyncConfigRestorer(file_purpose="dependency analysis", must_exist=True)
-            config = restorer.restore(file_reference=hocon_path)
+            # Registry HOCONs include shared files as `include "registries/..."`, i.e. relative
+            # to the project root that holds registries/, regardless of process CWD.
+            config = HoconConfigCache.restore(
+                hocon_path, basedir=os.path.dirname(self.registries_dir), file_purpose="dependency analysis"
+            )
         except (FileNotFoundError, ParseException, ValueError):
             return deps
 
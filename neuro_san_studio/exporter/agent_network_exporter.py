@@ -17,7 +17,6 @@
 """Bundle an agent network from a project directory into the shape `ns import -f` consumes."""
 
 import os
-import re
 import zipfile
 from dataclasses import dataclass
 from dataclasses import field
@@ -26,16 +25,18 @@ from pathlib import PurePosixPath
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 
 from neuro_san_studio.discovery.dependency_analyzer import AgentNetworkDependencies
 from neuro_san_studio.discovery.dependency_analyzer import DependencyAnalyzer
 from neuro_san_studio.exporter.export_metadata import ExportMetadataStamper
 from neuro_san_studio.mcp.mcp_info_merger import McpInfoMerger
+from neuro_san_studio.utils.hocon_config_cache import HoconConfigCache
 
 # `include "registries/<name>"` and `include classpath("registries/<name>")` both surface
 # shared HOCON files (e.g. aaosa.hocon). The DependencyAnalyzer reads the `tools` array
-# but doesn't parse include directives — this regex bridges the gap.
-_INCLUDE_RE = re.compile(r'include\s+(?:classpath\()?"registries/([^"]+)"\)?')
+# but doesn't parse include directives — HoconConfigCache.include_targets bridges the gap.
+_REGISTRIES_PREFIX = "registries/"
 
 # `ns init` scaffolds <project>/mcp/mcp_info.hocon. We export from the project's copy when
 # present, falling back to the studio package's bundled mcp_info.hocon — same precedence
@@ -83,22 +84,8 @@ class AgentNetworkExporter:  # pylint: disable=too-few-public-methods
         rel_hocon = self._resolve_network(network)
         full_hocon = os.path.join(self.registries_dir, rel_hocon)
 
-        # pyhocon resolves `include "registries/..."` directives relative to CWD; chdir to
-        # the project root while the analyzer parses, mirroring AgentNetworkRegistry.
         analyzer = DependencyAnalyzer(self.registries_dir, self.coded_tools_dir, self.middleware_dir)
-        prev_cwd = os.getcwd()
-        try:
-            os.chdir(self.project_dir)
-            deps = analyzer.get_transitive_dependencies(full_hocon)
-        finally:
-            os.chdir(prev_cwd)
-        # Shared HOCON `include` directives don't surface through the structured walker —
-        # do a textual scan over the network's own file so includes count toward "has_deps".
-        own_includes = self._collect_shared_includes([full_hocon])
-        # MCP refs are URL strings in the `tools` array; deps.mcp_tools already collects them
-        # (including transitively through sub-networks). Even an MCP-only network must export
-        # as a zip so we can ship the filtered mcp_info.hocon alongside the network.
-        has_deps = self._has_dependencies(deps) or bool(own_includes) or bool(deps.mcp_tools)
+        deps, has_deps = self._analyze(analyzer, full_hocon)
         target = self._resolve_output_path(rel_hocon, output_path, has_deps=has_deps)
         os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
 
@@ -116,6 +103,20 @@ class AgentNetworkExporter:  # pylint: disable=too-few-public-methods
         self._write_zip(target, rel_hocon, deps, result)
         return result
 
+    def _analyze(self, analyzer: DependencyAnalyzer, full_hocon: str) -> Tuple[AgentNetworkDependencies, bool]:
+        """Walk the network's transitive dependencies and decide whether it needs a zip."""
+        # The analyzer resolves `include "registries/..."` directives against the project
+        # root itself, so no chdir is needed here.
+        deps = analyzer.get_transitive_dependencies(full_hocon)
+        # Shared HOCON `include` directives don't surface through the structured walker —
+        # do a textual scan over the network's own file so includes count toward "has_deps".
+        own_includes = self._collect_shared_includes([full_hocon])
+        # MCP refs are URL strings in the `tools` array; deps.mcp_tools already collects them
+        # (including transitively through sub-networks). Even an MCP-only network must export
+        # as a zip so we can ship the filtered mcp_info.hocon alongside the network.
+        has_deps = self._has_dependencies(deps) or bool(own_includes) or bool(deps.mcp_tools)
+        return deps, has_deps
+
     @staticmethod
     def _stamped_network_hocon(full_hocon: str) -> str:
         """Read the network HOCON and return its text with export-provenance metadata stamped in."""
@@ -130,24 +131,38 @@ class AgentNetworkExporter:  # pylint: disable=too-few-public-methods
         result: ExportResult,
     ) -> None:
         """Bundle the network HOCON, sub-networks, coded tools, middleware, and shared includes."""
+        with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as zf:
+            self._bundle_members(zf, rel_hocon, deps, result)
+
+    def _bundle_members(
+        self,
+        zf: zipfile.ZipFile,
+        rel_hocon: str,
+        deps: AgentNetworkDependencies,
+        result: ExportResult,
+    ) -> None:
+        """Write every member of one network's bundle through `zf`.
+
+        Only `zf.write` and `zf.writestr` are called, so the bulk exporter can pass a
+        collector with the same two methods to plan members without compressing them.
+        """
         full_hocon = os.path.join(self.registries_dir, rel_hocon)
         # Use deduplicating set to avoid double-adding when sub-networks share files.
         added: Set[str] = set()
 
-        with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as zf:
-            # The primary network file is the one that carries the export-provenance metadata;
-            # write its stamped text rather than the verbatim file.
-            arcname = f"registries/{rel_hocon}"
-            zf.writestr(arcname, self._stamped_network_hocon(full_hocon))
-            added.add(arcname)
-            result.bundled_files.append(arcname)
-            self._add_sub_networks(zf, deps.sub_networks, added, result)
-            for ct in deps.coded_tools:
-                self._add_dep(zf, ct, added, result)
-            for mw in deps.middleware:
-                self._add_dep(zf, mw, added, result)
-            self._add_shared_includes(zf, full_hocon, deps.sub_networks, added, result)
-            self._add_filtered_mcp_info(zf, deps.mcp_tools, added, result)
+        # The primary network file is the one that carries the export-provenance metadata;
+        # write its stamped text rather than the verbatim file.
+        arcname = f"registries/{rel_hocon}"
+        zf.writestr(arcname, self._stamped_network_hocon(full_hocon))
+        added.add(arcname)
+        result.bundled_files.append(arcname)
+        self._add_sub_networks(zf, deps.sub_networks, added, result)
+        for ct in deps.coded_tools:
+            self._add_dep(zf, ct, added, result)
+        for mw in deps.middleware:
+            self._add_dep(zf, mw, added, result)
+        self._add_shared_includes(zf, full_hocon, deps.sub_networks, added, result)
+        self._add_filtered_mcp_info(zf, deps.mcp_tools, added, result)
 
     def _add_sub_networks(
         self, zf: zipfile.ZipFile, sub_refs: List[str], added: Set[str], result: ExportResult
@@ -276,12 +291,11 @@ class AgentNetworkExporter:  # pylint: disable=too-few-public-methods
         """Scan each hocon for `include "registries/<name>"` and return the unique <name>s."""
         seen: Set[str] = set()
         for path in hocon_paths:
-            try:
-                with open(path, encoding="utf-8") as fh:
-                    text = fh.read()
-            except OSError:
-                continue
-            for match in _INCLUDE_RE.findall(text):
+            # Already scanned (and memoized) by the analyzer's include-closure walk.
+            for kind, target in HoconConfigCache.include_targets(path):
+                if kind not in ("", "classpath") or not target.startswith(_REGISTRIES_PREFIX):
+                    continue
+                match = target[len(_REGISTRIES_PREFIX) :]
                 name = match if match.endswith(".hocon") else f"{match}.hocon"
                 seen.add(name)
         return seen
@@ -0,0 +1,361 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Export many agent networks in one pass: one dependency walk, each shared member compressed once, in parallel."""
+
+import copy
+import json
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from neuro_san_studio.discovery.dependency_analyzer import AgentNetworkDependencies
+from neuro_san_studio.discovery.dependency_analyzer import DependencyAnalyzer
+from neuro_san_studio.exporter.agent_network_exporter import AgentNetworkExporter
+from neuro_san_studio.exporter.agent_network_exporter import ExportResult
+from neuro_san_studio.exporter.export_metadata import ExportMetadataStamper
+from neuro_san_studio.utils.network_archive import BULK_EXPORT_MANIFEST
+from neuro_san_studio.utils.network_archive import MAX_ARCHIVE_ENTRIES
+from neuro_san_studio.utils.network_archive import ArchiveEntry
+from neuro_san_studio.utils.network_archive import DeflatedPayload
+from neuro_san_studio.utils.network_archive import deflate
+from neuro_san_studio.utils.network_archive import write_archive
+
+DEFAULT_COMBINED_NAME = "agent_networks.zip"
+
+# Below this many distinct members to compress, forking a process pool costs more than it saves.
+_MIN_MEMBERS_FOR_POOL = 16
+
+_MCP_ARCNAME = "mcp/mcp_info.hocon"
+
+
+@dataclass
+class PlannedMember:
+    """One archive member as the exporter asked for it: where it goes and where its bytes come from."""
+
+    arcname: str
+    payload: Union[str, bytes]
+    date_time: Tuple[int, int, int, int, int, int]
+    external_attr: int
+
+
+def _deflate_payload(payload: Union[str, bytes], level: int) -> DeflatedPayload:
+    """Read one member's content, if it is a file, and deflate it. Module-level so worker processes can unpickle it.
+
+    :param payload: Generated bytes, or the path of a file on disk, read here in the worker
+    :param level: zlib compression level
+    """
+    return deflate(payload if isinstance(payload, bytes) else Path(payload).read_bytes(), level)
+
+
+@dataclass
+class ArchiveJob:
+    """One archive to build: where it goes and its members in order."""
+
+    target: str
+    members: List[PlannedMember]
+
+
+@dataclass
+class BulkExportResult:  # pylint: disable=too-many-instance-attributes
+    """Outcome of a bulk export: every per-network result plus what the shared phases did."""
+
+    networks: List[ExportResult] = field(default_factory=list)
+    output_paths: List[str] = field(default_factory=list)
+    combined: bool = False
+    members_compressed: int = 0
+    members_written: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    phase_seconds: Dict[str, float] = field(default_factory=dict)
+    warnings: List[str] = field(default_factory=list)
+
+
+class _MemberCollector:
+    """Stands in for the ZipFile the exporter writes through, recording members instead of writing them."""
+
+    def __init__(self):
+        self.members: Dict[str, PlannedMember] = {}
+
+    def write(self, filename: str, arcname: Optional[str] = None) -> None:
+        """Record a file on disk, with the timestamp and mode ZipFile.write would give it."""
+        info = zipfile.ZipInfo.from_file(filename, arcname)
+        self.members[info.filename] = PlannedMember(
+            arcname=info.filename,
+            payload=os.path.realpath(filename),
+            date_time=info.date_time,
+            external_attr=info.external_attr,
+        )
+
+    def writestr(self, arcname: str, data: Union[str, bytes]) -> None:
+        """Record generated text, with the timestamp and mode ZipFile.writestr would give it."""
+        payload = data.encode("utf-8") if isinstance(data, str) else data
+        self.members[arcname] = PlannedMember(
+            arcname=arcname,
+            payload=payload,
+            date_time=time.localtime(time.time())[:6],
+            external_attr=0o600 << 16,
+        )
+
+
+@dataclass
+class NetworkPlan:
+    """One requested network after the resolve phase: its dependencies and planned members."""
+
+    rel_hocon: str
+    has_deps: bool
+    collector: _MemberCollector
+    result: ExportResult
+
+    @property
+    def root_arcname(self) -> str:
+        """Archive name of the network's own (stamped) HOCON."""
+        return f"registries/{self.rel_hocon}"
+
+
+class _MemoizedDependencyAnalyzer(DependencyAnalyzer):
+    """DependencyAnalyzer that parses and classifies each network file once per bulk export.
+
+    Networks in one registry share sub-networks heavily; the transitive walk for each
+    root would otherwise re-analyze every shared node. Copies are handed out because the
+    walker rewrites the lists on the object it gets back.
+    """
+
+    def __init__(self, registries_dir: str, coded_tools_dir: str, middleware_dir: str):
+        super().__init__(registries_dir, coded_tools_dir, middleware_dir)
+        self._analyzed: Dict[str, AgentNetworkDependencies] = {}
+
+    def analyze_network(self, hocon_path: str) -> AgentNetworkDependencies:
+        key = os.path.abspath(hocon_path)
+        if key not in self._analyzed:
+            self._analyzed[key] = super().analyze_network(hocon_path)
+        return copy.deepcopy(self._analyzed[key])
+
+
+class BulkAgentNetworkExporter(AgentNetworkExporter):
+    """Export many networks from one project, sharing the work the single exporter repeats.
+
+    Three phases, each timed:
+
+    * ``resolve`` — every requested network is resolved and its transitive dependencies are
+      walked with one memoized analyzer, so shared sub-networks are analyzed once. The
+      members of each bundle are planned through the single exporter's own bundling code,
+      so a bulk export carries exactly what `ns export <network>` would.
+    * ``compress`` — every distinct member is deflated once, across worker processes when there
+      are enough members to pay for the pool. A file that several per-network archives carry is
+      compressed once, not once per archive.
+    * ``write`` — the archives are laid out from the compressed members: either one combined zip
+      with an ``export_manifest.json``, or one archive per network. A ``.hocon`` is written for
+      each network without dependencies, as today.
+
+    A combined archive with more members than `ns import` accepts (MAX_ARCHIVE_ENTRIES) is
+    rejected before anything is built.
+    """
+
+    def __init__(self, project_dir: str, workers: Optional[int] = None, compress_level: int = 6):
+        super().__init__(project_dir)
+        self.workers = max(1, workers if workers is not None else (os.cpu_count() or 1))
+        self.compress_level = compress_level
+
+    def export_many(
+        self,
+        networks: List[str],
+        output: Optional[str] = None,
+        combined: bool = False,
+    ) -> BulkExportResult:
+        """Export `networks` (names or registries-relative paths, as `export` accepts).
+
+        :param networks: Networks to export; duplicates are exported once
+        :param output: Combined mode: the archive path (default ``<cwd>/agent_networks.zip``).
+                Per-network mode: the directory the archives land in (default: cwd).
+        :param combined: One archive for everything instead of one per network
+        :return: A BulkExportResult. Unknown networks raise FileNotFoundError, and a bad output
+                suffix, colliding archive names or a combined archive over MAX_ARCHIVE_ENTRIES
+                raise ValueError, before anything is written.
+        """
+        if combined and output and os.path.splitext(output)[1].lower() != ".zip":
+            raise ValueError("A combined export is always a '.zip'. Pass an -o ending in '.zip'.")
+        bulk = BulkExportResult(combined=combined)
+
+        started = time.perf_counter()
+        plans = self._plan(networks, bulk)
+        bulk.phase_seconds["resolve"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        if combined:
+            jobs = self._plan_combined(plans, output)
+        else:
+            jobs = self._plan_per_network(plans, output)
+        deflated = self._compress(jobs)
+        bulk.members_compressed = len(deflated)
+        bulk.bytes_in = sum(payload.size for payload in deflated.values())
+        bulk.bytes_out = sum(len(payload.data) for payload in deflated.values())
+        bulk.phase_seconds["compress"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for job in jobs:
+            entries = [
+                ArchiveEntry(member.arcname, member.date_time, member.external_attr, deflated[member.payload])
+                for member in job.members
+            ]
+            os.makedirs(os.path.dirname(job.target), exist_ok=True)
+            with open(job.target, "wb") as archive:
+                write_archive(archive, entries)
+            bulk.members_written += len(entries)
+        if combined:
+            bulk.output_paths = [job.target for job in jobs]
+        else:
+            self._write_plain_hocons(plans)
+            bulk.output_paths = [plan.result.output_path for plan in plans]
+        bulk.phase_seconds["write"] = time.perf_counter() - started
+
+        bulk.networks = [plan.result for plan in plans]
+        return bulk
+
+    def _plan(self, networks: List[str], bulk: BulkExportResult) -> List[NetworkPlan]:
+        """Resolve each network once, walk the union dependency graph, and collect bundle members."""
+        rel_hocons = list(dict.fromkeys(self._resolve_network(network) for network in networks))
+        analyzer = _MemoizedDependencyAnalyzer(self.registries_dir, self.coded_tools_dir, self.middleware_dir)
+
+        plans = []
+        for rel_hocon in rel_hocons:
+            full_hocon = os.path.join(self.registries_dir, rel_hocon)
+            deps, has_deps = self._analyze(analyzer, full_hocon)
+            result = ExportResult(
+                network_name=os.path.basename(rel_hocon).removesuffix(".hocon"),
+                output_path="",
+                dependencies=deps,
+            )
+            collector = _MemberCollector()
+            # The collector only records, so planning a no-deps network is as cheap as
+            # reading it; its stamped text is reused as the plain .hocon output.
+            self._bundle_members(collector, rel_hocon, deps, result)  # type: ignore[arg-type]
+            plans.append(NetworkPlan(rel_hocon=rel_hocon, has_deps=has_deps, collector=collector, result=result))
+            bulk.warnings.extend(f"{result.network_name}: {warning}" for warning in result.warnings)
+        return plans
+
+    def _compress(self, jobs: List[ArchiveJob]) -> Dict[Union[str, bytes], DeflatedPayload]:
+        """Deflate each distinct member content once, in worker processes when there are enough of them.
+
+        Members are keyed by their payload: the real path of a file on disk, or generated bytes. So a file
+        shared by several networks is read and compressed once, whichever archives carry it.
+        """
+        payloads = list(dict.fromkeys(member.payload for job in jobs for member in job.members))
+        levels = [self.compress_level] * len(payloads)
+        if self.workers > 1 and len(payloads) >= _MIN_MEMBERS_FOR_POOL:
+            # Files are read inside the workers too, so only paths and generated text are pickled.
+            chunksize = max(1, len(payloads) // (self.workers * 4))
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                deflated = list(pool.map(_deflate_payload, payloads, levels, chunksize=chunksize))
+        else:
+            deflated = [_deflate_payload(payload, level) for payload, level in zip(payloads, levels)]
+        return dict(zip(payloads, deflated))
+
+    @staticmethod
+    def _plan_per_network(plans: List[NetworkPlan], output: Optional[str]) -> List[ArchiveJob]:
+        """One archive per network with dependencies; networks without any export as a plain .hocon."""
+        out_dir = os.path.abspath(output or os.getcwd())
+        targets: Dict[str, str] = {}
+        jobs = []
+        for plan in plans:
+            target = os.path.join(out_dir, f"{plan.result.network_name}{'.zip' if plan.has_deps else '.hocon'}")
+            if target in targets:
+                raise ValueError(
+                    f"Networks '{targets[target]}' and '{plan.rel_hocon}' would both export to {target}. "
+                    "Export them separately with -o, or use --combined."
+                )
+            targets[target] = plan.rel_hocon
+            plan.result.output_path = target
+            if plan.has_deps:
+                jobs.append(ArchiveJob(target=target, members=list(plan.collector.members.values())))
+        return jobs
+
+    @staticmethod
+    def _write_plain_hocons(plans: List[NetworkPlan]) -> None:
+        """Write the stamped HOCON of each network without dependencies."""
+        for plan in plans:
+            if not plan.has_deps:
+                os.makedirs(os.path.dirname(plan.result.output_path), exist_ok=True)
+                Path(plan.result.output_path).write_bytes(plan.collector.members[plan.root_arcname].payload)
+                plan.result.bundled_files = [plan.root_arcname]
+
+    def _plan_combined(self, plans: List[NetworkPlan], output: Optional[str]) -> List[ArchiveJob]:
+        """One archive carrying every network, each shared member once, plus a manifest."""
+        target = os.path.abspath(output or DEFAULT_COMBINED_NAME)
+
+        # Root networks go first so their stamped text wins over the verbatim copy another
+        # network carries when it uses them as a sub-network.
+        members: Dict[str, PlannedMember] = {}
+        for plan in plans:
+            members[plan.root_arcname] = plan.collector.members[plan.root_arcname]
+        for plan in plans:
+            for arcname, member in plan.collector.members.items():
+                if arcname != _MCP_ARCNAME:
+                    members.setdefault(arcname, member)
+
+        # Each network's mcp_info is filtered to its own URLs; the combined archive needs the union.
+        mcp_urls = list(dict.fromkeys(url for plan in plans for url in plan.result.dependencies.mcp_tools))
+        if mcp_urls:
+            mcp_collector = _MemberCollector()
+            mcp_result = ExportResult(network_name="", output_path=target)
+            self._add_filtered_mcp_info(mcp_collector, mcp_urls, set(), mcp_result)  # type: ignore[arg-type]
+            members.update(mcp_collector.members)
+
+        # The manifest is an archive entry too
+        if len(members) + 1 > MAX_ARCHIVE_ENTRIES:
+            raise ValueError(
+                f"A combined archive of these networks would have {len(members) + 1} entries; `ns import` "
+                f"accepts at most {MAX_ARCHIVE_ENTRIES}. Export fewer networks per --combined archive, "
+                "or export per-network archives."
+            )
+
+        manifest = _MemberCollector()
+        manifest.writestr(BULK_EXPORT_MANIFEST, self._render_manifest(plans, sorted(members)))
+        for plan in plans:
+            plan.result.output_path = target
+        return [ArchiveJob(target=target, members=[*members.values(), *manifest.members.values()])]
+
+    @staticmethod
+    def _render_manifest(
+        plans: List[NetworkPlan],
+        arcnames: List[str],
+    ) -> str:
+        """JSON manifest for a combined archive: provenance, each network's own members, and the member list."""
+        manifest = {
+            **ExportMetadataStamper().build(),
+            "networks": [
+                {
+                    "network": plan.root_arcname,
+                    "members": list(plan.collector.members),
+                    "sub_networks": plan.result.dependencies.sub_networks,
+                    "coded_tools": plan.result.dependencies.coded_tools,
+                    "middleware": plan.result.dependencies.middleware,
+                    "mcp_servers": plan.result.dependencies.mcp_tools,
+                }
+                for plan in plans
+            ],
+            "members": arcnames,
+        }
+        return json.dumps(manifest, indent=4) + "\n"
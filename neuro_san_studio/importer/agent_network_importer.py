@@ -33,6 +33,9 @@ from neuro_san.internals.graph.persistence.raw_manifest_restorer import RawManif
 
 from neuro_san_studio.discovery.dependency_analyzer import AgentNetworkDependencies
 from neuro_san_studio.mcp.mcp_info_merger import McpInfoMerger
+from neuro_san_studio.utils.network_archive import BULK_EXPORT_MANIFEST
+from neuro_san_studio.utils.network_archive import MAX_ARCHIVE_BYTES
+from neuro_san_studio.utils.network_archive import MAX_ARCHIVE_ENTRIES
 from neuro_san_studio.utils.shared_registries import SHARED_REGISTRY_INCLUDES
 
 # `mcp/` is whitelisted so an export-side bundle can carry the filtered mcp_info.hocon. The
@@ -40,15 +43,15 @@ from neuro_san_studio.utils.shared_registries import SHARED_REGISTRY_INCLUDES
 # dropping it on disk verbatim — receivers may have already-configured URLs we must not
 # overwrite (e.g. with their own `${ENV}` headers).
 ALLOWED_TOP_LEVEL = ("registries/", "coded_tools/", "middleware/", "skills/", "mcp/")
-MAX_ARCHIVE_BYTES = 100 * 1024 * 1024  # 100 MB
-MAX_ARCHIVE_ENTRIES = 100
 
 
 def is_skippable_metadata(normalized: str) -> bool:
     """Tolerate common archive noise so a real-world zip isn't rejected over a __MACOSX entry,
-    and so receivers don't end up with stray .DS_Store / __pycache__ files in their tree."""
+    and so receivers don't end up with stray .DS_Store / __pycache__ files in their tree.
+    The manifest a combined `ns export` archive carries at its root is metadata too."""
     return (
-        normalized.startswith("__MACOSX/")
+        normalized == BULK_EXPORT_MANIFEST
+        or normalized.startswith("__MACOSX/")
         or "/.DS_Store" in normalized
         or normalized.endswith(".DS_Store")
         or "/__pycache__/" in normalized
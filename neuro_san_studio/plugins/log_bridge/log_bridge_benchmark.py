@@ -0,0 +1,97 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Throughput benchmark for ProcessLogBridge line handling.
+
+Run `python -m neuro_san_studio.plugins.log_bridge.log_bridge_benchmark [--lines N] [--tty]` to feed a mix of
+plain-text, single-line JSON and multi-line JSON server log lines through the bridge and print the lines
+handled per second. Console output goes to the null device; --tty makes Rich render as for a terminal.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import sys
+import time
+from argparse import ArgumentParser
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from neuro_san_studio.plugins.log_bridge.process_log_bridge import ProcessLogBridge
+
+
+def sample_lines() -> List[str]:
+    """One cycle of representative verbose server output."""
+    record = {
+        "user_id": "None",
+        "Timestamp": "2026-10-19T10:15:00.123456",
+        "source": "HttpServer",
+        "message_type": "Other",
+        "message": "Request reporting: ok",
+        "request_id": "server-1234",
+    }
+    return [
+        "2026-10-19 10:15:00,123 INFO neuro_san.service.http.server: Serving on port 8080",
+        "[2026-10-19 10:15:00] DEBUG | httpx | HTTP Request: POST https://api.openai.com/v1/chat/completions",
+        "Loading agent network from registries/basic/hello_world.hocon",
+        json.dumps(record),
+        json.dumps(dict(record, message_type="Error", message="Tool failed: timeout")),
+        "WARNING: session 42 used config {'temperature': 0.5, 'model_name': 'gpt-4o'}",
+        "{",
+        '    "message_type": "Info",',
+        '    "message": "multi-line record"',
+        "}",
+        "ValueError: could not parse tool arguments",
+        "",
+    ]
+
+
+def lines_per_second(line_count: int) -> float:
+    """Handle `line_count` sample lines on one stream and return the rate."""
+    bridge = ProcessLogBridge(level="DEBUG")
+    bridge._ensure_root_configured()  # pylint: disable=protected-access
+    with open(os.devnull, "w", encoding="utf-8") as tee:
+        state = bridge._make_stream_state("bench", tee)  # pylint: disable=protected-access
+        cycle = sample_lines()
+        lines = [cycle[index % len(cycle)] for index in range(line_count)]
+        start = time.perf_counter()
+        for line in lines:
+            bridge._handle_line(state, line)  # pylint: disable=protected-access
+        elapsed = time.perf_counter() - start
+    logging.getLogger().handlers.clear()
+    return line_count / elapsed
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Print the lines per second ProcessLogBridge handles."""
+    parser = ArgumentParser(description="Measure ProcessLogBridge throughput on sample server log lines.")
+    parser.add_argument("--lines", type=int, default=20_000, help="Number of lines to handle.")
+    parser.add_argument("--tty", action="store_true", help="Render as for a terminal (FORCE_COLOR).")
+    args = parser.parse_args(argv)
+
+    if args.tty:
+        os.environ["FORCE_COLOR"] = "1"
+    with open(os.devnull, "w", encoding="utf-8") as null, contextlib.redirect_stdout(null):
+        rate = lines_per_second(args.lines)
+    mode = "terminal" if args.tty else "not a terminal"
+    print(f"ProcessLogBridge: {rate:,.0f} lines/s ({args.lines} lines, console {mode})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,6 +19,7 @@ import copy
 import json
 import logging
 import re
+import sys
 import threading
 from datetime import datetime
 from logging.handlers import TimedRotatingFileHandler
@@ -37,6 +38,24 @@ from rich.theme import Theme
 
 from neuro_san_studio.interfaces.process_logger_interface import ProcessLoggerInterface
 
+try:
+    import orjson
+except ImportError:  # optional: the standard library decoder is used instead
+    orjson = None
+
+
+def _json_loads(text: str) -> Any:
+    """Decode JSON with orjson when it is installed, else with the standard library decoder."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)  # pylint: disable=no-member
+        except ValueError:
+            # NaN and Infinity are only accepted by the standard decoder
+            if "NaN" not in text and "Infinity" not in text:
+                raise
+    return json.loads(text)
+
+
 log_cfg = {
     # Refer rich guidelines for more options:
     # https://rich.readthedocs.io/en/latest/index.html
@@ -53,6 +72,12 @@ log_cfg = {
         "show_time": True,
         "show_path": False,
     },
+    # Console output. When stdout is not a terminal (piped, redirected, CI), lines are written as plain
+    # "[timestamp] LEVEL message" text instead of being laid out by Rich, which is much cheaper per line.
+    "console": {
+        "plain_when_not_tty": True,
+        "plain_fmt": "[%(asctime)s] %(levelname)-8s %(message)s",
+    },
     "file": {
         "when": "midnight",
         "backupCount": 10,
@@ -130,6 +155,17 @@ class ProcessLogBridge(ProcessLoggerInterface):
     _META_FIELDS = ["user_id", "Timestamp", "source", "message_type", "request_id"]
     _META_REGEXES = {f: re.compile(rf'"{f}"\s*:\s*"(?P<val>[^"]*)"', re.IGNORECASE) for f in _META_FIELDS}
 
+    # Line kinds decided by _classify_line.
+    _LINE_TEXT = "text"
+    _LINE_JSON = "json"
+    _LINE_JSON_START = "json_start"
+    # A whole line can only be a JSON document if it starts and ends like one; anything else is never parsed.
+    _JSON_DOCUMENT_ENDS = {"{": "}", "[": "]", '"': '"'}
+    _JSON_LITERALS = frozenset({"true", "false", "null", "NaN", "Infinity", "-Infinity"})
+    _JSON_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?")
+    # An embedded object must open with a quoted key or be empty: "{'a': 1}" and "{x}" are never parsed.
+    _JSON_OBJECT_OPEN = re.compile(r'\{\s*["}]')
+
     # ---------- construction ----------
     def __init__(
         self, level: str = "INFO", runner_log_file: Optional[str] = None, config: Optional[Dict[str, Any]] = None
@@ -174,6 +210,8 @@ class ProcessLogBridge(ProcessLoggerInterface):
         # rich console / handler
         theme = Theme(theme_styles)
         self.console: Console = Console(theme=theme, soft_wrap=True)
+        console_cfg = cfg.get("console", {})
+        self.plain_console: bool = bool(console_cfg.get("plain_when_not_tty", True)) and not self.console.is_terminal
 
         # Base kwargs with safe defaults, then let config["rich"] override.
         rh_kwargs = {
@@ -188,9 +226,16 @@ class ProcessLogBridge(ProcessLoggerInterface):
         }
         rh_kwargs.update(cfg.get("rich", {}))
 
-        self.rich_handler: RichHandler = RichHandler(**rh_kwargs)
-        self.rich_handler.setLevel(getattr(logging, self.level_name, logging.INFO))
-        self.rich_handler.setFormatter(logging.Formatter("%(message)s"))
+        self.console_handler: logging.Handler
+        if self.plain_console:
+            self.console_handler = logging.StreamHandler(sys.stdout)
+            self.console_handler.setFormatter(
+                self._TZFormatter(fmt=console_cfg.get("plain_fmt", "[%(asctime)s] %(levelname)-8s %(message)s"))
+            )
+        else:
+            self.console_handler = RichHandler(**rh_kwargs)
+            self.console_handler.setFormatter(logging.Formatter("%(message)s"))
+        self.console_handler.setLevel(getattr(logging, self.level_name, logging.INFO))
 
         # file handler (optional)
         self.file_handler: Optional[TimedRotatingFileHandler] = None
@@ -217,16 +262,17 @@ class ProcessLogBridge(ProcessLoggerInterface):
 
     # ---------- public API ----------
     def _ensure_root_configured(self) -> None:
-        """Configure the root logger with rich + file handlers (idempotent)."""
+        """Configure the root logger with console + file handlers (idempotent)."""
         if self._root_configured:
             return
         root = logging.getLogger()
         root.setLevel(logging.DEBUG)
         root.handlers.clear()
-        root.addHandler(self.rich_handler)
+        root.addHandler(self.console_handler)
         if self.file_handler:
             root.addHandler(self.file_handler)
-        self._logger.info("Runner logging initialized (rich console enabled)")
+        console = "plain console" if self.plain_console else "rich console"
+        self._logger.info("Runner logging initialized (%s enabled)", console)
         self._root_configured = True
 
     def attach_process_logger(self, process, process_name: str, log_file: str) -> None:
@@ -365,7 +411,7 @@ class ProcessLogBridge(ProcessLoggerInterface):
         Handle a single log line from a process.
         Steps:
             1. Mirror raw line to tee file.
-            2. Attempt strict or fragmentary JSON parsing.
+            2. Classify the line; only lines that can hold a JSON object are parsed.
             3. Otherwise apply multiline JSON reassembly logic.
             4. If none apply, log as plain text.
         :param state (dict): The per-stream state dict.
@@ -386,15 +432,18 @@ class ProcessLogBridge(ProcessLoggerInterface):
         # (still-quoted) text, not the rendered message.
         state["raw_line"] = line
 
+        kind = self._classify_line(line)
+
         # Single-line JSON?
-        obj = self._try_parse_json_fragment(line)
-        if obj is not None:
-            self._emit_json_block(state, obj)
-            return
+        if kind == self._LINE_JSON:
+            obj = self._try_parse_json_fragment(line)
+            if obj is not None:
+                self._emit_json_block(state, obj)
+                return
 
         # Multi-line accumulation
         if not state["collecting"]:
-            if self._reasm_start_if_jsonish(state, line):
+            if kind != self._LINE_TEXT and self._reasm_start_if_jsonish(state, line):
                 if state["balance"] <= 0:  # closed on same line
                     block = self._reasm_flush(state)
                     self._emit_collected(state, block)
@@ -549,31 +598,64 @@ class ProcessLogBridge(ProcessLoggerInterface):
         return default
 
     # ---------- json helpers ----------
-    @staticmethod
-    def _try_parse_json_fragment(text: str) -> Optional[Dict[str, Any]]:
+    @classmethod
+    def _could_be_json_document(cls, text: str) -> bool:
+        """
+        Cheap test of whether the whole text might parse as one JSON value.
+        :param text (str): Input text.
+        :return bool: False when a strict parse is certain to fail.
+        """
+        stripped = text.strip()
+        if not stripped:
+            return False
+        closer = cls._JSON_DOCUMENT_ENDS.get(stripped[0])
+        if closer is not None:
+            return len(stripped) > 1 and stripped[-1] == closer
+        return stripped in cls._JSON_LITERALS or cls._JSON_NUMBER.fullmatch(stripped) is not None
+
+    @classmethod
+    def _classify_line(cls, line: str) -> str:
+        """
+        Decide in one scan, without parsing, how a line must be handled.
+        :param line (str): A raw, non-empty line.
+        :return str: `_LINE_JSON` if the line may hold a complete JSON value, `_LINE_JSON_START` if it
+                opens a brace that may continue on later lines, else `_LINE_TEXT`.
+        """
+        brace = line.find("{")
+        if cls._could_be_json_document(line) or (brace != -1 and line.rfind("}") > brace):
+            return cls._LINE_JSON
+        return cls._LINE_TEXT if brace == -1 else cls._LINE_JSON_START
+
+    @classmethod
+    def _try_parse_json_fragment(cls, text: str) -> Optional[Dict[str, Any]]:
         """
         Try to parse a JSON dictionary from a text line.
         Attempts:
-            1. Full strict `json.loads(text)`
-            2. Extract fragment between first `{` and last `}` and parse that.
+            1. Full strict parse, if the text starts like a JSON value.
+            2. Extract fragment between first `{` and last `}` and parse that, if it opens like an object
+               and differs from the text already tried.
         :param text (str): Input line.
         :return dict | None: Parsed JSON as a dictionary, or None if not parseable.
         """
         if not text:
             return None
         # strict
-        try:
-            obj = json.loads(text)
-            return obj if isinstance(obj, dict) else {"message": obj}
-        except Exception:  # pylint: disable=broad-except
-            pass
+        document = cls._could_be_json_document(text)
+        if document:
+            try:
+                obj = _json_loads(text)
+                return obj if isinstance(obj, dict) else {"message": obj}
+            except Exception:  # pylint: disable=broad-except
+                pass
         # first {...}
         s = text.find("{")
         e = text.rfind("}")
-        if s != -1 and e != -1 and e > s:
+        if s != -1 and e > s and cls._JSON_OBJECT_OPEN.match(text, s):
             frag = text[s : e + 1]
+            if document and frag == text.strip():
+                return None
             try:
-                obj = json.loads(frag)
+                obj = _json_loads(frag)
                 return obj if isinstance(obj, dict) else {"message": obj}
             except Exception:  # pylint: disable=broad-except
                 return None
@@ -600,7 +682,7 @@ class ProcessLogBridge(ProcessLoggerInterface):
             return None
         # strict
         try:
-            return json.loads(s)
+            return _json_loads(s)
         except Exception:  # pylint: disable=broad-except
             pass
         # mild cleanup: unescape \n \t \r and drop trailing commas
@@ -730,7 +812,7 @@ class ProcessLogBridge(ProcessLoggerInterface):
             tb_text = self._normalize_traceback_str(raw_msg)
             if self._looks_like_traceback(tb_text):
                 self._log(state, level, header + " (traceback)")
-                self.console.print(Syntax(tb_text, "pytb", word_wrap=False))
+                self._print_traceback(tb_text)
 
     def _emit_text_line(self, state: Dict[str, Any], line: str) -> None:
         """
@@ -769,6 +851,23 @@ class ProcessLogBridge(ProcessLoggerInterface):
         flat = " ".join(p.strip() for p in block.splitlines() if p.strip())
         self._emit_text_line(state, flat)
 
+    def _print_traceback(self, tb_text: str) -> None:
+        """
+        Print a normalized traceback below its log line: syntax-highlighted by Rich on a terminal,
+        as plain text otherwise.
+        :param tb_text (str): Normalized traceback text.
+        """
+        if not self.plain_console:
+            self.console.print(Syntax(tb_text, "pytb", word_wrap=False))
+            return
+        handler = self.console_handler
+        handler.acquire()
+        try:
+            handler.stream.write(f"{tb_text}\n")
+            handler.flush()
+        finally:
+            handler.release()
+
     # ---------- logging wrapper ----------
     def _apply_sticky_level(self, state: Dict[str, Any], level: int) -> int:
         """
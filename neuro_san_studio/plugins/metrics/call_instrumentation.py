@@ -0,0 +1,357 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Wraps coded tool and middleware hooks so every call is recorded in a ToolMetrics registry.
+
+``CodedTool.async_invoke`` and ``invoke`` are wrapped on every subclass that defines them, and
+``AgentMiddleware.awrap_model_call`` / ``awrap_tool_call`` on every middleware subclass that overrides
+them, including classes defined after install() through an ``__init_subclass__`` hook. Only methods in a
+class's own namespace are replaced, so LangChain's "does this middleware override the hook" identity
+checks keep working.
+
+The network label is derived from the module path: ``coded_tools.industry.airline_policy.extract_docs``
+is recorded under ``industry/airline_policy``, matching how neuro-san resolves coded tools by network name.
+Tools shared across networks, such as ``neuro_san_studio.coded_tools.*``, are recorded under ``shared``.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import time
+import types
+from contextvars import ContextVar
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from neuro_san_studio.plugins.metrics.tool_metrics import ToolMetrics
+
+# Marks a wrapper so a class is never wrapped twice.
+_WRAPPED_ATTRIBUTE = "__neuro_san_metrics_wrapped__"
+
+# (id of the instance, method name) of the call being measured in this context. A subclass method that
+# calls super() reaches the parent class's wrapper with the same key and is not counted a second time.
+# Coded tools use "" as the method name, so an async_invoke() that delegates to invoke() counts once.
+_ACTIVE_CALL: ContextVar[Optional[Tuple[int, str]]] = ContextVar("neuro_san_metrics_active_call", default=None)
+
+# Module path prefixes stripped when deriving the network label.
+_NETWORK_PREFIXES = ("coded_tools.", "middleware.")
+
+# Payload types whose len() counts toward approximate_size(); exact types, checked without isinstance for speed.
+_SIZED_TYPES = frozenset({str, bytes, bytearray})
+
+CODED_TOOL_METHODS = ("async_invoke", "invoke")
+MIDDLEWARE_METHODS = ("awrap_model_call", "awrap_tool_call")
+
+
+def network_label(module_name: str) -> str:
+    """The network a coded tool or middleware module belongs to, e.g. ``industry/airline_policy``."""
+    for prefix in _NETWORK_PREFIXES:
+        if module_name.startswith(prefix):
+            parts = module_name[len(prefix) :].split(".")[:-1]
+            return "/".join(parts) if parts else "shared"
+    return "shared"
+
+
+def approximate_size(value: Any) -> int:
+    """A cheap payload size: the length of strings and bytes, shallowly summed over dicts, lists and tuples."""
+    value_type = type(value)
+    if value_type in _SIZED_TYPES:
+        return len(value)
+    total = 0
+    if value_type is dict:
+        for key, item in value.items():
+            if type(key) is str:  # pylint: disable=unidiomatic-typecheck
+                total += len(key)
+            if type(item) in _SIZED_TYPES:
+                total += len(item)
+    elif value_type is list or value_type is tuple:
+        for item in value:
+            if type(item) in _SIZED_TYPES:
+                total += len(item)
+    return total
+
+
+class _LoopTime:  # pylint: disable=too-few-public-methods
+    """Accumulates the time a coroutine spends running, i.e. holding its event loop thread."""
+
+    __slots__ = ("seconds",)
+
+    def __init__(self):
+        self.seconds = 0.0
+
+
+@types.coroutine
+def _timed(coroutine: Awaitable, loop_time: _LoopTime):
+    """Await `coroutine`, adding the duration of each of its steps to `loop_time`."""
+    perf_counter = time.perf_counter
+    send_value: Any = None
+    to_throw: Optional[BaseException] = None
+    while True:
+        start = perf_counter()
+        try:
+            if to_throw is not None:
+                yielded = coroutine.throw(to_throw)
+            else:
+                yielded = coroutine.send(send_value)
+        except StopIteration as stop:
+            return stop.value
+        finally:
+            loop_time.seconds += perf_counter() - start
+        to_throw = None
+        send_value = None
+        try:
+            send_value = yield yielded
+        except GeneratorExit:
+            coroutine.close()
+            raise
+        except BaseException as exception:  # pylint: disable=broad-exception-caught
+            to_throw = exception
+
+
+class CallInstrumentation:
+    """Installs and removes the metric wrappers."""
+
+    def __init__(self, metrics: ToolMetrics, measure_loop_time: bool = False):
+        """Initialize the instrumentation.
+
+        Args:
+            metrics: Registry the calls are recorded in.
+            measure_loop_time: Time every step of async calls to report event loop time. Off by default: it
+                drives the call through a generator and costs two clock reads per await inside the call.
+        """
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self.metrics = metrics
+        self.measure_loop_time = measure_loop_time
+        # (class, method group) -> whether more than one wrapper of the group is in the class's MRO
+        self._nesting: Dict[Tuple[type, Tuple[str, ...]], bool] = {}
+        # (class, method name, original attribute) for uninstall()
+        self._replaced: List[Tuple[type, str, Any]] = []
+        self._hooked: List[Tuple[type, Any]] = []
+
+    def install(self) -> None:
+        """Wrap every loaded coded tool and middleware class, and any defined later."""
+        # pylint: disable-next=import-outside-toplevel
+        from neuro_san.interfaces.coded_tool import CodedTool
+
+        self._install_for(CodedTool, CODED_TOOL_METHODS, "coded_tool")
+        try:
+            # pylint: disable-next=import-outside-toplevel
+            from langchain.agents.middleware import AgentMiddleware
+        except ImportError:
+            self._logger.info("langchain middleware is not available; only coded tools are instrumented")
+        else:
+            self._install_for(AgentMiddleware, MIDDLEWARE_METHODS, "middleware")
+
+    def uninstall(self) -> None:
+        """Restore every wrapped method and subclass hook."""
+        for cls, name, original in reversed(self._replaced):
+            setattr(cls, name, original)
+        self._replaced.clear()
+        for base, original_hook in reversed(self._hooked):
+            if original_hook is None:
+                delattr(base, "__init_subclass__")
+            else:
+                base.__init_subclass__ = original_hook
+        self._hooked.clear()
+
+    def instrument_class(self, cls: type, methods: Tuple[str, ...], kind: str) -> None:
+        """Wrap the given methods where `cls` itself defines them."""
+        network = network_label(cls.__module__)
+        for method_name in methods:
+            original = cls.__dict__.get(method_name)
+            if original is None or getattr(original, _WRAPPED_ATTRIBUTE, False) or not callable(original):
+                continue
+            wrapper = self._wrap(original, kind, network, cls.__name__, method_name)
+            self._replaced.append((cls, method_name, original))
+            setattr(cls, method_name, wrapper)
+
+    def _install_for(self, base: type, methods: Tuple[str, ...], kind: str) -> None:
+        for cls in _all_subclasses(base):
+            self.instrument_class(cls, methods, kind)
+
+        original_hook = base.__dict__.get("__init_subclass__")
+        instrumentation = self
+
+        def __init_subclass__(cls, **kwargs):
+            if original_hook is not None:
+                original_hook.__get__(None, cls)(**kwargs)
+            else:
+                super(base, cls).__init_subclass__(**kwargs)  # pylint: disable=bad-super-call
+            instrumentation.instrument_class(cls, methods, kind)
+
+        base.__init_subclass__ = classmethod(__init_subclass__)
+        self._hooked.append((base, original_hook))
+
+    def can_nest(self, cls: type, group: Tuple[str, ...]) -> bool:
+        """Whether a wrapped method of `group` can reach another one on the same instance of `cls`.
+
+        Only then, through super() or an async_invoke() that delegates to invoke(), does a call need the
+        context variable guard against being counted twice. The MRO is fixed once a class exists, and every
+        class in it is wrapped by then, so the answer is cached per class.
+        """
+        nesting_key = (cls, group)
+        nests = self._nesting.get(nesting_key)
+        if nests is None:
+            wrapped = 0
+            for klass in cls.__mro__:
+                for name in group:
+                    wrapped += bool(getattr(klass.__dict__.get(name), _WRAPPED_ATTRIBUTE, False))
+            nests = self._nesting[nesting_key] = wrapped > 1
+        return nests
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments,too-many-locals,too-many-statements
+    def _wrap(self, original: Callable, kind: str, network: str, class_name: str, method_name: str) -> Callable:
+        record = self.metrics.record
+        can_nest = self.can_nest
+        perf_counter = time.perf_counter
+        key = (kind, network, f"{class_name}.{method_name}" if kind == "middleware" else class_name)
+        group = CODED_TOOL_METHODS if kind == "coded_tool" else (method_name,)
+        guard_name = method_name if kind == "middleware" else ""
+        measure_sizes = kind == "coded_tool"
+        is_tool_hook = method_name == "awrap_tool_call"
+        measure_loop_time = self.measure_loop_time
+
+        def key_for(args: tuple) -> Tuple[str, str, str]:
+            if is_tool_hook and len(args) > 1:
+                tool_call = getattr(args[1], "tool_call", None)
+                if isinstance(tool_call, dict) and tool_call.get("name"):
+                    return (kind, network, f"{key[2]}:{tool_call['name']}")
+            return key
+
+        def finish(args: tuple, result: Any, seconds: float, error: bool, loop_seconds: float) -> None:
+            if measure_sizes:
+                args_bytes = approximate_size(args[1]) if len(args) > 1 else 0
+                record(
+                    key,
+                    seconds,
+                    error=error,
+                    loop_seconds=loop_seconds,
+                    args_bytes=args_bytes,
+                    result_bytes=approximate_size(result),
+                )
+            else:
+                record(key_for(args) if is_tool_hook else key, seconds, error=error, loop_seconds=loop_seconds)
+
+        def enter(args: tuple) -> Any:
+            """None when the call is nested in a measured one; else the guard token, or False if unguarded."""
+            if not args or can_nest(type(args[0]), group):
+                active = (id(args[0]) if args else 0, guard_name)
+                if _ACTIVE_CALL.get() == active:
+                    return None
+                return _ACTIVE_CALL.set(active)
+            return False
+
+        if not inspect.iscoroutinefunction(original):
+
+            @functools.wraps(original)
+            def sync_wrapper(*args, **kwargs):
+                token = enter(args)
+                if token is None:
+                    return original(*args, **kwargs)
+                start = perf_counter()
+                result = None
+                error = False
+                try:
+                    result = original(*args, **kwargs)
+                    return result
+                except Exception:
+                    error = True
+                    raise
+                finally:
+                    if token:
+                        _ACTIVE_CALL.reset(token)
+                    finish(args, result, perf_counter() - start, error, 0.0)
+
+            setattr(sync_wrapper, _WRAPPED_ATTRIBUTE, True)
+            return sync_wrapper
+
+        @functools.wraps(original)
+        async def async_wrapper(*args, **kwargs):
+            token = enter(args)
+            if token is None:
+                return await original(*args, **kwargs)
+            loop_time = _LoopTime() if measure_loop_time else None
+            start = perf_counter()
+            result = None
+            error = False
+            try:
+                if loop_time is None:
+                    result = await original(*args, **kwargs)
+                else:
+                    result = await _timed(original(*args, **kwargs), loop_time)
+                return result
+            except Exception:
+                error = True
+                raise
+            finally:
+                if token:
+                    _ACTIVE_CALL.reset(token)
+                finish(args, result, perf_counter() - start, error, 0.0 if loop_time is None else loop_time.seconds)
+
+        setattr(async_wrapper, _WRAPPED_ATTRIBUTE, True)
+        return async_wrapper
+
+    @staticmethod
+    def measure_overhead(iterations: int = 20_000, measure_loop_time: bool = False) -> float:
+        """CPU microseconds the wrapper adds to one async call, measured on a no-op method in a scratch registry."""
+
+        class _Probe:  # pylint: disable=too-few-public-methods
+            async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> str:
+                """A no-op call."""
+                return "ok" if args is not sly_data else ""
+
+        instrumentation = CallInstrumentation(ToolMetrics(), measure_loop_time=measure_loop_time)
+        raw = _Probe.async_invoke
+        wrapped = instrumentation._wrap(  # pylint: disable=protected-access
+            raw, "coded_tool", "shared", "_Probe", "async_invoke"
+        )
+        probe = _Probe()
+
+        async def run(method: Callable) -> float:
+            # CPU time rather than wall time, so other processes competing for the CPU do not count
+            args: Dict[str, Any] = {"query": "x"}
+            start = time.process_time()
+            for _ in range(iterations):
+                await method(probe, args, {})
+            return time.process_time() - start
+
+        async def compare() -> float:
+            await run(wrapped)
+            wrapped_times: List[float] = []
+            raw_times: List[float] = []
+            for _ in range(5):
+                wrapped_times.append(await run(wrapped))
+                raw_times.append(await run(raw))
+            return min(wrapped_times) - min(raw_times)
+
+        return max(0.0, asyncio.run(compare()) / iterations * 1_000_000.0)
+
+
+def _all_subclasses(base: type) -> List[type]:
+    found: Dict[type, None] = {}
+    pending = list(base.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        if cls not in found:
+            found[cls] = None
+            pending.extend(cls.__subclasses__())
+    return list(found)
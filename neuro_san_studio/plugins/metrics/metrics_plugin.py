@@ -0,0 +1,163 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Metrics plugin: per-coded-tool and per-middleware-hook latency and throughput.
+
+Handles:
+- Wrapping coded tools and middleware hooks when the server process initializes plugins
+- Serving the metrics in the Prometheus text format on a local HTTP endpoint
+- Logging a periodic summary of the slowest tools
+"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import Optional
+
+from neuro_san_studio.interfaces.base_plugin import BasePlugin
+from neuro_san_studio.plugins.metrics.call_instrumentation import CallInstrumentation
+from neuro_san_studio.plugins.metrics.tool_metrics import ToolMetrics
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsPlugin(BasePlugin):
+    """Plugin that records every coded tool and middleware hook call and exposes the metrics locally."""
+
+    def __init__(self, args: dict = None):
+        """Initialize the metrics plugin.
+
+        Args:
+            args: Optional dictionary of arguments for the plugin.
+        """
+        super().__init__(plugin_name="Metrics", args=args)
+        self.config = self.get_default_config()
+        self.config.update({key: value for key, value in self.args.items() if key in self.config})
+        self.metrics = ToolMetrics()
+        self.instrumentation: Optional[CallInstrumentation] = None
+        self.http_server: Optional[ThreadingHTTPServer] = None
+        self._stopped = threading.Event()
+        self._threads: list = []
+
+    @staticmethod
+    def get_default_config() -> dict:
+        """Get default metrics configuration from environment variables.
+
+        Returns:
+            Dictionary with default metrics configuration values
+        """
+        return {
+            "metrics_host": os.getenv("METRICS_HOST", "127.0.0.1"),
+            # 0 disables the endpoint
+            "metrics_port": os.getenv("METRICS_PORT", "9464"),
+            # Seconds between summary log lines; 0 disables the summary
+            "metrics_summary_interval": os.getenv("METRICS_SUMMARY_INTERVAL", "60"),
+            # Off by default: timing every step of async calls roughly doubles the per-call overhead
+            "metrics_event_loop_time": os.getenv("METRICS_EVENT_LOOP_TIME", "false"),
+        }
+
+    def do_initialize(self) -> None:
+        """Wrap coded tools and middleware, then start the endpoint and the summary log."""
+        measure_loop_time = str(self.config["metrics_event_loop_time"]).strip().lower() in ("true", "1", "yes", "on")
+        self.instrumentation = CallInstrumentation(self.metrics, measure_loop_time=measure_loop_time)
+        self.instrumentation.install()
+        self._logger.info(
+            "Instrumented coded tools and middleware; overhead is about %.1f us per call",
+            CallInstrumentation.measure_overhead(iterations=2000, measure_loop_time=measure_loop_time),
+        )
+        self.start_http_server()
+
+        interval = self._float("metrics_summary_interval")
+        if interval > 0:
+            thread = threading.Thread(
+                target=self._log_summaries, args=(interval,), name="metrics-summary", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def start_http_server(self) -> None:
+        """Serve GET /metrics on the configured host and port, unless the port is 0 or already taken."""
+        port = int(self._float("metrics_port"))
+        if port <= 0:
+            return
+        metrics = self.metrics
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # pylint: disable=invalid-name
+                """Answer /metrics with the registry, anything else with 404."""
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                """Keep scrapes out of the server log."""
+
+        host = str(self.config["metrics_host"])
+        try:
+            self.http_server = ThreadingHTTPServer((host, port), _Handler)
+        except OSError as exc:
+            # e.g. several server workers on one host: only the first one gets the port
+            self._logger.warning("Metrics endpoint not started on %s:%s: %s", host, port, exc)
+            return
+        self.http_server.daemon_threads = True
+        thread = threading.Thread(target=self.http_server.serve_forever, name="metrics-http", daemon=True)
+        thread.start()
+        self._threads.append(thread)
+        self._logger.info("Serving metrics at http://%s:%s/metrics", host, self.http_server.server_address[1])
+
+    def do_cleanup(self) -> None:
+        """Stop the endpoint and the summary, log a final summary and remove the wrappers."""
+        self._stopped.set()
+        if self.http_server is not None:
+            self.http_server.shutdown()
+            self.http_server.server_close()
+            self.http_server = None
+        if self.instrumentation is not None:
+            self._log_summary()
+            self.instrumentation.uninstall()
+            self.instrumentation = None
+
+    def update_args_dict(self, args_dict: dict):
+        """Update the args with the metrics configuration.
+
+        Args:
+            args_dict: Dictionary of arguments to update.
+        """
+        args_dict.update(MetricsPlugin.get_default_config())
+
+    def _log_summaries(self, interval: float) -> None:
+        while not self._stopped.wait(interval):
+            self._log_summary()
+
+    def _log_summary(self) -> None:
+        lines = self.metrics.summary_lines()
+        if lines:
+            self._logger.info("Call metrics (slowest by total time):\n  %s", "\n  ".join(lines))
+
+    def _float(self, key: str) -> float:
+        try:
+            return float(self.config[key])
+        except (TypeError, ValueError):
+            self._logger.warning("Ignoring malformed %s=%r", key, self.config[key])
+            return 0.0
@@ -0,0 +1,178 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""In-process registry of per-call metrics for coded tools and middleware hooks.
+
+Every call is recorded under a (kind, network, name) key: its count, errors, a latency histogram,
+approximate argument and result sizes, and the time it held the event loop thread. The registry
+renders itself in the Prometheus text exposition format and as a one-line-per-key summary.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+# Upper bounds, in seconds, of the latency histogram buckets; a final +Inf bucket is implied.
+LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# (kind, network, name), e.g. ("coded_tool", "industry/airline_policy", "ExtractDocs")
+MetricKey = Tuple[str, str, str]
+
+
+class CallStats:  # pylint: disable=too-many-instance-attributes,too-few-public-methods
+    """Accumulated metrics of one key."""
+
+    __slots__ = (
+        "calls",
+        "errors",
+        "latency_sum",
+        "latency_max",
+        "bucket_counts",
+        "loop_seconds",
+        "args_bytes",
+        "result_bytes",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.bucket_counts: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.loop_seconds = 0.0
+        self.args_bytes = 0
+        self.result_bytes = 0
+
+    def quantile(self, fraction: float) -> float:
+        """The upper bound of the bucket holding the given quantile, as Prometheus' histogram_quantile bounds it."""
+        if self.calls == 0:
+            return 0.0
+        rank = fraction * self.calls
+        seen = 0
+        for index, count in enumerate(self.bucket_counts):
+            seen += count
+            if seen >= rank:
+                return LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.latency_max
+        return self.latency_max
+
+
+class ToolMetrics:
+    """Thread-safe store of CallStats, shared by every instrumented call in the process."""
+
+    def __init__(self):
+        self._stats: Dict[MetricKey, CallStats] = {}
+        self._lock = threading.Lock()
+
+    # pylint: disable-next=too-many-arguments
+    def record(
+        self,
+        key: MetricKey,
+        seconds: float,
+        *,
+        error: bool = False,
+        loop_seconds: float = 0.0,
+        args_bytes: int = 0,
+        result_bytes: int = 0,
+    ) -> None:
+        """Add one finished call. On the path of every instrumented call, so zero values are skipped."""
+        bucket = bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = CallStats()
+            stats.calls += 1
+            stats.latency_sum += seconds
+            stats.bucket_counts[bucket] += 1
+            stats.latency_max = max(stats.latency_max, seconds)
+            if error:
+                stats.errors += 1
+            if loop_seconds:
+                stats.loop_seconds += loop_seconds
+            if args_bytes:
+                stats.args_bytes += args_bytes
+            if result_bytes:
+                stats.result_bytes += result_bytes
+
+    def snapshot(self) -> Dict[MetricKey, CallStats]:
+        """A consistent copy of every key's stats."""
+        with self._lock:
+            copies: Dict[MetricKey, CallStats] = {}
+            for key, stats in self._stats.items():
+                copy = CallStats()
+                for slot in CallStats.__slots__:
+                    value = getattr(stats, slot)
+                    setattr(copy, slot, list(value) if isinstance(value, list) else value)
+                copies[key] = copy
+        return copies
+
+    def clear(self) -> None:
+        """Forget every recorded call."""
+        with self._lock:
+            self._stats.clear()
+
+    def render_prometheus(self) -> str:
+        """Every key's metrics in the Prometheus text exposition format (version 0.0.4)."""
+        snapshot = sorted(self.snapshot().items())
+        lines: List[str] = []
+
+        def family(name: str, metric_type: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+        family("neuro_san_call_duration_seconds", "histogram", "Wall-clock duration of instrumented calls.")
+        for key, stats in snapshot:
+            labels = _labels(key)
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, stats.bucket_counts):
+                cumulative += count
+                lines.append(f'neuro_san_call_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'neuro_san_call_duration_seconds_bucket{{{labels},le="+Inf"}} {stats.calls}')
+            lines.append(f"neuro_san_call_duration_seconds_sum{{{labels}}} {stats.latency_sum!r}")
+            lines.append(f"neuro_san_call_duration_seconds_count{{{labels}}} {stats.calls}")
+
+        counters = (
+            ("neuro_san_call_errors_total", "Instrumented calls that raised.", "errors"),
+            ("neuro_san_call_event_loop_seconds_total", "Time calls held the event loop thread.", "loop_seconds"),
+            ("neuro_san_call_args_bytes_total", "Approximate size of call arguments.", "args_bytes"),
+            ("neuro_san_call_result_bytes_total", "Approximate size of call results.", "result_bytes"),
+        )
+        for name, help_text, slot in counters:
+            family(name, "counter", help_text)
+            for key, stats in snapshot:
+                lines.append(f"{name}{{{_labels(key)}}} {getattr(stats, slot)!r}")
+        return "\n".join(lines) + "\n"
+
+    def summary_lines(self, limit: int = 20) -> List[str]:
+        """The slowest keys by total time, one line each, for the periodic summary log."""
+        ranked = sorted(self.snapshot().items(), key=lambda item: item[1].latency_sum, reverse=True)[:limit]
+        return [
+            f"{kind} {network}/{name}: {stats.calls} calls, {stats.errors} errors, "
+            f"mean {stats.latency_sum / stats.calls * 1000.0:.1f} ms, p95 <= {stats.quantile(0.95) * 1000.0:.0f} ms, "
+            f"max {stats.latency_max * 1000.0:.1f} ms, event loop {stats.loop_seconds * 1000.0:.1f} ms"
+            for (kind, network, name), stats in ranked
+            if stats.calls
+        ]
+
+
+def _labels(key: MetricKey) -> str:
+    kind, network, name = key
+    return f'kind="{_escape(kind)}",network="{_escape(network)}",name="{_escape(name)}"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
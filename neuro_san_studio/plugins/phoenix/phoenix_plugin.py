@@ -23,6 +23,7 @@ Handles:
 - Phoenix integration via phoenix.otel.register()
 - Process-local initialization state tracking
 - Phoenix server process management (start/stop)
+- Span sampling, batch sizing and drop counters (see span_sampling.py)
 """
 
 import os
@@ -40,9 +41,15 @@ from typing import Type
 from leaf_common.resolution.resolver_util import ResolverUtil
 
 from neuro_san_studio.interfaces.base_plugin import BasePlugin
+from neuro_san_studio.plugins.phoenix.span_sampling import BoundedQueueSpanProcessor
+from neuro_san_studio.plugins.phoenix.span_sampling import CountingSampler
+from neuro_san_studio.plugins.phoenix.span_sampling import SpanCounters
+from neuro_san_studio.plugins.phoenix.span_sampling import SpanSamplingConfig
+from neuro_san_studio.plugins.phoenix.span_sampling import SpanStatsReporter
+from neuro_san_studio.plugins.phoenix.span_sampling import TailSamplingSpanProcessor
 
 
-class PhoenixPlugin(BasePlugin):
+class PhoenixPlugin(BasePlugin):  # pylint: disable=too-many-instance-attributes
     """Plugin for Phoenix/OpenTelemetry observability in Neuro-San Studio."""
 
     def __init__(self, args: dict = None):
@@ -54,6 +61,13 @@ class PhoenixPlugin(BasePlugin):
         super().__init__(plugin_name="Phoenix", args=args)
         self._initialized = False
         self.config = self.get_default_config()
+        # Plugin args override the environment for any config key they carry
+        self.config.update({key: value for key, value in self.args.items() if key in self.config})
+        self.sampling = SpanSamplingConfig.from_mapping(self.config)
+        self.span_processor: Optional[TailSamplingSpanProcessor] = None
+        self.export_processor: Optional[BoundedQueueSpanProcessor] = None
+        self.span_counters: Optional[SpanCounters] = None
+        self.stats_reporter: Optional[SpanStatsReporter] = None
         self.phoenix_process = None
         self.is_windows = os.name == "nt"
         self.set_environment_variables()
@@ -65,7 +79,7 @@ class PhoenixPlugin(BasePlugin):
         Returns:
             Dictionary with default Phoenix configuration values
         """
-        return {
+        config = {
             # Phoenix / OpenTelemetry defaults
             "otel_service_name": os.getenv("OTEL_SERVICE_NAME", "neuro-san-demos"),
             "otel_service_version": os.getenv("OTEL_SERVICE_VERSION", "dev"),
@@ -80,6 +94,9 @@ class PhoenixPlugin(BasePlugin):
             "phoenix_project_name": os.getenv("PHOENIX_PROJECT_NAME", "default"),
             "phoenix_otel_register": os.getenv("PHOENIX_OTEL_REGISTER", "true"),
         }
+        # Sampling, attribute caps and batch sizing
+        config.update(SpanSamplingConfig.defaults_from_env())
+        return config
 
     def _configure_tracer_provider(self) -> None:
         """Configure OpenTelemetry tracer provider with OTLP exporter.
@@ -126,7 +143,10 @@ class PhoenixPlugin(BasePlugin):
             }
         )
 
-        provider = TracerProvider(resource=resource)
+        # The attribute length limit comes from the OTEL_* variables that set_environment_variables()
+        # derived from the sampling config; the head sampler is wrapped so its drops are counted
+        self.span_counters = SpanCounters()
+        provider = TracerProvider(resource=resource, sampler=self._head_sampler())
 
         # pylint: disable=invalid-name
         OTLPSpanExporter: Type[Any] = ResolverUtil.create_type(
@@ -150,10 +170,32 @@ class PhoenixPlugin(BasePlugin):
                 "opentelemetry.sdk.trace.export.BatchSpanProcessor",
                 install_if_missing="opentelemetry-sdk",
             )
-            processor = BatchSpanProcessor(exporter)
+            self.export_processor = BoundedQueueSpanProcessor(
+                exporter, BatchSpanProcessor, self.sampling.batch_settings(), self.span_counters
+            )
+            processor: Any = self.export_processor
+            if self.sampling.tail_sampling:
+                self.span_processor = TailSamplingSpanProcessor(processor, self.sampling)
+                processor = self.span_processor
             provider.add_span_processor(processor)
 
         trace.set_tracer_provider(provider)
+        self.stats_reporter = SpanStatsReporter(self.span_stats, self.sampling.stats_interval_s)
+        self.stats_reporter.start()
+
+    def _head_sampler(self) -> Optional[Any]:
+        """The SDK's parent-based ratio sampler, counting its drops, when only head sampling applies.
+
+        Returns None otherwise, which leaves the SDK's default sampler in place.
+        """
+        if self.sampling.tail_sampling or self.sampling.sample_ratio >= 1.0:
+            return None
+        # pylint: disable=invalid-name
+        ParentBasedTraceIdRatio: Type[Any] = ResolverUtil.create_type(
+            "opentelemetry.sdk.trace.sampling.ParentBasedTraceIdRatio",
+            install_if_missing="opentelemetry-sdk",
+        )
+        return CountingSampler(ParentBasedTraceIdRatio(self.sampling.sample_ratio), self.span_counters)
 
     def _instrument_sdks(self) -> None:
         """Instrument various AI/ML SDKs for tracing.
@@ -202,6 +244,10 @@ class PhoenixPlugin(BasePlugin):
         try:
             if not self.get_bool_env("PHOENIX_OTEL_REGISTER", True):
                 return False
+            if not self.sampling.exports_everything:
+                # register() installs its own sampler and processor, which would hide the sampling counters
+                self._logger.info("Span sampling is on; configuring the tracer provider manually")
+                return False
 
             # Lazily load the method
             register: Type[Any] = ResolverUtil.create_type(
@@ -254,6 +300,19 @@ class PhoenixPlugin(BasePlugin):
         except Exception as exc:  # pylint: disable=broad-except
             self._logger.warning("Initialization failed: %s (PID=%s)", exc, os.getpid())
 
+    def span_stats(self) -> dict:
+        """Span counters in this process: spans sampled out by the head sampler, dropped by a full export
+        queue, sent or failed, and the spans queued now. With tail sampling, also its spans seen, kept and
+        sampled out, traces kept per reason or dropped, and the observed span rate. Empty when
+        phoenix.otel.register() configured tracing.
+        """
+        stats: dict = self.span_counters.snapshot() if self.span_counters is not None else {}
+        if self.export_processor is not None:
+            stats["spans_queued"] = self.export_processor.queued
+        if self.span_processor is not None:
+            stats.update(self.span_processor.stats())
+        return stats
+
     @property
     def is_initialized(self) -> bool:
         """Check if Phoenix has been initialized.
@@ -285,6 +344,19 @@ class PhoenixPlugin(BasePlugin):
         self._logger.info("PHOENIX_PROJECT_NAME set to: %s", os.environ["PHOENIX_PROJECT_NAME"])
         self._logger.info("PHOENIX_OTEL_REGISTER set to: %s", os.environ["PHOENIX_OTEL_REGISTER"])
 
+        # Sampling settings, so the server process builds the same config
+        for key, (env_var, _) in SpanSamplingConfig.ENV_VARS.items():
+            os.environ[env_var] = str(self.config[key])
+        # SDK settings derived from them; explicit OTEL_* values win
+        for env_var, value in self.sampling.sdk_environment().items():
+            os.environ.setdefault(env_var, value)
+        self._logger.info(
+            "Span sampling: ratio %s, tail sampling %s, attribute cap %s",
+            self.sampling.sample_ratio,
+            self.sampling.tail_sampling,
+            self.sampling.max_attribute_length or "none",
+        )
+
     @staticmethod
     def _is_port_open(host: str, port: int, timeout: float = 1.0) -> bool:
         """Check if a port is open on a given host.
@@ -411,5 +483,7 @@ class PhoenixPlugin(BasePlugin):
         args_dict.update(PhoenixPlugin.get_default_config())
 
     def do_cleanup(self):
-        """Stop Phoenix server if it was started by this plugin."""
+        """Stop the span stats reporter, and the Phoenix server if it was started by this plugin."""
+        if self.stats_reporter is not None:
+            self.stats_reporter.stop()
         self.stop_phoenix_server()
@@ -0,0 +1,501 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Bounded-overhead span processing for the Phoenix plugin.
+
+Handles:
+- Sampling settings read from plugin args and environment variables
+- Head-based ratio sampling through the OpenTelemetry SDK's own sampler settings
+- Tail-based retention: keep every errored, slow or high-token trace, and a ratio of the rest
+- Batch processor queue and batch sizes derived from the configured span throughput
+- Counters for spans kept, sampled out by the head or tail sampler, and dropped by a full export queue
+- A periodic log line with those counters while the server runs
+
+Nothing here imports the OpenTelemetry SDK: spans are only read through the ReadableSpan
+attributes the SDK documents, so this module loads even when the SDK is not installed.
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Optional
+
+# OpenInference attribute carrying the total token count of an LLM span.
+TOKEN_COUNT_ATTRIBUTE = "llm.token_count.total"
+
+# Trace ids are 128 bits; sampling decisions use the low 64, as the SDK's TraceIdRatioBased does.
+_TRACE_ID_LIMIT = 1 << 64
+
+
+@dataclass
+class SpanSamplingConfig:  # pylint: disable=too-many-instance-attributes
+    """Sampling and span processing settings.
+
+    The defaults keep today's behavior: every span exported, no attribute cap.
+    """
+
+    sample_ratio: float = 1.0
+    tail_sampling: bool = False
+    tail_slow_ms: float = 10_000.0
+    tail_min_tokens: int = 0
+    max_attribute_length: int = 0
+    max_pending_traces: int = 2048
+    spans_per_second: float = 200.0
+    schedule_delay_ms: int = 5000
+    stats_interval_s: float = 60.0
+
+    # Plugin config key -> (environment variable, default); update_args_dict() publishes these.
+    ENV_VARS = {
+        "phoenix_sample_ratio": ("PHOENIX_SAMPLE_RATIO", "1.0"),
+        "phoenix_tail_sampling": ("PHOENIX_TAIL_SAMPLING", "false"),
+        "phoenix_tail_slow_ms": ("PHOENIX_TAIL_SLOW_MS", "10000"),
+        "phoenix_tail_min_tokens": ("PHOENIX_TAIL_MIN_TOKENS", "0"),
+        "phoenix_max_attribute_length": ("PHOENIX_MAX_ATTRIBUTE_LENGTH", "0"),
+        "phoenix_max_pending_traces": ("PHOENIX_MAX_PENDING_TRACES", "2048"),
+        "phoenix_spans_per_second": ("PHOENIX_SPANS_PER_SECOND", "200"),
+        "phoenix_stats_interval_s": ("PHOENIX_STATS_INTERVAL_S", "60"),
+    }
+
+    @staticmethod
+    def defaults_from_env() -> Dict[str, str]:
+        """The sampling entries of the plugin config, read from the environment."""
+        return {key: os.getenv(env_var, default) for key, (env_var, default) in SpanSamplingConfig.ENV_VARS.items()}
+
+    @staticmethod
+    def from_mapping(config: Mapping[str, Any]) -> "SpanSamplingConfig":
+        """Build the settings from a plugin config dict; missing or malformed entries keep their defaults.
+
+        The ratio is clamped to [0, 1] and counts and sizes to non-negative values.
+        """
+        defaults = SpanSamplingConfig()
+
+        def number(key: str, fallback: float) -> float:
+            try:
+                value = float(config.get(key, fallback))
+            except (TypeError, ValueError):
+                return fallback
+            return value if math.isfinite(value) else fallback
+
+        return SpanSamplingConfig(
+            sample_ratio=min(1.0, max(0.0, number("phoenix_sample_ratio", defaults.sample_ratio))),
+            tail_sampling=str(config.get("phoenix_tail_sampling", "false")).strip().lower()
+            in ("true", "1", "yes", "on"),
+            tail_slow_ms=max(0.0, number("phoenix_tail_slow_ms", defaults.tail_slow_ms)),
+            tail_min_tokens=max(0, int(number("phoenix_tail_min_tokens", defaults.tail_min_tokens))),
+            max_attribute_length=max(0, int(number("phoenix_max_attribute_length", defaults.max_attribute_length))),
+            max_pending_traces=max(1, int(number("phoenix_max_pending_traces", defaults.max_pending_traces))),
+            spans_per_second=max(1.0, number("phoenix_spans_per_second", defaults.spans_per_second)),
+            stats_interval_s=max(0.0, number("phoenix_stats_interval_s", defaults.stats_interval_s)),
+        )
+
+    @property
+    def exports_everything(self) -> bool:
+        """Whether no sampling applies, so spans can go straight to the batch processor."""
+        return self.sample_ratio >= 1.0 and not self.tail_sampling
+
+    def sdk_environment(self) -> Dict[str, str]:
+        """OpenTelemetry SDK environment variables implementing the settings the SDK supports natively.
+
+        Head-only sampling becomes a parent-based trace id ratio sampler, so unsampled spans are never
+        recorded. With tail sampling every span is recorded, because the keep decision needs the whole
+        trace; the ratio is applied by TailSamplingSpanProcessor instead. The attribute cap becomes the
+        SDK's attribute value length limit, which truncates long prompt and response strings as spans are
+        built. The batch processor sizes are derived by batch_settings().
+        """
+        environment: Dict[str, str] = {}
+        if self.sample_ratio < 1.0 and not self.tail_sampling:
+            environment["OTEL_TRACES_SAMPLER"] = "parentbased_traceidratio"
+            environment["OTEL_TRACES_SAMPLER_ARG"] = repr(self.sample_ratio)
+        if self.max_attribute_length > 0:
+            environment["OTEL_ATTRIBUTE_VALUE_LENGTH_LIMIT"] = str(self.max_attribute_length)
+        settings = self.batch_settings()
+        environment["OTEL_BSP_MAX_QUEUE_SIZE"] = str(settings["max_queue_size"])
+        environment["OTEL_BSP_MAX_EXPORT_BATCH_SIZE"] = str(settings["max_export_batch_size"])
+        environment["OTEL_BSP_SCHEDULE_DELAY"] = str(settings["schedule_delay_millis"])
+        return environment
+
+    def batch_settings(self) -> Dict[str, int]:
+        """BatchSpanProcessor sizes for the expected span rate.
+
+        The queue holds four export intervals' worth of spans, so a slow or briefly unavailable
+        collector does not drop spans; a batch is about one interval's worth, bounded so one export
+        request stays small. Both are clamped to sane limits (the SDK defaults are 2048 and 512).
+
+        The rate is the configured ``spans_per_second``, not the rate TailSamplingSpanProcessor observes:
+        the SDK reads these sizes once, when the BatchSpanProcessor is built before any span exists, and
+        cannot resize its queue afterwards. The observed rate is reported at shutdown for the next run.
+        """
+        per_interval = self.spans_per_second * self.schedule_delay_ms / 1000.0
+        return {
+            "max_queue_size": int(min(65_536, max(2048, math.ceil(per_interval * 4)))),
+            "max_export_batch_size": int(min(2048, max(64, math.ceil(per_interval)))),
+            "schedule_delay_millis": self.schedule_delay_ms,
+        }
+
+
+class SpanCounters:
+    """Named span counters shared by the sampler, the span processors and the exporter."""
+
+    def __init__(self):
+        """Initialize with no counts."""
+        self._lock = threading.Lock()
+        self._values: Dict[str, int] = {}
+
+    def add(self, name: str, count: int = 1) -> None:
+        """Add to a counter, creating it at zero first."""
+        with self._lock:
+            self._values[name] = self._values.get(name, 0) + count
+
+    def snapshot(self) -> Dict[str, int]:
+        """A copy of the current counts."""
+        with self._lock:
+            return dict(self._values)
+
+
+class CountingSampler:
+    """A head sampler that delegates to the SDK's sampler and counts the spans it samples out.
+
+    Unsampled spans are never recorded, so no span processor sees them; the sampler is the only place
+    they can be counted.
+    """
+
+    def __init__(self, delegate: Any, counters: SpanCounters):
+        """Initialize the sampler.
+
+        Args:
+            delegate: The SDK sampler that decides, typically a ParentBasedTraceIdRatio.
+            counters: Where ``spans_head_sampled_out`` is counted.
+        """
+        self.delegate = delegate
+        self.counters = counters
+
+    def should_sample(self, *args: Any, **kwargs: Any) -> Any:
+        """Return the wrapped sampler's result, counting it if the span is not sampled."""
+        result = self.delegate.should_sample(*args, **kwargs)
+        if not result.decision.is_sampled():
+            self.counters.add("spans_head_sampled_out")
+        return result
+
+    def get_description(self) -> str:
+        """Describe the sampler as the wrapped one."""
+        return f"CountingSampler{{{self.delegate.get_description()}}}"
+
+
+class _CountingSpanExporter:
+    """Passes batches to the real exporter, telling the export processor they left the queue."""
+
+    def __init__(self, delegate: Any, owner: "BoundedQueueSpanProcessor"):
+        self.delegate = delegate
+        self.owner = owner
+
+    def export(self, spans: Any) -> Any:
+        """Export one batch and count its spans as sent or failed."""
+        self.owner.dequeued(len(spans))
+        result = self.delegate.export(spans)
+        sent = getattr(result, "name", None) == "SUCCESS"
+        self.owner.counters.add("spans_sent" if sent else "spans_send_failed", len(spans))
+        return result
+
+    def shutdown(self) -> None:
+        """Shut the real exporter down."""
+        self.delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Flush the real exporter."""
+        return self.delegate.force_flush(timeout_millis)
+
+
+class BoundedQueueSpanProcessor:
+    """Builds the BatchSpanProcessor and counts the spans that do not fit in its queue.
+
+    The SDK's BatchSpanProcessor drops spans when its queue is full without counting them. This processor
+    tracks the queue length itself: spans handed to the batch processor, less the spans it has passed to the
+    exporter. A span arriving when that length reaches ``max_queue_size`` is dropped here and counted as
+    ``spans_queue_dropped``, so the SDK's queue never overflows unseen. While a batch is between the queue
+    and the exporter, a span can be dropped slightly early.
+    """
+
+    def __init__(
+        self, exporter: Any, batch_processor_type: Any, batch_settings: Mapping[str, int], counters: SpanCounters
+    ):
+        """Initialize the processor.
+
+        Args:
+            exporter: The span exporter, typically an OTLPSpanExporter.
+            batch_processor_type: The SDK's BatchSpanProcessor class.
+            batch_settings: Its keyword arguments, as returned by SpanSamplingConfig.batch_settings().
+            counters: Where dropped, sent and failed spans are counted.
+        """
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self.counters = counters
+        self.max_queue_size = batch_settings["max_queue_size"]
+        self.queued = 0
+        self._lock = threading.Lock()
+        self.delegate = batch_processor_type(_CountingSpanExporter(exporter, self), **batch_settings)
+
+    def on_start(self, span: Any, parent_context: Any = None) -> None:
+        """Forward span starts unchanged."""
+        self.delegate.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: Any) -> None:
+        """Queue the span in the batch processor, or drop and count it when the queue is full."""
+        # The batch processor ignores unsampled spans, so they never take a queue slot
+        if getattr(getattr(span.context, "trace_flags", None), "sampled", True):
+            with self._lock:
+                if self.queued >= self.max_queue_size:
+                    self.counters.add("spans_queue_dropped")
+                    return
+                self.queued += 1
+        self.delegate.on_end(span)
+
+    def dequeued(self, count: int) -> None:
+        """Record that the batch processor took spans off its queue."""
+        with self._lock:
+            self.queued = max(0, self.queued - count)
+
+    def shutdown(self) -> None:
+        """Shut the batch processor down, then log the export counters."""
+        self.delegate.shutdown()
+        self._logger.info("Span export stats: %s", self.counters.snapshot())
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Flush the batch processor."""
+        return self.delegate.force_flush(timeout_millis)
+
+
+class SpanStatsReporter:
+    """Logs span stats at a fixed interval from a daemon thread while the server runs.
+
+    Warns when a full export queue dropped spans since the previous report.
+    """
+
+    def __init__(self, stats: Callable[[], Mapping[str, float]], interval_s: float):
+        """Initialize the reporter.
+
+        Args:
+            stats: Returns the current stats, e.g. PhoenixPlugin.span_stats.
+            interval_s: Seconds between reports; 0 disables reporting.
+        """
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._stats = stats
+        self.interval_s = interval_s
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._queue_dropped = 0
+
+    def start(self) -> None:
+        """Start reporting, unless disabled or already started."""
+        if self.interval_s <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="span-stats-reporter", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop reporting."""
+        self._stopped.set()
+
+    def report(self) -> Dict[str, float]:
+        """Log the current stats once and return them."""
+        stats = dict(self._stats())
+        self._logger.info("Span stats: %s", stats)
+        queue_dropped = int(stats.get("spans_queue_dropped", 0))
+        if queue_dropped > self._queue_dropped:
+            self._logger.warning(
+                "%d spans dropped by a full export queue since the last report; raise PHOENIX_SPANS_PER_SECOND.",
+                queue_dropped - self._queue_dropped,
+            )
+        self._queue_dropped = queue_dropped
+        return stats
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval_s):
+            self.report()
+
+
+@dataclass
+class _PendingTrace:
+    """The ended spans of one trace whose local root has not ended yet."""
+
+    spans: List[Any]
+    errored: bool = False
+    tokens: int = 0
+
+
+class TailSamplingSpanProcessor:  # pylint: disable=too-many-instance-attributes
+    """A span processor that decides per trace which spans reach the wrapped processor.
+
+    Ended spans are held per trace until the trace's local root span ends. The trace is then kept if any
+    span errored, if the root took at least ``tail_slow_ms``, if its spans reported at least
+    ``tail_min_tokens`` tokens, or if its trace id falls within ``sample_ratio``; otherwise it is dropped.
+    At most ``max_pending_traces`` traces are held: beyond that the oldest is decided early on what has
+    ended so far. Spans that end after their trace was decided follow that decision.
+    """
+
+    def __init__(self, delegate: Any, config: SpanSamplingConfig):
+        """Initialize the processor.
+
+        Args:
+            delegate: The span processor that exports kept spans, typically a BatchSpanProcessor.
+            config: The sampling settings.
+        """
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self.delegate = delegate
+        self.config = config
+        self._pending: "OrderedDict[int, _PendingTrace]" = OrderedDict()
+        self._decided: "OrderedDict[int, bool]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {
+            "spans_seen": 0,
+            "spans_kept": 0,
+            "spans_sampled_out": 0,
+            "traces_kept_error": 0,
+            "traces_kept_slow": 0,
+            "traces_kept_tokens": 0,
+            "traces_kept_ratio": 0,
+            "traces_dropped": 0,
+            "traces_decided_early": 0,
+        }
+        self._started_at = time.monotonic()
+
+    def on_start(self, span: Any, parent_context: Any = None) -> None:
+        """Forward span starts unchanged."""
+        self.delegate.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: Any) -> None:
+        """Hold the span until its trace is decided, or route it by an earlier decision."""
+        trace_id: int = span.context.trace_id
+        release: List[Any] = []
+        with self._lock:
+            self._counters["spans_seen"] += 1
+            decision = self._decided.get(trace_id)
+            if decision is not None:
+                self._count_spans(decision, 1)
+                if decision:
+                    release.append(span)
+            else:
+                pending = self._pending.get(trace_id)
+                if pending is None:
+                    pending = self._pending[trace_id] = _PendingTrace(spans=[])
+                pending.spans.append(span)
+                pending.errored = pending.errored or self._is_error(span)
+                pending.tokens += self._token_count(span)
+                if self._is_local_root(span):
+                    release.extend(self._decide(trace_id, self._duration_ms(span)))
+                while len(self._pending) > self.config.max_pending_traces:
+                    oldest = next(iter(self._pending))
+                    self._counters["traces_decided_early"] += 1
+                    release.extend(self._decide(oldest, 0.0))
+        for kept in release:
+            self.delegate.on_end(kept)
+
+    def shutdown(self) -> None:
+        """Decide every pending trace, log the counters, then shut the wrapped processor down.
+
+        Warns when the observed span rate exceeded the configured one, since the batch sizes came from the latter.
+        """
+        self.force_flush()
+        stats = self.stats()
+        self._logger.info("Span sampling stats: %s", stats)
+        if stats["observed_spans_per_second"] > self.config.spans_per_second:
+            self._logger.warning(
+                "Observed %.1f spans/s, above the %.1f the export queue was sized for; "
+                "raise PHOENIX_SPANS_PER_SECOND if spans were dropped.",
+                stats["observed_spans_per_second"],
+                self.config.spans_per_second,
+            )
+        self.delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Decide every pending trace on what has ended so far and flush the wrapped processor."""
+        release: List[Any] = []
+        with self._lock:
+            for trace_id in list(self._pending):
+                release.extend(self._decide(trace_id, 0.0))
+        for kept in release:
+            self.delegate.on_end(kept)
+        return self.delegate.force_flush(timeout_millis)
+
+    def stats(self) -> Dict[str, float]:
+        """The counters, the traces still pending and the observed span rate since start."""
+        with self._lock:
+            stats: Dict[str, float] = dict(self._counters)
+            stats["traces_pending"] = len(self._pending)
+        elapsed = max(time.monotonic() - self._started_at, 1e-9)
+        stats["observed_spans_per_second"] = stats["spans_seen"] / elapsed
+        return stats
+
+    def _decide(self, trace_id: int, root_duration_ms: float) -> List[Any]:
+        """Record the decision for a pending trace; return its spans if kept. Call under the lock."""
+        pending = self._pending.pop(trace_id)
+        reason = self._keep_reason(trace_id, pending, root_duration_ms)
+        keep = reason is not None
+        self._counters[f"traces_kept_{reason}" if keep else "traces_dropped"] += 1
+        self._count_spans(keep, len(pending.spans))
+        self._decided[trace_id] = keep
+        # Late spans of a trace usually end within moments; remember a bounded number of decisions
+        while len(self._decided) > self.config.max_pending_traces * 4:
+            self._decided.popitem(last=False)
+        return pending.spans if keep else []
+
+    def _keep_reason(self, trace_id: int, pending: _PendingTrace, root_duration_ms: float) -> Optional[str]:
+        if pending.errored:
+            return "error"
+        if self.config.tail_slow_ms > 0 and root_duration_ms >= self.config.tail_slow_ms:
+            return "slow"
+        if self.config.tail_min_tokens > 0 and pending.tokens >= self.config.tail_min_tokens:
+            return "tokens"
+        if self.ratio_sampled(trace_id, self.config.sample_ratio):
+            return "ratio"
+        return None
+
+    def _count_spans(self, keep: bool, count: int) -> None:
+        self._counters["spans_kept" if keep else "spans_sampled_out"] += count
+
+    @staticmethod
+    def ratio_sampled(trace_id: int, ratio: float) -> bool:
+        """Whether a trace id falls within the ratio; the same test as the SDK's TraceIdRatioBased sampler."""
+        return (trace_id & (_TRACE_ID_LIMIT - 1)) < round(ratio * _TRACE_ID_LIMIT)
+
+    @staticmethod
+    def _is_local_root(span: Any) -> bool:
+        parent = span.parent
+        return parent is None or bool(getattr(parent, "is_remote", False))
+
+    @staticmethod
+    def _is_error(span: Any) -> bool:
+        status_code = getattr(getattr(span, "status", None), "status_code", None)
+        return getattr(status_code, "name", None) == "ERROR"
+
+    @staticmethod
+    def _duration_ms(span: Any) -> float:
+        if span.start_time is None or span.end_time is None:
+            return 0.0
+        return (span.end_time - span.start_time) / 1_000_000.0
+
+    @staticmethod
+    def _token_count(span: Any) -> int:
+        value = (span.attributes or {}).get(TOKEN_COUNT_ATTRIBUTE)
+        return int(value) if isinstance(value, (int, float)) else 0
@@ -0,0 +1,196 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""A small streaming reverse proxy in front of a ServerWorkerPool, with session affinity.
+
+Requests that carry a session (an MCP session header, an X-Session-Id header or the proxy's own
+affinity cookie) always reach the same worker while it is healthy. Other requests go to the least
+busy worker, and the response sets the affinity cookie so a client that keeps cookies sticks from
+then on. A session id that a worker hands out in a response header is pinned to that worker.
+Responses, including streaming chats, are relayed chunk by chunk as the worker produces them.
+"""
+
+import asyncio
+import logging
+import threading
+import uuid
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from aiohttp import ClientError
+from aiohttp import ClientSession
+from aiohttp import ClientTimeout
+from aiohttp import TCPConnector
+from aiohttp import web
+
+from neuro_san_studio.runner.server_worker_pool import ServerWorkerPool
+
+AFFINITY_COOKIE = "neuro_san_affinity"
+
+# Request headers that identify a session, checked in order before the affinity cookie.
+DEFAULT_AFFINITY_HEADERS: Tuple[str, ...] = ("Mcp-Session-Id", "X-Session-Id")
+
+# Per-connection headers that must not be forwarded (RFC 9110 section 7.6.1).
+_HOP_BY_HOP = frozenset(
+    {
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+        "host",
+    }
+)
+
+
+class AffinityProxy:  # pylint: disable=too-many-instance-attributes
+    """Listens on the public server port and forwards each request to a worker of the pool.
+
+    The proxy runs its own event loop on a daemon thread, so it works alongside the synchronous runner.
+    """
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        pool: ServerWorkerPool,
+        host: str,
+        port: int,
+        *,
+        affinity_headers: Sequence[str] = DEFAULT_AFFINITY_HEADERS,
+        connect_timeout: float = 5.0,
+    ):
+        """Initialize the proxy.
+
+        Args:
+            pool: The workers to forward to.
+            host: Interface to listen on.
+            port: Public port to listen on.
+            affinity_headers: Request headers whose value pins a session to one worker.
+            connect_timeout: Seconds to wait for a connection to a worker. Responses have no overall
+                timeout, since streaming chats can run for a long time.
+        """
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self.pool = pool
+        self.host = host
+        self.port = port
+        self.affinity_headers = tuple(affinity_headers)
+        self.connect_timeout = connect_timeout
+        self._loop = asyncio.new_event_loop()
+        self._runner: Optional[web.AppRunner] = None
+        self._session: Optional[ClientSession] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Bind the public port and start serving on a background thread. Raises OSError if the bind fails."""
+        self._loop.run_until_complete(self._start_server())
+        self._thread = threading.Thread(target=self._loop.run_forever, name="server-affinity-proxy", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop accepting requests and close upstream connections."""
+        if self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._stop_server(), self._loop).result(timeout=10)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=10)
+        self._thread = None
+
+    def affinity_key(self, request: web.Request) -> Optional[str]:
+        """The session a request belongs to, if any."""
+        for header in self.affinity_headers:
+            value = request.headers.get(header)
+            if value:
+                return f"{header.lower()}:{value}"
+        cookie = request.cookies.get(AFFINITY_COOKIE)
+        return f"cookie:{cookie}" if cookie else None
+
+    async def _start_server(self) -> None:
+        self._session = ClientSession(
+            connector=TCPConnector(limit=0),
+            timeout=ClientTimeout(total=None, sock_connect=self.connect_timeout),
+            auto_decompress=False,
+        )
+        app = web.Application(client_max_size=0)
+        app.router.add_route("*", "/{tail:.*}", self._forward)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        try:
+            await site.start()
+        except OSError:
+            await self._stop_server()
+            raise
+
+    async def _stop_server(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+        if self._session is not None:
+            await self._session.close()
+
+    async def _forward(self, request: web.Request) -> web.StreamResponse:
+        affinity_key = self.affinity_key(request)
+        worker = self.pool.choose(affinity_key)
+        if worker is None:
+            return web.Response(status=503, text="No healthy Neuro SAN server worker is available.")
+        new_cookie = None
+        if affinity_key is None:
+            # Balanced now; the cookie pins the client to this worker from its next request on
+            new_cookie = uuid.uuid4().hex
+            self.pool.pin(f"cookie:{new_cookie}", worker)
+
+        headers = {name: value for name, value in request.headers.items() if name.lower() not in _HOP_BY_HOP}
+        headers["X-Forwarded-For"] = request.remote or ""
+        headers["X-Forwarded-Host"] = request.host
+        headers["X-Forwarded-Proto"] = request.scheme
+        url = f"http://{self.pool.host}:{worker.port}{request.rel_url}"
+
+        response: Optional[web.StreamResponse] = None
+        self.pool.begin_request(worker)
+        try:
+            async with self._session.request(
+                request.method,
+                url,
+                headers=headers,
+                data=request.content if request.body_exists else None,
+                allow_redirects=False,
+            ) as upstream:
+                response = web.StreamResponse(status=upstream.status, reason=upstream.reason)
+                for name, value in upstream.headers.items():
+                    if name.lower() not in _HOP_BY_HOP:
+                        response.headers.add(name, value)
+                if new_cookie is not None:
+                    response.set_cookie(AFFINITY_COOKIE, new_cookie, httponly=True, samesite="Lax")
+                for header in self.affinity_headers:
+                    session_id = upstream.headers.get(header)
+                    if session_id:
+                        self.pool.pin(f"{header.lower()}:{session_id}", worker)
+                await response.prepare(request)
+                async for chunk in upstream.content.iter_any():
+                    await response.write(chunk)
+                await response.write_eof()
+                return response
+        except ClientError as exc:
+            self._logger.warning("Forwarding %s %s to %s failed: %s", request.method, request.path, worker.name, exc)
+            if response is not None and response.prepared:
+                # The status line is already sent; ending here closes the connection mid-body
+                return response
+            return web.Response(status=502, text=f"{worker.name} did not respond: {type(exc).__name__}")
+        finally:
+            self.pool.end_request(worker)
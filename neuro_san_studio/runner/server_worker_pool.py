@@ -0,0 +1,302 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""A supervised pool of Neuro SAN server processes, each on its own internal port.
+
+Used by `neuro-san-studio run --workers N` together with AffinityProxy, which listens on the public
+port and forwards each request to a worker chosen here.
+"""
+
+import hashlib
+import http.client
+import logging
+import os
+import signal
+import socket
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+from typing import List
+from typing import Optional
+
+# Starts one worker: (worker index, internal http port) -> the running process.
+SpawnWorker = Callable[[int, int], subprocess.Popen]
+
+
+def find_free_port(host: str = "127.0.0.1") -> int:
+    """A port the OS reports as free on `host`."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+@dataclass
+class ServerWorker:  # pylint: disable=too-many-instance-attributes
+    """One server process in the pool and its supervision state."""
+
+    index: int
+    port: int = 0
+    process: Optional[subprocess.Popen] = None
+    healthy: bool = False
+    started_at: float = 0.0
+    failed_probes: int = 0
+    restarts: int = 0
+    crash_streak: int = 0
+    respawn_at: float = 0.0
+    active_requests: int = 0
+    served_requests: int = 0
+
+    @property
+    def name(self) -> str:
+        """The process name used in logs."""
+        return f"NeuroSan-{self.index}"
+
+
+class ServerWorkerPool:  # pylint: disable=too-many-instance-attributes
+    """Starts N server processes and keeps them running.
+
+    A monitor thread polls every worker: a worker whose process exited is respawned, with exponential
+    backoff while it keeps crashing during start-up, and a worker that stops answering its health
+    endpoint is killed and respawned. Only healthy workers are handed out by choose().
+    """
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        size: int,
+        spawn: SpawnWorker,
+        *,
+        host: str = "127.0.0.1",
+        health_path: str = "/healthz",
+        health_interval: float = 2.0,
+        unhealthy_after: int = 3,
+        startup_grace: float = 120.0,
+        max_backoff: float = 30.0,
+        kill_timeout: float = 10.0,
+        max_pinned_sessions: int = 100_000,
+    ):
+        """Initialize the pool.
+
+        Args:
+            size: Number of server processes.
+            spawn: Starts the process for one worker on the given internal port.
+            host: Interface the workers listen on.
+            health_path: HTTP path probed for liveness; any 2xx response counts as healthy.
+            health_interval: Seconds between monitor passes.
+            unhealthy_after: Consecutive failed probes before a healthy worker is restarted.
+            startup_grace: Seconds a new worker may take to answer its first probe.
+            max_backoff: Longest delay before respawning a worker that keeps crashing.
+            kill_timeout: Seconds an unresponsive worker has to exit after SIGTERM before it is killed.
+            max_pinned_sessions: Sessions remembered by pin(); the least recently used are forgotten first.
+        """
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self.workers: List[ServerWorker] = [ServerWorker(index) for index in range(size)]
+        self.spawn = spawn
+        self.host = host
+        self.health_path = health_path
+        self.health_interval = health_interval
+        self.unhealthy_after = unhealthy_after
+        self.startup_grace = startup_grace
+        self.max_backoff = max_backoff
+        self.kill_timeout = kill_timeout
+        self.max_pinned_sessions = max_pinned_sessions
+        self._pinned: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._monitor_stopped = threading.Event()
+        self._monitor_thread: Optional[threading.Thread] = None
+
+    @property
+    def ports(self) -> List[int]:
+        """The internal ports of the workers, by index."""
+        return [worker.port for worker in self.workers]
+
+    def start(self) -> None:
+        """Spawn every worker and start the monitor thread."""
+        for worker in self.workers:
+            self._spawn(worker)
+        self._monitor_thread = threading.Thread(target=self._monitor, name="server-worker-monitor", daemon=True)
+        self._monitor_thread.start()
+
+    def wait_until_healthy(self, timeout: float) -> bool:
+        """Block until every worker has passed a health probe, or `timeout` seconds pass."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and not self._stopped.is_set():
+            if all(worker.healthy for worker in self.workers):
+                return True
+            time.sleep(0.1)
+        return all(worker.healthy for worker in self.workers)
+
+    def choose(self, affinity_key: Optional[str] = None) -> Optional[ServerWorker]:
+        """Pick a healthy worker for one request, or None if there is none.
+
+        With an affinity key, a session pinned to a healthy worker goes there; any other session is
+        placed by rendezvous hashing, so it keeps its worker while that worker is healthy and only the
+        sessions of a failed worker move. Without a key the worker with the fewest requests in flight
+        is chosen.
+        """
+        with self._lock:
+            healthy = [worker for worker in self.workers if worker.healthy]
+            if not healthy:
+                return None
+            if not affinity_key:
+                return min(healthy, key=lambda worker: (worker.active_requests, worker.served_requests))
+            pinned = self._pinned.get(affinity_key)
+            if pinned is not None and self.workers[pinned].healthy:
+                self._pinned.move_to_end(affinity_key)
+                return self.workers[pinned]
+            return max(healthy, key=lambda worker: self._rendezvous_score(affinity_key, worker.index))
+
+    def pin(self, affinity_key: str, worker: ServerWorker) -> None:
+        """Send the session `affinity_key` to `worker` from now on, e.g. when the worker has just created it."""
+        with self._lock:
+            self._pinned[affinity_key] = worker.index
+            self._pinned.move_to_end(affinity_key)
+            while len(self._pinned) > self.max_pinned_sessions:
+                self._pinned.popitem(last=False)
+
+    def begin_request(self, worker: ServerWorker) -> None:
+        """Count a request as in flight on `worker`."""
+        with self._lock:
+            worker.active_requests += 1
+            worker.served_requests += 1
+
+    def end_request(self, worker: ServerWorker) -> None:
+        """Count a request on `worker` as finished."""
+        with self._lock:
+            worker.active_requests -= 1
+
+    def stop_monitor(self, timeout: float = 10.0) -> None:
+        """Stop supervising the workers without stopping them, waiting up to `timeout` seconds for a pass in flight."""
+        self._monitor_stopped.set()
+        if self._monitor_thread is not None and self._monitor_thread is not threading.current_thread():
+            self._monitor_thread.join(timeout=timeout)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the monitor and terminate every worker, waiting up to `timeout` seconds for each."""
+        self._stopped.set()
+        self._monitor_stopped.set()
+        with self._lock:
+            processes = [worker.process for worker in self.workers if worker.process is not None]
+            for worker in self.workers:
+                worker.healthy = False
+        for process in processes:
+            self._terminate(process)
+        for process in processes:
+            try:
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    def wait(self) -> None:
+        """Block until stop() is called."""
+        self._stopped.wait()
+
+    def check(self, worker: ServerWorker) -> None:
+        """One supervision pass over `worker`: respawn it if it exited or stopped answering."""
+        if self._stopped.is_set():
+            return
+        process = worker.process
+        if process is None or process.poll() is not None:
+            self._handle_exit(worker)
+            return
+
+        if self._probe(worker):
+            with self._lock:
+                worker.healthy = True
+                worker.failed_probes = 0
+                worker.crash_streak = 0
+            return
+
+        worker.failed_probes += 1
+        starting_too_long = not worker.healthy and time.monotonic() - worker.started_at > self.startup_grace
+        if (worker.healthy and worker.failed_probes >= self.unhealthy_after) or starting_too_long:
+            self._logger.warning("%s on port %d is not responding; restarting it", worker.name, worker.port)
+            with self._lock:
+                worker.healthy = False
+            self._terminate(process)
+            try:
+                process.wait(timeout=self.kill_timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+            self._respawn(worker)
+
+    def _monitor(self) -> None:
+        while not self._monitor_stopped.wait(self.health_interval):
+            for worker in self.workers:
+                try:
+                    self.check(worker)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    self._logger.exception("Supervising %s failed", worker.name)
+
+    def _handle_exit(self, worker: ServerWorker) -> None:
+        if worker.respawn_at == 0.0:
+            returncode = worker.process.returncode if worker.process is not None else None
+            with self._lock:
+                worker.healthy = False
+                crashed_during_startup = time.monotonic() - worker.started_at < self.startup_grace
+                worker.crash_streak = worker.crash_streak + 1 if crashed_during_startup else 1
+                delay = min(self.max_backoff, 2.0 ** (worker.crash_streak - 1))
+                worker.respawn_at = time.monotonic() + delay
+            self._logger.warning("%s exited with code %s; restarting it in %.0fs", worker.name, returncode, delay)
+        if time.monotonic() >= worker.respawn_at:
+            self._respawn(worker)
+
+    def _respawn(self, worker: ServerWorker) -> None:
+        worker.restarts += 1
+        self._spawn(worker)
+
+    def _spawn(self, worker: ServerWorker) -> None:
+        port = find_free_port(self.host)
+        process = self.spawn(worker.index, port)
+        with self._lock:
+            worker.port = port
+            worker.process = process
+            worker.healthy = False
+            worker.failed_probes = 0
+            worker.respawn_at = 0.0
+            worker.started_at = time.monotonic()
+
+    def _probe(self, worker: ServerWorker) -> bool:
+        connection = http.client.HTTPConnection(self.host, worker.port, timeout=max(1.0, self.health_interval))
+        try:
+            connection.request("GET", self.health_path)
+            return 200 <= connection.getresponse().status < 300
+        except OSError:
+            return False
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _rendezvous_score(affinity_key: str, index: int) -> int:
+        digest = hashlib.blake2b(f"{affinity_key}\0{index}".encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+    @staticmethod
+    def _terminate(process: subprocess.Popen) -> None:
+        """SIGTERM the worker's process group (workers start in their own session), or terminate on Windows."""
+        if process.poll() is not None:
+            return
+        try:
+            if os.name == "nt":
+                process.terminate()
+            else:
+                os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+        except (ProcessLookupError, PermissionError):
+            pass
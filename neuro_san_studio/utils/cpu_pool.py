@@ -0,0 +1,104 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""A process-wide thread pool for CPU-bound coded tool work.
+
+Coded tools run on the server's event loops, so CPU-heavy steps (PDF text extraction, sentiment
+scoring, parsing and laying out agent networks) must leave the loop. Under the GIL a worker thread
+only keeps the loop responsive; on a free-threaded interpreter (3.13t / 3.14t with the GIL disabled)
+the same threads also run in parallel, so the pool is sized to the CPU count there. Use
+``await CpuPool.run(func, *args)`` from ``async_invoke`` instead of ``asyncio.to_thread`` for such work,
+so it is bounded by one shared pool rather than the default executor of whichever loop it ran on.
+"""
+
+import asyncio
+import contextvars
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import TypeVar
+
+# Overrides the pool size, e.g. to leave cores for other processes on a shared host.
+WORKERS_ENV_VAR = "NEURO_SAN_STUDIO_CPU_WORKERS"
+
+# Pool size under the GIL: threads there only overlap the I/O and C-extension work that releases it.
+_GIL_WORKERS = 4
+
+Result = TypeVar("Result")
+
+
+def free_threading_active() -> bool:
+    """Whether this interpreter is running Python code without the GIL right now.
+
+    False on regular builds, and on free-threaded builds where the GIL was re-enabled
+    (PYTHON_GIL=1, or an extension module that is not marked as free-threading safe).
+    """
+    if not hasattr(sys, "_is_gil_enabled"):
+        return False
+    return not sys._is_gil_enabled()  # pylint: disable=protected-access,no-member
+
+
+class CpuPool:
+    """The shared executor behind run(), created on first use."""
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def default_workers() -> int:
+        """The pool size: the env override if set, else the CPU count without the GIL and a small pool with it."""
+        override = os.environ.get(WORKERS_ENV_VAR, "").strip()
+        if override.isdigit() and int(override) > 0:
+            return int(override)
+        if free_threading_active():
+            return os.process_cpu_count() if hasattr(os, "process_cpu_count") else (os.cpu_count() or 1)
+        return min(_GIL_WORKERS, os.cpu_count() or 1)
+
+    @staticmethod
+    def executor() -> ThreadPoolExecutor:
+        """The process-wide executor, created with default_workers() threads on first call."""
+        executor = CpuPool._executor
+        if executor is None:
+            with CpuPool._lock:
+                if CpuPool._executor is None:
+                    CpuPool._executor = ThreadPoolExecutor(
+                        max_workers=CpuPool.default_workers(), thread_name_prefix="neuro-san-cpu"
+                    )
+                executor = CpuPool._executor
+        return executor
+
+    @staticmethod
+    async def run(func: Callable[..., Result], *args: Any, **kwargs: Any) -> Result:
+        """Run ``func(*args, **kwargs)`` on the pool and await its result without blocking the event loop.
+
+        Like asyncio.to_thread, the function runs in a copy of the caller's context variables.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(CpuPool.executor(), partial(context.run, func, *args, **kwargs))
+
+    @staticmethod
+    def shutdown_for_testing() -> None:
+        """Shut the executor down so the next run() builds a new one, e.g. after changing the env override."""
+        with CpuPool._lock:
+            executor, CpuPool._executor = CpuPool._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
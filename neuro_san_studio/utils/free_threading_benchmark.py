@@ -0,0 +1,206 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Throughput benchmark for the free-threaded (no-GIL) execution mode.
+
+Runs the CPU-bound work that coded tools hand to CpuPool against the networks of a manifest, first on
+one thread and then on N, and reports operations per second and the parallel speedup. Run it once under
+a regular interpreter and once under 3.14t with the same arguments, then compare the two JSON reports:
+
+    python -m neuro_san_studio.utils.free_threading_benchmark --json py312.json
+    .venv-py314t/bin/python -m neuro_san_studio.utils.free_threading_benchmark --json py314t.json
+    python -m neuro_san_studio.utils.free_threading_benchmark --compare py312.json py314t.json
+
+Under the GIL the N-thread speedup stays near 1; without it, it should approach N for the workloads that
+do not take a process-wide lock. The "parse" workload is serialized by neuro-san's HoconParseLock and is
+listed to show that limit.
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from neuro_san_studio.utils.cpu_pool import CpuPool
+from neuro_san_studio.utils.cpu_pool import free_threading_active
+from neuro_san_studio.utils.hocon_config_cache import HoconConfigCache
+
+DEFAULT_MANIFEST = os.path.join("registries", "manifest.hocon")
+
+
+@dataclass
+class WorkloadResult:
+    """Throughput of one workload on one thread and on `threads` threads."""
+
+    workload: str
+    operations: int
+    threads: int
+    single_thread_ops_per_second: float
+    multi_thread_ops_per_second: float
+
+    @property
+    def speedup(self) -> float:
+        """Multi-thread over single-thread throughput."""
+        if self.single_thread_ops_per_second <= 0:
+            return 0.0
+        return self.multi_thread_ops_per_second / self.single_thread_ops_per_second
+
+
+def interpreter_info() -> Dict[str, object]:
+    """The interpreter facts a report is only comparable under."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "free_threaded_build": bool(getattr(sys, "_is_gil_enabled", None)),
+        "gil_disabled": free_threading_active(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def build_workloads(network_paths: Sequence[str]) -> Dict[str, Callable[[str], object]]:
+    """The benchmarked operations, each applied to one network path.
+
+    * restore: a warm HoconConfigCache hit — re-stat of the include closure plus a private deep copy.
+    * parse: a cold parse of the file with its includes, bypassing the cache.
+    """
+    project_dir = os.getcwd()
+    for path in network_paths:
+        HoconConfigCache.restore(path, basedir=project_dir, file_purpose="agent network")
+
+    def restore(path: str) -> object:
+        return HoconConfigCache.restore(path, basedir=project_dir, file_purpose="agent network")
+
+    def parse(path: str) -> object:
+        with open(path, "rb") as file_obj:
+            contents = file_obj.read()
+        # pylint: disable-next=protected-access
+        return HoconConfigCache._parse(path, contents, project_dir, "agent network")
+
+    return {"restore": restore, "parse": parse}
+
+
+def measure(operation: Callable[[str], object], inputs: Sequence[str], rounds: int, threads: int) -> float:
+    """Operations per second for `rounds` passes over `inputs`, spread over `threads` threads."""
+    work: List[str] = list(inputs) * rounds
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        # Warm the threads up so their start-up is not timed
+        list(executor.map(lambda _: None, range(threads)))
+        start = time.perf_counter()
+        for _ in executor.map(operation, work, chunksize=max(1, len(work) // (threads * 4))):
+            pass
+        elapsed = time.perf_counter() - start
+    return len(work) / elapsed if elapsed > 0 else 0.0
+
+
+def run_benchmark(
+    network_paths: Sequence[str], rounds: int, threads: int, workloads: Optional[Sequence[str]] = None
+) -> List[WorkloadResult]:
+    """Measure every selected workload on one thread and on `threads` threads."""
+    available = build_workloads(network_paths)
+    results: List[WorkloadResult] = []
+    for name in workloads or list(available):
+        operation = available[name]
+        single = measure(operation, network_paths, rounds, 1)
+        multi = measure(operation, network_paths, rounds, threads)
+        results.append(WorkloadResult(name, len(network_paths) * rounds, threads, single, multi))
+    return results
+
+
+def format_report(info: Dict[str, object], results: Sequence[WorkloadResult]) -> str:
+    """A plain-text table of one run."""
+    lines = [
+        f"Python {info['python']} ({info['implementation']}), free-threaded build: {info['free_threaded_build']}, "
+        f"GIL disabled: {info['gil_disabled']}, CPUs: {info['cpu_count']}",
+        f"  {'workload':<10} {'ops':>7} {'threads':>7} {'1-thread ops/s':>15} {'N-thread ops/s':>15} {'speedup':>8}",
+    ]
+    for result in results:
+        lines.append(
+            f"  {result.workload:<10} {result.operations:>7} {result.threads:>7} "
+            f"{result.single_thread_ops_per_second:>15.1f} {result.multi_thread_ops_per_second:>15.1f} "
+            f"{result.speedup:>7.2f}x"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(baseline: Dict[str, object], candidate: Dict[str, object]) -> str:
+    """Side-by-side N-thread throughput of two saved reports, e.g. 3.12 against 3.14t."""
+    base_rows = {row["workload"]: row for row in baseline["results"]}
+    lines = [
+        f"baseline:  Python {baseline['interpreter']['python']} "
+        f"(GIL disabled: {baseline['interpreter']['gil_disabled']})",
+        f"candidate: Python {candidate['interpreter']['python']} "
+        f"(GIL disabled: {candidate['interpreter']['gil_disabled']})",
+        f"  {'workload':<10} {'baseline ops/s':>15} {'candidate ops/s':>16} {'ratio':>7}",
+    ]
+    for row in candidate["results"]:
+        base = base_rows.get(row["workload"])
+        if base is None:
+            continue
+        base_rate = base["multi_thread_ops_per_second"]
+        rate = row["multi_thread_ops_per_second"]
+        ratio = rate / base_rate if base_rate > 0 else 0.0
+        lines.append(f"  {row['workload']:<10} {base_rate:>15.1f} {rate:>16.1f} {ratio:>6.2f}x")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the benchmark, or compare two saved reports."""
+    parser = ArgumentParser(description="Compare coded tool CPU throughput with and without the GIL.")
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST, help="Manifest whose networks are the inputs.")
+    parser.add_argument("--rounds", type=int, default=5, help="Passes over the networks per measurement.")
+    parser.add_argument("--threads", type=int, default=0, help="Threads for the parallel run (default: pool size).")
+    parser.add_argument("--workload", action="append", choices=["restore", "parse"], help="Workload(s) to run.")
+    parser.add_argument("--json", dest="json_path", help="Also write the report to this JSON file.")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CANDIDATE"), help="Compare two JSON reports.")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0], "r", encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        with open(args.compare[1], "r", encoding="utf-8") as candidate_file:
+            candidate = json.load(candidate_file)
+        print(format_comparison(baseline, candidate))
+        return 0
+
+    # pylint: disable-next=import-outside-toplevel
+    from neuro_san_studio.commands.check_config import collect_hocon_paths
+
+    network_paths = collect_hocon_paths(args.manifest)
+    if not network_paths:
+        print(f"No networks found in {args.manifest}", file=sys.stderr)
+        return 1
+    threads = args.threads or CpuPool.default_workers()
+    info = interpreter_info()
+    results = run_benchmark(network_paths, args.rounds, threads, args.workload)
+    print(format_report(info, results))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as report_file:
+            json.dump({"interpreter": info, "results": [asdict(result) for result in results]}, report_file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
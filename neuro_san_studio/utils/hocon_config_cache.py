@@ -0,0 +1,236 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Process-wide cache of parsed HOCON/JSON config files, shared by discovery, export,
+validation and the agent network designer."""
+
+import copy
+import os
+import re
+from collections import OrderedDict
+from glob import glob
+from io import BytesIO
+from json import JSONDecodeError
+from threading import Lock
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from leaf_common.serialization.format.hocon_serialization_format import HoconSerializationFormat
+from leaf_common.serialization.format.json_serialization_format import JsonSerializationFormat
+from neuro_san.internals.persistence.hocon_parse_lock import HoconParseLock
+from pyhocon import ConfigException
+from pyparsing.exceptions import ParseException
+from pyparsing.exceptions import ParseSyntaxException
+
+# Every include form pyhocon accepts: `include "x"`, `include file("x")`,
+# `include classpath("x")`, `include url("x")`, `include package("x")`, each optionally
+# wrapped in `required(...)`. Group 1 is the include kind ("" for the bare form), group 2
+# the target. Textual on purpose: it runs before (and instead of) a parse.
+_INCLUDE_RE = re.compile(r'\binclude\s+(?:required\s*\(\s*)?(?:(file|classpath|url|package)\s*\(\s*)?"([^"]+)"')
+_URL_PREFIXES = ("http://", "https://", "file://")
+
+# A (st_mtime_ns, st_size) pair, or None for a file that cannot be stat-ed.
+StatSignature = Optional[Tuple[int, int]]
+# (own signature, include-closure paths, their signatures, parsed config)
+ConfigEntry = Tuple[StatSignature, Tuple[str, ...], Tuple[StatSignature, ...], Any]
+
+
+class HoconConfigCache:
+    """Parse config files once per process and serve copies until they change on disk.
+
+    Entries are keyed by (resolved path, include base directory) and carry a fingerprint
+    of the file's own (mtime, size) plus the (mtime, size) of every file in its include
+    closure, captured BEFORE the parse. A lookup re-stats those files and re-parses on
+    any mismatch, so an edit to a shared include such as ``registries/aaosa.hocon``
+    invalidates every network that pulls it in.
+
+    Includes are resolved against an explicit ``basedir`` handed to pyhocon rather than
+    by chdir-ing into it, so callers never mutate process CWD and the cache is safe to
+    share across threads. When ``basedir`` is None the current working directory at call
+    time is used, which is exactly how an un-based pyhocon parse resolves includes.
+
+    The lock guards only the LRU dictionaries; file reads and parses run outside it
+    (HOCON parses are still serialized process-wide by neuro-san's HoconParseLock, which
+    pyhocon needs). Two threads missing on the same file may both parse it; the later
+    publish wins and both values are equally current.
+    """
+
+    MAX_ENTRIES: int = 1024
+
+    # Access goes through the class by name (not cls) so a hypothetical subclass shares
+    # the one cache instead of splitting it.
+    _configs: "OrderedDict[Tuple[str, str], ConfigEntry]" = OrderedDict()
+    _includes: "OrderedDict[str, Tuple[StatSignature, List[Tuple[str, str]]]]" = OrderedDict()
+    _lock: Lock = Lock()
+
+    @staticmethod
+    def restore(
+        file_path: str,
+        basedir: Optional[str] = None,
+        file_purpose: str = "config",
+        must_exist: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        """Return the parsed contents of a .hocon or .json file.
+
+        :param file_path: Path to the file, absolute or relative to the current working directory
+        :param basedir: Directory that relative ``include`` directives resolve against
+                (e.g. the project root for registry files, whose includes read
+                ``include "registries/aaosa.hocon"``). Defaults to the current working directory.
+        :param file_purpose: Description of the file, used in error messages
+        :param must_exist: When True a missing file raises FileNotFoundError; otherwise None is returned
+        :return: A private deep copy of the parsed dictionary, safe for the caller to mutate.
+                Parse failures and unsupported extensions raise ValueError, mirroring
+                neuro-san's AbstractAsyncConfigRestorer.
+        """
+        resolved_path: str = os.path.realpath(file_path)
+        include_base: str = os.path.abspath(basedir) if basedir else os.getcwd()
+        cache_key: Tuple[str, str] = (resolved_path, include_base)
+
+        with HoconConfigCache._lock:
+            entry: Optional[ConfigEntry] = HoconConfigCache._configs.get(cache_key)
+            if entry is not None:
+                HoconConfigCache._configs.move_to_end(cache_key)
+
+        if entry is not None:
+            own_signature, closure_paths, closure_signatures, config = entry
+            if own_signature == HoconConfigCache._stat_signature(resolved_path) and closure_signatures == tuple(
+                HoconConfigCache._stat_signature(path) for path in closure_paths
+            ):
+                return copy.deepcopy(config)
+
+        # Capture the fingerprint BEFORE reading and parsing: an edit that lands mid-parse
+        # then leaves the published entry already stale rather than a torn read living on.
+        own_signature = HoconConfigCache._stat_signature(resolved_path)
+        if own_signature is None:
+            if must_exist:
+                raise FileNotFoundError(f"Could not find {file_purpose} file at path: {file_path}")
+            return None
+        closure_paths = tuple(sorted(HoconConfigCache._include_closure(resolved_path, include_base)))
+        closure_signatures = tuple(HoconConfigCache._stat_signature(path) for path in closure_paths)
+
+        with open(resolved_path, "rb") as file_obj:
+            file_contents: bytes = file_obj.read()
+        config = HoconConfigCache._parse(file_path, file_contents, include_base, file_purpose)
+
+        with HoconConfigCache._lock:
+            HoconConfigCache._configs[cache_key] = (own_signature, closure_paths, closure_signatures, config)
+            HoconConfigCache._configs.move_to_end(cache_key)
+            while len(HoconConfigCache._configs) > HoconConfigCache.MAX_ENTRIES:
+                HoconConfigCache._configs.popitem(last=False)
+
+        return copy.deepcopy(config)
+
+    @staticmethod
+    def include_targets(file_path: str) -> List[Tuple[str, str]]:
+        """Return the ``include`` directives written in one file, without parsing it.
+
+        Memoized by the file's (mtime, size), and shared with the include-closure walk
+        that restore() does, so a file whose config was already cached is not re-read.
+
+        :param file_path: Path to the HOCON file
+        :return: (kind, target) pairs in file order; kind is "" for a bare ``include "x"``,
+                otherwise one of "file", "classpath", "url", "package". An unreadable file
+                yields an empty list.
+        """
+        resolved_path: str = os.path.realpath(file_path)
+        signature: StatSignature = HoconConfigCache._stat_signature(resolved_path)
+        if signature is None:
+            return []
+
+        with HoconConfigCache._lock:
+            entry = HoconConfigCache._includes.get(resolved_path)
+            if entry is not None and entry[0] == signature:
+                HoconConfigCache._includes.move_to_end(resolved_path)
+                return list(entry[1])
+
+        try:
+            with open(resolved_path, encoding="utf-8", errors="replace") as file_obj:
+                text: str = file_obj.read()
+        except OSError:
+            return []
+        targets: List[Tuple[str, str]] = list(_INCLUDE_RE.findall(text))
+
+        with HoconConfigCache._lock:
+            HoconConfigCache._includes[resolved_path] = (signature, targets)
+            HoconConfigCache._includes.move_to_end(resolved_path)
+            while len(HoconConfigCache._includes) > HoconConfigCache.MAX_ENTRIES:
+                HoconConfigCache._includes.popitem(last=False)
+        return list(targets)
+
+    @staticmethod
+    def clear_for_testing() -> None:
+        """Drop every cached config and include scan. For test isolation only."""
+        with HoconConfigCache._lock:
+            HoconConfigCache._configs.clear()
+            HoconConfigCache._includes.clear()
+
+    @staticmethod
+    def _stat_signature(path: str) -> StatSignature:
+        """(mtime_ns, size) of a file, or None if it cannot be stat-ed. Never raises."""
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return None
+        return (stat_result.st_mtime_ns, stat_result.st_size)
+
+    @staticmethod
+    def _include_closure(resolved_path: str, include_base: str) -> Set[str]:
+        """Every local file reachable through ``include`` directives, resolved the way pyhocon does.
+
+        Top-level includes resolve against ``include_base``; pyhocon parses each included
+        file with its own directory as the base, so nested includes resolve against that.
+        URL and package includes have no local mtime to watch and are skipped. A missing
+        include is still recorded, so its later appearance invalidates the entry.
+        """
+        closure: Set[str] = set()
+        pending: List[Tuple[str, str]] = [(resolved_path, include_base)]
+        visited: Set[str] = {resolved_path}
+        while pending:
+            current, base = pending.pop()
+            for kind, target in HoconConfigCache.include_targets(current):
+                if kind in ("url", "package") or target.startswith(_URL_PREFIXES):
+                    continue
+                joined: str = os.path.join(base, target)
+                candidates: List[str] = glob(joined, recursive=True) if ("*" in joined or "?" in joined) else [joined]
+                for candidate in candidates:
+                    included: str = os.path.realpath(candidate)
+                    closure.add(included)
+                    if included not in visited:
+                        visited.add(included)
+                        pending.append((included, os.path.dirname(included)))
+        return closure
+
+    @staticmethod
+    def _parse(file_path: str, file_contents: bytes, include_base: str, file_purpose: str) -> Dict[str, Any]:
+        """Deserialize file contents like AbstractAsyncConfigRestorer does, but with an include basedir."""
+        bytes_file = BytesIO(file_contents)
+        try:
+            if file_path.endswith(".hocon"):
+                with HoconParseLock():
+                    return HoconSerializationFormat(sanitize_keys=True).to_object(bytes_file, basedir=include_base)
+            if file_path.endswith(".json"):
+                return JsonSerializationFormat().to_object(bytes_file)
+        except (ParseException, ParseSyntaxException, JSONDecodeError, ConfigException) as exception:
+            message: str = (
+                f'There was an error loading {file_purpose} file "{file_path}".\n'
+                f"Underlying error ({type(exception).__name__}): {exception}"
+            )
+            raise ValueError(message) from exception
+        raise ValueError(f"File reference {file_path} must be a .json or .hocon file")
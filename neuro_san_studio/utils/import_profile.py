@@ -0,0 +1,174 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Cold-start import profiling for the neuro-san-studio CLI, built on `python -X importtime`.
+
+Run `python -m neuro_san_studio.utils.import_profile [--budget-ms N] [--top N] -- <cli args>` for a report
+on one invocation, e.g. `-- --version`. It exits 1 when the invocation's CPU time is over the budget.
+
+The budget is checked against the child's CPU time rather than the `-X importtime` wall-clock figures,
+which inflate on a loaded machine (e.g. a parallel test run) without the CLI doing any more work.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+# Default CPU-time budget for a cold `neuro-san-studio --version`, in milliseconds.
+DEFAULT_VERSION_BUDGET_MS = 400.0
+
+_IMPORTTIME_PREFIX = "import time:"
+
+try:
+    import resource
+except ImportError:  # Windows: budgets fall back to wall-clock time
+    resource = None
+
+
+@dataclass
+class ImportTiming:
+    """One line of `-X importtime` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportProfile:
+    """The imports and timings of one CLI invocation in a fresh interpreter."""
+
+    args: List[str]
+    returncode: int
+    wall_seconds: float
+    cpu_seconds: float
+    timings: List[ImportTiming] = field(default_factory=list)
+
+    @property
+    def total_import_ms(self) -> float:
+        """Sum of every module's own import time."""
+        return sum(timing.self_us for timing in self.timings) / 1000.0
+
+    @property
+    def modules(self) -> List[str]:
+        """Every module imported, in import order."""
+        return [timing.module for timing in self.timings]
+
+    def imported(self, package: str) -> bool:
+        """Whether the package or any of its submodules was imported."""
+        return any(module == package or module.startswith(f"{package}.") for module in self.modules)
+
+    def top_level(self) -> Dict[str, float]:
+        """Own import time in milliseconds per top-level package, largest first."""
+        totals: Dict[str, float] = {}
+        for timing in self.timings:
+            root = timing.module.split(".", 1)[0]
+            totals[root] = totals.get(root, 0.0) + timing.self_us / 1000.0
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def report(self, top: int = 15, budget_ms: Optional[float] = None) -> str:
+        """A plain-text summary: totals, the heaviest top-level packages and the slowest single modules."""
+        lines = [
+            f"neuro-san-studio {' '.join(self.args)}: exit {self.returncode}, "
+            f"cpu {self.cpu_seconds * 1000.0:.0f} ms, wall {self.wall_seconds * 1000.0:.0f} ms, "
+            f"imports {self.total_import_ms:.0f} ms "
+            f"({len(self.timings)} modules)" + (f", budget {budget_ms:.0f} ms" if budget_ms is not None else "")
+        ]
+        lines.append("  by top-level package (self ms):")
+        for package, total_ms in list(self.top_level().items())[:top]:
+            lines.append(f"    {total_ms:9.1f}  {package}")
+        lines.append("  slowest modules (self ms / cumulative ms):")
+        slowest = sorted(self.timings, key=lambda timing: timing.self_us, reverse=True)[:top]
+        for timing in slowest:
+            lines.append(f"    {timing.self_us / 1000.0:9.1f} {timing.cumulative_us / 1000.0:9.1f}  {timing.module}")
+        return "\n".join(lines)
+
+
+def parse_importtime(stderr: str) -> List[ImportTiming]:
+    """Parse the `import time: self | cumulative | module` lines written by `-X importtime`.
+
+    Other stderr lines are ignored, as is the column header.
+    """
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith(_IMPORTTIME_PREFIX):
+            continue
+        columns = line[len(_IMPORTTIME_PREFIX) :].split("|")
+        if len(columns) != 3 or not columns[0].strip().isdigit():
+            continue
+        name = columns[2].rstrip()
+        module = name.lstrip()
+        timings.append(
+            ImportTiming(
+                module=module,
+                self_us=int(columns[0]),
+                cumulative_us=int(columns[1]),
+                depth=(len(name) - len(module) - 1) // 2,
+            )
+        )
+    return timings
+
+
+def profile_cli(args: Sequence[str], env: Optional[Dict[str, str]] = None) -> ImportProfile:
+    """Run `python -X importtime -m neuro_san_studio <args>` in a fresh interpreter and collect its imports.
+
+    Args:
+        args: The CLI arguments, e.g. ["--version"].
+        env: Extra environment variables for the child process.
+    """
+    child_env = dict(os.environ)
+    child_env.update(env or {})
+    command = [sys.executable, "-X", "importtime", "-m", "neuro_san_studio", *args]
+    before = _children_cpu_seconds()
+    start = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True, env=child_env, check=False)
+    wall_seconds = time.perf_counter() - start
+    cpu_seconds = _children_cpu_seconds() - before if resource is not None else wall_seconds
+    return ImportProfile(list(args), result.returncode, wall_seconds, cpu_seconds, parse_importtime(result.stderr))
+
+
+def _children_cpu_seconds() -> float:
+    """User plus system CPU time of this process's finished children, or 0 where unsupported."""
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Print the import profile of one CLI invocation; exit 1 if it is over the budget."""
+    parser = ArgumentParser(description="Profile the cold-start imports of one neuro-san-studio invocation.")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_VERSION_BUDGET_MS, help="Import-time budget.")
+    parser.add_argument("--top", type=int, default=15, help="Number of packages and modules to list.")
+    parser.add_argument("cli_args", nargs="*", help="CLI arguments (after --), default: --version.")
+    args = parser.parse_args(argv)
+
+    profile = profile_cli(args.cli_args or ["--version"])
+    print(profile.report(top=args.top, budget_ms=args.budget_ms))
+    return 1 if profile.cpu_seconds * 1000.0 > args.budget_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
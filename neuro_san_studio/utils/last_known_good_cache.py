@@ -0,0 +1,106 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""On-disk record of checks that recently passed, so unchanged inputs can skip a live re-check."""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+# Where the CLI keeps its caches unless a command is given an explicit file.
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "neuro-san-studio")
+
+
+class LastKnownGoodCache:
+    """Fingerprint -> time of the last successful check, persisted as one JSON file.
+
+    Only successes are recorded: a failure is always re-checked on the next run. Entries older than
+    ``ttl_seconds`` count as absent, so a config or key that breaks later is caught within one TTL.
+    Fingerprints must be computed from data that is safe to store (redacted configs, hashed secrets).
+    An unreadable or missing file reads as an empty cache; a failed write is ignored.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float):
+        """Initialize the cache.
+
+        Args:
+            path: The JSON file backing the cache. Parent directories are created on save.
+            ttl_seconds: How long a success stays valid. 0 disables the cache.
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._entries: Optional[Dict[str, float]] = None
+
+    @staticmethod
+    def fingerprint(payload: Any) -> str:
+        """SHA-256 of the canonical JSON form of *payload* (keys sorted, non-JSON values stringified)."""
+        canonical = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether lookups can ever hit."""
+        return self.ttl_seconds > 0
+
+    def is_fresh(self, key: str) -> bool:
+        """Whether *key* passed within the TTL."""
+        if not self.enabled:
+            return False
+        checked_at = self._load().get(key)
+        return checked_at is not None and time.time() - checked_at < self.ttl_seconds
+
+    def age_seconds(self, key: str) -> Optional[float]:
+        """Seconds since *key* last passed, or None if it never did."""
+        checked_at = self._load().get(key)
+        return None if checked_at is None else time.time() - checked_at
+
+    def record(self, key: str) -> None:
+        """Mark *key* as passing now. Call save() to persist."""
+        if self.enabled:
+            self._load()[key] = time.time()
+
+    def save(self) -> None:
+        """Write the entries that are still within the TTL back to disk."""
+        if not self.enabled or self._entries is None:
+            return
+        now = time.time()
+        live = {key: stamp for key, stamp in self._entries.items() if now - stamp < self.ttl_seconds}
+        temp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as cache_file:
+                json.dump(live, cache_file)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+
+    def _load(self) -> Dict[str, float]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.path, "r", encoding="utf-8") as cache_file:
+                    data = json.load(cache_file)
+                if isinstance(data, dict):
+                    self._entries = {
+                        str(key): float(stamp) for key, stamp in data.items() if isinstance(stamp, (int, float))
+                    }
+            except (OSError, ValueError):
+                pass
+        return self._entries
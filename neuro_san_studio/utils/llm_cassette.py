@@ -0,0 +1,202 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Record and replay of LLM calls, so data-driven agent tests can run offline and reproducibly.
+
+A CassetteLlmServer is an OpenAI-compatible endpoint in front of the real one. Point the agent networks at
+it with OPENAI_API_BASE, as the load-testing stub does. Each chat completions request is normalized and
+hashed, and the response is kept in a cassette directory as one JSON file per hash:
+
+- ``record``: every request goes to the upstream API and its response is saved.
+- ``replay``: responses come from the cassette only; a request with no recording fails with HTTP 404,
+  naming its hash, so a changed prompt is caught rather than sent to a live model.
+- ``new``: recorded responses are replayed and missing ones are recorded.
+
+Normalization drops transport-only fields (``stream``, ``stream_options``, ``user``...), renumbers tool call
+ids in order of appearance and masks UUIDs and ISO timestamps in strings, so a request keeps its hash from
+run to run. Upstream calls are always made without streaming; streaming clients get the recorded
+completion re-sent as events. Replayed bytes depend only on the cassette, never on timing.
+
+Set NEURO_SAN_LLM_CASSETTE to a mode to run the integration tests through the cassette in
+tests/fixtures/cassettes, or NEURO_SAN_LLM_CASSETTE_DIR to use another directory.
+"""
+
+import json
+import os
+import re
+import urllib.error
+import urllib.request
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+from neuro_san_studio.utils.last_known_good_cache import LastKnownGoodCache
+from neuro_san_studio.utils.stub_llm_server import StubLlmError
+from neuro_san_studio.utils.stub_llm_server import StubLlmServer
+from neuro_san_studio.utils.stub_llm_server import point_openai_clients_at
+
+MODES = ("record", "replay", "new")
+
+# Selects the mode for test runs; unset means live LLM calls.
+CASSETTE_ENV_VAR = "NEURO_SAN_LLM_CASSETTE"
+CASSETTE_DIR_ENV_VAR = "NEURO_SAN_LLM_CASSETTE_DIR"
+DEFAULT_CASSETTE_DIR = os.path.join("tests", "fixtures", "cassettes")
+
+DEFAULT_UPSTREAM = "https://api.openai.com/v1"
+
+# Request fields that do not change the answer.
+_TRANSPORT_FIELDS = frozenset({"stream", "stream_options", "user", "metadata", "store", "service_tier"})
+
+_UUID = re.compile(r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b")
+_TIMESTAMP = re.compile(r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?\b")
+
+
+def normalize_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """The parts of a chat completions request that determine its answer, with volatile values masked."""
+    tool_call_ids: Dict[str, str] = {}
+
+    def normalize(value: Any, key: Optional[str] = None) -> Any:
+        if isinstance(value, dict):
+            return {name: normalize(item, name) for name, item in value.items()}
+        if isinstance(value, list):
+            return [normalize(item) for item in value]
+        if isinstance(value, str):
+            if key in ("id", "tool_call_id") and value:
+                return tool_call_ids.setdefault(value, f"call_{len(tool_call_ids)}")
+            return _TIMESTAMP.sub("<timestamp>", _UUID.sub("<uuid>", value))
+        return value
+
+    return normalize({name: value for name, value in request.items() if name not in _TRANSPORT_FIELDS})
+
+
+def request_key(request: Dict[str, Any]) -> str:
+    """The cassette key of a chat completions request."""
+    return LastKnownGoodCache.fingerprint(normalize_request(request))
+
+
+class LlmCassette:
+    """A directory of recorded responses, one ``<key>.json`` file each, safe to share between processes."""
+
+    def __init__(self, directory: str):
+        """Initialize with the directory holding the recordings; it is created on the first save."""
+        self.directory = directory
+
+    def path(self, key: str) -> str:
+        """The file of one recording."""
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The recorded response for `key`, or None."""
+        try:
+            with open(self.path(key), "r", encoding="utf-8") as recording:
+                return json.load(recording)["response"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key: str, request: Dict[str, Any], response: Dict[str, Any]) -> None:
+        """Save one recording with its normalized request, for reviewing cassette diffs."""
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = f"{self.path(key)}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as recording:
+            json.dump(
+                {"request": normalize_request(request), "response": response}, recording, indent=1, sort_keys=True
+            )
+            recording.write("\n")
+        os.replace(temp_path, self.path(key))
+
+
+class CassetteLlmServer(StubLlmServer):
+    """Answers chat completions from an LlmCassette, recording from the upstream API as the mode allows."""
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        cassette: LlmCassette,
+        mode: str = "replay",
+        *,
+        upstream: str = DEFAULT_UPSTREAM,
+        upstream_api_key: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Initialize the server.
+
+        Args:
+            cassette: Where recordings are read and written.
+            mode: "record", "replay" or "new".
+            upstream: Base URL of the real OpenAI-compatible API, used when recording.
+            upstream_api_key: Key for the upstream API; OPENAI_API_KEY at construction time by default.
+            host: Interface to listen on.
+            port: Port to listen on; 0 picks a free one.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}; expected one of {MODES}")
+        super().__init__(host=host, port=port)
+        self.cassette = cassette
+        self.mode = mode
+        self.upstream = upstream.rstrip("/")
+        self.upstream_api_key = upstream_api_key if upstream_api_key is not None else os.getenv("OPENAI_API_KEY", "")
+        self._stats.update({"replayed": 0, "recorded": 0, "missing": 0})
+
+    def complete(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """The recorded completion for `request`, or a new recording of the upstream one."""
+        key = request_key(request)
+        response = self.cassette.get(key) if self.mode != "record" else None
+        if response is not None:
+            self._count("replayed")
+            return response
+        if self.mode == "replay":
+            self._count("missing")
+            raise StubLlmError(
+                404, f"No recorded LLM response for request {key}; record it with NEURO_SAN_LLM_CASSETTE=new"
+            )
+        response = self._call_upstream(request)
+        self.cassette.put(key, request, response)
+        self._count("recorded")
+        return response
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+            self._stats["chat_completions"] += 1
+
+    def _call_upstream(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        body = {name: value for name, value in request.items() if name not in ("stream", "stream_options")}
+        upstream_request = urllib.request.Request(
+            f"{self.upstream}/chat/completions",
+            data=json.dumps(body).encode("utf-8"),
+            headers={"Content-Type": "application/json", "Authorization": f"Bearer {self.upstream_api_key}"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(upstream_request, timeout=300) as response:
+                return json.load(response)
+        except urllib.error.HTTPError as exc:
+            raise StubLlmError(exc.code, f"Upstream LLM call failed: {exc.read().decode('utf-8', 'replace')}") from exc
+        except (OSError, ValueError) as exc:
+            raise StubLlmError(502, f"Upstream LLM call failed: {exc}") from exc
+
+
+def cassette_server_from_environment() -> Optional[CassetteLlmServer]:
+    """Start the server NEURO_SAN_LLM_CASSETTE asks for and point OpenAI clients at it; None when unset."""
+    mode = os.getenv(CASSETTE_ENV_VAR, "").strip().lower()
+    if not mode:
+        return None
+    upstream = os.getenv("OPENAI_API_BASE") or os.getenv("OPENAI_BASE_URL") or DEFAULT_UPSTREAM
+    cassette = LlmCassette(os.getenv(CASSETTE_DIR_ENV_VAR) or DEFAULT_CASSETTE_DIR)
+    server = CassetteLlmServer(cassette, mode, upstream=upstream).start()
+    point_openai_clients_at(server.base_url)
+    return server
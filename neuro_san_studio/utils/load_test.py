@@ -0,0 +1,548 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Offline load test of agent networks: studio-side overhead with the LLM replaced by a local stub.
+
+Runs the data-driven test cases under tests/fixtures through neuro-san's DataDrivenAgentTestDriver, the
+driver behind DynamicHoconUnitTests, against a StubLlmServer in a child process. The stub answers with
+scripted tool calls after a fixed latency, so what varies between runs is the work done in this process:
+middleware, coded tools, sly_data handling and message conversion. Response checks in the fixtures are
+not evaluated, since the stub does not produce the answers they expect.
+
+Each fixture is run once to warm up, then `iterations` times at `concurrency` conversations in flight. One
+request is one interaction of a fixture; each conversation is one direct session, and sessions share one
+DirectAgentSessionFactory as they would in a server. Only direct connections are exercised. The report
+has throughput, request and session setup latency percentiles, CPU time per request, the memory
+high-water mark of this process, and the LLM calls the stub served per request. CPU time per request is also
+given relative to a calibration workload timed on the main thread throughout the run, which makes it comparable
+across machines and robust to the machine's speed changing during the run:
+
+    python -m neuro_san_studio.utils.load_test --concurrency 8 --iterations 5 --json report.json
+    python -m neuro_san_studio.utils.load_test --baseline tests/fixtures/load_test_baseline.json
+
+With --baseline the run exits 1 when it has errors the baseline did not, makes more LLM calls per request,
+or takes more relative CPU per request than the baseline by more than --cpu-tolerance; it exits 2 when the
+baseline was recorded with other settings. Raw timings and memory are only comparable on the machine the
+baseline was recorded on, so by default they are reported against the baseline without failing the run;
+--gate-timings also fails on those that are worse by more than --tolerance. --write-baseline records the
+current run instead.
+"""
+
+import json
+import logging
+import math
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from neuro_san_studio.utils.stub_llm_server import StubLlmScript
+from neuro_san_studio.utils.stub_llm_server import StubLlmServer
+from neuro_san_studio.utils.stub_llm_server import point_openai_clients_at
+
+try:
+    import resource
+except ImportError:  # Windows: no memory high-water mark
+    resource = None
+
+DEFAULT_FIXTURES_DIR = os.path.join("tests", "fixtures")
+
+# Fixtures whose networks run on the default OpenAI LLM config and need no other service or download.
+DEFAULT_FIXTURES = (
+    "basic/coffee_finder_advanced/coffee_where_sly_data_8am.hocon",
+    "basic/job_guessing_skill/bob_job.hocon",
+    "basic/music_nerd_pro/combination_responses_with_history_direct.hocon",
+    "basic/pii_middleware/jenny_phone.hocon",
+    "industry/telco_network_support_test.hocon",
+)
+
+# Result fields that do not depend on the machine; any increase over the baseline is a regression.
+GATED_METRICS = ("errors", "llm_calls_per_request")
+
+# Result fields scaled by this process's speed on the calibration workload; a rise beyond the CPU tolerance is a
+# regression on any machine.
+NORMALIZED_METRICS = ("relative_cpu_per_request",)
+
+# Seconds between calibration samples while the load runs; each sample takes about 50 ms of CPU.
+CALIBRATION_INTERVAL_S = 1.0
+
+# Relative CPU per request varies with the interpreter and the machine's cache sizes, so the default is generous.
+DEFAULT_CPU_TOLERANCE = 0.5
+
+# Result field -> +1 when larger is worse, -1 when smaller is worse. These depend on the machine, so they are
+# compared with a tolerance and only gate a run recorded on the same machine as its baseline.
+TIMING_METRICS: Dict[str, int] = {
+    "throughput_rps": -1,
+    "latency_p50_ms": 1,
+    "latency_p95_ms": 1,
+    "session_setup_p50_ms": 1,
+    "cpu_ms_per_request": 1,
+    "max_rss_mb": 1,
+}
+
+# Settings a baseline is only comparable under.
+_SETTINGS = ("fixtures", "concurrency", "iterations", "llm_latency_ms", "tool_rounds", "fan_out")
+
+
+@dataclass
+class LoadTestSettings:
+    """What to run."""
+
+    fixtures: List[str] = field(default_factory=lambda: list(DEFAULT_FIXTURES))
+    fixtures_dir: str = DEFAULT_FIXTURES_DIR
+    concurrency: int = 4
+    iterations: int = 3
+    llm_latency_ms: float = 0.0
+    tool_rounds: int = 1
+    fan_out: int = 1
+
+    def script(self) -> StubLlmScript:
+        """The stub LLM script these settings imply."""
+        return StubLlmScript(tool_rounds=self.tool_rounds, fan_out=self.fan_out, latency_ms=self.llm_latency_ms)
+
+
+@dataclass
+class LoadTestResult:  # pylint: disable=too-many-instance-attributes
+    """Measurements of one load test run."""
+
+    settings: Dict[str, Any]
+    requests: int
+    errors: int
+    duration_seconds: float
+    throughput_rps: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+    latency_max_ms: float
+    session_setup_p50_ms: float
+    session_setup_p95_ms: float
+    cpu_ms_per_request: float
+    calibration_cpu_ms: float
+    relative_cpu_per_request: float
+    max_rss_mb: Optional[float]
+    llm_calls_per_request: float
+    per_fixture: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """The nearest-rank percentile of already sorted values, or 0 for none."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def max_rss_mb() -> Optional[float]:
+    """This process's resident memory high-water mark in MiB, or None where unsupported."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0
+
+
+_CALIBRATION_MESSAGES = [
+    {
+        "role": "user" if index % 2 else "assistant",
+        "content": f"message {index} " * 8,
+        "tool_calls": [{"name": f"tool_{index % 7}", "arguments": {"index": index}}],
+    }
+    for index in range(400)
+]
+
+
+def calibration_cpu_ms() -> float:
+    """The CPU milliseconds the calling thread takes for one run of a fixed workload.
+
+    The workload, JSON round trips and dict and string handling of chat messages, is the kind of work the
+    studio does per request, so CPU per request divided by it depends little on the machine. Only the calling
+    thread's CPU time is counted, so it can be sampled while other threads are busy.
+    """
+    start = time.thread_time()
+    for _ in range(20):
+        _calibration_round(_CALIBRATION_MESSAGES)
+    return (time.thread_time() - start) * 1000.0
+
+
+def _calibration_round(messages: List[Dict[str, Any]]) -> int:
+    decoded = json.loads(json.dumps(messages))
+    names = sorted({call["name"] for message in decoded for call in message["tool_calls"]})
+    text = "".join(message["content"].upper() for message in decoded if message["role"] == "user")
+    return len(names) + len(text)
+
+
+class _RequestLog:
+    """Thread-safe record of request latencies by fixture, and of session setup times."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.session_setups: List[float] = []
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def add_session(self, seconds: float) -> None:
+        """Record the creation of one session."""
+        with self._lock:
+            self.session_setups.append(seconds)
+
+    def add(self, fixture: str, seconds: float, error: bool) -> None:
+        """Record one request."""
+        with self._lock:
+            self.latencies.setdefault(fixture, []).append(seconds)
+            self.errors += error
+
+
+def _timed_driver_class():
+    """A DataDrivenAgentTestDriver whose interactions are timed; imported late to keep the CLI light."""
+    # pylint: disable-next=import-outside-toplevel
+    from neuro_san.test.driver.data_driven_agent_test_driver import DataDrivenAgentTestDriver
+
+    # pylint: disable-next=import-outside-toplevel
+    from neuro_san.test.interfaces.null_assert_forwarder import NullAssertForwarder
+
+    class TimedDriver(DataDrivenAgentTestDriver):
+        """Records each interaction in a _RequestLog; response checks are not evaluated."""
+
+        def __init__(self, log: Optional[_RequestLog], fixture: str):
+            super().__init__(NullAssertForwarder(), test_name=fixture)
+            self.log = log
+            self.fixture = fixture
+
+        def run_once(self, test_case: Dict[str, Any], session_factory: Any) -> None:
+            """Run every interaction of the test case once, in one direct session.
+
+            Unlike one_iteration(), sessions come from one shared DirectAgentSessionFactory, as in a
+            server, instead of a factory per session that restores the whole manifest again.
+            """
+            start = time.perf_counter()
+            session = session_factory.create_session(
+                test_case["agent"],
+                use_direct=test_case.get("use_direct", False),
+                metadata=test_case.get("metadata") or {"user_id": os.environ.get("USER")},
+            )
+            if self.log is not None:
+                self.log.add_session(time.perf_counter() - start)
+            chat_context = None
+            sly_data = None
+            for interaction in test_case.get("interactions", []):
+                session.reset()
+                chat_context, sly_data = self.interact(
+                    test_case["agent"],
+                    session,
+                    interaction,
+                    chat_context,
+                    self.asserts_basis,
+                    [],
+                    self.fixture,
+                    None,
+                    sly_data,
+                )
+
+        def interact(self, *args, **kwargs) -> tuple:
+            start = time.perf_counter()
+            error = True
+            try:
+                result = super().interact(*args, **kwargs)
+                error = False
+                return result
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                # A failed interaction is counted; the conversation goes on without its context
+                logging.getLogger(self.__class__.__name__).warning("%s failed: %r", self.fixture, exc)
+                return None, None
+            finally:
+                if self.log is not None:
+                    self.log.add(self.fixture, time.perf_counter() - start, error)
+
+        def test_response_keys(self, *args, **kwargs) -> None:
+            """The stub's answers are not the ones the fixtures check for."""
+
+    return TimedDriver
+
+
+def _serve_stub(script: StubLlmScript, connection) -> None:
+    """Child process entry point: start a stub and send its base URL back."""
+    server = StubLlmServer(script)
+    connection.send(server.base_url)
+    server.serve_forever()
+
+
+class StubLlmProcess:
+    """A StubLlmServer in a child process, so its CPU time and memory stay out of the measurements."""
+
+    def __init__(self, script: StubLlmScript):
+        """Initialize with the script the stub follows."""
+        self.script = script
+        self.base_url = ""
+        self._process = None
+
+    def __enter__(self) -> "StubLlmProcess":
+        context = multiprocessing.get_context("spawn")
+        parent, child = context.Pipe()
+        self._process = context.Process(target=_serve_stub, args=(self.script, child), daemon=True)
+        self._process.start()
+        if not parent.poll(30):
+            self._process.terminate()
+            raise RuntimeError("The stub LLM did not start within 30 seconds")
+        self.base_url = parent.recv()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._process.terminate()
+        self._process.join(timeout=10)
+
+    def stats(self) -> Dict[str, Any]:
+        """The stub's request counters."""
+        with urllib.request.urlopen(self.base_url.removesuffix("/v1") + "/stats", timeout=10) as response:
+            return json.load(response)
+
+
+def point_at_stub(base_url: str, root_dir: str = ".") -> None:
+    """Send every OpenAI client in this process to the stub and make the project's networks resolvable."""
+    # pylint: disable-next=import-outside-toplevel
+    from neuro_san_studio.commands.project_environment import ProjectEnvironment
+
+    ProjectEnvironment(root_dir).apply()
+    root = os.path.abspath(root_dir)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    point_openai_clients_at(base_url)
+
+
+def run_load_test(settings: LoadTestSettings) -> LoadTestResult:  # pylint: disable=too-many-locals
+    """Warm up, then run every fixture `iterations` times at `concurrency` and measure."""
+    driver_class = _timed_driver_class()
+    test_cases = {}
+    for fixture in settings.fixtures:
+        path = os.path.join(settings.fixtures_dir, fixture)
+        test_cases[fixture] = driver_class(None, fixture).parse_hocon_test_case(path)
+
+    with StubLlmProcess(settings.script()) as stub:
+        point_at_stub(stub.base_url)
+        # pylint: disable-next=import-outside-toplevel
+        from neuro_san.client.direct_agent_session_factory import DirectAgentSessionFactory
+
+        session_factory = DirectAgentSessionFactory()
+        for fixture, test_case in test_cases.items():
+            driver_class(None, fixture).run_once(test_case, session_factory)
+
+        log = _RequestLog()
+        jobs = [fixture for _ in range(settings.iterations) for fixture in settings.fixtures]
+        calls_before = stub.stats()["chat_completions"]
+        cpu_before = time.process_time()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, settings.concurrency)) as executor:
+            futures = [
+                executor.submit(driver_class(log, job).run_once, test_cases[job], session_factory) for job in jobs
+            ]
+            # The machine's speed can drift during the run, so calibrate throughout it, on this otherwise idle thread
+            calibrations = [calibration_cpu_ms()]
+            pending = set(futures)
+            while pending:
+                _, pending = wait(pending, timeout=CALIBRATION_INTERVAL_S)
+                calibrations.append(calibration_cpu_ms())
+            for future in futures:
+                future.result()
+        duration = time.perf_counter() - start
+        cpu_seconds = time.process_time() - cpu_before - sum(calibrations) / 1000.0
+        llm_calls = stub.stats()["chat_completions"] - calls_before
+        calibration = statistics.median(calibrations)
+
+    everything = sorted(seconds for latencies in log.latencies.values() for seconds in latencies)
+    sessions = sorted(log.session_setups)
+    requests = len(everything)
+    per_request = max(1, requests)
+    cpu_ms_per_request = cpu_seconds * 1000.0 / per_request
+    return LoadTestResult(
+        settings={name: getattr(settings, name) for name in _SETTINGS},
+        requests=requests,
+        errors=log.errors,
+        duration_seconds=round(duration, 3),
+        throughput_rps=round(requests / duration, 3) if duration > 0 else 0.0,
+        latency_p50_ms=round(percentile(everything, 0.50) * 1000.0, 2),
+        latency_p95_ms=round(percentile(everything, 0.95) * 1000.0, 2),
+        latency_p99_ms=round(percentile(everything, 0.99) * 1000.0, 2),
+        latency_max_ms=round(everything[-1] * 1000.0, 2) if everything else 0.0,
+        session_setup_p50_ms=round(percentile(sessions, 0.50) * 1000.0, 2),
+        session_setup_p95_ms=round(percentile(sessions, 0.95) * 1000.0, 2),
+        cpu_ms_per_request=round(cpu_ms_per_request, 2),
+        calibration_cpu_ms=round(calibration, 3),
+        relative_cpu_per_request=round(cpu_ms_per_request / max(calibration, 1e-6), 3),
+        max_rss_mb=round(max_rss_mb(), 1) if resource is not None else None,
+        llm_calls_per_request=round(llm_calls / per_request, 2),
+        per_fixture={
+            fixture: {
+                "requests": len(latencies),
+                "latency_p50_ms": round(percentile(sorted(latencies), 0.50) * 1000.0, 2),
+                "latency_p95_ms": round(percentile(sorted(latencies), 0.95) * 1000.0, 2),
+            }
+            for fixture, latencies in sorted(log.latencies.items())
+        },
+    )
+
+
+def compare_to_baseline(
+    result: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float,
+    gate_timings: bool = False,
+    cpu_tolerance: float = DEFAULT_CPU_TOLERANCE,
+) -> List[str]:
+    """The regressions of `result` against `baseline`.
+
+    New errors and more LLM calls per request are regressions, and so is relative CPU per request higher by
+    more than `cpu_tolerance` (a fraction). With `gate_timings`, so are the timing and memory metrics that
+    timing_changes() finds worse by more than `tolerance`.
+
+    Raises:
+        ValueError: If the two runs used different settings.
+    """
+    if result.get("settings") != baseline.get("settings"):
+        raise ValueError(f"Baseline settings {baseline.get('settings')} differ from {result.get('settings')}")
+    regressions = []
+    for name in GATED_METRICS:
+        current, reference = result.get(name), baseline.get(name)
+        if current is not None and reference is not None and current > reference:
+            regressions.append(f"{name}: {current} (baseline {reference})")
+    for name in NORMALIZED_METRICS:
+        current, reference = result.get(name), baseline.get(name)
+        if current is None or not reference:
+            continue
+        change = (current - reference) / reference
+        if change > cpu_tolerance:
+            regressions.append(f"{name}: {current} vs baseline {reference} ({change:+.0%} worse)")
+    if gate_timings:
+        regressions.extend(timing_changes(result, baseline, tolerance))
+    return regressions
+
+
+def timing_changes(result: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """The timing and memory metrics of `result` that are worse than `baseline` by more than `tolerance`."""
+    changes = []
+    for name, direction in TIMING_METRICS.items():
+        current, reference = result.get(name), baseline.get(name)
+        if current is None or not reference:
+            continue
+        change = (current - reference) / reference * direction
+        if change > tolerance:
+            changes.append(f"{name}: {current} vs baseline {reference} ({change:+.0%} worse)")
+    return changes
+
+
+def format_report(result: LoadTestResult) -> str:
+    """A plain-text summary of one run."""
+    memory = f"{result.max_rss_mb:.0f} MiB" if result.max_rss_mb is not None else "n/a"
+    lines = [
+        f"{result.requests} requests ({result.errors} errors) in {result.duration_seconds:.1f}s "
+        f"at concurrency {result.settings['concurrency']}, stub latency {result.settings['llm_latency_ms']} ms",
+        f"  throughput    {result.throughput_rps:.2f} requests/s",
+        f"  latency       p50 {result.latency_p50_ms:.0f} ms, p95 {result.latency_p95_ms:.0f} ms, "
+        f"p99 {result.latency_p99_ms:.0f} ms, max {result.latency_max_ms:.0f} ms",
+        f"  session setup p50 {result.session_setup_p50_ms:.0f} ms, p95 {result.session_setup_p95_ms:.0f} ms",
+        f"  cpu           {result.cpu_ms_per_request:.1f} ms per request, "
+        f"{result.relative_cpu_per_request:.1f}x the {result.calibration_cpu_ms:.1f} ms calibration",
+        f"  memory        {memory} high-water mark",
+        f"  llm calls     {result.llm_calls_per_request:.1f} per request",
+    ]
+    for fixture, stats in result.per_fixture.items():
+        lines.append(
+            f"    {stats['latency_p50_ms']:8.0f} {stats['latency_p95_ms']:8.0f} ms  "
+            f"{fixture} ({stats['requests']:.0f} requests)"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the load test and optionally check it against, or record, a baseline."""
+    parser = ArgumentParser(description="Measure studio-side overhead of agent networks against a stub LLM.")
+    parser.add_argument("--fixture", action="append", help="Test case hocon under --fixtures-dir (repeatable).")
+    parser.add_argument("--fixtures-dir", default=DEFAULT_FIXTURES_DIR, help="Root of the test case hocons.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Conversations in flight at once.")
+    parser.add_argument("--iterations", type=int, default=3, help="Runs of each fixture after the warm-up.")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="Stub delay before every response.")
+    parser.add_argument("--tool-rounds", type=int, default=1, help="Tool-call rounds before each stub answer.")
+    parser.add_argument("--fan-out", type=int, default=1, help="Tools the stub calls per round.")
+    parser.add_argument("--json", dest="json_path", help="Also write the result to this JSON file.")
+    parser.add_argument("--baseline", help="Fail if the run is worse than this JSON result.")
+    parser.add_argument("--write-baseline", action="store_true", help="Write the result to --baseline instead.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed fraction worse than the baseline.")
+    parser.add_argument(
+        "--cpu-tolerance",
+        type=float,
+        default=DEFAULT_CPU_TOLERANCE,
+        help="Allowed fraction more CPU per request than the baseline, relative to the calibration workload.",
+    )
+    parser.add_argument(
+        "--gate-timings", action="store_true", help="Also fail on timings; only for a baseline from this machine."
+    )
+    args = parser.parse_args(argv)
+
+    settings = LoadTestSettings(
+        fixtures=args.fixture or list(DEFAULT_FIXTURES),
+        fixtures_dir=args.fixtures_dir,
+        concurrency=args.concurrency,
+        iterations=args.iterations,
+        llm_latency_ms=args.llm_latency_ms,
+        tool_rounds=args.tool_rounds,
+        fan_out=args.fan_out,
+    )
+    result = run_load_test(settings)
+    print(format_report(result))
+    report = dict(asdict(result), interpreter={"python": platform.python_version(), "cpu_count": os.cpu_count()})
+    targets = [args.json_path] if args.json_path else []
+    if args.baseline and args.write_baseline:
+        targets.append(args.baseline)
+    for target in targets:
+        with open(target, "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, indent=2)
+            report_file.write("\n")
+    if not args.baseline or args.write_baseline:
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    try:
+        regressions = compare_to_baseline(
+            report, baseline, args.tolerance, gate_timings=args.gate_timings, cpu_tolerance=args.cpu_tolerance
+        )
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if not args.gate_timings:
+        # Informational: the baseline may come from another machine
+        for change in timing_changes(report, baseline, args.tolerance):
+            print(f"TIMING {change}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Limits, reserved names and the writer of the agent network archives that `ns export` writes and `ns import` reads.
+
+The writer takes members that are already deflated, so a bulk export can compress a file shared by many
+archives once and copy its compressed bytes into each of them. zipfile has no public API for writing
+pre-compressed data, so the zip records are laid out here with struct, as the zip specification gives them.
+"""
+
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import BinaryIO
+from typing import List
+from typing import Tuple
+
+# `ns import` rejects an archive with more entries than this, or more uncompressed bytes, so
+# the exporter must not write one.
+MAX_ARCHIVE_ENTRIES = 100
+MAX_ARCHIVE_BYTES = 100 * 1024 * 1024  # 100 MB
+
+# Written at the root of a combined archive. `ns import` treats it as archive metadata
+# (tolerated, never copied into the receiver's tree).
+BULK_EXPORT_MANIFEST = "export_manifest.json"
+
+# Zip format constants: deflate, "version needed" 2.0, made on Unix (so external_attr holds a mode),
+# and the general purpose flag marking UTF-8 names.
+_DEFLATED = 8
+_VERSION = 20
+_MADE_BY = (3 << 8) | _VERSION
+_UTF8_FLAG = 0x800
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_CENTRAL_HEADER = struct.Struct("<4s6H3L5H2L")
+_END_RECORD = struct.Struct("<4s4H2LH")
+
+
+@dataclass
+class DeflatedPayload:
+    """A member's content after compression: what every archive carrying it copies."""
+
+    crc: int
+    data: bytes
+    size: int
+
+
+@dataclass
+class ArchiveEntry:
+    """One member of an archive: its name, timestamp and mode, and its deflated content."""
+
+    arcname: str
+    date_time: Tuple[int, int, int, int, int, int]
+    external_attr: int
+    payload: DeflatedPayload
+
+
+def deflate(content: bytes, level: int) -> DeflatedPayload:
+    """Compress `content` as a zip member: raw deflate, with the CRC of the uncompressed bytes."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    data = compressor.compress(content) + compressor.flush()
+    return DeflatedPayload(crc=zlib.crc32(content), data=data, size=len(content))
+
+
+def _dos_timestamp(date_time: Tuple[int, int, int, int, int, int]) -> Tuple[int, int]:
+    """The (time, date) fields of a zip header, in MS-DOS format with two-second resolution."""
+    year, month, day, hour, minute, second = date_time
+    return (hour << 11) | (minute << 5) | (second // 2), ((year - 1980) << 9) | (month << 5) | day
+
+
+def write_archive(stream: BinaryIO, entries: List[ArchiveEntry]) -> int:
+    """Write a zip of `entries`, in order, to `stream` and return the bytes written.
+
+    Archives stay within MAX_ARCHIVE_ENTRIES and MAX_ARCHIVE_BYTES, so the zip64 extensions are never needed.
+    """
+    offset = 0
+    central = []
+    for entry in entries:
+        name = entry.arcname.encode("utf-8")
+        flags = 0 if entry.arcname.isascii() else _UTF8_FLAG
+        dos_time, dos_date = _dos_timestamp(entry.date_time)
+        payload = entry.payload
+        sizes = (payload.crc, len(payload.data), payload.size)
+        stream.write(
+            _LOCAL_HEADER.pack(b"PK\x03\x04", _VERSION, flags, _DEFLATED, dos_time, dos_date, *sizes, len(name), 0)
+        )
+        stream.write(name)
+        stream.write(payload.data)
+        central.append(
+            _CENTRAL_HEADER.pack(
+                b"PK\x01\x02",
+                _MADE_BY,
+                _VERSION,
+                flags,
+                _DEFLATED,
+                dos_time,
+                dos_date,
+                *sizes,
+                len(name),
+                0,
+                0,
+                0,
+                0,
+                entry.external_attr,
+                offset,
+            )
+            + name
+        )
+        offset += _LOCAL_HEADER.size + len(name) + len(payload.data)
+    directory = b"".join(central)
+    stream.write(directory)
+    stream.write(_END_RECORD.pack(b"PK\x05\x06", 0, 0, len(entries), len(entries), len(directory), offset, 0))
+    return offset + len(directory) + _END_RECORD.size
@@ -0,0 +1,278 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Runs the data-driven integration tests in parallel shards, one pytest process per shard.
+
+The test cases are collected once, grouped, and spread across shards so each shard's expected run time is
+about the same (longest first onto the least loaded shard), using the durations of earlier runs. Cases of
+a fail-fast group, whose base test method name matches --serial-groups, stay together and in order in one
+shard, because each case may depend on the ones before it.
+
+Every shard gets its own temporary directory and, with --cassette, its own LLM cassette server. The shards
+start no agent server: the data-driven cases run their networks in-process, and the few that call a running
+service, such as the MCP server of tests/fixtures/generated/basic_helpdesk_test_mcp.hocon, all reach the one
+instance at the URL in their network. Output goes to one log per shard; the summary names the failed shards
+and their logs:
+
+    python -m neuro_san_studio.utils.sharded_test_runner --shards 8 --cassette replay
+    python -m neuro_san_studio.utils.sharded_test_runner --cassette new -- -k airline_policy
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from xml.etree import ElementTree
+
+from neuro_san_studio.utils.last_known_good_cache import DEFAULT_CACHE_DIR
+from neuro_san_studio.utils.llm_cassette import CASSETTE_ENV_VAR
+from neuro_san_studio.utils.llm_cassette import MODES
+
+DEFAULT_TARGET = os.path.join("tests", "integration", "test_integration_test_hocons.py")
+DEFAULT_DURATIONS_FILE = os.path.join(DEFAULT_CACHE_DIR, "integration_test_durations.json")
+
+# Base test methods whose cases run as one ordered unit (FailFastParamMixin groups).
+DEFAULT_SERIAL_GROUPS = r"_e2e$"
+
+# Assumed duration, in seconds, of a case no earlier run has timed.
+DEFAULT_CASE_SECONDS = 30.0
+
+
+@dataclass
+class ShardResult:  # pylint: disable=too-many-instance-attributes
+    """Outcome of one shard's pytest process."""
+
+    index: int
+    test_ids: List[str]
+    returncode: int
+    seconds: float
+    log_path: str
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    durations: Dict[str, float] = field(default_factory=dict)
+
+
+def duration_key(test_id: str) -> str:
+    """``Class::test_name`` of a node id, the form junit reports identify a case by."""
+    return "::".join(test_id.split("::")[-2:])
+
+
+def group_name(test_id: str) -> str:
+    """The base test method of a parameterized case, as FailFastParamMixin derives it."""
+    return re.sub(r"_\d+_.*$", "", test_id.split("::")[-1])
+
+
+def collect_test_ids(targets: Sequence[str], marker: str, extra_args: Sequence[str] = ()) -> List[str]:
+    """The node ids pytest selects from `targets` with `marker`, in collection order.
+
+    pytest -q lists one node id per line, up to the first blank line; parameter ids may contain spaces.
+
+    Raises:
+        RuntimeError: If collection failed, or a line of that list is not a node id.
+    """
+    command = [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", "--no-cov"]
+    command += ["-m", marker, *extra_args, *targets]
+    result = subprocess.run(command, capture_output=True, text=True, check=False)
+    lines = result.stdout.splitlines()
+    listed = lines[: lines.index("")] if "" in lines else lines
+    test_ids = [line for line in listed if line.strip()]
+    if result.returncode not in (0, 5):
+        raise RuntimeError(f"Collecting {targets} failed:\n{result.stdout}\n{result.stderr}")
+    unexpected = [line for line in test_ids if "::" not in line]
+    if unexpected:
+        raise RuntimeError(f"Unexpected lines where pytest lists the collected node ids: {unexpected}")
+    return test_ids
+
+
+def plan_shards(
+    test_ids: Sequence[str],
+    shards: int,
+    durations: Optional[Dict[str, float]] = None,
+    serial_groups: str = DEFAULT_SERIAL_GROUPS,
+) -> List[List[str]]:
+    """Spread `test_ids` over up to `shards` lists of about equal expected duration.
+
+    Each shard keeps the collection order of its cases, so a serial group runs in the order it was written.
+    """
+    durations = durations or {}
+    serial = re.compile(serial_groups) if serial_groups else None
+    units: Dict[str, List[str]] = {}
+    for test_id in test_ids:
+        group = group_name(test_id)
+        unit = group if serial is not None and serial.search(group) else test_id
+        units.setdefault(unit, []).append(test_id)
+
+    def weight(unit_ids: List[str]) -> float:
+        return sum(durations.get(duration_key(test_id), DEFAULT_CASE_SECONDS) for test_id in unit_ids)
+
+    plan: List[List[str]] = [[] for _ in range(max(1, min(shards, len(units))))]
+    loads = [0.0] * len(plan)
+    for unit_ids in sorted(units.values(), key=weight, reverse=True):
+        lightest = loads.index(min(loads))
+        plan[lightest].extend(unit_ids)
+        loads[lightest] += weight(unit_ids)
+    order = {test_id: index for index, test_id in enumerate(test_ids)}
+    return [sorted(shard, key=order.__getitem__) for shard in plan if shard]
+
+
+def shard_environment(index: int, base: Dict[str, str], temp_root: str, cassette: Optional[str]) -> Dict[str, str]:
+    """The environment of one shard: its own temporary directory and cassette mode."""
+    env = dict(base)
+    shard_temp = os.path.join(temp_root, f"shard-{index}")
+    os.makedirs(shard_temp, exist_ok=True)
+    env.update(
+        {
+            "NEURO_SAN_TEST_SHARD": str(index),
+            "TMPDIR": shard_temp,
+        }
+    )
+    if env.get("AGENT_TEST_THINKING_BASIS"):
+        env["AGENT_TEST_THINKING_BASIS"] = os.path.join(env["AGENT_TEST_THINKING_BASIS"], f"shard-{index}")
+    if cassette:
+        env[CASSETTE_ENV_VAR] = cassette
+    return env
+
+
+def read_junit(path: str) -> Dict[str, Tuple[str, float]]:
+    """``Class::test_name`` -> (passed, failed or skipped; seconds) for every case in a junit report."""
+    outcomes: Dict[str, Tuple[str, float]] = {}
+    try:
+        tree = ElementTree.parse(path)
+    except (OSError, ElementTree.ParseError):
+        return outcomes
+    for case in tree.iter("testcase"):
+        key = f"{case.get('classname', '').rsplit('.', 1)[-1]}::{case.get('name', '')}"
+        if case.find("failure") is not None or case.find("error") is not None:
+            outcome = "failed"
+        elif case.find("skipped") is not None:
+            outcome = "skipped"
+        else:
+            outcome = "passed"
+        outcomes[key] = (outcome, float(case.get("time") or 0.0))
+    return outcomes
+
+
+# pylint: disable-next=too-many-locals
+def run_shards(
+    plan: List[List[str]], env: Dict[str, str], log_dir: str, cassette: Optional[str], pytest_args: Sequence[str] = ()
+) -> List[ShardResult]:
+    """Start one pytest process per shard, wait for all of them and collect their results."""
+    temp_root = tempfile.mkdtemp(prefix="neuro-san-shards-")
+    os.makedirs(log_dir, exist_ok=True)
+    running = []
+    for index, test_ids in enumerate(plan):
+        log_path = os.path.join(log_dir, f"shard-{index}.log")
+        junit_path = os.path.join(log_dir, f"shard-{index}.xml")
+        command = [sys.executable, "-m", "pytest", "-p", "no:cacheprovider", "--no-cov", "-s"]
+        command += [f"--junitxml={junit_path}", *pytest_args, *test_ids]
+        log_file = open(log_path, "w", encoding="utf-8")  # pylint: disable=consider-using-with
+        process = subprocess.Popen(  # pylint: disable=consider-using-with
+            command,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            env=shard_environment(index, env, temp_root, cassette),
+        )
+        running.append((index, test_ids, process, log_file, log_path, junit_path, time.monotonic()))
+
+    results = []
+    for index, test_ids, process, log_file, log_path, junit_path, started in running:
+        returncode = process.wait()
+        log_file.close()
+        result = ShardResult(index, test_ids, returncode, time.monotonic() - started, log_path)
+        for key, (outcome, seconds) in read_junit(junit_path).items():
+            setattr(result, outcome, getattr(result, outcome) + 1)
+            result.durations[key] = seconds
+        results.append(result)
+    return results
+
+
+def load_durations(path: str) -> Dict[str, float]:
+    """Case durations saved by an earlier run; empty if there are none."""
+    try:
+        with open(path, "r", encoding="utf-8") as durations_file:
+            data = json.load(durations_file)
+        return {str(key): float(value) for key, value in data.items()}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def save_durations(path: str, durations: Dict[str, float]) -> None:
+    """Merge new case durations into the file; a failed write is ignored."""
+    merged = load_durations(path)
+    merged.update(durations)
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as durations_file:
+            json.dump(merged, durations_file, indent=1, sort_keys=True)
+    except OSError:
+        pass
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Collect, shard and run the integration tests; exit 1 if any shard failed."""
+    parser = ArgumentParser(description="Run the data-driven integration tests in parallel shards.")
+    parser.add_argument("targets", nargs="*", default=[DEFAULT_TARGET], help="Test files or directories.")
+    parser.add_argument("--shards", type=int, default=os.cpu_count() or 1, help="Parallel pytest processes.")
+    parser.add_argument("--marker", default="integration", help="pytest -m expression selecting the cases.")
+    parser.add_argument("--cassette", choices=MODES, help="Record or replay LLM calls through the cassette.")
+    parser.add_argument("--serial-groups", default=DEFAULT_SERIAL_GROUPS, help="Regex of ordered groups.")
+    parser.add_argument("--durations-file", default=DEFAULT_DURATIONS_FILE, help="Case durations for balancing.")
+    parser.add_argument("--log-dir", default=os.path.join("logs", "shards"), help="Where shard logs are written.")
+    argv = list(sys.argv[1:] if argv is None else argv)
+    pytest_args = argv[argv.index("--") + 1 :] if "--" in argv else []
+    args = parser.parse_args(argv[: argv.index("--")] if "--" in argv else argv)
+
+    # pylint: disable-next=import-outside-toplevel
+    from neuro_san_studio.commands.project_environment import ProjectEnvironment
+
+    ProjectEnvironment(os.getcwd()).apply()
+    test_ids = collect_test_ids(args.targets, args.marker, pytest_args)
+    if not test_ids:
+        print(f"No tests marked {args.marker!r} in {args.targets}", file=sys.stderr)
+        return 5
+    plan = plan_shards(test_ids, args.shards, load_durations(args.durations_file), args.serial_groups)
+    print(f"Running {len(test_ids)} cases in {len(plan)} shards" + (f" ({args.cassette})" if args.cassette else ""))
+    start = time.monotonic()
+    results = run_shards(plan, dict(os.environ), args.log_dir, args.cassette, pytest_args)
+
+    durations: Dict[str, float] = {}
+    for result in results:
+        durations.update(result.durations)
+        status = "ok" if result.returncode == 0 else f"FAILED (exit {result.returncode})"
+        print(
+            f"  shard {result.index}: {len(result.test_ids)} cases, {result.passed} passed, {result.failed} failed, "
+            f"{result.skipped} skipped in {result.seconds:.0f}s  {status}  {result.log_path}"
+        )
+    save_durations(args.durations_file, durations)
+    failed = [result for result in results if result.returncode != 0]
+    print(f"{len(results) - len(failed)} of {len(results)} shards passed in {time.monotonic() - start:.0f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""A local OpenAI-compatible chat completions server with scripted, deterministic responses.
+
+Used by the load-testing harness so agent networks run with no network access and no LLM variance. Point
+the OpenAI client at it with OPENAI_API_BASE=http://127.0.0.1:<port>/v1. Every response is chosen from the
+request alone, so it does not depend on how concurrent conversations interleave:
+
+- While fewer than ``tool_rounds`` assistant tool-call messages follow the last user message and the
+  request offers tools, the stub calls up to ``fan_out`` of them, with arguments built from each tool's
+  JSON schema (overridable per tool).
+- Otherwise it answers with ``answer``.
+
+Each response waits ``latency_ms`` plus up to ``jitter_ms`` first, to stand in for model latency. The jitter
+is drawn from ``seed`` and the request's messages, so a request gets the same delay in every run. Streaming
+(``"stream": true``) is answered with server-sent events. ``GET /stats`` reports the calls served so far.
+
+    python -m neuro_san_studio.utils.stub_llm_server --port 8765 --latency-ms 200
+"""
+
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from dataclasses import field
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+# Placeholder argument values by JSON schema type.
+_SCHEMA_DEFAULTS: Dict[str, Any] = {
+    "string": "stub",
+    "integer": 1,
+    "number": 1.0,
+    "boolean": True,
+    "array": [],
+    "object": {},
+}
+
+
+def point_openai_clients_at(base_url: str, api_key: str = "stub-llm-key") -> None:
+    """Send every OpenAI client created in this process from now on to `base_url`."""
+    os.environ["OPENAI_API_BASE"] = base_url
+    os.environ["OPENAI_BASE_URL"] = base_url
+    os.environ["OPENAI_API_KEY"] = api_key
+
+
+class StubLlmError(Exception):
+    """A failure StubLlmServer.complete() reports to the client as an HTTP error."""
+
+    def __init__(self, status: int, message: str):
+        """Initialize with the HTTP status and the message for the client."""
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class StubLlmScript:  # pylint: disable=too-many-instance-attributes
+    """How the stub answers."""
+
+    # Rounds of tool calls after each user message before the final answer.
+    tool_rounds: int = 1
+    # Tools called per round, in the order the request offers them (after any in `prefer`).
+    fan_out: int = 1
+    # Tool names to call first when offered.
+    prefer: List[str] = field(default_factory=list)
+    # Tool name -> arguments, merged over the placeholders built from the tool's schema.
+    arguments: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    answer: str = "This is a scripted answer from the stub LLM."
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    seed: int = 0
+
+    @staticmethod
+    def from_mapping(mapping: Dict[str, Any]) -> "StubLlmScript":
+        """A script from a parsed JSON or HOCON mapping; unknown keys are rejected."""
+        unknown = set(mapping) - set(StubLlmScript.__dataclass_fields__)  # pylint: disable=no-member
+        if unknown:
+            raise ValueError(f"Unknown stub LLM script keys: {sorted(unknown)}")
+        return StubLlmScript(**mapping)
+
+    def respond(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """The assistant message for one chat completions request."""
+        messages: List[Dict[str, Any]] = request.get("messages") or []
+        last_user = max((index for index, message in enumerate(messages) if message.get("role") == "user"), default=-1)
+        rounds = sum(1 for message in messages[last_user + 1 :] if message.get("tool_calls"))
+        tools = [tool.get("function", {}) for tool in request.get("tools") or [] if tool.get("type") == "function"]
+        if tools and rounds < self.tool_rounds:
+            chosen = self._choose_tools(tools)
+            return {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": f"call_{uuid.uuid4().hex[:24]}",
+                        "type": "function",
+                        "function": {"name": tool["name"], "arguments": json.dumps(self._arguments_for(tool))},
+                    }
+                    for tool in chosen
+                ],
+            }
+        return {"role": "assistant", "content": self.answer}
+
+    def _choose_tools(self, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        rank = {name: index for index, name in enumerate(self.prefer)}
+        ordered = sorted(tools, key=lambda tool: rank.get(tool.get("name"), len(rank)))
+        return ordered[: max(1, self.fan_out)]
+
+    def _arguments_for(self, tool: Dict[str, Any]) -> Dict[str, Any]:
+        parameters = tool.get("parameters") or {}
+        properties = parameters.get("properties") or {}
+        arguments = {}
+        for name in parameters.get("required") or []:
+            schema = properties.get(name) or {}
+            if schema.get("enum"):
+                arguments[name] = schema["enum"][0]
+            else:
+                arguments[name] = _SCHEMA_DEFAULTS.get(schema.get("type"), "stub")
+        arguments.update(self.arguments.get(tool.get("name"), {}))
+        return arguments
+
+
+class StubLlmServer:
+    """Serves a StubLlmScript over HTTP on a background thread."""
+
+    def __init__(self, script: Optional[StubLlmScript] = None, host: str = "127.0.0.1", port: int = 0):
+        """Initialize the server.
+
+        Args:
+            script: How to answer; the defaults call one tool per user message, then answer.
+            host: Interface to listen on.
+            port: Port to listen on; 0 picks a free one.
+        """
+        self.script = script or StubLlmScript()
+        self._lock = threading.Lock()
+        self._stats = {"chat_completions": 0, "tool_call_responses": 0, "stream_responses": 0, "latency_seconds": 0.0}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """The OpenAI API base URL of the server, ending in /v1."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "StubLlmServer":
+        """Serve on a daemon thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-llm", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until stop() is called from another one."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Counts of the requests served so far."""
+        with self._lock:
+            return dict(self._stats)
+
+    def complete(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Wait out the scripted latency and build the chat.completion for `request`.
+
+        Subclasses may answer differently, raising StubLlmError for a request they cannot answer.
+        """
+        delay = (self.script.latency_ms + self.jitter_ms(request)) / 1000.0
+        if delay > 0:
+            time.sleep(delay)
+        message = self.script.respond(request)
+        with self._lock:
+            self._stats["chat_completions"] += 1
+            self._stats["tool_call_responses"] += bool(message.get("tool_calls"))
+            self._stats["stream_responses"] += bool(request.get("stream"))
+            self._stats["latency_seconds"] += delay
+        prompt_tokens = sum(len(str(entry.get("content") or "")) for entry in request.get("messages") or []) // 4
+        completion_tokens = len(message.get("content") or "") // 4
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model") or "stub",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": message,
+                    "finish_reason": "tool_calls" if message.get("tool_calls") else "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    def jitter_ms(self, request: Dict[str, Any]) -> float:
+        """The jitter for `request`, drawn from the script's seed and the request's messages.
+
+        Tool call ids are left out, since they differ between runs; roles, contents and the names of the
+        tools called are the same whenever the conversation is.
+        """
+        if self.script.jitter_ms <= 0:
+            return 0.0
+        shape = [
+            [
+                message.get("role"),
+                message.get("content"),
+                [(call.get("function") or {}).get("name") for call in message.get("tool_calls") or []],
+            ]
+            for message in request.get("messages") or []
+        ]
+        digest = hashlib.sha256(json.dumps([self.script.seed, shape], sort_keys=True, default=str).encode("utf-8"))
+        return random.Random(digest.hexdigest()).uniform(0.0, self.script.jitter_ms)
+
+    @staticmethod
+    def stream_chunks(completion: Dict[str, Any], include_usage: bool) -> List[Dict[str, Any]]:
+        """The chat.completion.chunk events equivalent to one completion."""
+        message = completion["choices"][0]["message"]
+        base = {"id": completion["id"], "object": "chat.completion.chunk", "created": completion["created"]}
+        base["model"] = completion["model"]
+        deltas: List[Dict[str, Any]] = [{"role": "assistant", "content": ""}]
+        if message.get("content"):
+            deltas.append({"content": message["content"]})
+        for index, tool_call in enumerate(message.get("tool_calls") or []):
+            deltas.append({"tool_calls": [dict(tool_call, index=index)]})
+        chunks = [dict(base, choices=[{"index": 0, "delta": delta, "finish_reason": None}]) for delta in deltas]
+        chunks.append(
+            dict(base, choices=[{"index": 0, "delta": {}, "finish_reason": completion["choices"][0]["finish_reason"]}])
+        )
+        if include_usage:
+            chunks.append(dict(base, choices=[], usage=completion["usage"]))
+        return chunks
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """GET /stats, or /v1/models for clients that list models first."""
+                path = self.path.split("?", 1)[0].rstrip("/")
+                if path == "/stats":
+                    self._send_json(200, server.stats())
+                elif path.endswith("/models"):
+                    self._send_json(200, {"object": "list", "data": [{"id": "stub", "object": "model"}]})
+                else:
+                    self._send_json(404, {"error": {"message": f"No route for GET {self.path}"}})
+
+            def do_POST(self):  # pylint: disable=invalid-name
+                """POST /v1/chat/completions."""
+                if not self.path.split("?", 1)[0].rstrip("/").endswith("/chat/completions"):
+                    self._send_json(404, {"error": {"message": f"No route for POST {self.path}"}})
+                    return
+                try:
+                    request = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+                except ValueError as exc:
+                    self._send_json(400, {"error": {"message": f"Malformed JSON: {exc}"}})
+                    return
+                try:
+                    completion = server.complete(request)
+                except StubLlmError as exc:
+                    self._send_json(exc.status, {"error": {"message": str(exc), "type": "stub_llm_error"}})
+                    return
+                if not request.get("stream"):
+                    self._send_json(200, completion)
+                    return
+                include_usage = bool((request.get("stream_options") or {}).get("include_usage"))
+                events = [
+                    f"data: {json.dumps(chunk)}\n\n" for chunk in server.stream_chunks(completion, include_usage)
+                ]
+                body = ("".join(events) + "data: [DONE]\n\n").encode("utf-8")
+                self._send(200, "text/event-stream", body)
+
+            def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+                self._send(status, "application/json", json.dumps(payload).encode("utf-8"))
+
+            def _send(self, status: int, content_type: str, body: bytes) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                """Keep requests out of the output."""
+
+        return _Handler
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Serve the stub until interrupted."""
+    parser = ArgumentParser(description="Serve scripted OpenAI chat completions for offline agent network runs.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on.")
+    parser.add_argument("--port", type=int, default=0, help="Port to listen on (default: any free port).")
+    parser.add_argument("--script", help="JSON file with StubLlmScript fields.")
+    parser.add_argument("--latency-ms", type=float, help="Delay before every response.")
+    args = parser.parse_args(argv)
+
+    script = StubLlmScript()
+    if args.script:
+        with open(args.script, "r", encoding="utf-8") as script_file:
+            script = StubLlmScript.from_mapping(json.load(script_file))
+    if args.latency_ms is not None:
+        script.latency_ms = args.latency_ms
+    server = StubLlmServer(script, host=args.host, port=args.port)
+    print(f"Stub LLM serving at {server.base_url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
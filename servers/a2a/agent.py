@@ -18,11 +18,24 @@
 crewAI agents for an A2A server example
 """
 
+import asyncio
+import threading
+from typing import AsyncIterator
+from typing import Optional
+
 # pylint: disable=import-error
 from crewai import Agent
+from crewai import BaseLLM
 from crewai import Crew
 from crewai import LLM
 from crewai import Task
+from crewai import TaskOutput
+
+
+class CrewCancelled(Exception):
+    """
+    Raised inside the crew's worker thread to stop a run that was cancelled.
+    """
 
 
 class CrewAiResearchReport:
@@ -31,12 +44,20 @@ class CrewAiResearchReport:
 
     This example is adapted from https://docs.crewai.com/quickstart,
     but does not use any tools.
+
+    An instance runs one crew at a time; create one per request.
     """
 
-    def __init__(self):
+    def __init__(self, llm: Optional[BaseLLM] = None):
+        """
+        :param llm: LLM for the agents. Defaults to gpt-4o-mini.
+        """
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._outputs: Optional[asyncio.Queue] = None
+        self._cancelled = threading.Event()
 
         # LLM for agents
-        llm = LLM(model="gpt-4o-mini")
+        llm = llm or LLM(model="gpt-4o-mini")
 
         # Agents are researcher and reporting_analyst
         researcher = Agent(
@@ -70,6 +91,7 @@ class CrewAiResearchReport:
 
         # researcher conducts research while reporting_analyst write a report
         research_task = Task(
+            name="research_task",
             description=(
                 "Conduct a thorough research about {topic} "
                 "Make sure you find any interesting and relevant information "
@@ -82,6 +104,7 @@ class CrewAiResearchReport:
         )
 
         reporting_task = Task(
+            name="reporting_task",
             description=(
                 "Review the context you got and expand each topic into a full "
                 "section for a report. Make sure the report is detailed and "
@@ -99,7 +122,9 @@ class CrewAiResearchReport:
         self.crew = Crew(
             agents=[researcher, reporting_analyst],
             tasks=[research_task, reporting_task],
-            verbose=True
+            verbose=True,
+            step_callback=self._on_step,
+            task_callback=self._on_task_done,
         )
 
     async def ainvoke(self, topic: str) -> str:
@@ -113,3 +138,45 @@ class CrewAiResearchReport:
         result = await self.crew.kickoff_async(inputs=inputs)
 
         return result.raw
+
+    async def astream(self, topic: str) -> AsyncIterator[TaskOutput]:
+        """
+        Execute the run with given topic, yielding each task's output as soon as that task finishes.
+        :param topic: Topic for crew to do research and write report.
+
+        :return: The outputs of the research task and then the reporting task.
+            The last one is the report.
+
+        Closing the iterator early, or cancelling the coroutine consuming it, stops the crew
+        after the step it is on; the LLM call in flight is not interrupted.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._outputs = asyncio.Queue()
+        self._cancelled.clear()
+        run = asyncio.ensure_future(self.crew.kickoff_async(inputs={'topic': topic}))
+        run.add_done_callback(lambda _: self._outputs.put_nowait(None))
+        try:
+            while (output := await self._outputs.get()) is not None:
+                yield output
+            # Raises whatever stopped the crew, if anything did
+            await run
+        finally:
+            if not run.done():
+                self._cancelled.set()
+                run.cancel()
+
+    def _on_step(self, _step) -> None:
+        """
+        Called on the crew's thread after each agent step.
+        """
+        if self._cancelled.is_set():
+            raise CrewCancelled()
+
+    def _on_task_done(self, output: TaskOutput) -> None:
+        """
+        Called on the crew's thread when a task finishes; hands its output to astream().
+        """
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._outputs.put_nowait, output)
+        if self._cancelled.is_set():
+            raise CrewCancelled()
@@ -19,44 +19,116 @@ crewAI agent executor for an A2A server example
 See https://github.com/a2aproject/a2a-samples/tree/main/samples/python
 """
 
+import asyncio
+import logging
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
 from typing_extensions import override
 
 # pylint: disable=import-error
 from a2a.server.agent_execution import AgentExecutor
 from a2a.server.agent_execution import RequestContext
 from a2a.server.events import EventQueue
-from a2a.utils import new_agent_text_message
+from a2a.server.tasks import TaskUpdater
+from a2a.types import Part
+from a2a.types import TaskState
+from a2a.types import TextPart
+from a2a.utils import new_task
 
 from agent import CrewAiResearchReport
 
+# Crews that may run at once; further requests wait for a free slot
+DEFAULT_MAX_CONCURRENT_CREWS = 4
+
 
 class CrewAiAgentExecutor(AgentExecutor):
     """Agent executor for crewAI agents
 
     adapted from https://github.com/a2aproject/a2a-samples/blob/main/samples/python/agents/helloworld/agent_executor.py
+
+    Each request runs its own crew as an A2A task. The output of every crew task (the research,
+    then the report) is sent as an artifact as soon as that task finishes, with a working status
+    update. The A2A task completes once the report, the last artifact, has been sent.
+    Requests beyond the concurrency limit wait in the submitted state, and a running request
+    can be cancelled by its A2A task id.
     """
 
-    def __init__(self):
-        self.agent = CrewAiResearchReport()
+    def __init__(
+        self,
+        max_concurrent_crews: int = DEFAULT_MAX_CONCURRENT_CREWS,
+        crew_factory: Callable[[], CrewAiResearchReport] = CrewAiResearchReport,
+    ):
+        """
+        :param max_concurrent_crews: Crews that may run at once
+        :param crew_factory: Creates the crew for one request
+        """
+        self.crew_factory = crew_factory
+        self._slots = asyncio.Semaphore(max_concurrent_crews)
+        self._running: Dict[str, asyncio.Task] = {}
+        self._logger = logging.getLogger(self.__class__.__name__)
 
     @override
     async def execute(self, context: RequestContext, event_queue: EventQueue):
         """
         Handles incoming requests that expect a response or a stream of events.
-        It processes the user's input (available via context) and uses the event_queue to send back Message
+        It processes the user's input (available via context) and uses the event_queue to send back
+        the task, its status updates and one artifact per finished crew task.
         """
         # Get query from the context
         query: str = context.get_user_input()
         if not context.message:
             raise ValueError("No message provided")
 
-        # Invoke the underlying agent
-        result = await self.agent.ainvoke(query)
-        await event_queue.enqueue_event(new_agent_text_message(result))
+        task = context.current_task
+        if task is None:
+            task = new_task(context.message)
+            await event_queue.enqueue_event(task)
+        updater = TaskUpdater(event_queue, task.id, task.context_id)
+
+        self._running[task.id] = asyncio.current_task()
+        try:
+            if self._slots.locked():
+                await updater.update_status(
+                    TaskState.submitted, message=self._agent_message(updater, "Waiting for a free crew.")
+                )
+            async with self._slots:
+                await updater.start_work()
+                await self._run_crew(query, updater)
+            await updater.complete()
+        # A CancelledError passes through: cancel() has already reported the task as canceled
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._logger.exception("Research report on %r failed", query)
+            await updater.failed(message=self._agent_message(updater, f"Research report failed: {exc}"))
+        finally:
+            self._running.pop(task.id, None)
 
     @override
     async def cancel(self, context: RequestContext, event_queue: EventQueue):
         """
-        Handles requests to cancel an ongoing task. Cancellation is not supported for this example.
+        Handles requests to cancel an ongoing task. The crew stops after the step it is on.
+        """
+        running: Optional[asyncio.Task] = self._running.pop(context.task_id, None)
+        if running is not None:
+            running.cancel()
+        updater = TaskUpdater(event_queue, context.task_id, context.context_id)
+        await updater.cancel()
+
+    async def _run_crew(self, query: str, updater: TaskUpdater):
+        """
+        Run one crew, sending each task's output as an artifact as soon as it finishes.
+        The last artifact is the report.
+        """
+        async for output in self.crew_factory().astream(query):
+            await updater.add_artifact(parts=[Part(root=TextPart(text=output.raw))], name=output.name)
+            await updater.update_status(
+                TaskState.working, message=self._agent_message(updater, f"{output.agent} finished {output.name}.")
+            )
+
+    @staticmethod
+    def _agent_message(updater: TaskUpdater, text: str):
+        """
+        :return: An agent message with the given text for the task of the updater
         """
-        raise NotImplementedError
+        return updater.new_agent_message(parts=[Part(root=TextPart(text=text))])
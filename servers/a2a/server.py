@@ -35,18 +35,21 @@ from a2a.types import AgentCapabilities
 from a2a.types import AgentCard
 from a2a.types import AgentSkill
 
+from agent_executor import DEFAULT_MAX_CONCURRENT_CREWS
 from agent_executor import CrewAiAgentExecutor
 
 
 @click.command()
 @click.option("--host", "host", default="localhost")
 @click.option("--port", "port", default=9999)
-def main(host: str, port: int):
+@click.option("--max-concurrent-crews", "max_concurrent_crews", default=DEFAULT_MAX_CONCURRENT_CREWS)
+def main(host: str, port: int, max_concurrent_crews: int):
     """
     Starts the A2A server with the specified host and port.
 
     :param host: The hostname or IP address where the server will run.
     :param port: The port number on which the server will listen.
+    :param max_concurrent_crews: Crews that may run at once; further requests queue.
     """
 
     # Agent Skill describes a specific capability, function, or area of expertise the agent
@@ -67,11 +70,14 @@ def main(host: str, port: int):
         version='1.0.0',
         defaultInputModes=['text'],
         defaultOutputModes=['text'],
-        capabilities=AgentCapabilities(),
+        capabilities=AgentCapabilities(streaming=True),
         skills=[skill],
     )
 
-    request_handler = DefaultRequestHandler(agent_executor=CrewAiAgentExecutor(), task_store=InMemoryTaskStore())
+    request_handler = DefaultRequestHandler(
+        agent_executor=CrewAiAgentExecutor(max_concurrent_crews=max_concurrent_crews),
+        task_store=InMemoryTaskStore(),
+    )
 
     server = A2AStarletteApplication(agent_card=agent_card, http_handler=request_handler)
     uvicorn.run(server.build(), host=host, port=port)
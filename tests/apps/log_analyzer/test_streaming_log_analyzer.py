@@ -0,0 +1,187 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Tests for the streaming log analysis pipeline, with a stub analyzer in place of the agent network."""
+
+import gzip
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from apps.log_analyzer.streaming_log_analyzer import LogFileTailer
+from apps.log_analyzer.streaming_log_analyzer import StreamingLogAnalyzer
+
+
+def _log(*questions: str) -> str:
+    """A thinking log with one [SYSTEM] preamble and one HUMAN/AI/AGENT exchange per question."""
+    parts = ["[SYSTEM]:\nYou are a helpful agent.\n"]
+    for question in questions:
+        parts.append(f'[HUMAN]:\n{question}\n[AI]:\nanswer to {question}\n[AGENT]:\n{{"total_tokens": 7}}\n')
+    return "".join(parts)
+
+
+class _StubAnalyzer:  # pylint: disable=too-few-public-methods
+    """Thread-safe analyzer that records its inputs and the peak number of concurrent calls."""
+
+    def __init__(self, delay: float = 0.0, fail_on: str = ""):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.inputs: List[str] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, text: str) -> str:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.fail_on and self.fail_on in text:
+                raise RuntimeError("agent unavailable")
+            with self._lock:
+                self.inputs.append(text)
+            return f"analysis #{len(self.inputs)}"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _analyzer(tmp_path: Path, stub: _StubAnalyzer, **kwargs) -> StreamingLogAnalyzer:
+    kwargs.setdefault("parse_workers", 0)
+    return StreamingLogAnalyzer(
+        str(tmp_path / "logs"), stub, str(tmp_path / "checkpoint.jsonl"), on_result=lambda *_: None, **kwargs
+    )
+
+
+class TestLogFileTailer:
+    """Incremental reading and chunking of a single file."""
+
+    def test_chunks_are_released_at_the_next_human_label(self, tmp_path: Path) -> None:
+        """An entry is held until the next [HUMAN] arrives (or a flush), and carries the system prompt."""
+        path = tmp_path / "agent.log"
+        path.write_text(_log("first", "second"))
+        tailer = LogFileTailer(str(path))
+
+        held = list(tailer.poll(flush=False))
+        assert len(held) == 1
+        assert held[0][1] == "You are a helpful agent."
+        assert "first" in held[0][2] and "second" not in held[0][2]
+
+        flushed = list(tailer.poll(flush=True))
+        assert len(flushed) == 1 and "second" in flushed[0][2]
+
+    def test_only_appended_bytes_are_read_and_partial_lines_wait(self, tmp_path: Path) -> None:
+        """A later poll reads from the saved offset; a line without its newline is not split."""
+        path = tmp_path / "agent.log"
+        path.write_text(_log("first"))
+        tailer = LogFileTailer(str(path))
+        list(tailer.poll(flush=False))
+        offset = tailer.offset
+
+        with open(path, "a", encoding="utf-8") as log_file:
+            log_file.write("[HUMAN]:\nsec")
+        assert not list(tailer.poll(flush=False)) or tailer.offset > offset
+        with open(path, "a", encoding="utf-8") as log_file:
+            log_file.write("ond\n[AI]:\nok\n")
+
+        chunks = list(tailer.poll(flush=True))
+        assert "second" in chunks[-1][2]
+
+
+class TestStreamingLogAnalyzer:
+    """The whole pipeline over a directory of plain, rotated and gzipped logs."""
+
+    @staticmethod
+    def _write_logs(logs: Path) -> None:
+        logs.mkdir()
+        with gzip.open(logs / "agent.log.2.gz", "wt", encoding="utf-8") as log_file:
+            log_file.write(_log("oldest"))
+        (logs / "agent.log.1").write_text(_log("older"))
+        (logs / "agent.log").write_text(_log("newest a", "newest b"))
+
+    @pytest.mark.parametrize("parse_workers", [0, 2])
+    def test_every_entry_is_analyzed_once_oldest_first(self, tmp_path: Path, parse_workers: int) -> None:
+        """Gzipped and rotated files are read, in rotation order, inline or in the parser pool."""
+        self._write_logs(tmp_path / "logs")
+        stub = _StubAnalyzer()
+
+        stats = _analyzer(tmp_path, stub, parse_workers=parse_workers, max_in_flight=1).run()
+
+        expected = ["oldest", "older", "newest a", "newest b"]
+        assert [next(q for q in expected if f"\n{q}\n" in text) for text in stub.inputs] == expected
+        assert (stats.files, stats.analyzed, stats.failed) == (3, 4, 0)
+
+    def test_rerun_skips_checkpointed_entries(self, tmp_path: Path) -> None:
+        """A second run over the same logs sends nothing; a new entry is the only one analyzed."""
+        self._write_logs(tmp_path / "logs")
+        _analyzer(tmp_path, _StubAnalyzer()).run()
+
+        with open(tmp_path / "logs" / "agent.log", "a", encoding="utf-8") as log_file:
+            log_file.write('[HUMAN]:\nlate\n[AI]:\nok\n[AGENT]:\n{"total_tokens": 1}\n')
+        stub = _StubAnalyzer()
+        stats = _analyzer(tmp_path, stub).run()
+
+        assert len(stub.inputs) == 1 and "late" in stub.inputs[0]
+        assert stats.skipped == 4
+
+    def test_failed_analyses_are_retried_on_the_next_run(self, tmp_path: Path) -> None:
+        """A failure is counted but not checkpointed."""
+        self._write_logs(tmp_path / "logs")
+        first = _analyzer(tmp_path, _StubAnalyzer(fail_on="older")).run()
+        stub = _StubAnalyzer()
+        _analyzer(tmp_path, stub).run()
+
+        assert first.failed == 1
+        assert len(stub.inputs) == 1 and "older" in stub.inputs[0]
+
+    def test_in_flight_requests_are_bounded(self, tmp_path: Path) -> None:
+        """Requests run concurrently, but never more than max_in_flight at once."""
+        logs = tmp_path / "logs"
+        logs.mkdir()
+        (logs / "agent.log").write_text(_log(*(f"q{index}" for index in range(12))))
+        stub = _StubAnalyzer(delay=0.05)
+
+        stats = _analyzer(tmp_path, stub, max_in_flight=3).run()
+
+        assert stats.analyzed == 12
+        assert stub.peak == 3
+
+    def test_follow_mode_picks_up_appended_entries(self, tmp_path: Path) -> None:
+        """With follow=True, entries appended to a live log are analyzed until stopped."""
+        logs = tmp_path / "logs"
+        logs.mkdir()
+        (logs / "agent.log").write_text(_log("before"))
+        stub = _StubAnalyzer()
+        analyzer = _analyzer(tmp_path, stub, follow=True, poll_interval=0.02, settle_seconds=0.05)
+        stop = threading.Event()
+        runner = threading.Thread(target=analyzer.run, args=(stop,))
+        runner.start()
+        try:
+            with open(logs / "agent.log", "a", encoding="utf-8") as log_file:
+                log_file.write('[HUMAN]:\nafter\n[AI]:\nok\n[AGENT]:\n{"total_tokens": 1}\n')
+            deadline = time.monotonic() + 5
+            while len(stub.inputs) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            stop.set()
+            runner.join(timeout=5)
+
+        assert not runner.is_alive()
+        assert ["before" in stub.inputs[0], "after" in stub.inputs[1]] == [True, True]
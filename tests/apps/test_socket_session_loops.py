@@ -0,0 +1,264 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Tests for the per-client agent loops, driving simulated clients against a stub cruse() in place of the agent."""
+
+import itertools
+import threading
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from unittest.mock import patch
+
+import pytest
+
+from apps.cruse import cruse_assistant
+from apps.socket_session_loops import NEW_CHAT
+from apps.socket_session_loops import SocketSessionLoops
+
+
+class _StubCruse:
+    """Stands in for the cruse agent: each session keeps its own history, and turns take `delay` seconds."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.sessions: List[Dict[str, Any]] = []
+        self.torn_down: List[Dict[str, Any]] = []
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def set_up(self, selected_agent: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Stands in for set_up_cruse_assistant()."""
+        session = {"id": next(self._ids), "agent": selected_agent}
+        with self._lock:
+            self.sessions.append(session)
+        return session, {"history": []}
+
+    def cruse(self, session: Dict[str, Any], state: Dict[str, Any], user_input: str) -> Tuple[str, Dict[str, Any]]:
+        """Stands in for cruse(): answers with the session's agent and the input, after a delay."""
+        time.sleep(self.delay)
+        state["history"].append(user_input)
+        return f"say: {session['agent']}|{user_input}\ngui: <p>{len(state['history'])}</p>", state
+
+    def tear_down(self, session: Dict[str, Any]) -> None:
+        """Stands in for tear_down_cruse_assistant()."""
+        with self._lock:
+            self.torn_down.append(session)
+
+
+class _Client:
+    """Records what one simulated browser tab receives, and when."""
+
+    def __init__(self, sid: str):
+        self.sid = sid
+        self.received: List[Tuple[str, dict, float]] = []
+        self.event = threading.Event()
+
+    def speeches(self) -> List[str]:
+        """The update_speech payloads received so far."""
+        return [payload["data"] for name, payload, _ in self.received if name == "update_speech"]
+
+    def wait_for(self, count: int, timeout: float = 5.0) -> None:
+        """Wait until at least `count` speeches have arrived."""
+        deadline = time.monotonic() + timeout
+        while len(self.speeches()) < count and time.monotonic() < deadline:
+            self.event.wait(0.01)
+            self.event.clear()
+        assert len(self.speeches()) >= count, f"{self.sid} got {self.speeches()}"
+
+
+@pytest.fixture(name="stub")
+def fixture_stub():
+    """Patch the agent calls of cruse_assistant with a _StubCruse."""
+    stub = _StubCruse()
+    with (
+        patch.object(cruse_assistant, "cruse", side_effect=stub.cruse),
+        patch.object(cruse_assistant, "set_up_cruse_assistant", side_effect=stub.set_up),
+        patch.object(cruse_assistant, "tear_down_cruse_assistant", side_effect=stub.tear_down),
+        patch.object(cruse_assistant, "get_available_systems", return_value=["basic/default.hocon"]),
+    ):
+        yield stub
+
+
+def _cruse_loops(clients: Dict[str, _Client], **kwargs) -> SocketSessionLoops:
+    """SocketSessionLoops wired as the cruse app wires them, emitting into the simulated clients."""
+
+    def emit(name: str, payload: dict, sid: str) -> None:
+        clients[sid].received.append((name, payload, time.monotonic()))
+        clients[sid].event.set()
+
+    return SocketSessionLoops(
+        start_session=cruse_assistant.start_cruse_session,
+        run_turn=cruse_assistant.run_cruse_turn,
+        end_session=cruse_assistant.end_cruse_session,
+        emit=emit,
+        **kwargs,
+    )
+
+
+def test_clients_get_prompt_turns_and_their_own_sessions(stub: _StubCruse):
+    """N concurrent clients each get a session of their own and an answer well within a second per turn."""
+    clients = {f"sid-{number}": _Client(f"sid-{number}") for number in range(8)}
+    loops = _cruse_loops(clients)
+    latencies: List[float] = []
+    try:
+        for sid in clients:
+            loops.submit(sid, NEW_CHAT, {"system": f"agent-{sid}.hocon"})
+        for turn in range(3):
+            sent_at = time.monotonic()
+            for sid in clients:
+                loops.submit(sid, "user_input", f"{sid} turn {turn}")
+            for client in clients.values():
+                client.wait_for(turn + 1)
+                latencies.append(client.received[-1][2] - sent_at)
+    finally:
+        loops.close_all()
+
+    # The old loop slept up to two seconds before it looked at the input
+    assert max(latencies) < 0.75, latencies
+    assert len(stub.sessions) == len(clients)
+    for sid, client in clients.items():
+        assert client.speeches() == [f"agent-{sid}.hocon|{sid} turn {turn}" for turn in range(3)]
+    assert sorted(session["id"] for session in stub.torn_down) == sorted(session["id"] for session in stub.sessions)
+
+
+@pytest.mark.usefixtures("stub")
+def test_user_input_and_gui_context_make_one_turn():
+    """Events a client sends back to back reach the agent together, user input first."""
+    clients = {"sid": _Client("sid")}
+    loops = _cruse_loops(clients)
+    try:
+        loops.submit("sid", "user_input", "<form submitted>")
+        loops.submit("sid", "gui_context", {"name": "Ada"})
+        clients["sid"].wait_for(1)
+    finally:
+        loops.close_all()
+
+    assert clients["sid"].speeches() == ["basic/default.hocon|<form submitted>{'name': 'Ada'}"]
+    assert ("update_gui", {"data": "<p>1</p>"}) in [(name, payload) for name, payload, _ in clients["sid"].received]
+
+
+def test_new_chat_replaces_only_that_clients_session(stub: _StubCruse):
+    """new_chat tears down the client's session and starts the chosen system; other clients keep theirs."""
+    clients = {"a": _Client("a"), "b": _Client("b")}
+    loops = _cruse_loops(clients)
+    try:
+        loops.submit("a", "user_input", "one")
+        loops.submit("b", "user_input", "one")
+        clients["a"].wait_for(1)
+        clients["b"].wait_for(1)
+        loops.submit("a", NEW_CHAT, "other.hocon")
+        loops.submit("a", "user_input", "two")
+        loops.submit("b", "user_input", "two")
+        clients["a"].wait_for(2)
+        clients["b"].wait_for(2)
+        torn_down_while_open = list(stub.torn_down)
+    finally:
+        loops.close_all()
+
+    assert [session["agent"] for session in torn_down_while_open] == ["basic/default.hocon"]
+    assert clients["a"].speeches()[-1] == "other.hocon|two"
+    assert clients["b"].speeches()[-1] == "basic/default.hocon|two"
+
+
+def test_idle_session_is_evicted_and_restarted(stub: _StubCruse):
+    """A client silent past idle_timeout loses its session; its next input starts a new one."""
+    clients = {"sid": _Client("sid")}
+    loops = _cruse_loops(clients, idle_timeout=0.2)
+    try:
+        loops.submit("sid", "user_input", "hello")
+        clients["sid"].wait_for(1)
+        deadline = time.monotonic() + 5.0
+        while loops.active_sids and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert not loops.active_sids
+        assert len(stub.torn_down) == 1
+
+        loops.submit("sid", "user_input", "again")
+        clients["sid"].wait_for(2)
+    finally:
+        loops.close_all()
+
+    assert len(stub.sessions) == 2
+    assert clients["sid"].speeches()[-1] == "basic/default.hocon|again"
+
+
+def test_close_tears_down_and_failed_turns_keep_the_loop():
+    """A failing turn is logged and skipped; close() ends the session."""
+    ended: List[str] = []
+    turns: List[List[str]] = []
+
+    def run_turn(state, events, emit):
+        turns.append([event.data for event in events])
+        if events[0].data == "bad":
+            raise RuntimeError("agent unavailable")
+        emit("update_speech", {"data": events[0].data})
+        return state
+
+    received = threading.Event()
+    loops = SocketSessionLoops(
+        start_session=lambda data: "session",
+        run_turn=run_turn,
+        end_session=ended.append,
+        emit=lambda name, payload, sid: received.set(),
+    )
+    loops.submit("sid", "user_input", "bad")
+    time.sleep(0.1)
+    loops.submit("sid", "user_input", "good")
+    assert received.wait(5.0)
+    loops.close("sid")
+
+    deadline = time.monotonic() + 5.0
+    while not ended and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert turns == [["bad"], ["good"]]
+    assert ended == ["session"]
+    assert not loops.active_sids
+
+
+def test_ticks_run_turns_between_events():
+    """With tick_interval the loop thinks on its own, and an event wakes it before the next tick."""
+    turns: List[Tuple[float, List[str]]] = []
+    answered = threading.Event()
+
+    def run_turn(state, events, emit):
+        del emit
+        turns.append((time.monotonic(), [event.data for event in events]))
+        if events:
+            answered.set()
+        return state
+
+    loops = SocketSessionLoops(
+        start_session=lambda data: None,
+        run_turn=run_turn,
+        end_session=lambda state: None,
+        emit=lambda name, payload, sid: None,
+        tick_interval=10.0,
+    )
+    try:
+        loops.open("sid")
+        time.sleep(0.1)
+        sent_at = time.monotonic()
+        loops.submit("sid", "user_input", "hi")
+        assert answered.wait(5.0)
+    finally:
+        loops.close_all()
+
+    assert turns[0][1] == []
+    assert turns[-1][1] == ["hi"]
+    assert turns[-1][0] - sent_at < 1.0
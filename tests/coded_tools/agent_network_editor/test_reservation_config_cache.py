@@ -0,0 +1,182 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Tests for ReservationConfigCache and S3ClientPool against moto's in-process S3.
+"""
+
+import json
+import os
+import threading
+from typing import Any
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from coded_tools.agent_network_editor.reservation_config_cache import ReservationConfigCache
+from coded_tools.agent_network_editor.s3_client_pool import S3ClientPool
+
+moto = pytest.importorskip("moto")
+
+BUCKET: str = "test-reservations-bucket"
+FAKE_AWS_ENV: dict[str, str] = {
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "AWS_SESSION_TOKEN": "testing",
+    "AWS_DEFAULT_REGION": "us-east-1",
+}
+
+
+class TestReservationConfigCache(TestCase):
+    """Behavioral tests for the pooled, ETag-revalidated reservation cache."""
+
+    def setUp(self):
+        """Start a moto S3 mock with one empty bucket and a spy on get_object."""
+        env_patcher = patch.dict(os.environ, FAKE_AWS_ENV)
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+
+        mock = moto.mock_aws()
+        mock.start()
+        self.addCleanup(mock.stop)
+
+        self.s3: Any = S3ClientPool.get_client("s3")
+        self.s3.create_bucket(Bucket=BUCKET)
+
+        self.requests: list[dict[str, Any]] = []
+        real_get_object = self.s3.get_object
+
+        def spy_get_object(**kwargs):
+            self.requests.append(kwargs)
+            return real_get_object(**kwargs)
+
+        spy_patcher = patch.object(self.s3, "get_object", side_effect=spy_get_object)
+        spy_patcher.start()
+        self.addCleanup(spy_patcher.stop)
+
+    def _put(self, reservation_id: str, body: Any):
+        """Store a reservation object the way the neuro-san server lays it out."""
+        self.s3.put_object(Bucket=BUCKET, Key=f"reservations/{reservation_id}.json", Body=json.dumps(body))
+
+    def test_repeat_read_revalidates_by_etag_and_skips_the_parse(self):
+        """A second read sends If-None-Match and serves the cached object on 304."""
+        self._put("net-1", {"tools": [{"name": "front"}]})
+        cache = ReservationConfigCache()
+
+        first: dict[str, Any] = cache.get(BUCKET, "net-1")
+        with patch("coded_tools.agent_network_editor.reservation_config_cache.json.loads") as loads:
+            second: dict[str, Any] = cache.get(BUCKET, "net-1")
+            loads.assert_not_called()
+
+        self.assertIs(first, second)
+        self.assertNotIn("IfNoneMatch", self.requests[0])
+        self.assertEqual(
+            self.requests[1]["IfNoneMatch"], self.s3.head_object(Bucket=BUCKET, Key="reservations/net-1.json")["ETag"]
+        )
+
+    def test_rewritten_object_is_picked_up(self):
+        """A changed ETag makes the conditional GET return the new body."""
+        self._put("net-1", {"tools": [{"name": "old"}]})
+        cache = ReservationConfigCache()
+        cache.get(BUCKET, "net-1")
+
+        self._put("net-1", {"tools": [{"name": "new"}]})
+        self.assertEqual(cache.get(BUCKET, "net-1")["tools"][0]["name"], "new")
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Past max_entries, the least recently read reservation is dropped."""
+        for reservation_id in ("a", "b", "c"):
+            self._put(reservation_id, {"tools": []})
+        cache = ReservationConfigCache(max_entries=2)
+
+        cache.get(BUCKET, "a")
+        cache.get(BUCKET, "b")
+        cache.get(BUCKET, "a")
+        cache.get(BUCKET, "c")
+        self.assertEqual(len(cache), 2)
+
+        self.requests.clear()
+        cache.get(BUCKET, "b")
+        self.assertNotIn("IfNoneMatch", self.requests[0])
+
+    def test_zero_max_entries_disables_retention(self):
+        """max_entries <= 0 keeps nothing, so every read is unconditional."""
+        self._put("net-1", {"tools": []})
+        cache = ReservationConfigCache(max_entries=0)
+        cache.get(BUCKET, "net-1")
+        cache.get(BUCKET, "net-1")
+        self.assertEqual(len(cache), 0)
+        self.assertNotIn("IfNoneMatch", self.requests[1])
+
+    def test_missing_reservation_raises_and_drops_the_entry(self):
+        """NoSuchKey propagates as ClientError and evicts the stale cached copy."""
+        self._put("net-1", {"tools": []})
+        cache = ReservationConfigCache()
+        cache.get(BUCKET, "net-1")
+
+        self.s3.delete_object(Bucket=BUCKET, Key="reservations/net-1.json")
+        with self.assertRaises(ClientError):
+            cache.get(BUCKET, "net-1")
+        self.assertEqual(len(cache), 0)
+
+    def test_non_object_json_raises_and_is_not_cached(self):
+        """A body that decodes to a non-dict raises ValueError and caches nothing."""
+        self._put("net-1", ["not", "an", "object"])
+        cache = ReservationConfigCache()
+        with self.assertRaises(ValueError):
+            cache.get(BUCKET, "net-1")
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate_forces_an_unconditional_read(self):
+        """invalidate() drops the entry so the next read is a plain GET."""
+        self._put("net-1", {"tools": []})
+        cache = ReservationConfigCache()
+        cache.get(BUCKET, "net-1")
+        cache.invalidate(BUCKET, "net-1")
+        cache.get(BUCKET, "net-1")
+        self.assertNotIn("IfNoneMatch", self.requests[1])
+
+    def test_shared_instance_reads_its_size_from_the_environment(self):
+        """get_shared() is a process-wide singleton sized by env var."""
+        with patch.dict(os.environ, {"AGENT_RESERVATIONS_S3_CACHE_MAX_ENTRIES": "7"}):
+            shared = ReservationConfigCache.get_shared()
+        self.assertIs(shared, ReservationConfigCache.get_shared())
+        self.assertEqual(shared.max_entries, 7)
+
+    def test_shared_instance_rejects_a_non_integer_size(self):
+        """A malformed AGENT_RESERVATIONS_S3_CACHE_MAX_ENTRIES raises ValueError."""
+        with patch.dict(os.environ, {"AGENT_RESERVATIONS_S3_CACHE_MAX_ENTRIES": "lots"}):
+            with self.assertRaises(ValueError):
+                ReservationConfigCache.get_shared()
+
+    def test_client_pool_builds_one_client_across_threads(self):
+        """Concurrent cold callers all receive the one pooled client."""
+        S3ClientPool.clear_shared_clients_for_testing()
+        clients: list[Any] = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            clients.append(S3ClientPool.get_client("s3"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(client) for client in clients}), 1)
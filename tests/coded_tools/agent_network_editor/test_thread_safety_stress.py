@@ -0,0 +1,197 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Thread-safety stress tests for the Agent Network Designer's shared state:
+SharedProcessCache and SlyDataLock.
+
+These pass under the GIL too, but they exist for free-threaded interpreters
+(3.14t with PYTHON_GIL=0), where every thread below really runs in parallel.
+NEURO_SAN_STUDIO_STRESS_SCALE multiplies the iteration counts for a longer
+soak, e.g. in the py314t container. Like test_shared_process_cache.py, these
+are stdlib-only and drive their own event loops via asyncio.run().
+"""
+
+import asyncio
+import os
+import threading
+from functools import partial
+from typing import Any
+from typing import Callable
+from unittest import TestCase
+
+from coded_tools.agent_network_editor.shared_process_cache import SharedProcessCache
+from coded_tools.agent_network_editor.sly_data_lock import SlyDataLock
+
+SCALE = max(1, int(os.environ.get("NEURO_SAN_STUDIO_STRESS_SCALE", "1")))
+THREADS = 16
+
+
+def run_threads(target: Callable[[int], None], count: int = THREADS) -> list[BaseException]:
+    """Start `count` threads released together by a barrier; return whatever they raised."""
+    barrier = threading.Barrier(count)
+    errors: list[BaseException] = []
+
+    def body(index: int):
+        barrier.wait()
+        try:
+            target(index)
+        except BaseException as exception:  # pylint: disable=broad-exception-caught
+            errors.append(exception)
+
+    threads = [threading.Thread(target=body, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+    return errors
+
+
+class CountingLoader:  # pylint: disable=too-few-public-methods
+    """A loader that counts its calls, thread-safely."""
+
+    def __init__(self, build: Callable[[], Any]):
+        self.build = build
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> Any:
+        with self._lock:
+            self.calls += 1
+        return self.build()
+
+
+class TestSharedProcessCacheStress(TestCase):
+    """Many threads and event loops on one SharedProcessCache."""
+
+    def test_cold_burst_from_many_threads_loads_once(self):
+        """Threads missing together run the loader once and all get the same object."""
+        for _ in range(20 * SCALE):
+            loader = CountingLoader(lambda: {"value": 1})
+            cache: SharedProcessCache[dict[str, int]] = SharedProcessCache(loader=loader)
+            results: list[Any] = [None] * THREADS
+
+            def read(index: int, cache: SharedProcessCache, results: list[Any]):
+                results[index] = cache.get()
+
+            self.assertEqual(run_threads(partial(read, cache=cache, results=results)), [])
+            self.assertEqual(loader.calls, 1)
+            self.assertTrue(all(result is results[0] for result in results))
+
+    def test_warm_reads_never_see_a_torn_entry_while_reloading(self):
+        """Readers racing a stream of reloads only ever see values built whole."""
+        source = {"version": 0}
+        stop = threading.Event()
+
+        def loader() -> dict[str, int]:
+            version = source["version"]
+            return {"first": version, "second": version}
+
+        cache: SharedProcessCache[dict[str, int]] = SharedProcessCache(
+            loader=loader, fingerprint=lambda: source["version"]
+        )
+
+        def bump_versions():
+            for version in range(1, 500 * SCALE):
+                source["version"] = version
+            stop.set()
+
+        def read(index: int):
+            if index == 0:
+                bump_versions()
+                return
+            while not stop.is_set():
+                value = cache.peek() or cache.get()
+                if value["first"] != value["second"]:
+                    raise AssertionError(f"torn value {value}")
+
+        self.assertEqual(run_threads(read), [])
+
+    def test_aget_from_many_event_loops_shares_each_loops_load(self):
+        """Concurrent aget() bursts on per-thread loops all resolve, and leave no in-flight entries."""
+        for _ in range(5 * SCALE):
+            loader = CountingLoader(lambda: "value")
+            cache: SharedProcessCache[str] = SharedProcessCache(loader=loader)
+
+            self.assertEqual(run_threads(lambda _index, cache=cache: self._aget_burst(cache)), [])
+            # get() serializes the loads of different loops, so only the first one runs the loader
+            self.assertEqual(loader.calls, 1)
+            self.assertEqual(len(cache._loads_in_flight), 0)  # pylint: disable=protected-access
+
+    @staticmethod
+    def _aget_burst(cache: SharedProcessCache[str]):
+        async def burst() -> list[str]:
+            return await asyncio.gather(*(cache.aget() for _ in range(20)))
+
+        if asyncio.run(burst()) != ["value"] * 20:
+            raise AssertionError("aget() returned the wrong value")
+
+    def test_fills_survive_concurrent_clears(self):
+        """aget_or_fill() on many loops while another thread keeps clearing raises nothing unexpected."""
+        cache: SharedProcessCache[str] = SharedProcessCache()
+        stop = threading.Event()
+
+        async def fill() -> str:
+            await asyncio.sleep(0)
+            return "filled"
+
+        async def burst() -> list[str]:
+            return await asyncio.gather(*(cache.aget_or_fill(fill) for _ in range(10)))
+
+        def work(index: int):
+            if index == 0:
+                for _ in range(200 * SCALE):
+                    cache.clear_for_testing()
+                stop.set()
+                return
+            while not stop.is_set():
+                if asyncio.run(burst()) != ["filled"] * 10:
+                    raise AssertionError("aget_or_fill() returned the wrong value")
+
+        self.assertEqual(run_threads(work), [])
+        self.assertEqual(len(cache._loads_in_flight), 0)  # pylint: disable=protected-access
+
+
+class TestSlyDataLockStress(TestCase):
+    """Racing first calls to SlyDataLock.get_lock() on one sly_data."""
+
+    def test_racing_threads_share_one_lock(self):
+        """Every thread racing on a miss gets the same lock object back."""
+        for _ in range(50 * SCALE):
+            sly_data: dict[str, Any] = {}
+            locks: list[Any] = [None] * THREADS
+
+            def get_lock(index: int, sly_data: dict[str, Any], locks: list[Any]):
+                locks[index] = asyncio.run(SlyDataLock.get_lock(sly_data))
+
+            self.assertEqual(run_threads(partial(get_lock, sly_data=sly_data, locks=locks)), [])
+            self.assertTrue(all(lock is sly_data["lock"] for lock in locks))
+
+    def test_lock_serializes_updates_within_one_loop(self):
+        """The shared lock keeps read-modify-write updates from interleaving across awaits."""
+        sly_data: dict[str, Any] = {"count": 0}
+
+        async def increment():
+            async with await SlyDataLock.get_lock(sly_data):
+                count = sly_data["count"]
+                await asyncio.sleep(0)
+                sly_data["count"] = count + 1
+
+        async def burst():
+            await asyncio.gather(*(increment() for _ in range(100 * SCALE)))
+
+        asyncio.run(burst())
+        self.assertEqual(sly_data["count"], 100 * SCALE)
@@ -0,0 +1,210 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Tests for A2aResearchReport's pooled connections, against an A2A stub server running in this process."""
+
+import asyncio
+import threading
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Set
+from typing import Tuple
+from weakref import WeakKeyDictionary
+
+import httpx
+import pytest
+
+pytest.importorskip("a2a.server.apps")
+pytest.importorskip("uvicorn")
+
+# pylint: disable=wrong-import-position,wrong-import-order,import-error
+import uvicorn
+from a2a.client import A2AClientHTTPError
+from a2a.server.agent_execution import AgentExecutor
+from a2a.server.agent_execution import RequestContext
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.events import EventQueue
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.server.tasks import TaskUpdater
+from a2a.types import AgentCapabilities
+from a2a.types import AgentCard
+from a2a.types import Part
+from a2a.types import TextPart
+from a2a.utils import new_task
+from a2a.utils.constants import AGENT_CARD_WELL_KNOWN_PATH
+
+from coded_tools.tools.a2a_research_report import a2a_research_report
+from coded_tools.tools.a2a_research_report.a2a_research_report import A2aResearchReport
+from coded_tools.tools.a2a_research_report.a2a_research_report import _A2aConnections
+from neuro_san_studio.runner.server_worker_pool import find_free_port
+
+INVOCATIONS = 100
+
+
+class StubExecutor(AgentExecutor):
+    """Answers every topic with one status message and a one-artifact report, like the crew server."""
+
+    async def execute(self, context: RequestContext, event_queue: EventQueue):
+        """Report progress once, then attach the report and complete the task."""
+        task = new_task(context.message)
+        await event_queue.enqueue_event(task)
+        updater = TaskUpdater(event_queue, task.id, task.context_id)
+        await updater.start_work(updater.new_agent_message([Part(root=TextPart(text="Researching"))]))
+        report = f"Report on {context.get_user_input()}"
+        await updater.add_artifact([Part(root=TextPart(text=report))], name="reporting_task")
+        await updater.complete()
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue):
+        """Nothing to cancel: execute() finishes without waiting."""
+
+
+class StubServer:
+    """An A2A server on a uvicorn thread that counts agent card fetches and TCP connections."""
+
+    def __init__(self, port: int):
+        self.port = port
+        self.card_fetches = 0
+        self.connections: Set[Tuple[str, int]] = set()
+        self._server = None
+        self._thread = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            # Each TCP connection comes from its own client port
+            self.connections.add(tuple(scope["client"]))
+            if scope["path"] == AGENT_CARD_WELL_KNOWN_PATH:
+                self.card_fetches += 1
+        await self._app(scope, receive, send)
+
+    def start(self):
+        """Serve until stop()."""
+        card = AgentCard(
+            name="Stub Research Report Agent",
+            description="Answers with a fixed report",
+            url=f"http://127.0.0.1:{self.port}/",
+            version="1.0.0",
+            default_input_modes=["text"],
+            default_output_modes=["text"],
+            capabilities=AgentCapabilities(streaming=True),
+            skills=[],
+        )
+        handler = DefaultRequestHandler(agent_executor=StubExecutor(), task_store=InMemoryTaskStore())
+        # pylint: disable-next=attribute-defined-outside-init
+        self._app = A2AStarletteApplication(agent_card=card, http_handler=handler).build()
+        config = uvicorn.Config(self, host="127.0.0.1", port=self.port, log_level="warning", lifespan="off")
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+        self._thread.start()
+        deadline = time.monotonic() + 10.0
+        while not self._server.started:
+            assert time.monotonic() < deadline, "stub server did not start"
+            time.sleep(0.01)
+
+    def stop(self):
+        """Stop serving and close every connection."""
+        self._server.should_exit = True
+        self._thread.join(timeout=10.0)
+
+
+class RecordingReporter:  # pylint: disable=too-few-public-methods
+    """A progress reporter that keeps what it is sent."""
+
+    def __init__(self):
+        self.reports: List[Tuple[Dict[str, Any], str]] = []
+
+    async def async_report_progress(self, structure: Dict[str, Any], content: str = ""):
+        """Record one report."""
+        self.reports.append((structure, content))
+
+
+@pytest.fixture(name="server")
+def fixture_server(monkeypatch):
+    """A running stub server that the tool is pointed at, with the tool's connection caches empty."""
+    stub = StubServer(find_free_port())
+    stub.start()
+    monkeypatch.setattr(a2a_research_report, "BASE_URL", f"http://127.0.0.1:{stub.port}")
+    monkeypatch.setattr(_A2aConnections, "_cards", {})
+    monkeypatch.setattr(_A2aConnections, "_loops", WeakKeyDictionary())
+    yield stub
+    stub.stop()
+
+
+async def invoke(times: int, reporter: RecordingReporter = None) -> List[str]:
+    """Run the tool `times` times in a row on the current event loop."""
+    tool = A2aResearchReport()
+    results = []
+    for index in range(times):
+        args = {"topic": f"topic {index}", "progress_reporter": reporter}
+        results.append(await tool.async_invoke(args, {}))
+    return results
+
+
+def test_invocations_share_one_connection_and_card(server):
+    """A hundred reports need one agent card fetch and one TCP connection."""
+    results = asyncio.run(invoke(INVOCATIONS))
+
+    assert results == [f"Report on topic {index}" for index in range(INVOCATIONS)]
+    assert server.card_fetches == 1
+    assert len(server.connections) == 1
+
+
+def test_status_updates_are_relayed_as_progress(server):
+    """Status messages and artifacts on the way to the report reach the progress reporter."""
+    del server
+    reporter = RecordingReporter()
+
+    asyncio.run(invoke(1, reporter))
+
+    assert reporter.reports == [
+        ({"a2a_task_state": "working"}, "Researching"),
+        ({"a2a_task_state": "working", "artifact": "reporting_task"}, "Received reporting_task"),
+    ]
+
+
+def test_agent_card_is_fetched_again_after_its_ttl(server, monkeypatch):
+    """An expired agent card is fetched again."""
+    monkeypatch.setattr(a2a_research_report, "AGENT_CARD_TTL_SECONDS", 0.0)
+
+    asyncio.run(invoke(3))
+
+    assert server.card_fetches == 3
+
+
+def test_connection_error_drops_the_cached_card(server):
+    """After the server goes away the next call fails, and the one after that resolves the server afresh."""
+
+    async def run() -> str:
+        await invoke(1)
+        server.stop()
+        with pytest.raises((A2AClientHTTPError, httpx.HTTPError)):
+            await invoke(1)
+        assert not _A2aConnections._cards  # pylint: disable=protected-access
+        server.start()
+        return (await invoke(1))[0]
+
+    assert asyncio.run(run()) == "Report on topic 0"
+    assert server.card_fetches == 2
+
+
+def test_unreachable_server_is_reported(server):
+    """When no agent card can be fetched the tool says so instead of raising."""
+    server.stop()
+
+    assert asyncio.run(invoke(1)) == ["Failed to the agent card. Cannot continue."]
+    server.start()
@@ -0,0 +1,128 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Tests for VideoDescriber's keyframe sampling, on small synthetic videos.
+"""
+
+import asyncio
+import base64
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+numpy = pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from coded_tools.tools.video_describer import VideoDescriber  # noqa: E402
+from coded_tools.tools.video_frame_sampler import FrameSamplingSettings  # noqa: E402
+from coded_tools.tools.video_frame_sampler import _sample_interval  # noqa: E402
+from coded_tools.tools.video_frame_sampler import sample_frames  # noqa: E402
+
+FPS = 10
+# Three scenes of 4 seconds each: dark, bright, mid grey, with a little noise so frames are not identical.
+SCENES = (30, 220, 120)
+
+
+def write_video(path: str, seconds_per_scene: int = 4, size=(320, 240)) -> str:
+    """Write an MJPG AVI made of solid-color scenes."""
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), FPS, size)
+    rng = numpy.random.default_rng(0)
+    for level in SCENES:
+        for _ in range(seconds_per_scene * FPS):
+            frame = numpy.full((size[1], size[0], 3), level, dtype=numpy.uint8)
+            frame = numpy.clip(frame + rng.integers(-3, 4, frame.shape), 0, 255).astype(numpy.uint8)
+            writer.write(frame)
+    writer.release()
+    return path
+
+
+class TestFrameSampler(TestCase):
+    """Frames are chosen within the budget, downscaled and time-stamped."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Write the shared 12-second test video."""
+        cls.directory = tempfile.mkdtemp()
+        cls.video = write_video(os.path.join(cls.directory, "scenes.avi"))
+
+    def test_interval_sampling_spreads_the_budget_over_the_clip(self):
+        """With 4 frames for 12 seconds the rate widens to one frame every 3 seconds."""
+        frames = sample_frames(self.video, FrameSamplingSettings(interval_seconds=1.0, max_frames=4))
+
+        self.assertEqual([frame.timestamp for frame in frames], [0.0, 3.0, 6.0, 9.0])
+
+    def test_interval_sampling_without_a_known_length_halves_the_rate(self):
+        """When the frame count is unknown, the kept frames are thinned as the budget overflows."""
+        video = cv2.VideoCapture(self.video)
+        try:
+            frames = _sample_interval(video, FPS, 0, FrameSamplingSettings(interval_seconds=1.0, max_frames=5))
+        finally:
+            video.release()
+
+        self.assertLessEqual(len(frames), 5)
+        self.assertEqual([frame.timestamp for frame in frames], [0.0, 4.0, 8.0])
+
+    def test_scene_sampling_finds_the_cuts(self):
+        """The first frame and the first frame of each new scene are kept."""
+        frames = sample_frames(self.video, FrameSamplingSettings(mode="scene", max_gap_seconds=60.0))
+
+        self.assertEqual([frame.timestamp for frame in frames], [0.0, 4.0, 8.0])
+
+    def test_scene_budget_drops_the_weakest_frames(self):
+        """Over budget, gap-filler frames go before real cuts."""
+        settings = FrameSamplingSettings(mode="scene", max_gap_seconds=1.0, max_frames=3)
+
+        frames = sample_frames(self.video, settings)
+
+        self.assertEqual([frame.timestamp for frame in frames], [0.0, 4.0, 8.0])
+
+    def test_frames_are_downscaled(self):
+        """The longer side of every encoded frame is at most max_dimension."""
+        frames = sample_frames(self.video, FrameSamplingSettings(max_frames=2, max_dimension=160))
+
+        image = cv2.imdecode(numpy.frombuffer(base64.b64decode(frames[0].jpeg_base64), numpy.uint8), cv2.IMREAD_COLOR)
+        self.assertEqual(image.shape[:2], (120, 160))
+
+    def test_bad_inputs(self):
+        """A missing file and an unknown mode are rejected."""
+        with self.assertRaises(ValueError):
+            sample_frames(os.path.join(self.directory, "missing.mp4"))
+        with self.assertRaises(ValueError):
+            FrameSamplingSettings(mode="every")
+
+
+class TestVideoDescriber(TestCase):
+    """The describer sends only the sampled frames and reports their timestamps."""
+
+    def test_description_comes_with_frame_timestamps(self):
+        """Each image is preceded by its timestamp, and the timestamps are returned."""
+        video = write_video(os.path.join(tempfile.mkdtemp(), "clip.avi"), seconds_per_scene=1)
+        llm = AsyncMock()
+        llm.ainvoke.return_value.text = "Three colored scenes."
+        with patch("coded_tools.tools.video_describer.ChatOpenAI", return_value=llm):
+            result = asyncio.run(VideoDescriber().async_invoke({"file_path": video, "max_frames": 3}, {}))
+
+        self.assertEqual(result["description"], "Three colored scenes.")
+        self.assertEqual(result["frame_timestamps"], [0.0, 1.0, 2.0])
+        content = llm.ainvoke.call_args.args[0][0].content
+        self.assertEqual(sum(1 for part in content if part["type"] == "image"), 3)
+        self.assertEqual(content[1]["text"], "Frame at 0.0s")
@@ -0,0 +1,226 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""
+Tests for the warm VQA inference worker, with a fake ml-fastvlm checkout whose model "load" is counted.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from coded_tools.tools.visual_question_answering import vqa
+from coded_tools.tools.visual_question_answering.inference_worker import InferenceWorker
+from coded_tools.tools.visual_question_answering.inference_worker import InferenceWorkerError
+
+BUILDER = """
+import os
+
+def load_pretrained_model(model_path, model_base, model_name, device="cpu"):
+    with open(os.environ["LOADS_FILE"], "a", encoding="utf-8") as loads:
+        loads.write(model_path + "\\n")
+    return "tokenizer", {"path": model_path}, "processor", 2048
+"""
+
+PREDICT = """
+import argparse
+import os
+import sys
+import time
+
+from llava.model.builder import load_pretrained_model
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--model-path")
+parser.add_argument("--image-file")
+parser.add_argument("--prompt")
+args = parser.parse_args()
+if args.prompt == "crash":
+    os._exit(3)
+if args.prompt == "slow":
+    time.sleep(30)
+if args.prompt == "fail":
+    print("bad image", file=sys.stderr)
+    sys.exit(1)
+_, model, _, _ = load_pretrained_model(args.model_path, None, "fastvlm")
+print(f"{args.prompt} -> {model['path']} (pid {os.getpid()})")
+"""
+
+
+class TestInferenceWorker(TestCase):
+    """The worker keeps its model loaded, queues questions and recovers from crashes and timeouts."""
+
+    def setUp(self):
+        """Create a fake ml-fastvlm checkout and a worker for it."""
+        self.repo = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.repo, "llava", "model"))
+        for package in ("llava", os.path.join("llava", "model")):
+            with open(os.path.join(self.repo, package, "__init__.py"), "w", encoding="utf-8"):
+                pass
+        self._write(os.path.join("llava", "model", "builder.py"), BUILDER)
+        self.predict = self._write("predict.py", PREDICT)
+        self.loads_file = os.path.join(self.repo, "loads.txt")
+        env_patcher = patch.dict(os.environ, {"LOADS_FILE": self.loads_file})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        self.worker = InferenceWorker(sys.executable, repo_dir=self.repo, idle_timeout=0)
+        self.addCleanup(self.worker.close)
+
+    def _write(self, name: str, source: str) -> str:
+        path = os.path.join(self.repo, name)
+        with open(path, "w", encoding="utf-8") as script:
+            script.write(textwrap.dedent(source))
+        return path
+
+    def _ask(self, prompt: str, timeout: float = 30.0):
+        return self.worker.ask_sync(self.predict, ["--model-path", "m1", "--prompt", prompt], timeout)
+
+    def _loads(self) -> int:
+        with open(self.loads_file, "r", encoding="utf-8") as loads:
+            return len(loads.readlines())
+
+    def test_model_is_loaded_once_and_process_reused(self):
+        """Repeated questions run in the same process and load the model only for the first."""
+        first = self._ask("how many people?")
+        second = self._ask("what color?")
+
+        self.assertEqual(first["exit_code"], 0)
+        self.assertIn("how many people? -> m1", first["stdout"])
+        self.assertIn(f"(pid {self.worker.pid})", second["stdout"])
+        self.assertEqual(self._loads(), 1)
+        self.assertEqual(self.worker.starts, 1)
+
+    def test_script_failure_is_returned_not_raised(self):
+        """A failing script reports its exit code and stderr; the worker keeps running."""
+        result = self._ask("fail")
+
+        self.assertEqual((result["exit_code"], result["stderr"].strip()), (1, "bad image"))
+        self.assertEqual(self._ask("ok")["exit_code"], 0)
+        self.assertEqual(self.worker.starts, 1)
+
+    def test_crash_fails_the_question_and_restarts(self):
+        """A worker that dies mid-question fails that question; the next one gets a fresh worker."""
+        self._ask("warm up")
+        with self.assertRaises(InferenceWorkerError):
+            self._ask("crash")
+
+        self.assertEqual(self._ask("after crash")["exit_code"], 0)
+        self.assertEqual(self.worker.starts, 2)
+
+    def test_timeout_restarts_the_worker(self):
+        """A question over its timeout is abandoned and the busy worker replaced."""
+        self._ask("warm up")
+        pid = self.worker.pid
+        started = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            self._ask("slow", timeout=0.5)
+
+        self.assertLess(time.monotonic() - started, 10.0)
+        self.assertEqual(self._ask("after timeout")["exit_code"], 0)
+        self.assertNotEqual(self.worker.pid, pid)
+
+    def test_question_queued_behind_a_timeout_gets_a_fresh_worker(self):
+        """The timed-out worker is killed before the next question takes its slot, so that question succeeds."""
+        self._ask("warm up")
+        outcome = []
+        slow = threading.Thread(target=lambda: outcome.append(self._ask_catching("slow", 1.0)))
+        slow.start()
+        time.sleep(0.3)
+        try:
+            queued = self._ask("queued", timeout=30.0)
+        finally:
+            slow.join()
+
+        self.assertIsInstance(outcome[0], TimeoutError)
+        self.assertEqual(queued["exit_code"], 0)
+        self.assertIn(f"(pid {self.worker.pid})", queued["stdout"])
+        self.assertEqual(self.worker.starts, 2)
+
+    def _ask_catching(self, prompt: str, timeout: float):
+        try:
+            return self._ask(prompt, timeout)
+        except (TimeoutError, InferenceWorkerError) as exc:
+            return exc
+
+    def test_idle_worker_is_stopped(self):
+        """After the idle timeout the process exits; the next question starts a new one."""
+        self.worker.idle_timeout = 0.3
+        self._ask("warm up")
+        deadline = time.monotonic() + 10.0
+        while self.worker.pid is not None and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        self.assertIsNone(self.worker.pid)
+        self.assertEqual(self._ask("again")["exit_code"], 0)
+        self.assertEqual(self.worker.starts, 2)
+
+    def test_full_queue_is_rejected_as_busy(self):
+        """Questions beyond the concurrency limit plus the queue are refused at once."""
+        self.worker.max_queue = 0
+        self._ask("warm up")
+        slow = threading.Thread(target=self._ask_ignoring_errors, args=("slow", 1.5))
+        slow.start()
+        time.sleep(0.5)
+        try:
+            with self.assertRaisesRegex(InferenceWorkerError, "busy"):
+                self._ask("rejected")
+        finally:
+            slow.join()
+
+    def _ask_ignoring_errors(self, prompt: str, timeout: float):
+        try:
+            self._ask(prompt, timeout)
+        except (TimeoutError, InferenceWorkerError):
+            pass
+
+    def test_ask_from_different_event_loops(self):
+        """Sessions on their own event loops share the one warm worker."""
+        argv = ["--model-path", "m1", "--prompt", "loop"]
+        results = [asyncio.run(self.worker.ask(self.predict, argv, 30.0)) for _ in range(2)]
+
+        self.assertEqual([result["exit_code"] for result in results], [0, 0])
+        self.assertEqual(self.worker.starts, 1)
+        self.assertEqual(self._loads(), 1)
+
+
+class TestVisualQuestionAnswering(TestCase):
+    """The coded tool validates its input before reaching a worker."""
+
+    def test_missing_query_and_bad_extension(self):
+        """Argument errors are returned as "Error: ..." strings."""
+        tool = vqa.VisualQuestionAnswering()
+
+        self.assertEqual(tool.invoke({}, {"file_path": "a.jpg"}), "Error: No query provided.")
+        self.assertTrue(asyncio.run(tool.async_invoke({"query": "q"}, {"file_path": "a.txt"})).startswith("Error"))
+
+    def test_answer_comes_from_the_model_worker(self):
+        """A valid question is sent to the model's worker and its output returned."""
+        tool = vqa.VisualQuestionAnswering()
+        result = {"exit_code": 0, "stdout": " 14 people \n", "stderr": ""}
+        with patch.object(InferenceWorker, "ask_sync", return_value=result) as ask:
+            answer = tool.invoke({"query": "How many?"}, {"file_path": "/tmp/image.JPG"})
+
+        self.assertEqual(answer, "14 people")
+        script, argv, timeout = ask.call_args.args
+        self.assertEqual(script, vqa.PREDICT)
+        self.assertEqual(argv[argv.index("--prompt") + 1], "How many?")
+        self.assertEqual(timeout, vqa.DEFAULT_TIMEOUT)
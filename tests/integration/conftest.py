@@ -0,0 +1,35 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+# Session fixtures for the integration tests. pytest discovers this file by name.
+import pytest
+
+from neuro_san_studio.utils.llm_cassette import cassette_server_from_environment
+
+
+@pytest.fixture(scope="session", autouse=True)
+def llm_cassette():
+    """
+    Serve LLM calls from the cassette when NEURO_SAN_LLM_CASSETTE is set (record, replay or new).
+
+    The server starts before the first test, so the environment snapshot the root conftest restores
+    after each test already points OpenAI clients at it. Without the variable the tests call live LLMs.
+    """
+    server = cassette_server_from_environment()
+    yield server
+    if server is not None:
+        print(f"\nLLM cassette ({server.mode}): {server.stats()}")
+        server.stop()
@@ -14,20 +14,29 @@
 #
 # END COPYRIGHT
 
+import tempfile
+from pathlib import Path
 from unittest import TestCase
 
 from neuro_san_studio.coded_tools.file_management.read_file import ReadFile
 
 
-class TestSliceText(TestCase):
-    """Unit tests for ReadFile._slice_text."""
+class TestReadLineRange(TestCase):
+    """Unit tests for ReadFile._read_line_range."""
 
     def setUp(self):
         self.tool = ReadFile()
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.tmp_root = Path(self.tmpdir.name).resolve()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
 
     def _call(self, raw_text, start_line=1, end_line=None, max_chars=10_000):
-        """Invoke _slice_text with the given args and return the result tuple."""
-        return self.tool._slice_text(raw_text, start_line, end_line, max_chars)  # pylint: disable=protected-access
+        """Write raw_text to a file, invoke _read_line_range on it and return the result tuple."""
+        path = self.tmp_root / "file.txt"
+        path.write_bytes(raw_text.encode("utf-8"))
+        return self.tool._read_line_range(path, start_line, end_line, max_chars)  # pylint: disable=protected-access
 
     def test_full_text_returned_with_defaults(self):
         """Tests that start_line=1 and end_line=None return the full file."""
@@ -56,6 +65,12 @@ class TestSliceText(TestCase):
         content, _, _, _ = self._call(text, max_chars=5)
         self.assertEqual(content, "abcde")
 
+    def test_max_chars_counts_characters_not_bytes(self):
+        """Tests that multi-byte characters are neither split nor undercounted by the bounded read."""
+        text = "żółw\n" * 10
+        content, _, _, _ = self._call(text, max_chars=7)
+        self.assertEqual(content, "żółw\nżó")
+
     def test_empty_text(self):
         """Tests that an empty input returns empty content and zero lines."""
         content, start, end, total = self._call("")
@@ -70,6 +85,20 @@ class TestSliceText(TestCase):
         self.assertEqual(content, "hello")
         self.assertEqual((start, end, total), (1, 1, 1))
 
+    def test_crlf_line_endings_are_kept(self):
+        """Tests that CRLF files split into the same lines as LF files and keep their endings."""
+        content, start, end, total = self._call("a\r\nb\r\nc\r\n", start_line=2, end_line=2)
+        self.assertEqual(content, "b\r\n")
+        self.assertEqual((start, end, total), (2, 2, 3))
+
+    def test_non_utf8_file_is_decoded(self):
+        """Tests that a file that is not UTF-8 falls back to a single-byte encoding."""
+        path = self.tmp_root / "latin.txt"
+        path.write_bytes("caf\xe9\nna\xefve\n".encode("latin-1"))
+        content, _, _, total = self.tool._read_line_range(path, 2, None, 100)  # pylint: disable=protected-access
+        self.assertEqual(content, "naïve\n")
+        self.assertEqual(total, 2)
+
     def test_start_line_past_eof_returns_empty(self):
         """Tests that start_line beyond total_lines returns empty content with consistent bounds.
 
@@ -0,0 +1,100 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from neuro_san_studio.coded_tools.file_management.line_index import BLOCK_BYTES
+from neuro_san_studio.coded_tools.file_management.line_index import LineIndex
+
+
+class TestLineIndex(TestCase):
+    """Unit tests for LineIndex."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.tmp_root = Path(self.tmpdir.name).resolve()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _write(self, name: str, data: bytes) -> Path:
+        """Write data to a file under the temp dir and return its path."""
+        path = self.tmp_root / name
+        path.write_bytes(data)
+        return path
+
+    def test_counts_lines_across_block_boundaries(self):
+        """Tests that line starts are exact for lines that straddle or end on block boundaries."""
+        lines = [f"line {number:06d} {'x' * (number % 97)}\n".encode("utf-8") for number in range(1, 20_001)]
+        path = self._write("many.txt", b"".join(lines))
+        self.assertGreater(path.stat().st_size, 8 * BLOCK_BYTES)
+
+        index = LineIndex.build(str(path))
+
+        self.assertEqual(index.total_lines, 20_000)
+        with open(path, "rb") as file:
+            for number in (1, 2, 999, 7_777, 15_000, 20_000):
+                text = index.read_lines(file, number, number, 1_000)
+                self.assertEqual(text, lines[number - 1].decode("utf-8"))
+            self.assertEqual(index.line_start(file, 20_001), path.stat().st_size)
+
+    def test_newline_on_block_boundary(self):
+        """Tests a newline that is the last byte of a block."""
+        first = b"a" * (BLOCK_BYTES - 1) + b"\n"
+        path = self._write("edge.txt", first + b"second\n")
+
+        index = LineIndex.build(str(path))
+
+        with open(path, "rb") as file:
+            self.assertEqual(index.line_start(file, 2), BLOCK_BYTES)
+            self.assertEqual(index.read_lines(file, 2, 2, 100), "second\n")
+
+    def test_total_lines_without_trailing_newline(self):
+        """Tests that a last line without a newline counts, and an empty file has no lines."""
+        self.assertEqual(LineIndex.build(str(self._write("a.txt", b"a\nb"))).total_lines, 2)
+        self.assertEqual(LineIndex.build(str(self._write("b.txt", b"a\nb\n"))).total_lines, 2)
+        self.assertEqual(LineIndex.build(str(self._write("c.txt", b""))).total_lines, 0)
+
+    def test_read_is_bounded_by_max_chars(self):
+        """Tests that a capped read of a long line reads at most 4 bytes per character."""
+        path = self._write("long.txt", b"y" * (4 * BLOCK_BYTES) + b"\n")
+        index = LineIndex.build(str(path))
+
+        with open(path, "rb") as file:
+            with patch.object(file, "read", wraps=file.read) as read:
+                text = index.read_lines(file, 1, 1, 10)
+
+        self.assertEqual(text, "y" * 10)
+        self.assertEqual(read.call_args.args, (40,))
+
+    def test_for_file_reuses_index_until_file_changes(self):
+        """Tests that the cached index is returned while size and mtime match, and rebuilt after."""
+        path = self._write("cached.txt", b"a\nb\n")
+
+        first = LineIndex.for_file(path)
+        self.assertIs(LineIndex.for_file(path), first)
+
+        path.write_bytes(b"a\nb\nc\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, first.mtime_ns + 1_000_000_000))
+        rebuilt = LineIndex.for_file(path)
+
+        self.assertIsNot(rebuilt, first)
+        self.assertEqual(rebuilt.total_lines, 3)
@@ -0,0 +1,169 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+from typing import Any
+from unittest import IsolatedAsyncioTestCase
+
+from neuro_san_studio.coded_tools.agent_caller import AgentCaller
+from neuro_san_studio.coded_tools.agent_fan_out import AgentCall
+from neuro_san_studio.coded_tools.agent_fan_out import AgentFanOut
+
+
+class FakeAgentCaller(AgentCaller):
+    """AgentCaller that answers with tool_args["answer"] after tool_args["delay"] seconds."""
+
+    def __init__(self, name: str = "fake_agent"):
+        self.name = name
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.cancelled = 0
+
+    def get_name(self) -> str:
+        return self.name
+
+    async def call_agent(self, tool_args: dict[str, Any], sly_data: dict[str, Any] = None) -> str:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(tool_args.get("delay", 0.0))
+            if "error" in tool_args:
+                raise RuntimeError(tool_args["error"])
+            return tool_args.get("answer", "")
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+
+def make_calls(caller: AgentCaller, *delays: float) -> list[AgentCall]:
+    """One call per delay, answering with its own index."""
+    return [AgentCall(caller, {"delay": delay, "answer": str(index)}) for index, delay in enumerate(delays)]
+
+
+class TestAgentFanOut(IsolatedAsyncioTestCase):
+    """Unit tests for AgentFanOut."""
+
+    async def test_results_arrive_in_completion_order(self):
+        """Tests that as_completed yields the fastest call first and keeps each call's index."""
+        caller = FakeAgentCaller()
+        fan_out = AgentFanOut()
+
+        results = [result async for result in fan_out.as_completed(make_calls(caller, 0.2, 0.0, 0.1))]
+
+        self.assertEqual([result.index for result in results], [1, 2, 0])
+        self.assertEqual([result.response for result in results], ["1", "2", "0"])
+        self.assertTrue(all(result.ok for result in results))
+
+    async def test_concurrency_is_capped(self):
+        """Tests that no more than max_concurrency calls run at once."""
+        caller = FakeAgentCaller()
+        fan_out = AgentFanOut(max_concurrency=2)
+
+        results = await fan_out.gather(make_calls(caller, *([0.01] * 6)))
+
+        self.assertEqual(len(results), 6)
+        self.assertEqual(caller.peak_in_flight, 2)
+
+    async def test_semaphore_is_shared_across_fan_outs(self):
+        """Tests that concurrent fan-outs through one instance share its limit."""
+        caller = FakeAgentCaller()
+        fan_out = AgentFanOut(max_concurrency=3)
+
+        await asyncio.gather(*(fan_out.gather(make_calls(caller, *([0.01] * 4))) for _ in range(3)))
+
+        self.assertEqual(caller.peak_in_flight, 3)
+
+    async def test_quorum_cancels_stragglers(self):
+        """Tests that gather returns once the quorum is met and cancels the calls still running."""
+        caller = FakeAgentCaller()
+        fan_out = AgentFanOut()
+
+        results = await fan_out.gather(make_calls(caller, 0.0, 0.01, 5.0, 5.0), quorum=2)
+
+        self.assertEqual(sorted(result.index for result in results), [0, 1])
+        self.assertEqual(caller.cancelled, 2)
+        self.assertEqual(caller.in_flight, 0)
+
+    async def test_quorum_counts_only_accepted_results(self):
+        """Tests that results rejected by accept are returned but do not count towards the quorum."""
+        caller = FakeAgentCaller()
+        calls = make_calls(caller, 0.0, 0.05, 0.1, 5.0)
+        fan_out = AgentFanOut()
+
+        results = await fan_out.gather(calls, quorum=1, accept=lambda result: result.response == "2")
+
+        self.assertEqual([result.index for result in results], [0, 1, 2])
+        self.assertEqual(caller.cancelled, 1)
+
+    async def test_errors_are_returned_not_raised(self):
+        """Tests that a failing call is reported in its result and does not stop the others."""
+        caller = FakeAgentCaller()
+        calls = [AgentCall(caller, {"error": "boom"}), AgentCall(caller, {"answer": "fine"})]
+
+        results = await AgentFanOut().gather(calls)
+
+        by_index = {result.index: result for result in results}
+        self.assertIsInstance(by_index[0].error, RuntimeError)
+        self.assertEqual(by_index[1].response, "fine")
+
+    async def test_call_timeout(self):
+        """Tests that a call past call_timeout is cancelled and reported with a TimeoutError."""
+        caller = FakeAgentCaller()
+        fan_out = AgentFanOut(call_timeout=0.05)
+
+        results = await fan_out.gather(make_calls(caller, 0.0, 5.0))
+
+        by_index = {result.index: result for result in results}
+        self.assertTrue(by_index[0].ok)
+        self.assertIsInstance(by_index[1].error, TimeoutError)
+        self.assertGreaterEqual(by_index[1].latency_seconds, 0.05)
+        self.assertEqual(caller.cancelled, 1)
+
+    async def test_overall_timeout_returns_partial_results(self):
+        """Tests that the fan-out deadline reports unfinished and never-started calls as timed out."""
+        caller = FakeAgentCaller()
+        fan_out = AgentFanOut(max_concurrency=1, timeout=0.1)
+
+        results = await fan_out.gather(make_calls(caller, 0.0, 5.0, 0.0))
+
+        self.assertEqual([result.index for result in results], [0, 1, 2])
+        self.assertTrue(results[0].ok)
+        self.assertIsInstance(results[1].error, TimeoutError)
+        self.assertGreater(results[1].latency_seconds, 0.0)
+        self.assertIsInstance(results[2].error, TimeoutError)
+        self.assertEqual(results[2].latency_seconds, 0.0)
+        self.assertEqual(caller.in_flight, 0)
+
+    async def test_latency_summary_per_agent(self):
+        """Tests that latencies are recorded per agent name."""
+        fast = FakeAgentCaller("fast")
+        slow = FakeAgentCaller("slow")
+        fan_out = AgentFanOut()
+
+        await fan_out.gather(make_calls(fast, 0.0, 0.0) + make_calls(slow, 0.05))
+
+        summary = fan_out.latency_summary()
+        self.assertEqual(summary["fast"]["count"], 2)
+        self.assertEqual(summary["slow"]["count"], 1)
+        self.assertGreaterEqual(summary["slow"]["max"], 0.05)
+        self.assertLess(summary["fast"]["max"], summary["slow"]["max"])
+
+    def test_invalid_concurrency(self):
+        """Tests that max_concurrency below 1 is rejected."""
+        with self.assertRaises(ValueError):
+            AgentFanOut(max_concurrency=0)
@@ -19,28 +19,47 @@
 # pylint: disable=protected-access
 
 import asyncio
+import threading
+import time
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
 from requests.exceptions import HTTPError
 
 from neuro_san_studio.coded_tools import confluence_rag
+from neuro_san_studio.coded_tools.confluence_rag import AttachmentExtractor
 from neuro_san_studio.coded_tools.confluence_rag import ConfluenceRag
+from neuro_san_studio.coded_tools.confluence_rag import ConfluenceSyncState
 
 BASE_URL = "https://your-domain.atlassian.net/wiki"
 
 
-def _page(page_id: str, title: str = "Page") -> dict:
+def _page(page_id: str, title: str = "Page", version: int = 1, text: str = "Page text") -> dict:
     """Create a representative Confluence API page."""
     return {
         "id": page_id,
         "title": title,
-        "body": {"storage": {"value": "<h1>Heading</h1><p>Page text</p>"}},
-        "version": {"when": "2026-08-01T12:00:00Z"},
+        "body": {"storage": {"value": f"<h1>Heading</h1><p>{text}</p>"}},
+        "version": {"when": "2026-08-01T12:00:00Z", "number": version},
         "_links": {"webui": f"/spaces/TEST/pages/{page_id}"},
     }
 
 
+def _space(pages: dict) -> MagicMock:
+    """A Confluence client serving *pages* (page id -> page) from space TEST."""
+    confluence = MagicMock()
+    confluence.get_all_pages_from_space.side_effect = lambda **kwargs: list(pages.values())[kwargs["start"] :]
+    confluence.get_page_by_id.side_effect = lambda page_id, expand: pages.get(page_id)
+    return confluence
+
+
+def _upper(content: bytes, title: str, media_type: str, ocr_languages: str | None) -> str:
+    """Picklable stand-in for attachment extraction in a worker process."""
+    return f"{title}:{content.decode().upper()}:{media_type}:{ocr_languages}"
+
+
 def test_get_pages_paginates_and_deduplicates_explicit_page_ids():
     """Space pages are paginated and duplicate explicit IDs are not fetched twice."""
     confluence = MagicMock()
@@ -57,6 +76,49 @@ def test_get_pages_paginates_and_deduplicates_explicit_page_ids():
     confluence.get_page_by_id.assert_called_once_with(page_id="4", expand="body.storage,version")
 
 
+def test_sync_documents_fetches_only_changed_pages():
+    """A sync lists versions, fetches changed pages only and reports changed and deleted pages as stale."""
+    pages = {"1": _page("1"), "2": _page("2", version=3), "3": _page("3")}
+    tool = object.__new__(ConfluenceRag)
+    state = ConfluenceSyncState(path="unused", pages={"1": 1, "2": 2, "9": 1})
+    loader_args = {"url": BASE_URL, "space_key": "TEST", "limit": 50, "max_pages": 100}
+
+    with patch.object(ConfluenceRag, "_create_client", return_value=_space(pages)) as create_client:
+        docs, stale = tool._sync_documents_sync(loader_args, state)
+
+    assert sorted(doc.metadata["id"] for doc in docs) == ["2", "3"]
+    assert stale == {"2", "3", "9"}
+    assert state.pages == {"1": 1, "2": 3, "3": 1}
+    confluence = create_client.return_value
+    assert confluence.get_all_pages_from_space.call_args.kwargs["expand"] == "version"
+    assert sorted(call.kwargs["page_id"] for call in confluence.get_page_by_id.call_args_list) == ["2", "3"]
+
+
+def test_sync_vector_store_replaces_only_stale_chunks(tmp_path):
+    """Unchanged pages keep their embedded chunks; changed pages are re-embedded and deleted pages dropped."""
+    pages = {"1": _page("1", text="first"), "2": _page("2", text="second"), "3": _page("3", text="third")}
+    tool = object.__new__(ConfluenceRag)
+    tool.embeddings = DeterministicFakeEmbedding(size=8)
+    tool.save_vector_store = False
+    tool.abs_vector_store_path = str(tmp_path / "store.json")
+    loader_args = {"url": BASE_URL, "space_key": "TEST", "limit": 50, "max_pages": 100}
+
+    with (
+        patch.object(ConfluenceRag, "_create_client", side_effect=lambda args: _space(pages)),
+        patch.object(ConfluenceRag, "split_documents", side_effect=lambda docs: docs),
+    ):
+        first = asyncio.run(tool.sync_vector_store(loader_args))
+        unchanged_ids = {key for key, record in first.store.items() if record["metadata"]["id"] == "1"}
+        pages["2"] = _page("2", version=2, text="second, edited")
+        del pages["3"]
+        second = asyncio.run(tool.sync_vector_store(loader_args))
+
+    texts = {record["metadata"]["id"]: record["text"] for record in second.store.values()}
+    assert texts == {"1": "Heading first", "2": "Heading second, edited"}
+    assert unchanged_ids <= set(second.store)
+    assert ConfluenceSyncState.load(str(tmp_path / "store.sync.json")).pages == {"1": 1, "2": 2}
+
+
 def test_page_to_document_converts_html_and_preserves_metadata():
     """Page content and metadata retain the previous loader's output shape."""
     document = object.__new__(ConfluenceRag)._page_to_document(
@@ -156,6 +218,72 @@ def test_load_attachment_texts_downloads_and_extracts_supported_attachment():
     extract.assert_called_once_with(b"pdf bytes", "notes.pdf", "application/pdf", None)
 
 
+def test_load_attachment_texts_reuses_cached_text_of_unchanged_version():
+    """An attachment whose id and version are cached is neither downloaded nor extracted again."""
+    confluence = MagicMock()
+    confluence.get_attachments_from_content.return_value = {
+        "results": [
+            {
+                "id": "att7",
+                "version": {"number": 2},
+                "title": "notes.pdf",
+                "metadata": {"mediaType": "application/pdf"},
+                "_links": {"download": "/download/notes.pdf"},
+            }
+        ]
+    }
+    extract = MagicMock()
+    extractor = AttachmentExtractor(extract, cache={"att7:2:": {"page": "42", "text": "Cached text"}})
+
+    texts = object.__new__(ConfluenceRag)._load_attachment_texts(confluence, BASE_URL, "42", None, extractor)
+
+    assert texts == ["\nnotes.pdf\nCached text"]
+    confluence.request.assert_not_called()
+    extract.assert_not_called()
+    assert extractor.used_keys == {"att7:2:"}
+
+
+def test_attachment_extractor_limits_concurrency_per_kind():
+    """No more extractions of one kind run at once than its limit allows."""
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def extract(content, title, media_type, ocr_languages):  # pylint: disable=unused-argument
+        with lock:
+            running.append(title)
+            peak.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.remove(title)
+        return title
+
+    extractor = AttachmentExtractor(extract, limits={"image": 2})
+    threads = [
+        threading.Thread(target=extractor.extract, args=(b"", f"scan{index}.png", "image/png", None))
+        for index in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 2
+
+
+@pytest.mark.integration
+def test_attachment_extractor_runs_in_worker_processes():
+    """With workers, extraction runs in a separate process and returns its text.
+
+    Marked integration: the spawned worker re-imports this module and the langchain stack behind it, which
+    takes seconds, and far longer when the test runs under xdist.
+    """
+    with AttachmentExtractor(_upper, workers=1) as extractor:
+        text = extractor.extract(b"abc", "notes.docx", "", "eng")
+
+    assert text == "notes.docx:ABC::eng"
+
+
 def test_load_attachment_texts_skips_extraction_failure(caplog):
     """One unreadable attachment does not prevent later attachments from being extracted."""
     confluence = MagicMock()
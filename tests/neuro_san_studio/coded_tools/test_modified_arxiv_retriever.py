@@ -246,6 +246,92 @@ class TestModifiedArxivRetriever:
             with pytest.raises(ValueError, match="weird"):
                 asyncio.run(strict._aload_single(result, session, asyncio.Semaphore(1)))
 
+    # --- text cache and shared downloads ---------------------------------- #
+    def _slow_session(self, started, release, read_bytes=b"%PDF"):
+        """Build a fake ClientSession whose responses wait for `release` after setting `started`."""
+        session = MagicMock(name="session")
+
+        async def read():
+            started.set()
+            await release.wait()
+            return read_bytes
+
+        def get(url):  # pylint: disable=unused-argument
+            response = self._response(read_bytes=read_bytes)
+            response.read = AsyncMock(side_effect=read)
+            return self._acm(response)
+
+        session.get = MagicMock(side_effect=get)
+        return session
+
+    def test_warm_cache_skips_download_and_parse(self, tmp_path):
+        """A paper version already in the cache is served without downloading or parsing it again."""
+        retriever = ModifiedArxivRetriever(cache_dir=str(tmp_path), doc_content_chars_max=100)
+        result = self._make_result(entry_id="http://arxiv.org/abs/2301.01234v2")
+        session = self._session_returning(self._response())
+        with patch(f"{MODULE}.PdfUtils.parse_pdf_bytes", return_value="full text") as parse:
+            first = asyncio.run(retriever._aload_single(result, session, asyncio.Semaphore(1)))
+            offline = MagicMock(name="session")
+            offline.get.side_effect = AssertionError("the warm cache must not download")
+            second = asyncio.run(retriever._aload_single(result, offline, asyncio.Semaphore(1)))
+        assert first.page_content == second.page_content == "full text"
+        parse.assert_called_once()
+
+    def test_unversioned_entry_is_not_cached(self, tmp_path):
+        """An entry id without a version may change, so its text is downloaded every time."""
+        retriever = ModifiedArxivRetriever(cache_dir=str(tmp_path))
+        result = self._make_result(entry_id="http://arxiv.org/abs/2301.01234")
+        with patch(f"{MODULE}.PdfUtils.parse_pdf_bytes", return_value="text") as parse:
+            for _ in range(2):
+                session = self._session_returning(self._response())
+                asyncio.run(retriever._aload_single(result, session, asyncio.Semaphore(1)))
+        assert parse.call_count == 2
+        assert not list(tmp_path.iterdir())
+
+    def test_concurrent_requests_share_one_download(self):
+        """Requests for the same paper version while it is downloading wait for that download."""
+        retriever = ModifiedArxivRetriever()
+        result = self._make_result(entry_id="http://arxiv.org/abs/2301.05555v1")
+
+        async def run():
+            started, release = asyncio.Event(), asyncio.Event()
+            session = self._slow_session(started, release)
+            first = asyncio.ensure_future(retriever._aload_single(result, session, asyncio.Semaphore(2)))
+            await started.wait()
+            second = asyncio.ensure_future(retriever._aload_single(result, session, asyncio.Semaphore(2)))
+            await asyncio.sleep(0.01)
+            release.set()
+            return await asyncio.gather(first, second), session
+
+        with patch(f"{MODULE}.PdfUtils.parse_pdf_bytes", return_value="shared text") as parse:
+            (first, second), session = asyncio.run(run())
+        assert first.page_content == second.page_content == "shared text"
+        session.get.assert_called_once()
+        parse.assert_called_once()
+
+    def test_waiter_downloads_itself_when_the_download_is_cancelled(self):
+        """Cancelling the downloading request hands the download over to a waiting request."""
+        retriever = ModifiedArxivRetriever()
+        result = self._make_result(entry_id="http://arxiv.org/abs/2301.06666v1")
+
+        async def run():
+            started, release = asyncio.Event(), asyncio.Event()
+            session = self._slow_session(started, release)
+            first = asyncio.ensure_future(retriever._aload_single(result, session, asyncio.Semaphore(2)))
+            await started.wait()
+            started.clear()
+            second = asyncio.ensure_future(retriever._aload_single(result, session, asyncio.Semaphore(2)))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            await started.wait()
+            release.set()
+            return await second, session
+
+        with patch(f"{MODULE}.PdfUtils.parse_pdf_bytes", return_value="text"):
+            second, session = asyncio.run(run())
+        assert second.page_content == "text"
+        assert session.get.call_count == 2
+
     # --- _build_metadata() ------------------------------------------------ #
     def test_build_metadata_minimal(self):
         """Default metadata holds only the five core fields with formatted values."""
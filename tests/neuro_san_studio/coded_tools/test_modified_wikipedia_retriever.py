@@ -14,6 +14,8 @@
 #
 # END COPYRIGHT
 
+import threading
+import time
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
@@ -23,6 +25,7 @@ import pytest
 
 from neuro_san_studio.coded_tools.modified_wikipedia_retriever import WIKIPEDIA_MAX_QUERY_LENGTH
 from neuro_san_studio.coded_tools.modified_wikipedia_retriever import ModifiedWikipediaRetriever
+from neuro_san_studio.coded_tools.modified_wikipedia_retriever import WikipediaPageCache
 
 MODULE = "neuro_san_studio.coded_tools.modified_wikipedia_retriever"
 
@@ -35,18 +38,52 @@ class DisambiguationError(Exception):
     """Fake wikipedia DisambiguationError."""
 
 
+PAGES = {
+    "First": SimpleNamespace(content="first content", summary="first summary", url="https://example.com/first"),
+    "Second": SimpleNamespace(content="second content", summary="second summary", url="https://example.com/second"),
+}
+
+
+class CountingPage:
+    """A fake wikipedia page that counts how often its content is loaded, as wikipedia 1.4.0 loads it."""
+
+    def __init__(self, content: str, revision_id: int):
+        self.pageid = "42"
+        self._article = (content, revision_id)
+        self.summary = f"{content} summary"
+        self.url = "https://example.com/page"
+        self.content_loads = 0
+        self._content = ""
+        self._revision_id = None
+
+    @property
+    def content(self) -> str:
+        """The page text, loaded once along with the revision id; loading it is the expensive request."""
+        if not self._content:
+            self.content_loads += 1
+            self._content, self._revision_id = self._article
+        return self._content
+
+    @property
+    def revision_id(self) -> int:
+        """Like the library, checks an attribute that is never set, so it always loads the content."""
+        if not getattr(self, "_revid", False):
+            _ = self.content
+        return self._revision_id
+
+
+def _revision_response(revision_id: int) -> dict:
+    """The API response to a prop=revisions&rvprop=ids query for page 42."""
+    return {"query": {"pages": {"42": {"pageid": 42, "revisions": [{"revid": revision_id}]}}}}
+
+
 @pytest.fixture(name="wikipedia")
 def wikipedia_fixture() -> SimpleNamespace:
-    """Create a mocked wikipedia module."""
+    """Create a mocked wikipedia module; pages are looked up by title, since they are fetched concurrently."""
     return SimpleNamespace(
         set_lang=Mock(),
         search=Mock(return_value=["First", "Second"]),
-        page=Mock(
-            side_effect=[
-                SimpleNamespace(content="first content", summary="first summary", url="https://example.com/first"),
-                SimpleNamespace(content="second content", summary="second summary", url="https://example.com/second"),
-            ]
-        ),
+        page=Mock(side_effect=lambda title, auto_suggest: PAGES[title]),
         exceptions=SimpleNamespace(PageError=PageError, DisambiguationError=DisambiguationError),
     )
 
@@ -85,7 +122,13 @@ class TestModifiedWikipediaRetriever:
     @pytest.mark.parametrize("error", [PageError(), DisambiguationError()])
     def test_load_skips_unavailable_pages(self, wikipedia: SimpleNamespace, error: Exception):
         """Missing and ambiguous pages are skipped."""
-        wikipedia.page.side_effect = [error, SimpleNamespace(content="ok", summary="summary", url="source")]
+
+        def page(title: str, auto_suggest: bool) -> SimpleNamespace:  # pylint: disable=unused-argument
+            if title == "First":
+                raise error
+            return SimpleNamespace(content="ok", summary="summary", url="source")
+
+        wikipedia.page.side_effect = page
         retriever = ModifiedWikipediaRetriever(top_k_results=2)
 
         with patch.object(retriever, "_get_wikipedia_client", return_value=wikipedia):
@@ -112,3 +155,63 @@ class TestModifiedWikipediaRetriever:
         with patch.dict("sys.modules", {"wikipedia": None}):
             with pytest.raises(ImportError, match="pip install wikipedia"):
                 retriever.load("query")
+
+    def test_pages_are_fetched_concurrently_within_the_limit(self, wikipedia: SimpleNamespace):
+        """Pages are fetched in parallel, at most max_concurrency at once, and keep the search order."""
+        titles = [f"Page {index}" for index in range(6)]
+        wikipedia.search.return_value = titles
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def page(title: str, auto_suggest: bool) -> SimpleNamespace:  # pylint: disable=unused-argument
+            with lock:
+                running.append(title)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(title)
+            return SimpleNamespace(content=title, summary="summary", url="source")
+
+        wikipedia.page.side_effect = page
+        retriever = ModifiedWikipediaRetriever(top_k_results=6, max_concurrency=3)
+
+        with patch.object(retriever, "_get_wikipedia_client", return_value=wikipedia):
+            documents = retriever.load("query")
+
+        assert [document.metadata["title"] for document in documents] == titles
+        assert max(peak) == 3
+
+    def test_fresh_cached_page_is_not_fetched(self, wikipedia: SimpleNamespace, tmp_path):
+        """Within the TTL a cached page is served without any request for it."""
+        retriever = ModifiedWikipediaRetriever(top_k_results=1, cache_dir=str(tmp_path))
+        wikipedia.page.side_effect = lambda title, auto_suggest: CountingPage("cached text", revision_id=7)
+
+        with patch.object(retriever, "_get_wikipedia_client", return_value=wikipedia):
+            first = retriever.load("query")
+            second = retriever.load("query")
+
+        assert first == second
+        assert second[0].page_content == "cached text"
+        assert wikipedia.page.call_count == 1
+
+    def test_stale_page_is_revalidated_by_revision(self, wikipedia: SimpleNamespace, tmp_path):
+        """After the TTL an unchanged revision reuses the cached content; a new revision is fetched."""
+        retriever = ModifiedWikipediaRetriever(top_k_results=1, cache_dir=str(tmp_path), cache_ttl_seconds=0)
+        original = CountingPage("original", revision_id=1)
+        unchanged = CountingPage("original", revision_id=1)
+        edited = CountingPage("edited", revision_id=2)
+        wikipedia.page.side_effect = [original, unchanged, edited]
+        wikipedia.wikipedia = SimpleNamespace(
+            _wiki_request=Mock(side_effect=[_revision_response(1), _revision_response(2)])
+        )
+
+        with patch.object(retriever, "_get_wikipedia_client", return_value=wikipedia):
+            contents = [retriever.load("query")[0].page_content for _ in range(3)]
+
+        assert contents == ["original", "original", "edited"]
+        assert (original.content_loads, unchanged.content_loads, edited.content_loads) == (1, 0, 1)
+        wikipedia.wikipedia._wiki_request.assert_called_with(  # pylint: disable=protected-access
+            {"prop": "revisions", "rvprop": "ids", "pageids": "42"}
+        )
+        assert WikipediaPageCache(str(tmp_path), 0).get("en", "First")["revision_id"] == 2
@@ -0,0 +1,74 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Tests for CompressedTextCache."""
+
+import gzip
+import os
+
+from neuro_san_studio.coded_tools.utils.compressed_text_cache import CompressedTextCache
+
+
+class TestCompressedTextCache:
+    """Round trips, least-recently-used eviction and the disabled cache."""
+
+    def test_text_round_trips_compressed(self, tmp_path):
+        """Stored text is read back unchanged from a gzip file smaller than the text."""
+        cache = CompressedTextCache(str(tmp_path), max_bytes=1_000_000)
+        text = "attention is all you need " * 1000
+
+        cache.put("2301.01234v1", text)
+
+        assert cache.get("2301.01234v1") == text
+        assert cache.get("2301.01234v2") is None
+        (entry,) = tmp_path.iterdir()
+        assert entry.stat().st_size < len(text) / 10
+        assert gzip.decompress(entry.read_bytes()).decode("utf-8") == text
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        """Beyond the size bound, the entries read or written longest ago are removed first."""
+        texts = {key: os.urandom(400).hex() for key in ("a", "b", "c")}
+        one_entry = len(gzip.compress(texts["a"].encode("utf-8")))
+        cache = CompressedTextCache(str(tmp_path), max_bytes=int(one_entry * 2.5))
+        cache.put("a", texts["a"])
+        cache.put("b", texts["b"])
+        for age, name in enumerate(sorted(tmp_path.iterdir(), key=lambda path: path.stat().st_mtime)):
+            os.utime(name, (1000 + age, 1000 + age))
+        assert cache.get("a") == texts["a"]
+
+        cache.put("c", texts["c"])
+
+        assert cache.get("a") == texts["a"]
+        assert cache.get("b") is None
+        assert cache.get("c") == texts["c"]
+
+    def test_zero_size_disables_the_cache(self, tmp_path):
+        """With max_bytes 0 nothing is written or read."""
+        cache = CompressedTextCache(str(tmp_path / "cache"), max_bytes=0)
+
+        cache.put("key", "text")
+
+        assert cache.get("key") is None
+        assert not (tmp_path / "cache").exists()
+
+    def test_corrupt_entry_reads_as_absent(self, tmp_path):
+        """A truncated or foreign file is a cache miss, not an error."""
+        cache = CompressedTextCache(str(tmp_path), max_bytes=1_000_000)
+        cache.put("key", "text")
+        (entry,) = tmp_path.iterdir()
+        entry.write_bytes(b"not gzip")
+
+        assert cache.get("key") is None
@@ -0,0 +1,269 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Tests for BulkAgentNetworkExporter (shared dependency walk, parallel archive builds, both output shapes)."""
+
+import json
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from neuro_san_studio.commands.export_networks import ExportCommand
+from neuro_san_studio.discovery.dependency_analyzer import DependencyAnalyzer
+from neuro_san_studio.exporter import bulk_exporter
+from neuro_san_studio.exporter.bulk_exporter import BulkAgentNetworkExporter
+from neuro_san_studio.utils.network_archive import BULK_EXPORT_MANIFEST
+from neuro_san_studio.utils.network_archive import MAX_ARCHIVE_ENTRIES
+
+
+def _build_project(project_dir: Path, shared_files: int = 1) -> None:
+    """Two networks under group `team` that both call a shared sub-network whose coded tool is
+    the `coded_tools/shared` package, plus one no-deps network under group `basic`."""
+    registries = project_dir / "registries"
+    (registries / "team").mkdir(parents=True)
+    (registries / "basic").mkdir(parents=True)
+    (registries / "manifest.hocon").write_text(
+        '{\n    "team/alpha.hocon": true,\n    "team/beta.hocon": true,\n    "basic/plain.hocon": true,\n}\n'
+    )
+    shared = project_dir / "coded_tools" / "shared"
+    shared.mkdir(parents=True)
+    (shared / "__init__.py").write_text("")
+    (shared / "lookup.py").write_text("class Lookup:\n    pass\n" * 50)
+    for index in range(1, shared_files):
+        (shared / f"extra_{index}.py").write_text(f"VALUE = {index}\n" * 40)
+    (registries / "helper.hocon").write_text(
+        '{ "tools": [ { "name": "f", "class": "openai" }, { "name": "l", "class": "shared.Lookup" } ] }\n'
+    )
+    for name in ("alpha", "beta"):
+        (registries / "team" / f"{name}.hocon").write_text(
+            f'{{ "tools": [ {{ "name": "{name}", "class": "openai", "tools": ["/helper"] }} ] }}\n'
+        )
+    (registries / "basic" / "plain.hocon").write_text('{ "tools": [ { "name": "f", "class": "openai" } ] }\n')
+
+
+class TestBulkExport:
+    """Per-network and combined bulk exports."""
+
+    def test_per_network_archives_are_self_contained(self, tmp_path: Path) -> None:
+        """Each network gets its own archive carrying the shared files too."""
+        project_dir = tmp_path / "project"
+        _build_project(project_dir)
+        out_dir = tmp_path / "out"
+
+        bulk = BulkAgentNetworkExporter(str(project_dir), workers=1).export_many(
+            ["team/alpha", "team/beta", "plain"], output=str(out_dir)
+        )
+
+        assert [r.output_path for r in bulk.networks] == [
+            str(out_dir / "alpha.zip"),
+            str(out_dir / "beta.zip"),
+            str(out_dir / "plain.hocon"),
+        ]
+        # Each archive: its stamped root, helper.hocon, lookup.py and __init__.py. The last three are
+        # shared, so they are compressed once for both archives.
+        assert bulk.members_compressed == 5
+        assert bulk.members_written == 8
+        for name in ("alpha", "beta"):
+            with zipfile.ZipFile(out_dir / f"{name}.zip") as zf:
+                assert zf.testzip() is None
+                assert (
+                    zf.read("coded_tools/shared/lookup.py")
+                    == (project_dir / "coded_tools" / "shared" / "lookup.py").read_bytes()
+                )
+                assert b"export_user" in zf.read(f"registries/team/{name}.hocon")
+        assert "export_user" in (out_dir / "plain.hocon").read_text()
+        assert list(bulk.phase_seconds) == ["resolve", "compress", "write"]
+
+    def test_combined_archive_carries_a_manifest_and_each_member_once(self, tmp_path: Path) -> None:
+        """One zip, one copy of each shared file, and a manifest listing every network's members."""
+        project_dir = tmp_path / "project"
+        _build_project(project_dir)
+        target = tmp_path / "all.zip"
+
+        bulk = BulkAgentNetworkExporter(str(project_dir), workers=1).export_many(
+            ["team/alpha", "team/beta", "helper"], output=str(target), combined=True
+        )
+
+        with zipfile.ZipFile(target) as zf:
+            assert zf.testzip() is None
+            names = zf.namelist()
+            manifest = json.loads(zf.read(BULK_EXPORT_MANIFEST))
+            # helper is exported as a root too, so its stamped text wins over the verbatim copy.
+            assert b"export_user" in zf.read("registries/helper.hocon")
+        assert len(names) == len(set(names))
+        assert names.count("coded_tools/shared/lookup.py") == 1
+        assert [entry["network"] for entry in manifest["networks"]] == [
+            "registries/team/alpha.hocon",
+            "registries/team/beta.hocon",
+            "registries/helper.hocon",
+        ]
+        assert "export_neuro_san_studio_version" in manifest
+        assert bulk.output_paths == [str(target)]
+
+    def test_worker_pool_output_matches_inline(self, tmp_path: Path) -> None:
+        """Archives built in worker processes hold the same members as the inline path."""
+        project_dir = tmp_path / "project"
+        _build_project(project_dir, shared_files=20)
+
+        inline = BulkAgentNetworkExporter(str(project_dir), workers=1).export_many(
+            ["team/alpha", "team/beta"], output=str(tmp_path / "inline")
+        )
+        pooled = BulkAgentNetworkExporter(str(project_dir), workers=2).export_many(
+            ["team/alpha", "team/beta"], output=str(tmp_path / "pooled")
+        )
+
+        assert inline.members_compressed == pooled.members_compressed >= 16
+        assert inline.members_written == pooled.members_written == 2 * inline.members_compressed - 2
+        for archive in ("alpha.zip", "beta.zip"):
+            with (
+                zipfile.ZipFile(tmp_path / "inline" / archive) as left,
+                zipfile.ZipFile(tmp_path / "pooled" / archive) as right,
+            ):
+                assert right.testzip() is None
+                assert left.namelist() == right.namelist()
+                for name in left.namelist():
+                    if name.startswith("coded_tools/"):
+                        assert left.read(name) == right.read(name)
+
+    def test_combined_export_compresses_in_the_pool(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A combined export fans its members out to the pool too, and the archive reads back intact."""
+        project_dir = tmp_path / "project"
+        _build_project(project_dir, shared_files=20)
+        pools = []
+
+        class _RecordingPool(ThreadPoolExecutor):
+            """Runs in threads so the test stays fast; records that a pool was used."""
+
+            def __init__(self, max_workers: int):
+                super().__init__(max_workers=max_workers)
+                pools.append(max_workers)
+
+        monkeypatch.setattr(bulk_exporter, "ProcessPoolExecutor", _RecordingPool)
+        target = tmp_path / "all.zip"
+
+        bulk = BulkAgentNetworkExporter(str(project_dir), workers=2).export_many(
+            ["team/alpha", "team/beta"], output=str(target), combined=True
+        )
+
+        assert pools == [2]
+        with zipfile.ZipFile(target) as zf:
+            assert zf.testzip() is None
+            lookup = zf.getinfo("coded_tools/shared/lookup.py")
+            assert zf.read(lookup) == (project_dir / "coded_tools" / "shared" / "lookup.py").read_bytes()
+            modified = zipfile.ZipInfo.from_file(project_dir / "coded_tools/shared/lookup.py").date_time
+            # Zip timestamps have two-second resolution
+            assert lookup.date_time == (*modified[:5], modified[5] // 2 * 2)
+        assert bulk.members_compressed == bulk.members_written
+
+    def test_shared_sub_network_is_analyzed_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The union dependency graph is walked once: helper.hocon is analyzed for the first root only."""
+        project_dir = tmp_path / "project"
+        _build_project(project_dir)
+        analyzed = []
+        original = DependencyAnalyzer.analyze_network
+
+        def counting(self, hocon_path):
+            analyzed.append(Path(hocon_path).name)
+            return original(self, hocon_path)
+
+        monkeypatch.setattr(DependencyAnalyzer, "analyze_network", counting)
+        BulkAgentNetworkExporter(str(project_dir), workers=1).export_many(
+            ["team/alpha", "team/beta"], output=str(tmp_path / "out")
+        )
+
+        assert analyzed.count("helper.hocon") == 1
+
+    def test_colliding_archive_names_are_rejected_before_writing(self, tmp_path: Path) -> None:
+        """Two networks with the same basename cannot share one output directory."""
+        project_dir = tmp_path / "project"
+        _build_project(project_dir)
+        (project_dir / "registries" / "basic" / "alpha.hocon").write_text(
+            '{ "tools": [ { "name": "f", "class": "openai", "tools": ["/helper"] } ] }\n'
+        )
+        out_dir = tmp_path / "out"
+
+        with pytest.raises(ValueError, match="would both export"):
+            BulkAgentNetworkExporter(str(project_dir), workers=1).export_many(
+                ["team/alpha", "basic/alpha"], output=str(out_dir)
+            )
+        assert not out_dir.exists()
+
+    def test_combined_archive_over_the_import_limit_is_rejected_before_writing(self, tmp_path: Path) -> None:
+        """A combined archive `ns import` would refuse is never written."""
+        project_dir = tmp_path / "project"
+        _build_project(project_dir, shared_files=MAX_ARCHIVE_ENTRIES)
+        target = tmp_path / "all.zip"
+
+        with pytest.raises(ValueError, match=f"accepts at most {MAX_ARCHIVE_ENTRIES}"):
+            BulkAgentNetworkExporter(str(project_dir), workers=1).export_many(
+                ["team/alpha", "team/beta"], output=str(target), combined=True
+            )
+        assert not target.exists()
+
+    def test_combined_archive_imports_without_the_manifest(self, tmp_path: Path) -> None:
+        """`ns import` accepts a combined archive and does not copy its manifest into the project."""
+        # pylint: disable-next=import-outside-toplevel
+        from neuro_san_studio.importer.agent_network_importer import AgentNetworkImporter
+
+        project_dir = tmp_path / "project"
+        _build_project(project_dir)
+        bundle = tmp_path / "all.zip"
+        BulkAgentNetworkExporter(str(project_dir), workers=1).export_many(
+            ["team/alpha", "team/beta"], output=str(bundle), combined=True
+        )
+        recv = tmp_path / "recv"
+        (recv / "registries").mkdir(parents=True)
+
+        result = AgentNetworkImporter(str(recv), str(recv)).import_from_path(str(bundle))
+
+        assert (recv / "registries" / "team" / "beta.hocon").is_file()
+        assert (recv / "coded_tools" / "shared" / "lookup.py").is_file()
+        assert not (recv / BULK_EXPORT_MANIFEST).exists()
+        assert BULK_EXPORT_MANIFEST not in result.copied_files
+
+
+class TestExportCommandBulk:
+    """`ns export` routes group names, 'all' and several names to the bulk exporter."""
+
+    def test_group_name_exports_every_network_in_it(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """A group token expands through the manifest, and per-phase timing is reported."""
+        _build_project(tmp_path)
+        monkeypatch.chdir(tmp_path)
+
+        ExportCommand(networks=["team"], output=str(tmp_path / "out"), workers=1).run()
+
+        assert (tmp_path / "out" / "alpha.zip").is_file()
+        assert (tmp_path / "out" / "beta.zip").is_file()
+        out = capsys.readouterr().out
+        assert "Exported 2 network(s)" in out
+        assert "resolve" in out and "compress" in out and "write" in out
+
+    def test_single_name_keeps_the_single_export_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """One plain network name still goes through AgentNetworkExporter.export."""
+        _build_project(tmp_path)
+        monkeypatch.chdir(tmp_path)
+
+        def boom(*_args, **_kwargs):
+            raise AssertionError("a single network must not use the bulk exporter")
+
+        monkeypatch.setattr(BulkAgentNetworkExporter, "export_many", boom)
+        ExportCommand(networks=["plain"]).run()
+
+        assert (tmp_path / "plain.hocon").is_file()
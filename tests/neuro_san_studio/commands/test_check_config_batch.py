@@ -0,0 +1,301 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+
+import asyncio
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from neuro_san_studio.commands.check_config import CheckConfigCommand
+from neuro_san_studio.commands.check_config import ProbeLimits
+from neuro_san_studio.commands.check_config import UniqueLlmConfig
+from neuro_san_studio.commands.check_config import collect_hocon_paths
+from neuro_san_studio.commands.check_config import load_llm_configs
+from neuro_san_studio.commands.check_config import probe_unique_configs
+from neuro_san_studio.commands.check_config import run_batch_checks
+from neuro_san_studio.utils.hocon_config_cache import HoconConfigCache
+from neuro_san_studio.utils.last_known_good_cache import LastKnownGoodCache
+
+_CHECKS_MODULE = "neuro_san_studio.commands.check_config"
+
+
+class _StubLlm:  # pylint: disable=too-few-public-methods
+    """Stands in for a BaseLanguageModel; records how many probes overlap, overall and per provider."""
+
+    def __init__(self, tracker: "_ConcurrencyTracker", llm_config: dict):
+        self.tracker = tracker
+        self.llm_config = llm_config
+
+
+class _ConcurrencyTracker:
+    """Collects the peak number of concurrent invocations."""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.active = {}
+        self.peak = {}
+        self.invoked = []
+
+    async def invoke(self, llm: _StubLlm) -> str:
+        """Replacement for check_config.invoke_llm."""
+        provider = llm.llm_config.get("class", "unknown")
+        model_name = llm.llm_config.get("model_name")
+        self.invoked.append(model_name)
+        for key in (provider, "*"):
+            self.active[key] = self.active.get(key, 0) + 1
+            self.peak[key] = max(self.peak.get(key, 0), self.active[key])
+        try:
+            if model_name == "hangs":
+                await asyncio.sleep(60)
+            await asyncio.sleep(self.delay)
+        finally:
+            for key in (provider, "*"):
+                self.active[key] -= 1
+        return "hi"
+
+    def patches(self):
+        """Patch LLM creation and invocation to go through this tracker."""
+        return (
+            patch(f"{_CHECKS_MODULE}.create_llm_instance", side_effect=lambda _f, cfg: _StubLlm(self, cfg)),
+            patch(f"{_CHECKS_MODULE}.invoke_llm", new=self.invoke),
+        )
+
+
+def _unique(model_name: str, provider: str) -> UniqueLlmConfig:
+    return UniqueLlmConfig([model_name], {"model_name": model_name, "class": provider}, MagicMock())
+
+
+class TestProbeUniqueConfigs(TestCase):
+    """Tests for the bounded, concurrent probing of unique configs."""
+
+    def _probe(self, tracker, unique_configs, limits, cache=None):
+        create_patch, invoke_patch = tracker.patches()
+        with create_patch, invoke_patch:
+            return asyncio.run(probe_unique_configs(unique_configs, limits, cache))
+
+    def test_global_and_per_provider_limits_are_respected(self):
+        """No more probes overlap than the global limit, nor per provider than the provider limit."""
+        tracker = _ConcurrencyTracker()
+        unique_configs = [_unique(f"a{i}", "openai") for i in range(6)] + [
+            _unique(f"b{i}", "anthropic") for i in range(6)
+        ]
+
+        successes, failures = self._probe(tracker, unique_configs, ProbeLimits(concurrency=3, per_provider=2))
+
+        self.assertEqual(len(successes), 12)
+        self.assertEqual(failures, [])
+        self.assertEqual(tracker.peak["*"], 3)
+        self.assertLessEqual(tracker.peak["openai"], 2)
+        self.assertLessEqual(tracker.peak["anthropic"], 2)
+
+    def test_slow_probe_times_out_without_blocking_others(self):
+        """A probe that exceeds the timeout fails on its own; the rest still pass."""
+        tracker = _ConcurrencyTracker()
+        unique_configs = [_unique("hangs", "openai"), _unique("fine", "openai")]
+
+        successes, failures = self._probe(tracker, unique_configs, ProbeLimits(timeout=0.2))
+
+        self.assertEqual([labels for labels, _ in successes], [["fine"]])
+        self.assertEqual(len(failures), 1)
+        self.assertIn("no response within 0.2s", failures[0][2])
+
+    def test_cached_success_is_not_probed_again(self):
+        """A config that passed within the TTL is reported as passing without a probe."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = os.path.join(tmp, "cache.json")
+            first = _ConcurrencyTracker()
+            self._probe(first, [_unique("m1", "openai")], ProbeLimits(), LastKnownGoodCache(cache_path, 60))
+
+            second = _ConcurrencyTracker()
+            successes, _ = self._probe(
+                second,
+                [_unique("m1", "openai"), _unique("m2", "openai")],
+                ProbeLimits(),
+                LastKnownGoodCache(cache_path, 60),
+            )
+
+        self.assertEqual(first.invoked, ["m1"])
+        self.assertEqual(second.invoked, ["m2"])
+        self.assertEqual(len(successes), 2)
+
+    def test_failures_are_not_cached(self):
+        """A failing config is probed again on the next run."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = os.path.join(tmp, "cache.json")
+            for _ in range(2):
+                tracker = _ConcurrencyTracker()
+                _, failures = self._probe(
+                    tracker,
+                    [_unique("hangs", "openai")],
+                    ProbeLimits(timeout=0.05),
+                    LastKnownGoodCache(cache_path, 60),
+                )
+                self.assertEqual(tracker.invoked, ["hangs"])
+                self.assertEqual(len(failures), 1)
+
+
+class _Registry:
+    """A temporary project with a root manifest, one group manifest and studio llm_config files."""
+
+    def __init__(self):
+        self._tmp = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.root = self._tmp.name
+        self.registries = os.path.join(self.root, "registries")
+        self.write("registries/manifest.hocon", '{\n    include "registries/basic/manifest.hocon"\n}\n')
+        self.write(
+            "registries/basic/manifest.hocon",
+            "{\n"
+            '    "basic/one.hocon": true,\n'
+            '    "basic/two.hocon": {"serve": true, "public": false},\n'
+            '    "basic/off.hocon": false,\n'
+            '    "basic/hidden.hocon": {"serve": false},\n'
+            "}\n",
+        )
+        for name, model_name in (("one", "shared"), ("two", "shared"), ("off", "unused"), ("hidden", "unused")):
+            self.write(f"registries/basic/{name}.hocon", f'{{ "llm_config": {{ "model_name": "{model_name}" }} }}\n')
+
+    def write(self, relpath: str, text: str) -> None:
+        """Write a file under the project root."""
+        path = os.path.join(self.root, relpath)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as out:
+            out.write(text)
+
+    def path(self, relpath: str) -> str:
+        """Absolute path of a file under the project root."""
+        return os.path.join(self.root, relpath)
+
+    def cleanup(self) -> None:
+        """Remove the project."""
+        self._tmp.cleanup()
+
+
+class TestCollectHoconPaths(TestCase):
+    """Tests for expanding a directory or manifest into the HOCON files to check."""
+
+    def setUp(self):
+        HoconConfigCache.clear_for_testing()
+        self.registry = _Registry()
+
+    def tearDown(self):
+        self.registry.cleanup()
+
+    def test_manifest_expands_to_served_networks(self):
+        """The root manifest yields the networks its groups serve, skipping disabled ones."""
+        paths = collect_hocon_paths(self.registry.path("registries/manifest.hocon"))
+
+        self.assertEqual(
+            paths,
+            [self.registry.path("registries/basic/one.hocon"), self.registry.path("registries/basic/two.hocon")],
+        )
+
+    def test_group_manifest_keys_resolve_against_registries_dir(self):
+        """Group manifest keys are relative to registries/, not to the group directory."""
+        paths = collect_hocon_paths(self.registry.path("registries/basic/manifest.hocon"))
+
+        self.assertIn(self.registry.path("registries/basic/one.hocon"), paths)
+
+    def test_directory_expands_to_every_hocon_except_manifests(self):
+        """A directory yields all of its HOCON files, recursively, without manifests."""
+        paths = collect_hocon_paths(self.registry.registries)
+
+        self.assertEqual(
+            [os.path.basename(path) for path in paths], ["hidden.hocon", "off.hocon", "one.hocon", "two.hocon"]
+        )
+
+    def test_plain_file_is_returned_as_is(self):
+        """Any other path is checked on its own."""
+        self.assertEqual(collect_hocon_paths("config/llm_config.hocon"), ["config/llm_config.hocon"])
+
+
+class TestRunBatchChecks(TestCase):
+    """Tests for checking many files with global deduplication."""
+
+    def setUp(self):
+        HoconConfigCache.clear_for_testing()
+        self.registry = _Registry()
+
+    def tearDown(self):
+        self.registry.cleanup()
+
+    def test_identical_configs_across_files_are_probed_once(self):
+        """Two networks sharing a config share one factory and one probe."""
+        tracker = _ConcurrencyTracker()
+        paths = collect_hocon_paths(self.registry.path("registries/manifest.hocon"))
+        create_patch, invoke_patch = tracker.patches()
+        with (
+            create_patch,
+            invoke_patch,
+            patch(f"{_CHECKS_MODULE}.create_and_load_llm_factory", return_value=MagicMock()) as mock_factory,
+            patch(f"{_CHECKS_MODULE}.print_results") as mock_print,
+        ):
+            result = asyncio.run(run_batch_checks(paths, workers=1))
+
+        self.assertTrue(result)
+        self.assertEqual(tracker.invoked, ["shared"])
+        mock_factory.assert_called_once_with({})
+        (successes, failures), _ = mock_print.call_args
+        self.assertEqual(successes, [(paths, {"model_name": "shared"})])
+        self.assertEqual(failures, [])
+
+    def test_unparseable_file_is_reported_as_failure(self):
+        """A file that fails to load fails the batch without stopping the other files."""
+        tracker = _ConcurrencyTracker()
+        self.registry.write("registries/basic/broken.hocon", "{ not: [valid")
+        paths = [self.registry.path("registries/basic/one.hocon"), self.registry.path("registries/basic/broken.hocon")]
+        create_patch, invoke_patch = tracker.patches()
+        with (
+            create_patch,
+            invoke_patch,
+            patch(f"{_CHECKS_MODULE}.create_and_load_llm_factory", return_value=MagicMock()),
+            patch(f"{_CHECKS_MODULE}.print_results") as mock_print,
+        ):
+            result = asyncio.run(run_batch_checks(paths, workers=1))
+
+        self.assertFalse(result)
+        self.assertEqual(tracker.invoked, ["shared"])
+        (_, failures), _ = mock_print.call_args
+        self.assertEqual([labels for labels, _, _ in failures], [[paths[1]]])
+
+    def test_load_llm_configs_returns_plain_data(self):
+        """Worker results carry plain dicts so they can be pickled back to the parent."""
+        loaded = load_llm_configs(self.registry.path("registries/basic/one.hocon"))
+
+        self.assertEqual(loaded.error, "")
+        self.assertIs(type(loaded.llm_configs[0][1]), dict)
+
+    def test_command_routes_manifest_to_batch(self):
+        """A manifest path runs the batch check rather than the single-file check."""
+
+        async def _passes(*_args):
+            return True
+
+        with (
+            patch(f"{_CHECKS_MODULE}.run_batch_checks", side_effect=_passes) as mock_batch,
+            patch(f"{_CHECKS_MODULE}.run_checks") as mock_single,
+        ):
+            code = CheckConfigCommand(self.registry.path("registries/manifest.hocon")).run()
+
+        self.assertEqual(code, 0)
+        mock_single.assert_not_called()
+        self.assertEqual(len(mock_batch.call_args.args[0]), 2)
+
+    def test_manifest_flag_defaults_to_registries_manifest(self):
+        """--manifest without a path checks registries/manifest.hocon."""
+        self.assertEqual(CheckConfigCommand(manifest=True).hocon_path, os.path.join("registries", "manifest.hocon"))
@@ -16,9 +16,16 @@
 
 """Tests for the `neuro-san-studio check-llm-keys` command and EnvValidator."""
 
+import asyncio
+import time
+from pathlib import Path
+from typing import Callable
+from typing import Optional
+from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import httpx
 from pytest import MonkeyPatch
 
 from neuro_san_studio.commands import check_llm_keys as check_llm_keys_module
@@ -227,22 +234,32 @@ class TestCheckLlmKeysCommand:
         exit_code = CheckLlmKeysCommand(tier=2).run()
         assert exit_code == 1
 
+    @staticmethod
+    def _validate(validator: EnvValidator, method_name: str, var_name: str) -> ValidationResult:
+        """Run one async live validator on a throwaway HTTP client."""
+
+        async def _run() -> ValidationResult:
+            async with httpx.AsyncClient() as http_client:
+                return await getattr(validator, method_name)(var_name, http_client)
+
+        return asyncio.run(_run())
+
     def test_tier3_openai_mocked(self, monkeypatch: MonkeyPatch) -> None:
         """Tier 3 OpenAI path uses the mocked OpenAI client — no real call."""
         _wipe_env(monkeypatch)
         monkeypatch.setenv("OPENAI_API_KEY", "sk-abc1234567890abcdef")
 
         mock_client = MagicMock()
-        mock_client.models.list.return_value = []
+        mock_client.models.list = AsyncMock(return_value=[])
         mock_openai_ctor = MagicMock(return_value=mock_client)
 
-        monkeypatch.setattr(check_llm_keys_module, "OpenAI", mock_openai_ctor, raising=False)
+        monkeypatch.setattr(check_llm_keys_module, "AsyncOpenAI", mock_openai_ctor, raising=False)
         monkeypatch.setattr(check_llm_keys_module, "HAS_OPENAI", True, raising=False)
 
-        result = EnvValidator().validate_tier3_openai("OPENAI_API_KEY")
+        result = self._validate(EnvValidator(), "validate_tier3_openai_async", "OPENAI_API_KEY")
         assert result.status == ValidationStatus.VALID
-        mock_openai_ctor.assert_called_once_with(api_key="sk-abc1234567890abcdef")
-        mock_client.models.list.assert_called_once()
+        assert mock_openai_ctor.call_args.kwargs["api_key"] == "sk-abc1234567890abcdef"
+        mock_client.models.list.assert_awaited_once()
 
     def test_tier3_anthropic_mocked(self, monkeypatch: MonkeyPatch) -> None:
         """Tier 3 Anthropic path uses the mocked Anthropic client — no real call."""
@@ -250,15 +267,16 @@ class TestCheckLlmKeysCommand:
         monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-abc1234567890abc")
 
         mock_client = MagicMock()
+        mock_client.messages.count_tokens = AsyncMock(return_value=None)
         mock_anthropic_ctor = MagicMock(return_value=mock_client)
 
-        monkeypatch.setattr(check_llm_keys_module, "Anthropic", mock_anthropic_ctor, raising=False)
+        monkeypatch.setattr(check_llm_keys_module, "AsyncAnthropic", mock_anthropic_ctor, raising=False)
         monkeypatch.setattr(check_llm_keys_module, "HAS_ANTHROPIC", True, raising=False)
 
-        result = EnvValidator().validate_tier3_anthropic("ANTHROPIC_API_KEY")
+        result = self._validate(EnvValidator(), "validate_tier3_anthropic_async", "ANTHROPIC_API_KEY")
         assert result.status == ValidationStatus.VALID
-        mock_anthropic_ctor.assert_called_once_with(api_key="sk-ant-abc1234567890abc")
-        mock_client.messages.count_tokens.assert_called_once()
+        assert mock_anthropic_ctor.call_args.kwargs["api_key"] == "sk-ant-abc1234567890abc"
+        mock_client.messages.count_tokens.assert_awaited_once()
 
     def test_tier3_google_mocked(self, monkeypatch: MonkeyPatch) -> None:
         """Tier 3 Google path uses the mocked genai.Client — no real call."""
@@ -266,13 +284,125 @@ class TestCheckLlmKeysCommand:
         monkeypatch.setenv("GOOGLE_API_KEY", "AIzaSy" + "x" * 30)
 
         mock_client = MagicMock()
-        mock_client.models.list.return_value = iter([])
+        mock_client.aio.models.list = AsyncMock(return_value=[])
         mock_genai = MagicMock()
         mock_genai.Client.return_value = mock_client
 
         monkeypatch.setattr(check_llm_keys_module, "genai", mock_genai, raising=False)
+        monkeypatch.setattr(check_llm_keys_module, "genai_types", MagicMock(), raising=False)
         monkeypatch.setattr(check_llm_keys_module, "HAS_GOOGLE", True, raising=False)
 
-        result = EnvValidator().validate_tier3_google("GOOGLE_API_KEY")
+        result = self._validate(EnvValidator(), "validate_tier3_google_async", "GOOGLE_API_KEY")
         assert result.status == ValidationStatus.VALID
         mock_genai.Client.assert_called_once()
+        mock_client.aio.models.list.assert_awaited_once()
+
+
+class _SlowAsyncClient:  # pylint: disable=too-few-public-methods
+    """Stands in for AsyncOpenAI/AsyncAnthropic: every API call sleeps, or raises, as scripted."""
+
+    def __init__(self, delay: float, calls: list, error: Optional[Exception] = None):
+        self.calls = calls
+        self.delay = delay
+        self.error = error
+        self.models = MagicMock(list=self._call)
+        self.messages = MagicMock(count_tokens=self._call)
+
+    async def _call(self, **_kwargs) -> list:
+        self.calls.append(time.monotonic())
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return []
+
+
+class TestTier3Concurrent:
+    """Tests for the concurrent, cached tier 3 path used by validate_all(tier=3)."""
+
+    @staticmethod
+    def _install(monkeypatch: MonkeyPatch, delay: float = 0.3, anthropic_delay: Optional[float] = None) -> dict:
+        """Set valid-format keys and replace the async SDK clients; returns the recorded constructor calls."""
+        _wipe_env(monkeypatch)
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-abc1234567890abcdef")
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-abc1234567890abc")
+        monkeypatch.setattr(check_llm_keys_module, "HAS_OPENAI", True, raising=False)
+        monkeypatch.setattr(check_llm_keys_module, "HAS_ANTHROPIC", True, raising=False)
+        monkeypatch.setattr(check_llm_keys_module, "HAS_GOOGLE", False, raising=False)
+        recorded: dict = {"http_clients": [], "calls": []}
+
+        def _factory(client_delay: float) -> Callable[..., _SlowAsyncClient]:
+            def _construct(api_key: str, http_client, max_retries: int) -> _SlowAsyncClient:
+                assert api_key and max_retries == 0
+                recorded["http_clients"].append(http_client)
+                return _SlowAsyncClient(client_delay, recorded["calls"])
+
+            return _construct
+
+        monkeypatch.setattr(check_llm_keys_module, "AsyncOpenAI", _factory(delay), raising=False)
+        monkeypatch.setattr(
+            check_llm_keys_module,
+            "AsyncAnthropic",
+            _factory(delay if anthropic_delay is None else anthropic_delay),
+            raising=False,
+        )
+        return recorded
+
+    def test_live_checks_overlap_on_one_http_client(self, monkeypatch: MonkeyPatch) -> None:
+        """Both live checks start before either finishes, and share one pooled HTTP client."""
+        recorded = self._install(monkeypatch)
+
+        results = EnvValidator().validate_all(tier=3)
+
+        by_name = {r.var_name: r for r in results}
+        assert by_name["OPENAI_API_KEY"].status == ValidationStatus.VALID
+        assert by_name["ANTHROPIC_API_KEY"].status == ValidationStatus.VALID
+        assert [r.var_name for r in results] == EnvValidator.LLM_API_KEYS
+        assert len(recorded["calls"]) == 2
+        assert abs(recorded["calls"][0] - recorded["calls"][1]) < 0.2
+        assert recorded["http_clients"][0] is recorded["http_clients"][1]
+
+    def test_slow_check_times_out_without_holding_up_others(self, monkeypatch: MonkeyPatch) -> None:
+        """A check over the timeout is a network error; the other key is still verified."""
+        self._install(monkeypatch, delay=0.0, anthropic_delay=5.0)
+
+        start = time.monotonic()
+        results = EnvValidator(timeout=0.2).validate_all(tier=3)
+
+        by_name = {r.var_name: r for r in results}
+        assert time.monotonic() - start < 2.0
+        assert by_name["OPENAI_API_KEY"].status == ValidationStatus.VALID
+        assert by_name["ANTHROPIC_API_KEY"].status == ValidationStatus.NETWORK_ERROR
+        assert "0.2s" in by_name["ANTHROPIC_API_KEY"].message
+
+    def test_auth_failure_maps_to_invalid_key(self, monkeypatch: MonkeyPatch) -> None:
+        """SDK authentication errors map to an invalid key."""
+        self._install(monkeypatch, delay=0.0)
+        auth_error = check_llm_keys_module.OpenAIAuthError("bad key", response=MagicMock(), body=None)
+        monkeypatch.setattr(
+            check_llm_keys_module,
+            "AsyncOpenAI",
+            lambda **_kwargs: _SlowAsyncClient(0.0, [], error=auth_error),
+            raising=False,
+        )
+
+        results = EnvValidator().validate_all(tier=3)
+
+        openai_result = next(r for r in results if r.var_name == "OPENAI_API_KEY")
+        assert openai_result.status == ValidationStatus.INVALID_KEY
+
+    def test_cached_key_skips_live_call_until_key_changes(self, monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+        """A key that passed within the TTL is not called again; a different key is."""
+        recorded = self._install(monkeypatch, delay=0.0)
+        cache_file = str(tmp_path / "keys.json")
+
+        assert CheckLlmKeysCommand(cache_ttl=60, cache_file=cache_file).run() == 0
+        assert len(recorded["calls"]) == 2
+        assert "sk-abc1234567890abcdef" not in (tmp_path / "keys.json").read_text(encoding="utf-8")
+
+        recorded["calls"].clear()
+        assert CheckLlmKeysCommand(cache_ttl=60, cache_file=cache_file).run() == 0
+        assert not recorded["calls"]
+
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-zzz1234567890abcdef")
+        CheckLlmKeysCommand(cache_ttl=60, cache_file=cache_file).run()
+        assert len(recorded["calls"]) == 1
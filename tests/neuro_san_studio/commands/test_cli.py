@@ -27,6 +27,7 @@ from neuro_san_studio.commands import cli as cli_module
 from neuro_san_studio.commands import import_networks as import_networks_module
 from neuro_san_studio.commands import init as init_module
 from neuro_san_studio.commands import internalize_agents as internalize_agents_module
+from neuro_san_studio.commands import run as run_module
 from neuro_san_studio.commands.cli import main
 
 
@@ -60,7 +61,7 @@ class TestMainEntryPoint:
                 """Record that run() was invoked."""
                 call_order.append("run")
 
-        monkeypatch.setattr(cli_module, "NeuroSanRunner", FakeRunner)
+        monkeypatch.setattr(run_module, "NeuroSanRunner", FakeRunner)
         return call_order
 
     def test_main_with_no_args_shows_help(self, monkeypatch: MonkeyPatch) -> None:
@@ -209,7 +210,7 @@ class TestMainEntryPoint:
                 """Raise to simulate a runtime failure."""
                 raise RuntimeError("boom")
 
-        monkeypatch.setattr(cli_module, "NeuroSanRunner", ExplodingRunner)
+        monkeypatch.setattr(run_module, "NeuroSanRunner", ExplodingRunner)
         monkeypatch.setattr(sys, "argv", ["neuro-san-studio", "run"])
         with pytest.raises(RuntimeError, match="boom"):
             main()
@@ -252,7 +253,7 @@ class TestMainEntryPoint:
             def run(self) -> None:
                 """No-op."""
 
-        monkeypatch.setattr(cli_module, "NeuroSanRunner", CapturingRunner)
+        monkeypatch.setattr(run_module, "NeuroSanRunner", CapturingRunner)
         monkeypatch.setattr(sys, "argv", ["neuro-san-studio", "run", "--server-host", "myhost"])
         main()
         assert captured[0]["server_host"] == "myhost"
@@ -0,0 +1,107 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Cold-start regression checks for the CLI: lazy subcommand imports and the `--version` import budget."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from neuro_san_studio.utils.import_profile import DEFAULT_VERSION_BUDGET_MS
+from neuro_san_studio.utils.import_profile import parse_importtime
+from neuro_san_studio.utils.import_profile import profile_cli
+
+# Pin the version so the budget measures the CLI itself, not the setuptools-scm / git fallbacks that
+# resolve_version() only reaches when the package is not installed as a distribution.
+_PINNED_VERSION = {"NEURO_SAN_STUDIO_VERSION": "0.0.0"}
+
+# Stacks that only `run` / `chat` need; `--version` must never load them.
+_HEAVY_PACKAGES = (
+    "neuro_san",
+    "langchain",
+    "langchain_core",
+    "pyhocon",
+    "neuro_san_studio.plugins",
+    "neuro_san_studio.commands.run",
+)
+
+
+class TestLazySubcommands:  # pylint: disable=too-few-public-methods
+    """Importing the dispatcher must not import any subcommand implementation."""
+
+    def test_cli_module_imports_no_subcommand(self) -> None:
+        """Only cli.py itself is loaded from neuro_san_studio.commands until a subcommand is dispatched."""
+        code = (
+            "import sys, neuro_san_studio.commands.cli; "
+            "print(sorted(m for m in sys.modules if m.startswith('neuro_san_studio.commands.')))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "['neuro_san_studio.commands.cli']"
+
+
+class TestVersionImportBudget:
+    """`neuro-san-studio --version` stays within its cold-start import budget."""
+
+    def test_version_skips_heavy_stacks(self) -> None:
+        """--version prints the version without importing the server, plugin or LLM stacks."""
+        profile = profile_cli(["--version"], env=_PINNED_VERSION)
+
+        assert profile.returncode == 0
+        loaded = [package for package in _HEAVY_PACKAGES if profile.imported(package)]
+        assert not loaded, f"--version imported {loaded}\n{profile.report()}"
+
+    @pytest.mark.integration
+    def test_version_import_time_is_within_budget(self) -> None:
+        """Best of three runs' CPU time, after a warm-up that writes the .pyc files, is under the budget.
+
+        NEURO_SAN_STUDIO_CLI_IMPORT_BUDGET_MS overrides the budget for slower machines. Marked integration
+        because four cold interpreter starts take several seconds.
+        """
+        budget_ms = float(os.environ.get("NEURO_SAN_STUDIO_CLI_IMPORT_BUDGET_MS", DEFAULT_VERSION_BUDGET_MS))
+        profile_cli(["--version"], env=_PINNED_VERSION)
+        profiles = [profile_cli(["--version"], env=_PINNED_VERSION) for _ in range(3)]
+        best = min(profiles, key=lambda profile: profile.cpu_seconds)
+        assert best.returncode == 0
+
+        print(best.report(budget_ms=budget_ms))
+        assert best.cpu_seconds * 1000.0 <= budget_ms, best.report(budget_ms=budget_ms)
+
+
+class TestParseImporttime:  # pylint: disable=too-few-public-methods
+    """Parsing of `-X importtime` output."""
+
+    @pytest.mark.parametrize("header", ["import time: self [us] | cumulative | imported package", "noise"])
+    def test_lines_are_parsed_with_depth(self, header: str) -> None:
+        """Header and unrelated lines are skipped; nesting depth comes from the indentation."""
+        stderr = "\n".join(
+            [
+                header,
+                "import time:       120 |        120 |     typer._click",
+                "import time:       300 |        420 |   typer",
+                "import time:        80 |        500 | neuro_san_studio.commands.cli",
+            ]
+        )
+
+        timings = parse_importtime(stderr)
+
+        assert [(t.module, t.self_us, t.cumulative_us, t.depth) for t in timings] == [
+            ("typer._click", 120, 120, 2),
+            ("typer", 300, 420, 1),
+            ("neuro_san_studio.commands.cli", 80, 500, 0),
+        ]
@@ -17,6 +17,7 @@
 """Tests for NeuroSanRunner."""
 
 import os
+import threading
 from collections.abc import Callable
 from collections.abc import Iterable
 from pathlib import Path
@@ -26,9 +27,12 @@ import pytest
 from pytest import CaptureFixture
 from pytest import MonkeyPatch
 
+from neuro_san_studio.commands import check_llm_keys as check_llm_keys_module
 from neuro_san_studio.commands import run as run_module
 from neuro_san_studio.commands.project_environment import ProjectEnvironment
 from neuro_san_studio.commands.run import NeuroSanRunner
+from neuro_san_studio.runner import affinity_proxy as affinity_proxy_module
+from neuro_san_studio.runner import server_worker_pool as server_worker_pool_module
 
 
 class TestNeuroSanRunner:
@@ -173,3 +177,79 @@ class TestRunnerArgsInitialization:
         runner = NeuroSanRunner(cli_overrides={"server_only": True, "server_host": "example"})
         assert runner.args["server_only"] is True
         assert runner.args["server_host"] == "example"
+
+    def test_llm_key_check_runs_in_background(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """start_llm_key_check returns at once; the check runs on a daemon thread with the configured TTL."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("CHECK_LLM_KEYS_CACHE_TTL", "120")
+        runner = NeuroSanRunner(cli_overrides={"check_llm_keys": True})
+        release = threading.Event()
+        seen: dict = {}
+
+        class _Command:  # pylint: disable=too-few-public-methods
+            def __init__(self, cache_ttl: float):
+                seen["cache_ttl"] = cache_ttl
+
+            def run(self) -> int:
+                """Block until the test releases the check."""
+                release.wait(5)
+                return 0
+
+        monkeypatch.setattr(check_llm_keys_module, "CheckLlmKeysCommand", _Command)
+
+        thread = runner.start_llm_key_check()
+        assert thread.daemon and thread.is_alive()
+        release.set()
+        thread.join(5)
+        assert seen["cache_ttl"] == 120.0
+
+    def test_bad_llm_keys_cache_ttl_falls_back_with_a_warning(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """A malformed TTL does not stop the runner from starting; the key check warns and uses the default."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("CHECK_LLM_KEYS_CACHE_TTL", "one hour")
+        runner = NeuroSanRunner()
+
+        with caplog.at_level("WARNING"):
+            ttl = runner._llm_keys_cache_ttl()  # pylint: disable=protected-access
+
+        assert ttl == run_module.DEFAULT_LLM_KEYS_CACHE_TTL_SECONDS
+        assert "CHECK_LLM_KEYS_CACHE_TTL" in caplog.text
+
+    def test_workers_start_a_pool_behind_the_server_port(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """--workers N starts a pool whose workers go through start_process, plus a proxy on the public port."""
+        monkeypatch.chdir(tmp_path)
+        runner = NeuroSanRunner(cli_overrides={"server_workers": 2, "server_http_port": 9999})
+        started: list = []
+        monkeypatch.setattr(runner, "start_process", lambda command, name, _log: started.append((command, name)))
+        created: dict = {}
+
+        class _Pool:  # pylint: disable=too-few-public-methods
+            def __init__(self, size: int, spawn: Callable[[int, int], Any]):
+                created["pool"] = self
+                self.size = size
+                self.spawn = spawn
+                self.ports = [7001, 7002]
+
+            def start(self) -> None:
+                """Spawn both workers on their internal ports."""
+                for index, port in enumerate(self.ports):
+                    self.spawn(index, port)
+
+        class _Proxy:  # pylint: disable=too-few-public-methods
+            def __init__(self, pool: _Pool, host: str, port: int):
+                created["proxy"] = (pool, host, port)
+
+            def start(self) -> None:
+                """Nothing to bind in this test."""
+
+        monkeypatch.setattr(server_worker_pool_module, "ServerWorkerPool", _Pool)
+        monkeypatch.setattr(affinity_proxy_module, "AffinityProxy", _Proxy)
+
+        runner.start_neuro_san()
+
+        assert runner.server_process is None
+        assert created["proxy"] == (created["pool"], "localhost", 9999)
+        assert [name for _, name in started] == ["NeuroSan-0", "NeuroSan-1"]
+        assert [command[-1] for command, _ in started] == ["7001", "7002"]
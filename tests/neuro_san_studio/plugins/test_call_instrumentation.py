@@ -0,0 +1,196 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Tests for CallInstrumentation: wrapping coded tools and middleware hooks."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+from typing import Dict
+
+import pytest
+from neuro_san.interfaces.coded_tool import CodedTool
+
+from neuro_san_studio.plugins.metrics.call_instrumentation import CallInstrumentation
+from neuro_san_studio.plugins.metrics.call_instrumentation import approximate_size
+from neuro_san_studio.plugins.metrics.call_instrumentation import network_label
+from neuro_san_studio.plugins.metrics.tool_metrics import ToolMetrics
+
+
+class SyncTool(CodedTool):  # pylint: disable=abstract-method
+    """A coded tool that only implements invoke()."""
+
+    __module__ = "coded_tools.demo.network.sync_tool"
+
+    def invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Any:
+        if args.get("fail"):
+            raise ValueError("asked to fail")
+        return "x" * 10
+
+
+class AsyncTool(CodedTool):
+    """A coded tool whose async_invoke() blocks the loop briefly, then awaits, then delegates to invoke()."""
+
+    __module__ = "coded_tools.demo.network.async_tool"
+
+    def invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Any:
+        return "done"
+
+    async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Any:
+        time.sleep(0.02)
+        await asyncio.sleep(0.05)
+        return self.invoke(args, sly_data)
+
+
+@pytest.fixture(name="metrics")
+def fixture_metrics():
+    """A registry with the wrappers installed for the duration of one test."""
+    registry = ToolMetrics()
+    instrumentation = CallInstrumentation(registry)
+    instrumentation.install()
+    yield registry
+    instrumentation.uninstall()
+
+
+class TestHelpers:
+    """Network labels and payload sizes."""
+
+    @pytest.mark.parametrize(
+        "module, expected",
+        [
+            ("coded_tools.industry.airline_policy.extract_docs", "industry/airline_policy"),
+            ("middleware.retry.retry_middleware", "retry"),
+            ("coded_tools.tool", "shared"),
+            ("neuro_san_studio.coded_tools.web_fetch", "shared"),
+        ],
+    )
+    def test_network_label(self, module: str, expected: str):
+        """The network is the module path below coded_tools/middleware, without the file."""
+        assert network_label(module) == expected
+
+    def test_approximate_size(self):
+        """Strings and bytes count by length, one level into dicts, lists and tuples; anything else is 0."""
+        assert approximate_size("abc") == 3
+        assert approximate_size(b"ab") == 2
+        assert approximate_size({"key": "value", "n": 5}) == 3 + 5 + 1
+        assert approximate_size(["ab", ("c",), "de"]) == 4
+        assert approximate_size(42) == 0
+        assert approximate_size(None) == 0
+
+
+class TestCodedTools:
+    """Coded tool calls are recorded once per call."""
+
+    def test_sync_invoke_is_recorded(self, metrics: ToolMetrics):
+        """Calls, errors and sizes land under the network derived from the module."""
+        tool = SyncTool()
+        tool.invoke({"query": "abcd"}, {})
+        with pytest.raises(ValueError):
+            tool.invoke({"fail": True}, {})
+
+        stats = metrics.snapshot()[("coded_tool", "demo/network", "SyncTool")]
+
+        assert (stats.calls, stats.errors) == (2, 1)
+        assert stats.args_bytes == len("query") + 4 + len("fail")
+        assert stats.result_bytes == 10
+
+    def test_async_invoke_delegating_to_invoke_counts_once(self, metrics: ToolMetrics):
+        """A call that reaches a second wrapped method on the same instance is recorded once."""
+        asyncio.run(AsyncTool().async_invoke({}, {}))
+
+        stats = metrics.snapshot()[("coded_tool", "demo/network", "AsyncTool")]
+
+        assert stats.calls == 1
+        assert stats.latency_sum >= 0.07
+        assert stats.loop_seconds == 0.0
+
+    def test_event_loop_time_covers_only_the_blocking_part(self):
+        """With measure_loop_time, the blocking sleep counts toward event loop time and the awaited one does not."""
+        registry = ToolMetrics()
+        instrumentation = CallInstrumentation(registry, measure_loop_time=True)
+        instrumentation.install()
+        try:
+            asyncio.run(AsyncTool().async_invoke({}, {}))
+        finally:
+            instrumentation.uninstall()
+
+        stats = registry.snapshot()[("coded_tool", "demo/network", "AsyncTool")]
+
+        assert stats.loop_seconds >= 0.02
+        assert stats.latency_sum - stats.loop_seconds >= 0.05
+
+    def test_classes_defined_after_install_are_wrapped(self, metrics: ToolMetrics):
+        """The subclass hook instruments new tools as they are defined."""
+
+        class LateTool(CodedTool):
+            """Defined after install()."""
+
+            __module__ = "coded_tools.late.late_tool"
+
+            async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Any:
+                return "late"
+
+        assert asyncio.run(LateTool().async_invoke({}, {})) == "late"
+        assert metrics.snapshot()[("coded_tool", "late", "LateTool")].calls == 1
+
+    def test_uninstall_restores_originals(self):
+        """After uninstall() the methods are the unwrapped functions and nothing is recorded."""
+        original = SyncTool.__dict__["invoke"]
+        registry = ToolMetrics()
+        instrumentation = CallInstrumentation(registry)
+        instrumentation.install()
+        assert SyncTool.__dict__["invoke"] is not original
+        instrumentation.uninstall()
+
+        SyncTool().invoke({}, {})
+
+        assert SyncTool.__dict__["invoke"] is original
+        assert not registry.snapshot()
+        assert "__init_subclass__" not in CodedTool.__dict__
+
+    def test_overhead_is_small(self):
+        """The wrapper adds 2 to 4 us of CPU time to a call; the bound leaves room for slower machines."""
+        assert CallInstrumentation.measure_overhead(iterations=2000) < 20.0
+
+
+class TestMiddleware:  # pylint: disable=too-few-public-methods
+    """Middleware hooks are recorded without breaking LangChain's override detection."""
+
+    def test_tool_hook_is_recorded_per_tool(self, metrics: ToolMetrics):
+        """awrap_tool_call is keyed by the tool name; hooks the class does not override stay untouched."""
+        middleware_module = pytest.importorskip("langchain.agents.middleware")
+        base = middleware_module.AgentMiddleware
+
+        class AuditMiddleware(base):  # pylint: disable=too-few-public-methods
+            """Overrides only the tool hook."""
+
+            __module__ = "middleware.audit.audit_middleware"
+
+            async def awrap_tool_call(self, request, handler):
+                """Pass the call through."""
+                return await handler(request)
+
+        async def handler(request):
+            return request.tool_call["name"]
+
+        request = SimpleNamespace(tool_call={"name": "search", "args": {}})
+        assert asyncio.run(AuditMiddleware().awrap_tool_call(request, handler)) == "search"
+
+        key = ("middleware", "audit", "AuditMiddleware.awrap_tool_call:search")
+        assert metrics.snapshot()[key].calls == 1
+        assert AuditMiddleware.awrap_model_call is base.awrap_model_call
+        assert AuditMiddleware.awrap_tool_call is not base.awrap_tool_call
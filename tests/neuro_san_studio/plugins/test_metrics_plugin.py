@@ -0,0 +1,84 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Tests for the MetricsPlugin."""
+
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+from neuro_san_studio.interfaces.base_plugin import BasePlugin
+from neuro_san_studio.plugins.metrics.metrics_plugin import MetricsPlugin
+from neuro_san_studio.runner.server_worker_pool import find_free_port
+
+
+class TestMetricsPlugin:
+    """Tests for MetricsPlugin."""
+
+    def test_extends_base_plugin(self):
+        """MetricsPlugin is a BasePlugin named Metrics."""
+        plugin = MetricsPlugin()
+        assert isinstance(plugin, BasePlugin)
+        assert plugin.plugin_name == "Metrics"
+
+    def test_args_override_environment(self):
+        """Known keys passed as plugin args win over the environment; unknown keys are ignored."""
+        with patch.dict("os.environ", {"METRICS_PORT": "1234"}):
+            plugin = MetricsPlugin(args={"metrics_port": "4321", "other": 1})
+        assert plugin.config["metrics_port"] == "4321"
+        assert "other" not in plugin.config
+
+    def test_cleanup_without_initialize(self):
+        """The runner process never initializes the plugin; cleanup there is a no-op."""
+        plugin = MetricsPlugin()
+        plugin.cleanup()
+        assert plugin.instrumentation is None
+
+    def test_serves_metrics_until_cleanup(self):
+        """/metrics answers with the exposition format while initialized; other paths are 404."""
+        port = find_free_port()
+        plugin = MetricsPlugin(args={"metrics_port": str(port), "metrics_summary_interval": "0"})
+        plugin.initialize()
+        try:
+            plugin.metrics.record(("coded_tool", "shared", "Probe"), 0.01)
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+                body = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+            assert "neuro_san_call_duration_seconds_count" in body
+            assert 'name="Probe"' in body
+            assert content_type.startswith("text/plain; version=0.0.4")
+            with pytest.raises(urllib.error.HTTPError) as error:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/other", timeout=5)  # pylint: disable=consider-using-with
+            assert error.value.code == 404
+        finally:
+            plugin.cleanup()
+        assert plugin.http_server is None
+        assert plugin.instrumentation is None
+
+    def test_port_in_use_is_a_warning(self):
+        """A second plugin on a taken port keeps running without an endpoint."""
+        port = find_free_port()
+        first = MetricsPlugin(args={"metrics_port": str(port), "metrics_summary_interval": "0"})
+        second = MetricsPlugin(args={"metrics_port": str(port), "metrics_summary_interval": "0"})
+        first.start_http_server()
+        try:
+            second.start_http_server()
+            assert first.http_server is not None
+            assert second.http_server is None
+        finally:
+            first.cleanup()
@@ -20,6 +20,7 @@ from unittest.mock import patch
 
 from neuro_san_studio.interfaces.base_plugin import BasePlugin
 from neuro_san_studio.plugins.phoenix.phoenix_plugin import PhoenixPlugin
+from neuro_san_studio.plugins.phoenix.span_sampling import SpanCounters
 
 
 class TestPhoenixPlugin:
@@ -72,3 +73,35 @@ class TestPhoenixPlugin:
         PhoenixPlugin().update_args_dict(args)
         assert "phoenix_port" in args
         assert "otel_service_name" in args
+
+    def test_args_override_sampling_config(self):
+        """Sampling keys passed as plugin args win over the environment."""
+        with patch.dict("os.environ", {}, clear=False):
+            plugin = PhoenixPlugin(args={"phoenix_sample_ratio": "0.1", "phoenix_tail_sampling": "true"})
+
+            assert plugin.sampling.sample_ratio == 0.1
+            assert plugin.sampling.tail_sampling is True
+            assert not plugin.span_stats()
+
+    def test_tail_sampling_skips_phoenix_register(self):
+        """register() exports every span, so tail sampling uses the manual setup."""
+        with patch.dict("os.environ", {}, clear=False):
+            plugin = PhoenixPlugin(args={"phoenix_tail_sampling": "true"})
+
+            assert plugin._try_phoenix_register() is False  # pylint: disable=protected-access
+
+    def test_head_sampling_skips_phoenix_register(self):
+        """register() would hide the head sampler's drops, so a ratio alone also uses the manual setup."""
+        with patch.dict("os.environ", {}, clear=False):
+            plugin = PhoenixPlugin(args={"phoenix_sample_ratio": "0.5"})
+
+            assert plugin._try_phoenix_register() is False  # pylint: disable=protected-access
+
+    def test_span_stats_include_head_sampling_drops(self):
+        """Counters are reported without tail sampling too."""
+        with patch.dict("os.environ", {}, clear=False):
+            plugin = PhoenixPlugin(args={"phoenix_sample_ratio": "0.5"})
+            plugin.span_counters = SpanCounters()
+            plugin.span_counters.add("spans_head_sampled_out", 4)
+
+            assert plugin.span_stats() == {"spans_head_sampled_out": 4}
@@ -0,0 +1,351 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Tests for the Phoenix plugin's span sampling."""
+
+from types import SimpleNamespace
+from typing import Any
+from typing import List
+from typing import Optional
+
+from neuro_san_studio.plugins.phoenix.span_sampling import BoundedQueueSpanProcessor
+from neuro_san_studio.plugins.phoenix.span_sampling import CountingSampler
+from neuro_san_studio.plugins.phoenix.span_sampling import SpanCounters
+from neuro_san_studio.plugins.phoenix.span_sampling import SpanSamplingConfig
+from neuro_san_studio.plugins.phoenix.span_sampling import SpanStatsReporter
+from neuro_san_studio.plugins.phoenix.span_sampling import TailSamplingSpanProcessor
+
+_MS = 1_000_000
+
+
+class _RecordingProcessor:
+    """Stands in for the BatchSpanProcessor and records what reaches it."""
+
+    def __init__(self):
+        self.ended: List[Any] = []
+        self.flushed = 0
+        self.shut_down = False
+
+    def on_start(self, span, parent_context=None):
+        """Ignore span starts."""
+
+    def on_end(self, span):
+        """Record an exported span."""
+        self.ended.append(span)
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Count flushes."""
+        assert timeout_millis > 0
+        self.flushed += 1
+        return True
+
+    def shutdown(self):
+        """Record the shutdown."""
+        self.shut_down = True
+
+
+# pylint: disable-next=too-many-arguments
+def _span(
+    trace_id: int,
+    *,
+    root: bool = False,
+    duration_ms: float = 1.0,
+    error: bool = False,
+    tokens: Optional[int] = None,
+    remote_parent: bool = False,
+):
+    """A minimal ReadableSpan look-alike."""
+    parent = None if root and not remote_parent else SimpleNamespace(is_remote=remote_parent)
+    return SimpleNamespace(
+        context=SimpleNamespace(trace_id=trace_id),
+        parent=parent,
+        status=SimpleNamespace(status_code=SimpleNamespace(name="ERROR" if error else "UNSET")),
+        start_time=0,
+        end_time=int(duration_ms * _MS),
+        attributes={} if tokens is None else {"llm.token_count.total": tokens},
+    )
+
+
+class _QueueingBatchProcessor(_RecordingProcessor):
+    """Stands in for the BatchSpanProcessor type, keeping the exporter it is built with."""
+
+    def __init__(self, exporter, **settings):
+        super().__init__()
+        self.exporter = exporter
+        self.settings = settings
+
+    def export_queued(self, result: str = "SUCCESS"):
+        """Hand everything queued so far to the exporter as one batch."""
+        batch, self.ended = self.ended, []
+        return self.exporter.export(batch), result
+
+
+class _Exporter:
+    """Stands in for the OTLP exporter, returning a result with the given name."""
+
+    def __init__(self, result: str = "SUCCESS"):
+        self.result = result
+
+    def export(self, spans):
+        """Return the configured result."""
+        assert spans is not None
+        return SimpleNamespace(name=self.result)
+
+    def shutdown(self):
+        """Nothing to release."""
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Nothing to flush."""
+        return timeout_millis > 0
+
+
+def _processor(**overrides) -> TailSamplingSpanProcessor:
+    settings = {"sample_ratio": 0.0, "tail_sampling": True, "tail_slow_ms": 1000.0, "tail_min_tokens": 500}
+    settings.update(overrides)
+    return TailSamplingSpanProcessor(_RecordingProcessor(), SpanSamplingConfig(**settings))
+
+
+class TestSpanSamplingConfig:
+    """Reading the settings and deriving SDK settings from them."""
+
+    def test_defaults_export_everything(self):
+        """With nothing configured every span is exported and no sampler is set."""
+        config = SpanSamplingConfig.from_mapping({})
+
+        assert config.exports_everything
+        assert "OTEL_TRACES_SAMPLER" not in config.sdk_environment()
+        assert "OTEL_ATTRIBUTE_VALUE_LENGTH_LIMIT" not in config.sdk_environment()
+
+    def test_values_are_parsed_and_clamped(self):
+        """Strings from the environment are parsed; out-of-range and malformed values are corrected."""
+        config = SpanSamplingConfig.from_mapping(
+            {
+                "phoenix_sample_ratio": "1.5",
+                "phoenix_tail_sampling": "Yes",
+                "phoenix_tail_slow_ms": "not a number",
+                "phoenix_max_attribute_length": "4096",
+            }
+        )
+
+        assert config.sample_ratio == 1.0
+        assert config.tail_sampling is True
+        assert config.tail_slow_ms == 10_000.0
+        assert config.max_attribute_length == 4096
+
+    def test_head_sampling_uses_the_sdk_sampler(self):
+        """A ratio without tail sampling becomes the SDK's parent-based ratio sampler."""
+        environment = SpanSamplingConfig(sample_ratio=0.25, max_attribute_length=2048).sdk_environment()
+
+        assert environment["OTEL_TRACES_SAMPLER"] == "parentbased_traceidratio"
+        assert environment["OTEL_TRACES_SAMPLER_ARG"] == "0.25"
+        assert environment["OTEL_ATTRIBUTE_VALUE_LENGTH_LIMIT"] == "2048"
+
+    def test_tail_sampling_records_every_span(self):
+        """With tail sampling the SDK records everything; the ratio is applied per trace later."""
+        environment = SpanSamplingConfig(sample_ratio=0.25, tail_sampling=True).sdk_environment()
+
+        assert "OTEL_TRACES_SAMPLER" not in environment
+
+    def test_stats_interval_is_read(self):
+        """The report interval is parsed; a negative one disables reporting."""
+        assert SpanSamplingConfig.from_mapping({"phoenix_stats_interval_s": "15"}).stats_interval_s == 15.0
+        assert SpanSamplingConfig.from_mapping({"phoenix_stats_interval_s": "-1"}).stats_interval_s == 0.0
+
+    def test_batch_sizes_follow_the_span_rate(self):
+        """Higher throughput gets a larger queue and batches, within fixed bounds."""
+        quiet = SpanSamplingConfig(spans_per_second=1).batch_settings()
+        busy = SpanSamplingConfig(spans_per_second=2000).batch_settings()
+        flood = SpanSamplingConfig(spans_per_second=1_000_000).batch_settings()
+
+        assert quiet["max_queue_size"] == 2048 and quiet["max_export_batch_size"] == 64
+        assert busy["max_queue_size"] == 40_000 and busy["max_export_batch_size"] == 2048
+        assert flood["max_queue_size"] == 65_536
+
+
+class TestTailSamplingSpanProcessor:
+    """Per-trace keep decisions."""
+
+    def test_spans_wait_for_the_local_root(self):
+        """Nothing is exported before the root ends; then the whole trace is, if kept."""
+        processor = _processor()
+        processor.on_end(_span(1, error=True))
+        assert not processor.delegate.ended
+
+        processor.on_end(_span(1, root=True))
+
+        assert len(processor.delegate.ended) == 2
+        assert processor.stats()["traces_kept_error"] == 1
+
+    def test_ordinary_traces_are_dropped_at_ratio_zero(self):
+        """A fast, error-free, low-token trace is sampled out and counted."""
+        processor = _processor()
+        processor.on_end(_span(2, tokens=10))
+        processor.on_end(_span(2, root=True))
+
+        stats = processor.stats()
+        assert not processor.delegate.ended
+        assert stats["traces_dropped"] == 1
+        assert stats["spans_sampled_out"] == 2
+
+    def test_slow_and_token_heavy_traces_are_kept(self):
+        """Root duration and summed token counts each retain a trace."""
+        processor = _processor()
+        processor.on_end(_span(3, root=True, duration_ms=1500))
+        processor.on_end(_span(4, tokens=300))
+        processor.on_end(_span(4, tokens=300))
+        processor.on_end(_span(4, root=True))
+
+        stats = processor.stats()
+        assert stats["traces_kept_slow"] == 1
+        assert stats["traces_kept_tokens"] == 1
+        assert stats["spans_kept"] == 4
+
+    def test_remote_parent_marks_the_local_root(self):
+        """A span whose parent is remote closes the trace in this process."""
+        processor = _processor(sample_ratio=1.0)
+        processor.on_end(_span(5, root=True, remote_parent=True))
+
+        assert processor.stats()["traces_kept_ratio"] == 1
+
+    def test_late_spans_follow_the_decision(self):
+        """A span ending after its trace was decided is kept or dropped with it."""
+        processor = _processor()
+        processor.on_end(_span(6, root=True, error=True))
+        processor.on_end(_span(6))
+        processor.on_end(_span(7, root=True))
+        processor.on_end(_span(7))
+
+        assert len(processor.delegate.ended) == 2
+        assert processor.stats()["spans_sampled_out"] == 2
+
+    def test_pending_traces_are_bounded(self):
+        """Beyond max_pending_traces the oldest trace is decided early."""
+        processor = _processor(max_pending_traces=2)
+        for trace_id in range(10, 15):
+            processor.on_end(_span(trace_id, error=trace_id == 10))
+
+        stats = processor.stats()
+        assert stats["traces_pending"] == 2
+        assert stats["traces_decided_early"] == 3
+        assert stats["traces_kept_error"] == 1
+
+    def test_ratio_matches_the_sdk_sampler_bound(self):
+        """The ratio test uses the low 64 bits of the trace id, like TraceIdRatioBased."""
+        assert TailSamplingSpanProcessor.ratio_sampled((1 << 64) + 1, 0.5)
+        assert not TailSamplingSpanProcessor.ratio_sampled((1 << 63) + 1, 0.5)
+        assert not TailSamplingSpanProcessor.ratio_sampled(0, 0.0)
+        assert TailSamplingSpanProcessor.ratio_sampled((1 << 64) - 1, 1.0)
+
+    def test_shutdown_flushes_pending_traces(self):
+        """Pending traces are decided and the wrapped processor is flushed and shut down."""
+        processor = _processor()
+        processor.on_end(_span(20, error=True))
+
+        processor.shutdown()
+
+        assert len(processor.delegate.ended) == 1
+        assert processor.delegate.flushed == 1
+        assert processor.delegate.shut_down
+
+    def test_shutdown_warns_when_spans_outpace_the_configured_rate(self, caplog):
+        """A rate above spans_per_second, which sized the export queue, is reported at shutdown."""
+        processor = _processor(spans_per_second=1.0)
+        processor._started_at -= 1.0
+        for trace_id in range(10):
+            processor.on_end(_span(trace_id, root=True))
+
+        with caplog.at_level("WARNING"):
+            processor.shutdown()
+
+        assert "PHOENIX_SPANS_PER_SECOND" in caplog.text
+
+
+class TestDropCounters:
+    """Counting spans dropped by the head sampler and by a full export queue, and reporting them."""
+
+    def test_head_sampler_counts_sampled_out_spans(self):
+        """Only spans the wrapped sampler does not sample are counted."""
+        decisions = iter([False, True, False])
+        delegate = SimpleNamespace(
+            should_sample=lambda **_: SimpleNamespace(decision=SimpleNamespace(is_sampled=lambda: next(decisions))),
+            get_description=lambda: "ParentBased",
+        )
+        counters = SpanCounters()
+        sampler = CountingSampler(delegate, counters)
+
+        for _ in range(3):
+            sampler.should_sample(trace_id=1, name="span")
+
+        assert counters.snapshot() == {"spans_head_sampled_out": 2}
+        assert "ParentBased" in sampler.get_description()
+
+    def test_full_queue_drops_and_counts_spans(self):
+        """Spans beyond the queue size are dropped until the exporter takes a batch."""
+        counters = SpanCounters()
+        processor = BoundedQueueSpanProcessor(
+            _Exporter(), _QueueingBatchProcessor, {"max_queue_size": 2, "max_export_batch_size": 2}, counters
+        )
+        batch: _QueueingBatchProcessor = processor.delegate
+        for trace_id in range(3):
+            processor.on_end(_span(trace_id, root=True))
+
+        assert len(batch.ended) == 2
+        assert counters.snapshot() == {"spans_queue_dropped": 1}
+        assert batch.settings["max_queue_size"] == 2
+
+        batch.export_queued()
+        processor.on_end(_span(3, root=True))
+
+        assert processor.queued == 1
+        assert counters.snapshot() == {"spans_queue_dropped": 1, "spans_sent": 2}
+
+    def test_unsampled_spans_take_no_queue_slot(self):
+        """The batch processor ignores unsampled spans, so they are not counted as queued."""
+        processor = BoundedQueueSpanProcessor(
+            _Exporter(), _QueueingBatchProcessor, {"max_queue_size": 1}, SpanCounters()
+        )
+        span = _span(1, root=True)
+        span.context.trace_flags = SimpleNamespace(sampled=False)
+
+        processor.on_end(span)
+
+        assert processor.queued == 0
+
+    def test_failed_exports_are_counted(self):
+        """A batch the exporter rejects counts as failed, not sent."""
+        counters = SpanCounters()
+        processor = BoundedQueueSpanProcessor(
+            _Exporter("FAILURE"), _QueueingBatchProcessor, {"max_queue_size": 4}, counters
+        )
+        processor.on_end(_span(1, root=True))
+
+        processor.delegate.export_queued()
+
+        assert counters.snapshot() == {"spans_send_failed": 1}
+
+    def test_reporter_warns_about_new_queue_drops(self, caplog):
+        """Each report logs the stats and warns only when the queue dropped spans since the last one."""
+        counters = SpanCounters()
+        reporter = SpanStatsReporter(counters.snapshot, interval_s=0.0)
+        reporter.start()
+
+        counters.add("spans_queue_dropped", 3)
+        with caplog.at_level("INFO"):
+            reporter.report()
+            reporter.report()
+
+        assert caplog.text.count("Span stats") == 2
+        assert caplog.text.count("3 spans dropped by a full export queue") == 1
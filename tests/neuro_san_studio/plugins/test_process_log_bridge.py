@@ -14,11 +14,16 @@
 #
 # END COPYRIGHT
 
-"""Tests for ProcessLogBridge._infer_level_from_text (regression for #915)."""
+"""Tests for ProcessLogBridge line classification, severity inference (regression for #915) and console output."""
 
 import logging
+import math
+import re
 from unittest.mock import patch
 
+import pytest
+from rich.logging import RichHandler
+
 from neuro_san_studio.plugins.log_bridge.process_log_bridge import ProcessLogBridge
 
 
@@ -142,3 +147,68 @@ class TestInferLevelFromText:
         bridge = self._make_bridge()
         line = '{"error": "something broke", "level": "info"}'
         assert bridge._infer_level_from_text(line) == logging.INFO  # pylint: disable=protected-access
+
+
+class TestLineClassifier:
+    """Only lines that can hold JSON are parsed, with the same results as a full parse attempt."""
+
+    @pytest.mark.parametrize(
+        "line, kind",
+        [
+            ("Server started successfully on port 8080", "text"),
+            ('{"message_type": "Info", "message": "hi"}', "json"),
+            ('INFO request {"request_id": "1"} done', "json"),
+            ("{", "json_start"),
+            ('WARNING: config {"temperature": 0.5,', "json_start"),
+            ("[1, 2]", "json"),
+            ("-1.5e3", "json"),
+            ("2026-10-19 10:15:00 INFO ready", "text"),
+        ],
+    )
+    def test_classify_line(self, line, kind):
+        """Each line gets the kind its handling needs."""
+        assert ProcessLogBridge._classify_line(line) == kind  # pylint: disable=protected-access
+
+    @pytest.mark.parametrize(
+        "line, parsed",
+        [
+            ('{"message": "hi"}', {"message": "hi"}),
+            ('prefix {"a": 1} suffix', {"a": 1}),
+            ("[1, 2]", {"message": [1, 2]}),
+            ('"a{b}"', {"message": "a{b}"}),
+            ("config {'temperature': 0.5}", None),
+            ("{", None),
+            ("Loaded {x}", None),
+        ],
+    )
+    def test_parse_matches_strict_then_fragment(self, line, parsed):
+        """Skipped parses are exactly the ones that could not succeed."""
+        assert ProcessLogBridge._try_parse_json_fragment(line) == parsed  # pylint: disable=protected-access
+
+    def test_nan_still_parses(self):
+        """NaN, which orjson rejects, falls back to the standard decoder."""
+        parsed = ProcessLogBridge._try_parse_json_fragment('{"score": NaN}')  # pylint: disable=protected-access
+        assert math.isnan(parsed["score"])
+
+
+class TestPlainConsole:
+    """Output that is not a terminal is written as plain text instead of being laid out by Rich."""
+
+    def test_not_a_tty_uses_a_plain_stream_handler(self):
+        """Under pytest stdout is captured, so the bridge writes plain "[time] LEVEL message" lines."""
+        bridge = ProcessLogBridge()
+        record = logging.LogRecord("proc", logging.WARNING, __file__, 1, "proc - disk low", None, None)
+
+        assert bridge.plain_console
+        assert not isinstance(bridge.console_handler, RichHandler)
+        assert re.fullmatch(
+            r"\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} \S+\] WARNING  proc - disk low",
+            bridge.console_handler.format(record),
+        )
+
+    def test_plain_output_can_be_turned_off(self):
+        """With plain_when_not_tty disabled the Rich handler is always used."""
+        bridge = ProcessLogBridge(config={"console": {"plain_when_not_tty": False}})
+
+        assert not bridge.plain_console
+        assert isinstance(bridge.console_handler, RichHandler)
@@ -0,0 +1,119 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Tests for the ToolMetrics registry."""
+
+import threading
+
+from neuro_san_studio.plugins.metrics.tool_metrics import LATENCY_BUCKETS
+from neuro_san_studio.plugins.metrics.tool_metrics import ToolMetrics
+
+KEY = ("coded_tool", "industry/airline_policy", "ExtractDocs")
+
+
+class TestToolMetrics:
+    """Recording, snapshots and rendering."""
+
+    def test_record_accumulates(self):
+        """Counts, errors, sums, maximum and sizes add up per key."""
+        metrics = ToolMetrics()
+        metrics.record(KEY, 0.002, args_bytes=10, result_bytes=100, loop_seconds=0.001)
+        metrics.record(KEY, 0.3, error=True, args_bytes=5)
+
+        stats = metrics.snapshot()[KEY]
+
+        assert stats.calls == 2
+        assert stats.errors == 1
+        assert stats.latency_sum == 0.302
+        assert stats.latency_max == 0.3
+        assert stats.loop_seconds == 0.001
+        assert (stats.args_bytes, stats.result_bytes) == (15, 100)
+        assert sum(stats.bucket_counts) == 2
+
+    def test_snapshot_is_a_copy(self):
+        """Later calls do not change an earlier snapshot."""
+        metrics = ToolMetrics()
+        metrics.record(KEY, 0.01)
+        snapshot = metrics.snapshot()
+        metrics.record(KEY, 0.01)
+
+        assert snapshot[KEY].calls == 1
+        assert sum(snapshot[KEY].bucket_counts) == 1
+
+    def test_quantile_is_a_bucket_bound(self):
+        """A quantile resolves to the upper bound of its bucket; beyond the last bound it is the maximum."""
+        metrics = ToolMetrics()
+        for _ in range(9):
+            metrics.record(KEY, 0.004)
+        metrics.record(KEY, 120.0)
+        stats = metrics.snapshot()[KEY]
+
+        assert stats.quantile(0.5) == 0.005
+        assert stats.quantile(1.0) == 120.0
+
+    def test_render_prometheus(self):
+        """The histogram is cumulative and ends with +Inf, count and sum; counters carry the same labels."""
+        metrics = ToolMetrics()
+        metrics.record(KEY, 0.002)
+        metrics.record(KEY, 0.02, error=True)
+
+        text = metrics.render_prometheus()
+        labels = 'kind="coded_tool",network="industry/airline_policy",name="ExtractDocs"'
+
+        assert "# TYPE neuro_san_call_duration_seconds histogram" in text
+        assert f'neuro_san_call_duration_seconds_bucket{{{labels},le="0.001"}} 0' in text
+        assert f'neuro_san_call_duration_seconds_bucket{{{labels},le="0.005"}} 1' in text
+        assert f'neuro_san_call_duration_seconds_bucket{{{labels},le="0.025"}} 2' in text
+        assert f'neuro_san_call_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f"neuro_san_call_duration_seconds_count{{{labels}}} 2" in text
+        assert f"neuro_san_call_errors_total{{{labels}}} 1" in text
+        assert text.count("_bucket{") == len(LATENCY_BUCKETS) + 1
+        assert text.endswith("\n")
+
+    def test_label_values_are_escaped(self):
+        """Quotes and backslashes in names cannot break the exposition format."""
+        metrics = ToolMetrics()
+        metrics.record(("middleware", "shared", 'Odd"Name\\'), 0.1)
+
+        assert 'name="Odd\\"Name\\\\"' in metrics.render_prometheus()
+
+    def test_summary_orders_by_total_time(self):
+        """The slowest key by total time comes first and the limit is honoured."""
+        metrics = ToolMetrics()
+        metrics.record(("coded_tool", "shared", "Fast"), 0.001)
+        metrics.record(("coded_tool", "shared", "Slow"), 2.0)
+
+        lines = metrics.summary_lines(limit=1)
+
+        assert len(lines) == 1
+        assert lines[0].startswith("coded_tool shared/Slow: 1 calls, 0 errors")
+
+    def test_concurrent_records_are_not_lost(self):
+        """Calls recorded from many threads at once all count."""
+        metrics = ToolMetrics()
+
+        def worker():
+            for _ in range(2000):
+                metrics.record(KEY, 0.001, args_bytes=1)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = metrics.snapshot()[KEY]
+        assert stats.calls == stats.args_bytes == 16000
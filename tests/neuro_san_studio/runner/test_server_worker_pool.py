@@ -0,0 +1,212 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+
+"""Tests for the multi-worker server mode: ServerWorkerPool supervision and AffinityProxy routing."""
+
+import http.client
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import time
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import pytest
+
+from neuro_san_studio.runner.affinity_proxy import AFFINITY_COOKIE
+from neuro_san_studio.runner.affinity_proxy import AffinityProxy
+from neuro_san_studio.runner.server_worker_pool import ServerWorkerPool
+from neuro_san_studio.runner.server_worker_pool import find_free_port
+
+# A stand-in for the Neuro SAN server: /healthz, /whoami (its port), /session (hands out an
+# Mcp-Session-Id), /stream (a chunked response written in pieces) and /crash (exits the process).
+_FAKE_SERVER = textwrap.dedent(
+    """
+    import os, sys, time, uuid
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    PORT = int(sys.argv[1])
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, body, headers=()):
+            self.send_response(200)
+            for name, value in headers:
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/crash":
+                os._exit(3)
+            if self.path == "/stream":
+                self.send_response(200)
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                for part in (b"one ", b"two ", str(PORT).encode()):
+                    self.wfile.write(b"%x\\r\\n%s\\r\\n" % (len(part), part))
+                    self.wfile.flush()
+                    time.sleep(0.05)
+                self.wfile.write(b"0\\r\\n\\r\\n")
+                return
+            if self.path == "/session":
+                self._send(str(PORT).encode(), [("Mcp-Session-Id", uuid.uuid4().hex)])
+                return
+            self._send(str(PORT).encode())
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self._send(body + b"@" + str(PORT).encode())
+
+    ThreadingHTTPServer(("127.0.0.1", PORT), Handler).serve_forever()
+    """
+)
+
+
+def _spawn(_index: int, port: int) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, "-c", _FAKE_SERVER, str(port)], start_new_session=os.name != "nt")
+
+
+@pytest.fixture(name="pool")
+def _pool() -> Iterator[ServerWorkerPool]:
+    pool = ServerWorkerPool(
+        3, _spawn, health_interval=0.1, unhealthy_after=2, startup_grace=10.0, max_backoff=0.1, kill_timeout=0.5
+    )
+    pool.start()
+    assert pool.wait_until_healthy(timeout=20)
+    yield pool
+    pool.stop(timeout=5)
+
+
+@pytest.fixture(name="proxy")
+def _proxy(pool: ServerWorkerPool) -> Iterator[AffinityProxy]:
+    proxy = AffinityProxy(pool, "127.0.0.1", find_free_port())
+    proxy.start()
+    yield proxy
+    proxy.stop()
+
+
+def _request(
+    proxy: AffinityProxy, path: str, headers: Optional[Dict[str, str]] = None, body: Optional[bytes] = None
+) -> Tuple[int, Dict[str, str], bytes]:
+    connection = http.client.HTTPConnection("127.0.0.1", proxy.port, timeout=10)
+    try:
+        connection.request("POST" if body is not None else "GET", path, body=body, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        connection.close()
+
+
+def _wait_for(condition, timeout: float = 15.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+class TestAffinityProxy:
+    """Requests through the proxy reach the pool's workers."""
+
+    def test_requests_without_a_session_spread_over_workers(self, proxy: AffinityProxy) -> None:
+        """Stateless requests are balanced, and each gets an affinity cookie."""
+        ports: List[bytes] = []
+        for _ in range(9):
+            status, headers, body = _request(proxy, "/whoami")
+            assert status == 200
+            assert AFFINITY_COOKIE in headers["Set-Cookie"]
+            ports.append(body)
+
+        assert {int(port) for port in ports} == set(proxy.pool.ports)
+
+    def test_cookie_and_session_header_stick_to_one_worker(self, proxy: AffinityProxy) -> None:
+        """A client with the affinity cookie, or a session id a worker handed out, keeps that worker."""
+        _, headers, first = _request(proxy, "/whoami")
+        cookie = headers["Set-Cookie"].split(";", 1)[0]
+        assert all(_request(proxy, "/whoami", {"Cookie": cookie})[2] == first for _ in range(5))
+
+        _, headers, owner = _request(proxy, "/session")
+        session = {"Mcp-Session-Id": headers["Mcp-Session-Id"]}
+        assert all(_request(proxy, "/whoami", session)[2] == owner for _ in range(5))
+
+    def test_streamed_and_posted_bodies_pass_through(self, proxy: AffinityProxy) -> None:
+        """Chunked responses and request bodies are relayed unchanged."""
+        status, _, body = _request(proxy, "/stream")
+        assert status == 200
+        assert body.startswith(b"one two ")
+
+        _, _, echoed = _request(proxy, "/echo", body=b"payload")
+        assert echoed.startswith(b"payload@")
+
+    def test_no_healthy_worker_is_503(self, proxy: AffinityProxy) -> None:
+        """With every worker down the proxy answers itself instead of hanging."""
+        # Stop the monitor, and wait out a pass in flight, so it cannot probe the workers back to healthy
+        proxy.pool.stop_monitor()
+        for worker in proxy.pool.workers:
+            worker.healthy = False
+        assert _request(proxy, "/whoami")[0] == 503
+
+
+class TestServerWorkerPool:
+    """The pool keeps its workers running."""
+
+    def test_crashed_worker_is_restarted_and_its_sessions_move(self, proxy: AffinityProxy) -> None:
+        """A worker that exits is respawned on a new port; meanwhile its sessions go to a healthy worker."""
+        pool = proxy.pool
+        session = {"X-Session-Id": "abc"}
+        owner_port = int(_request(proxy, "/whoami", session)[2])
+        owner = next(worker for worker in pool.workers if worker.port == owner_port)
+
+        _request(proxy, "/crash", session)
+
+        assert _wait_for(lambda: owner.restarts == 1 and owner.healthy)
+        assert owner.port != owner_port
+        assert int(_request(proxy, "/whoami", session)[2]) in pool.ports
+
+    @pytest.mark.skipif(os.name == "nt", reason="needs SIGSTOP")
+    def test_unresponsive_worker_is_replaced(self, pool: ServerWorkerPool) -> None:
+        """A worker that stops answering its health probe is killed and respawned."""
+        worker = pool.workers[0]
+        stalled = worker.process
+        # Alive but silent, and deaf to SIGTERM until killed
+        os.kill(stalled.pid, signal.SIGSTOP)
+
+        assert _wait_for(lambda: worker.restarts == 1 and worker.healthy)
+        assert stalled.poll() is not None
+
+    def test_choose_prefers_least_busy_and_pins_sessions(self, pool: ServerWorkerPool) -> None:
+        """Unkeyed requests go to the least busy worker; a pinned session overrides hashing."""
+        busy = pool.workers[0]
+        pool.begin_request(busy)
+        assert pool.choose() is not busy
+        pool.end_request(busy)
+
+        pool.pin("cookie:x", pool.workers[2])
+        assert pool.choose("cookie:x") is pool.workers[2]
+        assert pool.choose("other") is pool.choose("other")
@@ -0,0 +1,82 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Tests for CpuPool."""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from neuro_san_studio.utils.cpu_pool import WORKERS_ENV_VAR
+from neuro_san_studio.utils.cpu_pool import CpuPool
+from neuro_san_studio.utils.cpu_pool import free_threading_active
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    """Each test builds its own executor, so env overrides take effect."""
+    CpuPool.shutdown_for_testing()
+    yield
+    CpuPool.shutdown_for_testing()
+
+
+class TestCpuPool:
+    """Sizing and dispatch of the shared CPU pool."""
+
+    def test_env_override_sets_the_pool_size(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A positive NEURO_SAN_STUDIO_CPU_WORKERS wins; anything else falls back to the default."""
+        monkeypatch.setenv(WORKERS_ENV_VAR, "3")
+        assert CpuPool.default_workers() == 3
+        assert CpuPool.executor()._max_workers == 3  # pylint: disable=protected-access
+
+        monkeypatch.setenv(WORKERS_ENV_VAR, "zero")
+        assert CpuPool.default_workers() >= 1
+
+    def test_pool_uses_every_cpu_without_the_gil(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Free-threaded interpreters get a thread per CPU; the GIL build a small pool."""
+        monkeypatch.delenv(WORKERS_ENV_VAR, raising=False)
+        with patch("neuro_san_studio.utils.cpu_pool.os.cpu_count", return_value=32):
+            with patch("neuro_san_studio.utils.cpu_pool.free_threading_active", return_value=False):
+                assert CpuPool.default_workers() == 4
+            with (
+                patch("neuro_san_studio.utils.cpu_pool.free_threading_active", return_value=True),
+                patch("neuro_san_studio.utils.cpu_pool.os.process_cpu_count", return_value=32, create=True),
+            ):
+                assert CpuPool.default_workers() == 32
+
+    def test_run_executes_off_the_event_loop_thread(self) -> None:
+        """run() returns the function's result, computed on a pool thread."""
+
+        def where(value: int) -> tuple:
+            return value * 2, threading.current_thread().name
+
+        async def call() -> tuple:
+            return await CpuPool.run(where, 21)
+
+        result, thread_name = asyncio.run(call())
+
+        assert result == 42
+        assert thread_name.startswith("neuro-san-cpu")
+
+    def test_free_threading_active_matches_the_interpreter(self) -> None:
+        """False on builds without sys._is_gil_enabled, and the inverse of it where it exists."""
+        with patch("neuro_san_studio.utils.cpu_pool.sys") as fake_sys:
+            del fake_sys._is_gil_enabled
+            assert free_threading_active() is False
+            fake_sys._is_gil_enabled = lambda: False  # pylint: disable=protected-access
+            assert free_threading_active() is True
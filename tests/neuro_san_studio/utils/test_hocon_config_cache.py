@@ -0,0 +1,212 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Tests for HoconConfigCache."""
+
+import os
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from neuro_san_studio.utils.hocon_config_cache import HoconConfigCache
+
+_FORMAT = "neuro_san_studio.utils.hocon_config_cache.HoconSerializationFormat"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    """Each test starts and ends with an empty process-wide cache."""
+    HoconConfigCache.clear_for_testing()
+    yield
+    HoconConfigCache.clear_for_testing()
+
+
+def _bump(path: Path, text: str) -> None:
+    """Rewrite a file and move its mtime forward so the change is visible on coarse-mtime filesystems."""
+    before = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(text)
+    os.utime(path, ns=(before + 1_000_000_000, before + 1_000_000_000))
+
+
+def _project(tmp_path: Path) -> Path:
+    """A project root whose network includes a shared registries/aaosa.hocon."""
+    registries = tmp_path / "registries"
+    registries.mkdir()
+    (registries / "aaosa.hocon").write_text('{ "aaosa_instructions": "shared" }\n')
+    (registries / "net.hocon").write_text(
+        "{\n"
+        '    include "registries/aaosa.hocon"\n'
+        '    "tools": [ { "name": "front", "instructions": ${aaosa_instructions} } ]\n'
+        "}\n"
+    )
+    return registries / "net.hocon"
+
+
+class TestRestore:
+    """Parsing, include resolution and freshness."""
+
+    def test_includes_resolve_against_basedir_without_touching_cwd(self, tmp_path: Path) -> None:
+        """Project-root-relative includes resolve from any CWD, and CWD is left alone."""
+        network = _project(tmp_path)
+        cwd_before = os.getcwd()
+
+        config = HoconConfigCache.restore(str(network), basedir=str(tmp_path))
+
+        assert config["tools"][0]["instructions"] == "shared"
+        assert os.getcwd() == cwd_before
+
+    def test_repeat_restore_parses_once_and_returns_private_copies(self, tmp_path: Path) -> None:
+        """A warm hit skips pyhocon, and mutating one result cannot corrupt the next."""
+        network = _project(tmp_path)
+        first = HoconConfigCache.restore(str(network), basedir=str(tmp_path))
+        first["tools"].clear()
+
+        with patch(_FORMAT) as hocon_format:
+            second = HoconConfigCache.restore(str(network), basedir=str(tmp_path))
+            hocon_format.assert_not_called()
+
+        assert second["tools"][0]["name"] == "front"
+
+    def test_editing_the_file_invalidates(self, tmp_path: Path) -> None:
+        """A changed (mtime, size) on the file itself forces a re-parse."""
+        path = tmp_path / "plain.hocon"
+        path.write_text('{ "value": 1 }\n')
+        assert HoconConfigCache.restore(str(path))["value"] == 1
+
+        _bump(path, '{ "value": 22 }\n')
+        assert HoconConfigCache.restore(str(path))["value"] == 22
+
+    def test_editing_an_included_file_invalidates(self, tmp_path: Path) -> None:
+        """The include closure is part of the fingerprint."""
+        network = _project(tmp_path)
+        HoconConfigCache.restore(str(network), basedir=str(tmp_path))
+
+        _bump(tmp_path / "registries" / "aaosa.hocon", '{ "aaosa_instructions": "edited" }\n')
+        config = HoconConfigCache.restore(str(network), basedir=str(tmp_path))
+        assert config["tools"][0]["instructions"] == "edited"
+
+    def test_different_basedirs_are_separate_entries(self, tmp_path: Path) -> None:
+        """The same file read with another include base is parsed on its own."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        (tmp_path / "a" / "inc.hocon").write_text('{ "who": "a" }\n')
+        (tmp_path / "b" / "inc.hocon").write_text('{ "who": "b" }\n')
+        main = tmp_path / "main.hocon"
+        main.write_text('include "inc.hocon"\n')
+
+        assert HoconConfigCache.restore(str(main), basedir=str(tmp_path / "a"))["who"] == "a"
+        assert HoconConfigCache.restore(str(main), basedir=str(tmp_path / "b"))["who"] == "b"
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """must_exist decides between FileNotFoundError and None."""
+        missing = str(tmp_path / "missing.hocon")
+        with pytest.raises(FileNotFoundError):
+            HoconConfigCache.restore(missing)
+        assert HoconConfigCache.restore(missing, must_exist=False) is None
+
+    def test_parse_error_and_bad_extension_raise_value_error(self, tmp_path: Path) -> None:
+        """Failures surface as ValueError, like AbstractAsyncConfigRestorer."""
+        broken = tmp_path / "broken.hocon"
+        broken.write_text("{ unterminated\n")
+        other = tmp_path / "notes.txt"
+        other.write_text("hello\n")
+
+        with pytest.raises(ValueError):
+            HoconConfigCache.restore(str(broken))
+        with pytest.raises(ValueError):
+            HoconConfigCache.restore(str(other))
+
+    def test_concurrent_restores_agree(self, tmp_path: Path) -> None:
+        """Threads sharing the cache all see the same parsed value."""
+        network = _project(tmp_path)
+        results = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            results.append(HoconConfigCache.restore(str(network), basedir=str(tmp_path)))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 8
+        assert all(result == results[0] for result in results)
+
+    def test_restores_stay_whole_under_edits_and_eviction(self, tmp_path: Path) -> None:
+        """Threads restoring while the include is edited and the LRU evicts only see complete configs."""
+        network = _project(tmp_path)
+        aaosa = tmp_path / "registries" / "aaosa.hocon"
+        start_ns = aaosa.stat().st_mtime_ns
+        errors: list = []
+        barrier = threading.Barrier(8)
+
+        def restore(index: int) -> None:
+            barrier.wait()
+            try:
+                for round_number in range(40):
+                    if index == 0 and round_number % 10 == 0:
+                        # Replace the file atomically, as editors do, so readers never see it half-written
+                        staged = tmp_path / "aaosa.staged"
+                        staged.write_text(f'{{ "aaosa_instructions": "shared-{round_number}" }}\n')
+                        stamp = start_ns + (round_number + 1) * 1_000_000_000
+                        os.utime(staged, ns=(stamp, stamp))
+                        os.replace(staged, aaosa)
+                    config = HoconConfigCache.restore(str(network), basedir=str(tmp_path))
+                    if not config["tools"][0]["instructions"].startswith("shared"):
+                        raise AssertionError(config)
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                errors.append(exception)
+
+        with patch.object(HoconConfigCache, "MAX_ENTRIES", 1):
+            threads = [threading.Thread(target=restore, args=(index,)) for index in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert not errors
+        final = HoconConfigCache.restore(str(network), basedir=str(tmp_path))
+        assert final["tools"][0]["instructions"] == "shared-30"
+
+
+class TestIncludeTargets:
+    """The textual include scan shared with the exporter."""
+
+    def test_lists_every_include_form(self, tmp_path: Path) -> None:
+        """Bare, file(), classpath(), url() and required() forms are all reported."""
+        path = tmp_path / "net.hocon"
+        path.write_text(
+            'include "registries/aaosa.hocon"\n'
+            'include classpath("registries/llm.hocon")\n'
+            'include required(file("local.hocon"))\n'
+            'include url("https://example.com/x.hocon")\n'
+        )
+
+        assert HoconConfigCache.include_targets(str(path)) == [
+            ("", "registries/aaosa.hocon"),
+            ("classpath", "registries/llm.hocon"),
+            ("file", "local.hocon"),
+            ("url", "https://example.com/x.hocon"),
+        ]
+
+    def test_unreadable_file_yields_nothing(self, tmp_path: Path) -> None:
+        """A missing file is not an error for a textual scan."""
+        assert not HoconConfigCache.include_targets(str(tmp_path / "missing.hocon"))
@@ -0,0 +1,79 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+
+import json
+import os
+import tempfile
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from neuro_san_studio.utils.last_known_good_cache import LastKnownGoodCache
+
+
+class TestLastKnownGoodCache(TestCase):
+    """Tests for LastKnownGoodCache."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self._tmp.name, "nested", "cache.json")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_recorded_key_is_fresh_after_reload(self):
+        """A recorded success survives save() and a new instance."""
+        cache = LastKnownGoodCache(self.path, ttl_seconds=60)
+        cache.record("abc")
+        cache.save()
+
+        reloaded = LastKnownGoodCache(self.path, ttl_seconds=60)
+        self.assertTrue(reloaded.is_fresh("abc"))
+        self.assertFalse(reloaded.is_fresh("other"))
+
+    def test_expired_entry_is_stale_and_not_saved(self):
+        """Entries older than the TTL are not fresh and are dropped on save."""
+        cache = LastKnownGoodCache(self.path, ttl_seconds=60)
+        cache.record("old")
+        with patch("neuro_san_studio.utils.last_known_good_cache.time.time", return_value=time.time() + 120):
+            self.assertFalse(cache.is_fresh("old"))
+            cache.save()
+        with open(self.path, "r", encoding="utf-8") as cache_file:
+            self.assertEqual(json.load(cache_file), {})
+
+    def test_zero_ttl_disables_cache(self):
+        """With a TTL of 0 nothing is recorded or written."""
+        cache = LastKnownGoodCache(self.path, ttl_seconds=0)
+        cache.record("abc")
+        cache.save()
+        self.assertFalse(cache.is_fresh("abc"))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_corrupt_file_reads_as_empty(self):
+        """An unreadable cache file is treated as empty rather than raising."""
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w", encoding="utf-8") as cache_file:
+            cache_file.write("not json")
+        self.assertFalse(LastKnownGoodCache(self.path, ttl_seconds=60).is_fresh("abc"))
+
+    def test_fingerprint_ignores_key_order(self):
+        """Fingerprints are computed from canonical JSON."""
+        self.assertEqual(
+            LastKnownGoodCache.fingerprint({"a": 1, "b": [1, 2]}),
+            LastKnownGoodCache.fingerprint({"b": [1, 2], "a": 1}),
+        )
+        self.assertNotEqual(LastKnownGoodCache.fingerprint({"a": 1}), LastKnownGoodCache.fingerprint({"a": 2}))
@@ -0,0 +1,172 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Tests for recording and replaying LLM calls through a cassette."""
+
+import urllib.request
+
+import openai
+import pytest
+from openai import OpenAI
+
+from neuro_san_studio.utils.llm_cassette import CassetteLlmServer
+from neuro_san_studio.utils.llm_cassette import LlmCassette
+from neuro_san_studio.utils.llm_cassette import normalize_request
+from neuro_san_studio.utils.llm_cassette import request_key
+from neuro_san_studio.utils.stub_llm_server import StubLlmScript
+from neuro_san_studio.utils.stub_llm_server import StubLlmServer
+
+MESSAGES = [{"role": "user", "content": "What is on the menu?"}]
+
+
+@pytest.fixture(name="upstream")
+def fixture_upstream():
+    """A scripted stub standing in for the real LLM API."""
+    stub = StubLlmServer(StubLlmScript(tool_rounds=0, answer="coffee")).start()
+    yield stub
+    stub.stop()
+
+
+def _server(cassette: LlmCassette, mode: str, upstream: StubLlmServer) -> CassetteLlmServer:
+    return CassetteLlmServer(cassette, mode, upstream=upstream.base_url, upstream_api_key="key").start()
+
+
+def _client(server: CassetteLlmServer) -> OpenAI:
+    return OpenAI(base_url=server.base_url, api_key="key", max_retries=0)
+
+
+class TestNormalization:
+    """Requests that differ only in volatile values share a key."""
+
+    def test_uuids_timestamps_and_transport_fields_are_masked(self):
+        """Session UUIDs, ISO timestamps and streaming options do not change the key."""
+        first = {
+            "model": "gpt",
+            "stream": True,
+            "messages": [
+                {"role": "user", "content": "session 1b4e28ba-2fa1-11d2-883f-0016d3cca427 at 2026-01-02T03:04:05Z"}
+            ],
+        }
+        second = {
+            "model": "gpt",
+            "messages": [
+                {"role": "user", "content": "session 6fa459ea-ee8a-3ca4-894e-db77e160355e at 2026-05-06 07:08:09"}
+            ],
+        }
+
+        assert request_key(first) == request_key(second)
+        assert request_key(first) != request_key({"model": "gpt", "messages": MESSAGES})
+
+    def test_tool_call_ids_are_renumbered_in_order(self):
+        """Tool call ids become call_0, call_1... wherever they appear."""
+        request = {
+            "messages": [
+                {"role": "assistant", "tool_calls": [{"id": "call_xyz", "type": "function"}]},
+                {"role": "tool", "tool_call_id": "call_xyz", "content": "done"},
+            ]
+        }
+
+        normalized = normalize_request(request)
+
+        assert normalized["messages"][0]["tool_calls"][0]["id"] == "call_0"
+        assert normalized["messages"][1]["tool_call_id"] == "call_0"
+
+
+class TestLlmCassette:  # pylint: disable=too-few-public-methods
+    """One JSON file per recorded request."""
+
+    def test_put_then_get(self, tmp_path):
+        """A saved response reads back; an unknown key reads as None."""
+        cassette = LlmCassette(str(tmp_path / "cassettes"))
+        request = {"model": "gpt", "messages": MESSAGES}
+
+        cassette.put(request_key(request), request, {"id": "r1"})
+
+        assert cassette.get(request_key(request)) == {"id": "r1"}
+        assert cassette.get("missing") is None
+
+
+class TestCassetteLlmServer:
+    """Record, replay and new modes behind an OpenAI client."""
+
+    def test_record_then_replay_offline(self, tmp_path, upstream):
+        """A recorded completion is replayed after the upstream is gone."""
+        cassette = LlmCassette(str(tmp_path))
+        recorder = _server(cassette, "record", upstream)
+        try:
+            recorded = _client(recorder).chat.completions.create(model="gpt", messages=MESSAGES)
+        finally:
+            recorder.stop()
+        upstream.stop()
+
+        replayer = _server(cassette, "replay", upstream)
+        try:
+            replayed = _client(replayer).chat.completions.create(model="gpt", messages=MESSAGES)
+            stats = replayer.stats()
+        finally:
+            replayer.stop()
+
+        assert replayed.choices[0].message.content == "coffee"
+        assert replayed.id == recorded.id
+        assert stats["replayed"] == 1 and stats["missing"] == 0
+
+    def test_replay_miss_is_404(self, tmp_path, upstream):
+        """In replay mode an unrecorded request fails instead of reaching the upstream."""
+        server = _server(LlmCassette(str(tmp_path)), "replay", upstream)
+        try:
+            with pytest.raises(openai.NotFoundError, match="No recorded LLM response"):
+                _client(server).chat.completions.create(model="gpt", messages=MESSAGES)
+            assert server.stats()["missing"] == 1
+        finally:
+            server.stop()
+        assert upstream.stats()["chat_completions"] == 0
+
+    def test_new_mode_records_only_misses(self, tmp_path, upstream):
+        """The second identical request is served from the recording made by the first."""
+        server = _server(LlmCassette(str(tmp_path)), "new", upstream)
+        try:
+            for _ in range(2):
+                _client(server).chat.completions.create(model="gpt", messages=MESSAGES)
+            stats = server.stats()
+        finally:
+            server.stop()
+
+        assert (stats["recorded"], stats["replayed"]) == (1, 1)
+        assert upstream.stats()["chat_completions"] == 1
+
+    def test_streamed_replay_is_byte_stable(self, tmp_path, upstream):
+        """Replaying a streamed request twice sends identical bytes."""
+        server = _server(LlmCassette(str(tmp_path)), "new", upstream)
+        body = b'{"model": "gpt", "stream": true, "messages": [{"role": "user", "content": "hi"}]}'
+        try:
+            streams = []
+            for _ in range(3):
+                request = urllib.request.Request(
+                    f"{server.base_url}/chat/completions", data=body, headers={"Content-Type": "application/json"}
+                )
+                with urllib.request.urlopen(request, timeout=10) as response:
+                    streams.append(response.read())
+        finally:
+            server.stop()
+
+        assert streams[1] == streams[2]
+        assert streams[0] == streams[1]
+        assert b"data: [DONE]" in streams[0]
+
+    def test_unknown_mode_is_rejected(self, tmp_path):
+        """Only record, replay and new are valid modes."""
+        with pytest.raises(ValueError, match="Unknown cassette mode"):
+            CassetteLlmServer(LlmCassette(str(tmp_path)), "live")
@@ -0,0 +1,163 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Tests for the offline load-testing harness's statistics, baseline checks and report."""
+
+import pytest
+
+from neuro_san_studio.utils.load_test import DEFAULT_FIXTURES
+from neuro_san_studio.utils.load_test import DEFAULT_FIXTURES_DIR
+from neuro_san_studio.utils.load_test import LoadTestResult
+from neuro_san_studio.utils.load_test import LoadTestSettings
+from neuro_san_studio.utils.load_test import calibration_cpu_ms
+from neuro_san_studio.utils.load_test import compare_to_baseline
+from neuro_san_studio.utils.load_test import format_report
+from neuro_san_studio.utils.load_test import percentile
+from neuro_san_studio.utils.load_test import timing_changes
+
+SETTINGS = {"fixtures": ["basic/a.hocon"], "concurrency": 4, "iterations": 3, "llm_latency_ms": 0.0}
+
+
+def _result(**overrides) -> dict:
+    result = {
+        "settings": dict(SETTINGS),
+        "errors": 0,
+        "throughput_rps": 10.0,
+        "latency_p50_ms": 100.0,
+        "latency_p95_ms": 200.0,
+        "session_setup_p50_ms": 50.0,
+        "cpu_ms_per_request": 40.0,
+        "relative_cpu_per_request": 2.0,
+        "max_rss_mb": 300.0,
+        "llm_calls_per_request": 2.0,
+    }
+    result.update(overrides)
+    return result
+
+
+class TestPercentile:
+    """Nearest-rank percentiles."""
+
+    @pytest.mark.parametrize("fraction, expected", [(0.5, 5), (0.95, 10), (0.99, 10), (0.0, 1)])
+    def test_nearest_rank(self, fraction: float, expected: int):
+        """Percentiles of 1..10 pick an observed value."""
+        assert percentile(list(range(1, 11)), fraction) == expected
+
+    def test_empty(self):
+        """No observations is 0."""
+        assert percentile([], 0.5) == 0.0
+
+
+class TestCompareToBaseline:
+    """Regression detection against a recorded run."""
+
+    def test_within_tolerance_passes(self):
+        """Changes inside the tolerance, and improvements of any size, are not regressions."""
+        current = _result(latency_p95_ms=240.0, throughput_rps=30.0, cpu_ms_per_request=10.0)
+        assert not compare_to_baseline(current, _result(), tolerance=0.25, gate_timings=True)
+
+    def test_timings_are_reported_but_only_gated_on_request(self):
+        """Latency up and throughput down beyond the tolerance are reported; they fail only with gate_timings."""
+        current = _result(latency_p50_ms=150.0, throughput_rps=5.0)
+
+        assert [line.split(":")[0] for line in timing_changes(current, _result(), 0.25)] == [
+            "throughput_rps",
+            "latency_p50_ms",
+        ]
+        assert not compare_to_baseline(current, _result(), tolerance=0.25)
+        assert len(compare_to_baseline(current, _result(), tolerance=0.25, gate_timings=True)) == 2
+
+    def test_more_llm_calls_fail(self):
+        """Any rise in LLM calls per request is a regression, whatever the tolerance."""
+        regressions = compare_to_baseline(_result(llm_calls_per_request=2.25), _result(), tolerance=0.5)
+        assert regressions == ["llm_calls_per_request: 2.25 (baseline 2.0)"]
+
+    def test_more_relative_cpu_fails_beyond_its_tolerance(self):
+        """CPU per request relative to the calibration is gated without gate_timings, within its own tolerance."""
+        assert not compare_to_baseline(_result(relative_cpu_per_request=2.8), _result(), tolerance=0.0)
+        regressions = compare_to_baseline(_result(relative_cpu_per_request=3.2), _result(), tolerance=0.0)
+        assert regressions == ["relative_cpu_per_request: 3.2 vs baseline 2.0 (+60% worse)"]
+        assert compare_to_baseline(_result(relative_cpu_per_request=2.8), _result(), tolerance=0.0, cpu_tolerance=0.2)
+
+    def test_baseline_without_relative_cpu_is_not_gated_on_it(self):
+        """An older baseline without the normalized metric is compared on the others."""
+        baseline = _result()
+        del baseline["relative_cpu_per_request"]
+        assert not compare_to_baseline(_result(relative_cpu_per_request=9.0), baseline, tolerance=0.25)
+
+    def test_new_errors_fail(self):
+        """Errors the baseline did not have are a regression."""
+        assert compare_to_baseline(_result(errors=2), _result(), tolerance=0.25)[0].startswith("errors")
+
+    def test_missing_memory_is_skipped(self):
+        """Platforms without a memory high-water mark are compared on the other metrics."""
+        assert not compare_to_baseline(_result(max_rss_mb=None), _result(), tolerance=0.25)
+
+    def test_different_settings_are_not_comparable(self):
+        """A baseline from another configuration is refused rather than compared."""
+        with pytest.raises(ValueError, match="differ"):
+            compare_to_baseline(_result(settings=dict(SETTINGS, concurrency=8)), _result(), tolerance=0.25)
+
+
+class TestSettingsAndReport:
+    """Defaults and formatting."""
+
+    def test_default_fixtures_exist(self):
+        """Every default fixture is a test case under tests/fixtures."""
+        settings = LoadTestSettings()
+        assert settings.fixtures == list(DEFAULT_FIXTURES)
+        for fixture in settings.fixtures:
+            with open(f"{DEFAULT_FIXTURES_DIR}/{fixture}", "r", encoding="utf-8") as test_case:
+                assert '"agent"' in test_case.read()
+
+    def test_script_follows_settings(self):
+        """The stub script carries the latency and tool-call shape of the settings."""
+        script = LoadTestSettings(llm_latency_ms=25.0, tool_rounds=2, fan_out=3).script()
+        assert (script.latency_ms, script.tool_rounds, script.fan_out) == (25.0, 2, 3)
+
+    def test_format_report(self):
+        """The report lists the headline metrics and one line per fixture."""
+        result = LoadTestResult(
+            settings=dict(SETTINGS),
+            requests=12,
+            errors=1,
+            duration_seconds=3.0,
+            throughput_rps=4.0,
+            latency_p50_ms=100.0,
+            latency_p95_ms=200.0,
+            latency_p99_ms=250.0,
+            latency_max_ms=260.0,
+            session_setup_p50_ms=50.0,
+            session_setup_p95_ms=70.0,
+            cpu_ms_per_request=40.0,
+            calibration_cpu_ms=20.0,
+            relative_cpu_per_request=2.0,
+            max_rss_mb=None,
+            llm_calls_per_request=2.0,
+            per_fixture={"basic/a.hocon": {"requests": 12, "latency_p50_ms": 100.0, "latency_p95_ms": 200.0}},
+        )
+
+        report = format_report(result)
+
+        assert report.startswith("12 requests (1 errors) in 3.0s at concurrency 4")
+        assert "p95 200 ms" in report
+        assert "2.0x the 20.0 ms calibration" in report
+        assert "memory        n/a" in report
+        assert report.endswith("basic/a.hocon (12 requests)")
+
+    def test_calibration_takes_measurable_cpu(self):
+        """The calibration workload is long enough for thread_time to resolve."""
+        assert calibration_cpu_ms() > 1.0
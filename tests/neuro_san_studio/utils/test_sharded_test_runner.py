@@ -0,0 +1,144 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Tests for planning the shards of the integration test run."""
+
+import json
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from neuro_san_studio.utils.sharded_test_runner import collect_test_ids
+from neuro_san_studio.utils.sharded_test_runner import group_name
+from neuro_san_studio.utils.sharded_test_runner import load_durations
+from neuro_san_studio.utils.sharded_test_runner import plan_shards
+from neuro_san_studio.utils.sharded_test_runner import read_junit
+from neuro_san_studio.utils.sharded_test_runner import save_durations
+from neuro_san_studio.utils.sharded_test_runner import shard_environment
+
+PREFIX = "tests/integration/test_integration_test_hocons.py::TestIntegrationTestHocons::"
+
+
+def _ids(*names: str):
+    return [PREFIX + name for name in names]
+
+
+class TestPlanShards:
+    """Cases are balanced by duration while fail-fast groups stay whole."""
+
+    def test_group_name_strips_the_case_suffix(self):
+        """The base method is the name before the `_<index>_<case>` suffix, as FailFastParamMixin derives it."""
+        assert group_name(PREFIX + "test_hocon_industry_coffee_e2e_3_coffee_where_sly_data_8am") == (
+            "test_hocon_industry_coffee_e2e"
+        )
+
+    def test_serial_groups_stay_together_and_in_order(self):
+        """Every case of an _e2e group lands in the same shard, in collection order."""
+        test_ids = _ids(*(f"test_flow_e2e_{index}_step{index}" for index in range(4)), "test_a_0_x", "test_a_1_y")
+
+        plan = plan_shards(test_ids, 3)
+
+        e2e_shards = [shard for shard in plan if any("e2e" in test_id for test_id in shard)]
+        assert len(e2e_shards) == 1
+        assert [test_id for test_id in e2e_shards[0] if "e2e" in test_id] == test_ids[:4]
+        assert sorted(test_id for shard in plan for test_id in shard) == sorted(test_ids)
+
+    def test_durations_balance_the_shards(self):
+        """The slowest case gets a shard to itself."""
+        test_ids = _ids("test_a_0_slow", "test_a_1_x", "test_a_2_y", "test_a_3_z")
+        durations = {"TestIntegrationTestHocons::test_a_0_slow": 300.0}
+
+        plan = plan_shards(test_ids, 2, durations)
+
+        assert [PREFIX + "test_a_0_slow"] in plan
+        assert len(plan) == 2
+
+    def test_never_more_shards_than_units(self):
+        """Empty shards are not planned."""
+        assert len(plan_shards(_ids("test_a_0_x", "test_a_1_y"), 8)) == 2
+
+
+class TestCollectTestIds:
+    """Reading the node ids from pytest's collection output."""
+
+    @staticmethod
+    def _collect(monkeypatch, stdout: str, returncode: int = 0):
+        monkeypatch.setattr(
+            subprocess, "run", lambda *args, **kwargs: SimpleNamespace(returncode=returncode, stdout=stdout, stderr="")
+        )
+        return collect_test_ids(["tests/integration"], "integration")
+
+    def test_node_ids_with_spaces_are_kept(self, monkeypatch):
+        """Parameter ids may contain spaces; the summary after the blank line is not a node id."""
+        stdout = PREFIX + "test_a[two words]\n" + PREFIX + "test_b\n\n2 tests collected in 0.1s\n"
+
+        assert self._collect(monkeypatch, stdout) == _ids("test_a[two words]", "test_b")
+
+    def test_nothing_selected(self, monkeypatch):
+        """pytest exits 5 with only a summary when the marker selects nothing."""
+        assert not self._collect(monkeypatch, "\nno tests collected (3 deselected) in 0.1s\n", returncode=5)
+
+    def test_unexpected_lines_fail_loudly(self, monkeypatch):
+        """A line in the node id list that is not a node id is an error, not silently dropped."""
+        with pytest.raises(RuntimeError, match="Unexpected"):
+            self._collect(monkeypatch, PREFIX + "test_a\nsomething else\n\n1 test collected\n")
+
+    def test_collection_errors_fail(self, monkeypatch):
+        """A module that fails to import stops the run instead of dropping its cases."""
+        with pytest.raises(RuntimeError, match="failed"):
+            self._collect(monkeypatch, PREFIX + "test_a\n\nERROR tests/integration/test_b.py\n", returncode=2)
+
+
+class TestShardState:
+    """Per-shard environments and the durations file."""
+
+    def test_each_shard_gets_its_own_temp_dir(self, tmp_path):
+        """Directories differ between shards; the cassette mode is passed through."""
+        base = {"AGENT_TEST_THINKING_BASIS": str(tmp_path / "thinking")}
+
+        first = shard_environment(0, base, str(tmp_path), "replay")
+        second = shard_environment(1, base, str(tmp_path), None)
+
+        assert first["NEURO_SAN_TEST_SHARD"] != second["NEURO_SAN_TEST_SHARD"]
+        assert first["TMPDIR"] != second["TMPDIR"]
+        assert first["AGENT_TEST_THINKING_BASIS"] != second["AGENT_TEST_THINKING_BASIS"]
+        assert first["NEURO_SAN_LLM_CASSETTE"] == "replay"
+        assert "NEURO_SAN_LLM_CASSETTE" not in second
+
+    def test_junit_outcomes_and_durations_round_trip(self, tmp_path):
+        """Outcomes and times are read from the junit report and merged into the durations file."""
+        junit = tmp_path / "shard-0.xml"
+        junit.write_text(
+            '<testsuites><testsuite name="pytest">'
+            '<testcase classname="tests.integration.test_x.TestX" name="test_a" time="1.5"/>'
+            '<testcase classname="tests.integration.test_x.TestX" name="test_b" time="2"><failure/></testcase>'
+            "</testsuite></testsuites>",
+            encoding="utf-8",
+        )
+        durations_path = tmp_path / "durations.json"
+        durations_path.write_text(json.dumps({"TestX::test_c": 4.0}), encoding="utf-8")
+
+        outcomes = read_junit(str(junit))
+        save_durations(str(durations_path), {key: seconds for key, (_, seconds) in outcomes.items()})
+
+        assert outcomes == {"TestX::test_a": ("passed", 1.5), "TestX::test_b": ("failed", 2.0)}
+        assert load_durations(str(durations_path)) == {
+            "TestX::test_a": 1.5,
+            "TestX::test_b": 2.0,
+            "TestX::test_c": 4.0,
+        }
+        assert not read_junit(str(tmp_path / "missing.xml"))
@@ -0,0 +1,183 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Tests for the scripted stub LLM server."""
+
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+from openai import OpenAI
+
+from neuro_san_studio.utils.stub_llm_server import StubLlmScript
+from neuro_san_studio.utils.stub_llm_server import StubLlmServer
+
+SEARCH_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "search",
+        "parameters": {
+            "type": "object",
+            "properties": {"query": {"type": "string"}, "limit": {"type": "integer"}, "mode": {"enum": ["a", "b"]}},
+            "required": ["query", "limit", "mode"],
+        },
+    },
+}
+LOOKUP_TOOL = {"type": "function", "function": {"name": "lookup", "parameters": {"type": "object"}}}
+
+
+def _tool_call_message(call_id: str) -> dict:
+    return {
+        "role": "assistant",
+        "content": None,
+        "tool_calls": [{"id": call_id, "type": "function", "function": {"name": "search", "arguments": "{}"}}],
+    }
+
+
+@pytest.fixture(name="server")
+def fixture_server():
+    """A running stub with the default script."""
+    stub = StubLlmServer(StubLlmScript(answer="scripted")).start()
+    yield stub
+    stub.stop()
+
+
+class TestStubLlmScript:
+    """Responses are a function of the request alone."""
+
+    def test_calls_a_tool_then_answers(self):
+        """The first round calls a tool with schema placeholders; after the tool result it answers."""
+        script = StubLlmScript()
+        request = {"messages": [{"role": "user", "content": "hi"}], "tools": [SEARCH_TOOL]}
+
+        first = script.respond(request)
+        tool_call = first["tool_calls"][0]["function"]
+        request["messages"] += [first, {"role": "tool", "content": "found", "tool_call_id": "1"}]
+
+        assert tool_call["name"] == "search"
+        assert json.loads(tool_call["arguments"]) == {"query": "stub", "limit": 1, "mode": "a"}
+        assert script.respond(request) == {"role": "assistant", "content": script.answer}
+
+    def test_rounds_restart_after_each_user_message(self):
+        """Tool calls before the last user message do not count toward the rounds."""
+        script = StubLlmScript()
+        messages = [
+            {"role": "user", "content": "one"},
+            {"role": "assistant", "tool_calls": [{"id": "1"}]},
+            {"role": "tool", "content": "x"},
+            {"role": "assistant", "content": "answer"},
+            {"role": "user", "content": "two"},
+        ]
+
+        assert "tool_calls" in script.respond({"messages": messages, "tools": [SEARCH_TOOL]})
+
+    def test_prefer_fan_out_and_argument_overrides(self):
+        """Preferred tools come first, fan_out calls several, and per-tool arguments win."""
+        script = StubLlmScript(prefer=["lookup"], fan_out=2, arguments={"search": {"query": "given"}})
+
+        response = script.respond({"messages": [{"role": "user"}], "tools": [SEARCH_TOOL, LOOKUP_TOOL]})
+        calls = [call["function"] for call in response["tool_calls"]]
+
+        assert [call["name"] for call in calls] == ["lookup", "search"]
+        assert json.loads(calls[1]["arguments"])["query"] == "given"
+
+    def test_no_tools_means_an_answer(self):
+        """A request without tools is answered directly."""
+        assert StubLlmScript().respond({"messages": [{"role": "user"}]})["content"]
+
+    def test_unknown_script_keys_are_rejected(self):
+        """A typo in a script file is an error rather than a silently ignored setting."""
+        with pytest.raises(ValueError, match="latency"):
+            StubLlmScript.from_mapping({"latency": 5})
+
+
+class TestStubLlmJitter:
+    """Jitter comes from the request, not from the order requests arrive in."""
+
+    def test_same_conversation_same_jitter(self):
+        """A request gets the same jitter from any server with the same seed, whatever its tool call ids."""
+        script = StubLlmScript(jitter_ms=100.0, seed=7)
+        first = {"messages": [{"role": "user", "content": "hi"}, _tool_call_message("call_a")]}
+        second = {"messages": [{"role": "user", "content": "hi"}, _tool_call_message("call_b")]}
+        other = {"messages": [{"role": "user", "content": "hello"}]}
+        server, later = StubLlmServer(script).start(), StubLlmServer(script).start()
+        try:
+            later.jitter_ms(other)
+            jitter = server.jitter_ms(first)
+
+            assert 0.0 <= jitter <= 100.0
+            assert later.jitter_ms(second) == jitter
+            assert server.jitter_ms(other) != jitter
+        finally:
+            server.stop()
+            later.stop()
+        reseeded = StubLlmServer(StubLlmScript(jitter_ms=100.0, seed=8)).start()
+        try:
+            assert reseeded.jitter_ms(first) != jitter
+        finally:
+            reseeded.stop()
+
+    def test_no_jitter_configured(self, server: StubLlmServer):
+        """Without jitter_ms the delay is exactly the latency."""
+        assert server.jitter_ms({"messages": [{"role": "user", "content": "hi"}]}) == 0.0
+
+
+class TestStubLlmServer:
+    """The server speaks the OpenAI chat completions protocol."""
+
+    def test_openai_client_round_trip(self, server: StubLlmServer):
+        """The official client parses tool calls and answers, and the stats count them."""
+        client = OpenAI(base_url=server.base_url, api_key="stub", max_retries=0)
+        messages = [{"role": "user", "content": "hi"}]
+
+        first = client.chat.completions.create(model="gpt-test", messages=messages, tools=[SEARCH_TOOL])
+        call = first.choices[0].message.tool_calls[0]
+        messages += [first.choices[0].message.model_dump(exclude_none=True)]
+        messages += [{"role": "tool", "tool_call_id": call.id, "content": "found"}]
+        second = client.chat.completions.create(model="gpt-test", messages=messages, tools=[SEARCH_TOOL])
+
+        assert first.choices[0].finish_reason == "tool_calls"
+        assert call.function.name == "search"
+        assert second.choices[0].message.content == "scripted"
+        assert server.stats()["chat_completions"] == 2
+        assert server.stats()["tool_call_responses"] == 1
+
+    def test_streaming(self, server: StubLlmServer):
+        """Streamed answers arrive as chunks followed by usage when asked for."""
+        client = OpenAI(base_url=server.base_url, api_key="stub", max_retries=0)
+
+        chunks = list(
+            client.chat.completions.create(
+                model="gpt-test",
+                messages=[{"role": "user", "content": "hi"}],
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+        )
+
+        text = "".join(chunk.choices[0].delta.content or "" for chunk in chunks if chunk.choices)
+        assert text == "scripted"
+        assert chunks[-1].usage is not None
+
+    def test_stats_endpoint_and_unknown_routes(self, server: StubLlmServer):
+        """GET /stats is JSON; other routes are 404."""
+        root = server.base_url.removesuffix("/v1")
+        with urllib.request.urlopen(f"{root}/stats", timeout=5) as response:
+            assert json.load(response)["chat_completions"] == 0
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"{root}/nowhere", timeout=5)  # pylint: disable=consider-using-with
+        assert error.value.code == 404
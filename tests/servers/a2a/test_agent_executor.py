@@ -0,0 +1,206 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Tests for the example A2A server's CrewAiAgentExecutor, with a stub LLM in place of gpt-4o-mini."""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+from typing import List
+from typing import Optional
+
+import pytest
+
+pytest.importorskip("a2a.server.tasks")
+pytest.importorskip("crewai")
+
+# pylint: disable=wrong-import-position,wrong-import-order,import-error
+from a2a.server.agent_execution import RequestContext
+from a2a.server.events import EventQueue
+from a2a.types import Message
+from a2a.types import MessageSendParams
+from a2a.types import Part
+from a2a.types import Role
+from a2a.types import Task
+from a2a.types import TaskArtifactUpdateEvent
+from a2a.types import TaskState
+from a2a.types import TaskStatusUpdateEvent
+from a2a.types import TextPart
+from crewai import BaseLLM
+
+# The server modules import each other as scripts run from their own directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "servers" / "a2a"))
+
+from agent import CrewAiResearchReport  # noqa: E402
+from agent_executor import CrewAiAgentExecutor  # noqa: E402
+
+
+class StubLLM(BaseLLM):  # pylint: disable=too-few-public-methods
+    """Answers every agent at once with a final answer naming the agent, unless told to hold or fail."""
+
+    calls: List[str] = []
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    release: Optional[Any] = None
+    fail: bool = False
+
+    def call(self, *_args, from_agent=None, **_kwargs) -> str:
+        """Record the calling agent's role and answer for it; crewai passes the agent as `from_agent`."""
+        role = from_agent.role if from_agent is not None else "agent"
+        self.calls.append(role)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            if self.release is not None:
+                self.release.wait(5.0)
+            if self.fail:
+                raise RuntimeError("model unavailable")
+            return f"Thought: I now know the final answer\nFinal Answer: {role} output"
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture(autouse=True)
+def quiet_crewai(monkeypatch):
+    """Keep crewAI from sending telemetry or traces."""
+    monkeypatch.setenv("CREWAI_DISABLE_TELEMETRY", "true")
+    monkeypatch.setenv("CREWAI_TRACING_ENABLED", "false")
+    monkeypatch.setenv("OTEL_SDK_DISABLED", "true")
+
+
+def make_executor(llm: StubLLM, max_concurrent_crews: int = 4) -> CrewAiAgentExecutor:
+    """An executor whose crews use the stub LLM."""
+    return CrewAiAgentExecutor(
+        max_concurrent_crews=max_concurrent_crews, crew_factory=lambda: CrewAiResearchReport(llm=llm)
+    )
+
+
+def make_context(topic: str = "quantum dots") -> RequestContext:
+    """A request context for a new A2A task on the topic."""
+    message = Message(role=Role.user, parts=[Part(root=TextPart(text=topic))], message_id=f"msg-{topic}")
+    return RequestContext(request=MessageSendParams(message=message))
+
+
+async def drain(queue: EventQueue) -> list:
+    """Every event waiting in the queue."""
+    events = []
+    while not queue.is_closed():
+        try:
+            events.append(await queue.dequeue_event(no_wait=True))
+        except asyncio.QueueEmpty:
+            break
+    return events
+
+
+async def wait_until(condition, timeout: float = 10.0) -> None:
+    """Poll until condition() is true."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def test_task_outputs_stream_as_artifacts():
+    """The research and the report arrive as separate artifacts, in order, before the task completes."""
+    llm = StubLLM(model="stub", calls=[])
+    executor = make_executor(llm)
+
+    async def run() -> list:
+        queue = EventQueue()
+        await executor.execute(make_context(), queue)
+        return await drain(queue)
+
+    events = asyncio.run(run())
+
+    assert isinstance(events[0], Task)
+    artifacts = [event.artifact for event in events if isinstance(event, TaskArtifactUpdateEvent)]
+    assert [artifact.name for artifact in artifacts] == ["research_task", "reporting_task"]
+    assert artifacts[-1].parts[0].root.text == "quantum dots Reporting Analyst output"
+    statuses = [event.status.state for event in events if isinstance(event, TaskStatusUpdateEvent)]
+    assert statuses[0] == TaskState.working
+    assert statuses[-1] == TaskState.completed
+    assert events.index(next(e for e in events if isinstance(e, TaskArtifactUpdateEvent))) < len(events) - 1
+
+
+def test_cancel_stops_the_crew():
+    """cancel() ends execute(), reports the task canceled and keeps the crew from starting its next task."""
+    release = threading.Event()
+    llm = StubLLM(model="stub", calls=[], release=release)
+    executor = make_executor(llm)
+
+    async def run() -> list:
+        queue = EventQueue()
+        context = make_context()
+        running = asyncio.ensure_future(executor.execute(context, queue))
+        await wait_until(lambda: llm.calls)
+        await executor.cancel(context, queue)
+        with pytest.raises(asyncio.CancelledError):
+            await running
+        release.set()
+        await asyncio.sleep(0.5)
+        return await drain(queue)
+
+    events = asyncio.run(run())
+
+    statuses = [event.status.state for event in events if isinstance(event, TaskStatusUpdateEvent)]
+    assert statuses[-1] == TaskState.canceled
+    assert not any(isinstance(event, TaskArtifactUpdateEvent) for event in events)
+    assert llm.calls == ["quantum dots Senior Researcher"]
+
+
+def test_requests_beyond_the_limit_wait():
+    """With one crew slot, a second request is reported as waiting and its crew starts after the first ends."""
+    release = threading.Event()
+    llm = StubLLM(model="stub", calls=[], release=release)
+    executor = make_executor(llm, max_concurrent_crews=1)
+
+    async def run() -> tuple:
+        first_queue, second_queue = EventQueue(), EventQueue()
+        first = asyncio.ensure_future(executor.execute(make_context("first"), first_queue))
+        await wait_until(lambda: llm.calls)
+        second = asyncio.ensure_future(executor.execute(make_context("second"), second_queue))
+        await asyncio.sleep(0.2)
+        calls_while_first_runs = list(llm.calls)
+        release.set()
+        await asyncio.gather(first, second)
+        return calls_while_first_runs, await drain(second_queue)
+
+    calls_while_first_runs, second_events = asyncio.run(run())
+
+    assert calls_while_first_runs == ["first Senior Researcher"]
+    assert llm.peak_in_flight == 1
+    statuses = [event.status.state for event in second_events if isinstance(event, TaskStatusUpdateEvent)]
+    assert statuses[0] == TaskState.submitted
+    assert statuses[-1] == TaskState.completed
+
+
+def test_crew_failure_fails_the_task():
+    """An error in the crew is reported as a failed task rather than raised."""
+    llm = StubLLM(model="stub", calls=[], fail=True)
+    executor = make_executor(llm)
+
+    async def run() -> list:
+        queue = EventQueue()
+        await executor.execute(make_context(), queue)
+        return await drain(queue)
+
+    events = asyncio.run(run())
+
+    final = [event for event in events if isinstance(event, TaskStatusUpdateEvent)][-1]
+    assert final.status.state == TaskState.failed
+    assert "model unavailable" in final.status.message.parts[0].root.text